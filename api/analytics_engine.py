@@ -0,0 +1,229 @@
+"""
+In-memory columnar copy of the roster for ad-hoc statistics.
+The non-photo columns are held as NumPy arrays: strings are dictionary
+encoded to int32 codes and timestamps are int64 epoch seconds. The copy is
+loaded once per process and then kept current by replaying the changes feed,
+so group-by/filter/aggregate requests run vectorized without touching ORM
+objects.
+"""
+
+import threading
+from datetime import datetime
+import numpy as np
+from .models.roster import db, Roster
+from .models.charge import Charge
+from .models.change import latest_change_id, changes_since
+from .models.population import location_key
+
+MISSING = np.iinfo(np.int64).min  # Sentinel for null timestamps
+SECONDS_PER_DAY = 86400
+EPOCH = datetime(1970, 1, 1)
+
+# Charge degrees from least to most serious; a booking is classed by its most serious charge
+DEGREE_ORDER = ['', 'M4', 'M3', 'M2', 'M1', 'F5', 'F4', 'F3', 'F2', 'F1']
+
+GROUP_BY_FIELDS = ('jailLocation', 'cell', 'degree', 'arrestHour', 'arrestWeekday', 'sex', 'status')
+METRICS = ('count', 'avgStayDays', 'totalStayDays', 'felonyRatio')
+
+
+def _timestamp(value):
+    """Wall-clock seconds since 1970 as stored, so hours and weekdays fall out by division."""
+    if not value:
+        return MISSING
+    return int((value.replace(tzinfo=None) - EPOCH).total_seconds())
+
+
+class StringDictionary:
+    """Dictionary encoding for a string column."""
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def encode(self, value):
+        value = value or ''
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class ColumnarRoster:
+    """Column arrays over every booking, with in-place updates from the changes feed."""
+
+    INT64_COLUMNS = ('arrest', 'release')
+    CODE_COLUMNS = ('location', 'cell', 'degree')
+    BOOL_COLUMNS = ('sex_m', 'sex_f', 'felony', 'alive')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.last_change_id = 0
+        self.size = 0
+        self.row_of = {}  # Booking id -> row
+        self.dictionaries = {name: StringDictionary() for name in self.CODE_COLUMNS}
+        self._allocate(1024)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.columns = {}
+        for name in self.INT64_COLUMNS:
+            self.columns[name] = np.full(capacity, MISSING, dtype=np.int64)
+        for name in self.CODE_COLUMNS:
+            self.columns[name] = np.zeros(capacity, dtype=np.int32)
+        for name in self.BOOL_COLUMNS:
+            self.columns[name] = np.zeros(capacity, dtype=bool)
+
+    def _grow(self, needed):
+        if needed <= self.capacity:
+            return
+        old_columns, old_size = self.columns, self.size
+        self._allocate(max(needed, self.capacity * 2))
+        for name, values in old_columns.items():
+            self.columns[name][:old_size] = values[:old_size]
+
+    def _write_row(self, row, booking, degree):
+        columns = self.columns
+        columns['arrest'][row] = _timestamp(booking.arrest_date_time)
+        columns['release'][row] = _timestamp(booking.release_date_time)
+        columns['location'][row] = self.dictionaries['location'].encode(location_key(booking.jail_location))
+        columns['cell'][row] = self.dictionaries['cell'].encode((booking.cell or '').strip().upper())
+        columns['degree'][row] = self.dictionaries['degree'].encode(degree)
+        columns['sex_m'][row] = bool(booking.sex_m)
+        columns['sex_f'][row] = bool(booking.sex_f)
+        columns['felony'][row] = bool(booking.felony)
+        columns['alive'][row] = True
+
+    def _load_bookings(self, booking_ids=None):
+        """Fetch the analytic columns and most serious charge degree for some or all bookings."""
+        query = db.session.query(
+            Roster.id, Roster.arrest_date_time, Roster.release_date_time, Roster.jail_location,
+            Roster.cell, Roster.sex_m, Roster.sex_f, Roster.felony
+        )
+        degree_query = db.session.query(Charge.roster_id, Charge.degree).filter(Charge.degree.isnot(None))
+        if booking_ids is not None:
+            query = query.filter(Roster.id.in_(booking_ids))
+            degree_query = degree_query.filter(Charge.roster_id.in_(booking_ids))
+
+        degrees = {}
+        for roster_id, degree in degree_query.all():
+            if DEGREE_ORDER.index(degree) > DEGREE_ORDER.index(degrees.get(roster_id, '')):
+                degrees[roster_id] = degree
+        return [(booking, degrees.get(booking.id, '')) for booking in query.all()]
+
+    def _upsert(self, booking, degree):
+        row = self.row_of.get(booking.id)
+        if row is None:
+            self._grow(self.size + 1)
+            row = self.size
+            self.size += 1
+            self.row_of[booking.id] = row
+        self._write_row(row, booking, degree)
+
+    def refresh(self):
+        """Load everything on first use, then apply only changes since the last refresh."""
+        with self.lock:
+            if not self.loaded:
+                self.last_change_id = latest_change_id()
+                bookings = self._load_bookings()
+                self._grow(len(bookings))
+                for booking, degree in bookings:
+                    self._upsert(booking, degree)
+                self.loaded = True
+                return
+
+            changes = changes_since(self.last_change_id)
+            if not changes:
+                return
+            changed_ids = {change.roster_id for change in changes}
+            self.last_change_id = changes[-1].id
+
+            found = set()
+            for booking, degree in self._load_bookings(list(changed_ids)):
+                self._upsert(booking, degree)
+                found.add(booking.id)
+            for booking_id in changed_ids - found:
+                row = self.row_of.get(booking_id)
+                if row is not None:
+                    self.columns['alive'][row] = False
+
+    def _view(self):
+        """Live rows of every column."""
+        alive = self.columns['alive'][:self.size]
+        return {name: values[:self.size][alive] for name, values in self.columns.items()}
+
+    def _group_keys(self, view, group_by):
+        """Integer group codes and their labels for a group-by field."""
+        if group_by in ('jailLocation', 'cell', 'degree'):
+            name = {'jailLocation': 'location', 'cell': 'cell', 'degree': 'degree'}[group_by]
+            return view[name], self.dictionaries[name].values
+        if group_by in ('arrestHour', 'arrestWeekday'):
+            has_arrest = view['arrest'] != MISSING
+            local = np.where(has_arrest, view['arrest'], 0)
+            if group_by == 'arrestHour':
+                keys = (local % SECONDS_PER_DAY) // 3600
+                labels = [str(hour) for hour in range(24)] + ['']
+            else:
+                keys = (local // SECONDS_PER_DAY + 3) % 7  # 1970-01-01 was a Thursday
+                labels = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday', '']
+            return np.where(has_arrest, keys, len(labels) - 1), labels
+        if group_by == 'sex':
+            return np.where(view['sex_m'], 0, np.where(view['sex_f'], 1, 2)), ['M', 'F', '']
+        if group_by == 'status':
+            return (view['release'] != MISSING).astype(np.int64), ['active', 'released']
+        raise ValueError(f'Unknown group-by field: {group_by}')
+
+    def aggregate(self, metric='count', group_by='jailLocation', status=None, jail_location=None,
+                  arrested_from=None, arrested_to=None, now=None):
+        """
+        Group live bookings and compute a metric per group.
+        metric is one of METRICS; group_by is one of GROUP_BY_FIELDS.
+        Returns a list of {'group', 'value', 'count'} dicts.
+        """
+        if metric not in METRICS:
+            raise ValueError(f'Unknown metric: {metric}')
+        now = now or datetime.now()
+        self.refresh()
+        view = self._view()
+
+        mask = np.ones(len(view['arrest']), dtype=bool)
+        if status == 'active':
+            mask &= view['release'] == MISSING
+        elif status == 'released':
+            mask &= view['release'] != MISSING
+        if jail_location:
+            code = self.dictionaries['location'].codes.get(jail_location)
+            mask &= view['location'] == (code if code is not None else -1)
+        if arrested_from:
+            mask &= (view['arrest'] != MISSING) & (view['arrest'] >= _timestamp(arrested_from))
+        if arrested_to:
+            mask &= (view['arrest'] != MISSING) & (view['arrest'] < _timestamp(arrested_to))
+        view = {name: values[mask] for name, values in view.items()}
+
+        keys, labels = self._group_keys(view, group_by)
+        counts = np.bincount(keys, minlength=len(labels))
+
+        if metric == 'count':
+            values = counts.astype(float)
+        elif metric == 'felonyRatio':
+            values = np.bincount(keys, weights=view['felony'], minlength=len(labels)) / np.maximum(counts, 1)
+        else:
+            has_arrest = view['arrest'] != MISSING
+            end = np.where(view['release'] != MISSING, view['release'], _timestamp(now))
+            stay_days = np.where(has_arrest, (end - view['arrest']) / SECONDS_PER_DAY, 0.0)
+            totals = np.bincount(keys, weights=stay_days, minlength=len(labels))
+            if metric == 'totalStayDays':
+                values = totals
+            else:
+                stay_counts = np.bincount(keys, weights=has_arrest, minlength=len(labels))
+                values = totals / np.maximum(stay_counts, 1)
+
+        return [
+            {'group': labels[code], 'value': round(float(values[code]), 3), 'count': int(counts[code])}
+            for code in np.nonzero(counts)[0]
+        ]
+
+
+roster_columns = ColumnarRoster()
@@ -0,0 +1,134 @@
+"""
+In-memory prefix index of values typed on bookings, for form suggestions.
+Each field keeps a sorted array of distinct lowercase values with their use
+counts; a prefix lookup is a bisect into that array. The index is loaded
+with one grouped query per field, then kept current from the changes feed.
+The feed carries new values but not the ones they replaced, so counts only
+grow between loads; the index is rebuilt every REBUILD_SECONDS to let
+values nobody uses anymore drop out. Each field is capped at
+MAX_VALUES_PER_FIELD values, evicting the least used first.
+"""
+
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from .models.roster import db, Roster
+from .models.charge import Charge, parse_charges
+from .models.change import latest_change_id, changes_since
+
+MAX_VALUES_PER_FIELD = 20000
+MAX_VALUE_LENGTH = 100
+REFRESH_SECONDS = 1
+REBUILD_SECONDS = 3600
+
+# API field name -> roster column
+FIELDS = {
+    'name': 'name',
+    'charge': 'charges',
+    'cell': 'cell',
+    'bond': 'bond',
+    'courtPacket': 'court_packet',
+}
+
+
+def _field_values(field, raw):
+    """The suggestion values one booking contributes to a field."""
+    if field == 'charge':
+        return [parsed['description'] for parsed in parse_charges(raw)]
+    value = (raw or '').strip()
+    return [value] if value else []
+
+
+class PrefixIndex:
+    """Distinct values of one field, sorted for prefix search."""
+
+    def __init__(self, capacity=MAX_VALUES_PER_FIELD):
+        self.capacity = capacity
+        self.keys = []  # Sorted lowercase values
+        self.entries = {}  # Lowercase value -> [display value, count]
+
+    def add(self, value, count=1):
+        value = value[:MAX_VALUE_LENGTH]
+        key = value.lower()
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry[1] += count
+            return
+        self.entries[key] = [value, max(count, 1)]
+        insort(self.keys, key)
+        if len(self.keys) > self.capacity:
+            self._evict()
+
+    def _evict(self):
+        """Drop the least used tenth of the values."""
+        keep = heapq.nlargest(int(self.capacity * 0.9), self.entries.items(), key=lambda item: item[1][1])
+        self.entries = dict(keep)
+        self.keys = sorted(self.entries)
+
+    def search(self, prefix, limit=10):
+        """Values starting with prefix (case-insensitive), most used first."""
+        prefix = prefix.lower()
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + '\uffff', start)
+        matches = self.keys[start:end]
+        best = heapq.nlargest(limit, matches, key=lambda key: self.entries[key][1])
+        return [{'value': self.entries[key][0], 'count': self.entries[key][1]} for key in best]
+
+
+class Autocomplete:
+    """Prefix indexes for every suggestion field, shared by the process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.indexes = None
+        self.last_change_id = 0
+        self.checked_at = 0.0
+        self.loaded_at = 0.0
+
+    def _load(self):
+        self.last_change_id = latest_change_id()
+        indexes = {field: PrefixIndex() for field in FIELDS}
+        for field, column_name in FIELDS.items():
+            if field == 'charge':
+                rows = db.session.query(Charge.description, db.func.count()).group_by(Charge.description)
+            else:
+                column = getattr(Roster, column_name)
+                rows = db.session.query(column, db.func.count()).filter(
+                    column.isnot(None), column != ''
+                ).group_by(column)
+            for value, count in rows.order_by(db.func.count().desc()).limit(MAX_VALUES_PER_FIELD).all():
+                value = (value or '').strip()
+                if value:
+                    indexes[field].add(value, count)
+        self.indexes = indexes
+        self.loaded_at = time.monotonic()
+
+    def refresh(self):
+        """Load on first use or when due for a rebuild; otherwise apply new feed rows, at most once a second."""
+        now = time.monotonic()
+        with self.lock:
+            if self.indexes is None or now - self.loaded_at > REBUILD_SECONDS:
+                self._load()
+                self.checked_at = now
+                return
+            if now - self.checked_at < REFRESH_SECONDS:
+                return
+            self.checked_at = now
+            for change in changes_since(self.last_change_id):
+                self.last_change_id = change.id
+                fields = change.fields()
+                if fields is None:
+                    continue
+                # Updates repeat every field, so they only add values not seen before
+                count = 1 if change.operation == 'insert' else 0
+                for field, column_name in FIELDS.items():
+                    for value in _field_values(field, fields.get(column_name)):
+                        self.indexes[field].add(value, count)
+
+    def suggest(self, field, prefix, limit=10):
+        self.refresh()
+        return self.indexes[field].search(prefix, limit)
+
+
+autocomplete = Autocomplete()
@@ -0,0 +1,122 @@
+"""
+Benchmark for the columnar analytics engine.
+Fills a throwaway SQLite database with synthetic bookings and times the same
+statistics (bookings and average stay per location) three ways: the NumPy
+columnar engine, a SQL GROUP BY, and a Python loop over ORM objects.
+Run with: python -m api.benchmark_analytics --rows 100000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+
+def build_rows(count, seed=1):
+    """Synthetic bookings spread over the last two years."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    locations = ['Solon', 'Main']
+    cells = {'Solon': ['SOL-1', 'SOL-2', 'SOL-3', 'SOL-4'], 'Main': ['A-101', 'A-102', 'B-103', 'C-301']}
+    rows = []
+    for i in range(count):
+        location = rng.choice(locations)
+        arrest = now - timedelta(minutes=rng.randint(0, 2 * 365 * 24 * 60))
+        release = arrest + timedelta(hours=rng.randint(1, 24 * 60))
+        if release > now or rng.random() < 0.1:
+            release = None
+        male = rng.random() < 0.8
+        rows.append({
+            'id': str(1_000_000_000_000 + i),
+            'name': f'Inmate {i}',
+            'arrest_date_time': arrest,
+            'release_date_time': release,
+            'jail_location': location,
+            'cell': rng.choice(cells[location]),
+            'sex_m': male,
+            'sex_f': not male,
+            'felony': rng.random() < 0.3,
+            'misdemeanor': False,
+            'created_at': now,
+            'updated_at': now
+        })
+    return rows
+
+
+def timed(label, func, repeat):
+    func()  # Warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f'{label:<12} {elapsed * 1000:10.2f} ms')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000, help='Synthetic bookings to generate.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per approach.')
+    args = parser.parse_args()
+
+    database = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    database.close()
+    os.environ['DATABASE_URL'] = f'sqlite:///{database.name}'
+
+    from .main import create_app
+    from .models.roster import db, Roster
+    from .models.population import location_key
+    from .analytics_engine import ColumnarRoster
+
+    app = create_app()
+    try:
+        with app.app_context():
+            # Core insert skips the per-booking ORM listeners, which would dominate setup time
+            db.session.execute(Roster.__table__.insert(), build_rows(args.rows))
+            db.session.commit()
+            now = datetime.now()
+
+            engine = ColumnarRoster()
+            started = time.perf_counter()
+            engine.refresh()
+            print(f'Loaded {args.rows} bookings into columns in {(time.perf_counter() - started) * 1000:.0f} ms')
+
+            def columnar():
+                counts = engine.aggregate('count', 'jailLocation', now=now)
+                stays = engine.aggregate('avgStayDays', 'jailLocation', now=now)
+                return {row['group']: (row['count'], stays_row['value'])
+                        for row, stays_row in zip(counts, stays)}
+
+            def sql():
+                end = db.func.coalesce(Roster.release_date_time, now)
+                stay = db.func.julianday(end) - db.func.julianday(Roster.arrest_date_time)
+                rows = db.session.query(
+                    Roster.jail_location, db.func.count(Roster.id), db.func.avg(stay)
+                ).group_by(Roster.jail_location).all()
+                return {location_key(location): (count, round(avg, 3)) for location, count, avg in rows}
+
+            def python_loop():
+                totals = {}
+                for record in Roster.query.all():
+                    entry = totals.setdefault(location_key(record.jail_location), [0, 0.0])
+                    entry[0] += 1
+                    end = record.release_date_time or now
+                    entry[1] += (end - record.arrest_date_time).total_seconds() / 86400
+                db.session.expunge_all()
+                return {location: (count, round(total / count, 3)) for location, (count, total) in totals.items()}
+
+            results = [
+                timed('columnar', columnar, args.repeat),
+                timed('sql', sql, args.repeat),
+                timed('python', python_loop, max(1, args.repeat // 5))
+            ]
+            for location in sorted(results[0]):
+                print(location, [result.get(location) for result in results])
+    finally:
+        os.unlink(database.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Bed-day billing for inmates housed at each location.
+A bed-day is one calendar day (midnight to midnight) during which a booking
+was in custody at any time. Monthly totals are summed from the cached daily
+population buckets; per-inmate detail lines split each booking's interval
+at midnight boundaries within the month.
+"""
+
+from datetime import datetime, timedelta
+from .models.roster import Roster
+from .models.population import population_series, booking_intervals, ALL_LOCATIONS
+
+
+def month_bounds(month):
+    """Start of a 'YYYY-MM' month and of the following month."""
+    start = datetime.strptime(month, '%Y-%m')
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start, end
+
+
+def bed_days_in_range(arrest, release, start, end, now):
+    """(first day, last day, bed-days) of a booking within [start, end), or None if it was not in custody."""
+    begin = max(arrest, start)
+    finish = min(release or now, end)
+    if finish <= begin:
+        return None
+    first_day = begin.date()
+    # A release exactly at midnight does not bill the day that starts then
+    last_day = (finish - timedelta(microseconds=1)).date()
+    return first_day, last_day, (last_day - first_day).days + 1
+
+
+def monthly_totals(month, now=None):
+    """Bed-days per location for a month, from the daily population buckets."""
+    now = now or datetime.now()
+    start, end = month_bounds(month)
+    totals = {}
+    for stats in population_series(start, end, 'day', now=now).values():
+        for location, (_, _, _, _, bed_days) in stats.items():
+            if location != ALL_LOCATIONS:
+                totals[location] = totals.get(location, 0) + bed_days
+    return totals
+
+
+def monthly_details(month, jail_location=None, now=None):
+    """Per-inmate bed-day lines for a month, sorted by location then name."""
+    now = now or datetime.now()
+    start, end = month_bounds(month)
+    lines = []
+    for arrest, release, location, record_id, name in booking_intervals(start, end, Roster.id, Roster.name):
+        if jail_location and location != jail_location:
+            continue
+        billed = bed_days_in_range(arrest, release, start, end, now)
+        if billed is None:
+            continue
+        first_day, last_day, bed_days = billed
+        lines.append({
+            'id': record_id,
+            'name': name,
+            'jailLocation': location,
+            'arrestDateTime': arrest.isoformat(),
+            'releaseDateTime': release.isoformat() if release else '',
+            'firstDay': first_day.isoformat(),
+            'lastDay': last_day.isoformat(),
+            'bedDays': bed_days
+        })
+    lines.sort(key=lambda line: (line['jailLocation'], line['name'], line['firstDay']))
+    return lines
+
+
+def billing_report(month, jail_location=None, now=None):
+    """Monthly bed-day totals with detail lines, optionally for one location."""
+    totals = monthly_totals(month, now)
+    if jail_location:
+        totals = {jail_location: totals.get(jail_location, 0)}
+    return {
+        'month': month,
+        'locations': [
+            {'jailLocation': location, 'bedDays': bed_days}
+            for location, bed_days in sorted(totals.items())
+        ],
+        'totalBedDays': sum(totals.values()),
+        'details': monthly_details(month, jail_location, now)
+    }
@@ -0,0 +1,55 @@
+"""
+Reading bond amounts as officers type them.
+The bond column is free text: "$5,000", "5000 cash/surety", "$2,500 10%",
+"ROR", "No Bond". parse_bond() turns it into a kind and an amount, and
+raises ValueError for text that cannot be read, such as "5,0000", "TBD" or
+two amounts in one field.
+"""
+
+import re
+from decimal import Decimal
+
+RECOGNIZANCE = 'recognizance'
+NO_BOND = 'no_bond'
+AMOUNT = 'amount'
+
+_MONEY = re.compile(r'^\$?(\d{1,3}(?:,\d{3})+|\d+)(\.\d{1,2})?([kK])?$')
+_PERCENT = re.compile(r'^\d{1,3}%$')
+# O.R. must keep its periods, so a plain "or" ("cash or surety") is not read as recognizance
+_RECOGNIZANCE = re.compile(r'(?<!\w)(ror|r\.o\.r\.?|o\.r\.?|pr|recog|recognizance|personal bond|signature bond)(?!\w)')
+_NO_BOND = re.compile(r'\b(no bond|none|no bail|held without bond|hold without bond|denied|remanded)\b')
+
+
+def parse_bond(text):
+    """
+    Return (kind, amount) for a bond: kind is 'amount', 'recognizance',
+    'no_bond' or '' when blank; amount is a Decimal for 'amount', else None.
+    """
+    text = (text or '').strip()
+    if not text:
+        return '', None
+
+    amounts = []
+    for token in re.split(r'[\s/+()]+', text):
+        token = token.strip('.,;:')
+        if not token or not any(ch.isdigit() for ch in token) or _PERCENT.match(token):
+            continue
+        match = _MONEY.match(token)
+        if not match:
+            raise ValueError(f'Unreadable bond amount: {token}')
+        amount = Decimal(match.group(1).replace(',', '') + (match.group(2) or ''))
+        if match.group(3):
+            amount *= 1000
+        amounts.append(amount)
+
+    if len(amounts) > 1:
+        raise ValueError('More than one bond amount')
+    if amounts:
+        return AMOUNT, amounts[0]
+
+    lowered = ' '.join(text.lower().split())
+    if _NO_BOND.search(lowered):
+        return NO_BOND, None
+    if _RECOGNIZANCE.search(lowered):
+        return RECOGNIZANCE, None
+    raise ValueError(f'Unreadable bond: {text}')
@@ -0,0 +1,96 @@
+"""
+Incidents (cases) and the co-defendants booked on them.
+Bookings from the same incident share an OCA number or a court case/ticket
+number. Both columns are indexed, so a case is gathered with index probes:
+the bookings carrying the requested number, then any others sharing an OCA
+or case number with those.
+"""
+
+from datetime import date
+from sqlalchemy.orm import selectinload
+from .models.roster import db, Roster
+
+
+def case_key(record):
+    """The number a booking is grouped under: its OCA number, else its court case/ticket."""
+    return record.oca_number or record.court_case_ticket or None
+
+
+def case_bookings(number):
+    """Every booking tied to an incident number, arrest order."""
+    def lookup(ocas, tickets):
+        conditions = []
+        if ocas:
+            conditions.append(Roster.oca_number.in_(ocas))
+        if tickets:
+            conditions.append(Roster.court_case_ticket.in_(tickets))
+        return Roster.query.options(selectinload(Roster.charge_items)).filter(
+            db.or_(*conditions)
+        ).order_by(Roster.arrest_date_time, Roster.id).all()
+
+    number = (number or '').strip()
+    if not number:
+        return []
+    bookings = lookup({number}, {number})
+    ocas = {record.oca_number for record in bookings if record.oca_number}
+    tickets = {record.court_case_ticket for record in bookings if record.court_case_ticket}
+    if ocas - {number} or tickets - {number}:
+        bookings = lookup(ocas, tickets)
+    return bookings
+
+
+def case_summary(bookings, today=None):
+    """Aggregate status of a case's bookings."""
+    today = today or date.today()
+    active = [record for record in bookings if record.release_date_time is None]
+    upcoming = [record.court_date for record in active if record.court_date and record.court_date >= today]
+    return {
+        'bookings': len(bookings),
+        'inCustody': len(active),
+        'released': len(bookings) - len(active),
+        'nextCourtDate': min(upcoming).isoformat() if upcoming else ''
+    }
+
+
+def group_by_case(records, today=None):
+    """Group already-loaded bookings by case key; bookings without one are grouped under ''."""
+    groups = {}
+    for record in records:
+        groups.setdefault(case_key(record) or '', []).append(record)
+    return [
+        {'case': key, **case_summary(bookings, today), 'records': [record.to_dict() for record in bookings]}
+        for key, bookings in groups.items()
+    ]
+
+
+def list_cases(min_bookings=2, status=None, today=None, limit=500):
+    """
+    Cases with at least min_bookings bookings, from one grouped query.
+    Bookings are grouped under case_key(), so unlike case_bookings() a
+    ticket-only booking is not merged into the OCA it is linked to.
+    status='active' keeps only cases with someone still in custody.
+    """
+    today = today or date.today()
+    key = db.func.coalesce(db.func.nullif(Roster.oca_number, ''), db.func.nullif(Roster.court_case_ticket, ''))
+    active = Roster.release_date_time.is_(None)
+    in_custody = db.func.sum(db.case((active, 1), else_=0))
+    next_court_date = db.func.min(db.case((db.and_(active, Roster.court_date >= today), Roster.court_date)))
+
+    query = db.session.query(
+        key, db.func.count(Roster.id), in_custody, next_court_date
+    ).filter(key.isnot(None)).group_by(key).having(db.func.count(Roster.id) >= min_bookings)
+    if status == 'active':
+        query = query.having(in_custody > 0)
+
+    cases = []
+    for number, bookings, custody, court_date in query.order_by(key).limit(limit).all():
+        if isinstance(court_date, str):  # SQLite returns MIN() over dates as text
+            court_date = date.fromisoformat(court_date)
+        cases.append({
+            'case': number,
+            'bookings': bookings,
+            'inCustody': custody or 0,
+            'released': bookings - (custody or 0),
+            'nextCourtDate': court_date.isoformat() if court_date else ''
+        })
+    return cases
@@ -0,0 +1,193 @@
+"""
+Flask CLI commands for maintenance jobs.
+Run with: flask --app api.index <command>
+"""
+
+import click
+import json
+import time
+from datetime import date, timedelta
+from .models.roster import Roster
+from .models.person import link_unassigned_bookings
+from .migrations import backfill_ssn_protection, rekey_ssns, backfill_charges, backfill_holds
+from .models.housing import rebuild_occupancy
+from .models.court import precompute_manifests
+from .models.deadline import check_deadlines, DEFAULT_DEADLINE_HOURS
+from .models.snapshot import take_missing_snapshots
+from .models.reminder import send_due_reminders, schedule_existing_reminders, reminder_recipients, REMINDER_BATCH_SIZE
+from .mailer import send_email
+from .models.ledger import verify_ledger
+from .models.consistency import scan, SCAN_CHUNK_SIZE
+from .models.archive import archive_released, restore_booking, RETENTION_YEARS, ARCHIVE_BATCH_SIZE
+from .warrant_match import read_entries, read_csv, match_list, RECENT_DAYS, MIN_SCORE
+
+
+def register_commands(app):
+    """Register maintenance commands on the Flask CLI."""
+
+    @app.cli.command('link-persons')
+    @click.option('--chunk-size', default=500, show_default=True, help='Bookings processed per transaction.')
+    def link_persons_command(chunk_size):
+        """Link bookings without a person to the person master index."""
+        linked = link_unassigned_bookings(chunk_size=chunk_size)
+        click.echo(f'Linked {linked} bookings')
+
+    @app.cli.command('protect-ssns')
+    @click.option('--chunk-size', default=500, show_default=True, help='Rows encrypted per transaction.')
+    def protect_ssns_command(chunk_size):
+        """Encrypt legacy plaintext SSNs and build their blind index."""
+        updated = backfill_ssn_protection(chunk_size=chunk_size)
+        click.echo(f'Protected SSNs for {updated} records')
+
+    @app.cli.command('rekey-ssns')
+    @click.option('--old-secret-key', envvar='OLD_SECRET_KEY', required=True,
+                  help='The SECRET_KEY the SSN keys were derived from (or set OLD_SECRET_KEY).')
+    @click.option('--chunk-size', default=500, show_default=True, help='Rows re-keyed per transaction.')
+    def rekey_ssns_command(old_secret_key, chunk_size):
+        """Move SSNs encrypted with keys derived from SECRET_KEY to SSN_ENCRYPTION_KEY and SSN_INDEX_KEY."""
+        updated = rekey_ssns(old_secret_key, chunk_size=chunk_size)
+        click.echo(f'Re-keyed SSNs for {updated} records')
+
+    @app.cli.command('parse-charges')
+    @click.option('--chunk-size', default=500, show_default=True, help='Rows parsed per transaction.')
+    @click.option('--reparse', is_flag=True, help='Re-parse records that already have charge rows.')
+    def parse_charges_command(chunk_size, reparse):
+        """Populate the charges table from existing free-text charges."""
+        updated = backfill_charges(chunk_size=chunk_size, reparse=reparse)
+        click.echo(f'Parsed charges for {updated} records')
+
+    @app.cli.command('extract-holds')
+    @click.option('--chunk-size', default=500, show_default=True, help='Rows processed per transaction.')
+    @click.option('--recheck', is_flag=True, help='Re-parse records already flagged as holds.')
+    def extract_holds_command(chunk_size, recheck):
+        """Populate the hold fields from existing holders notes."""
+        updated = backfill_holds(chunk_size=chunk_size, recheck=recheck)
+        click.echo(f'Extracted holds for {updated} records')
+
+    @app.cli.command('rebuild-occupancy')
+    def rebuild_occupancy_command():
+        """Recompute cell occupancy counters from active bookings."""
+        rebuild_occupancy()
+        click.echo('Rebuilt cell occupancy')
+
+    @app.cli.command('precompute-court-manifests')
+    @click.option('--days', default=7, show_default=True, help='Number of days ahead to build.')
+    def precompute_court_manifests_command(days):
+        """Build and cache transport manifests for upcoming court days."""
+        start = date.today()
+        built = precompute_manifests(start, start + timedelta(days=days))
+        click.echo(f'Cached manifests for {len(built)} court days')
+
+    @app.cli.command('check-deadlines')
+    @click.option('--hours', default=DEFAULT_DEADLINE_HOURS, show_default=True, help='Hours allowed from arrest to first court date.')
+    def check_deadlines_command(hours):
+        """Record alerts for inmates past their initial-appearance deadline. Meant to run from cron."""
+        opened, resolved = check_deadlines(hours)
+        click.echo(f'Opened {opened} alerts, resolved {resolved}')
+
+    @app.cli.command('refresh-day-numbers')
+    @click.option('--all', 'include_released', is_flag=True, help='Also recompute released bookings.')
+    def refresh_day_numbers_command(include_released):
+        """Recompute the legacy day_number/total_number columns. Meant to run nightly from cron."""
+        updated = Roster.refresh_custody_counts(include_released=include_released)
+        click.echo(f'Updated day numbers for {updated} bookings')
+
+    @app.cli.command('snapshot-roster')
+    def snapshot_roster_command():
+        """Snapshot the roster for each day through yesterday not yet snapshotted. Meant to run from cron just after midnight."""
+        built = take_missing_snapshots()
+        for snapshot in built:
+            click.echo(f'Snapshot {snapshot.snapshot_date.isoformat()}: {snapshot.booking_count} bookings')
+        click.echo(f'Built {len(built)} snapshots')
+
+    @app.cli.command('schedule-court-reminders')
+    def schedule_court_reminders_command():
+        """Queue reminders for existing bookings with upcoming court dates."""
+        queued = schedule_existing_reminders()
+        click.echo(f'Queued {queued} court date reminders')
+
+    @app.cli.command('send-court-reminders')
+    @click.option('--batch-size', default=REMINDER_BATCH_SIZE, show_default=True, help='Reminders per email.')
+    def send_court_reminders_command(batch_size):
+        """Email court date reminders that are due. Meant to run from cron every few minutes."""
+        recipients = reminder_recipients()
+        if not recipients:
+            raise click.ClickException('COURT_REMINDER_EMAIL is not set')
+        sent = send_due_reminders(
+            lambda subject, html_content: send_email(recipients, subject, html_content),
+            batch_size=batch_size
+        )
+        click.echo(f'Sent {sent} court date reminders')
+
+    @app.cli.command('match-warrants')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--recent-days', default=RECENT_DAYS, show_default=True, help='Also match bookings released this many days back.')
+    @click.option('--min-score', default=MIN_SCORE, show_default=True, help='Lowest score reported as a candidate.')
+    @click.option('--output', type=click.Path(dir_okay=False), help='Write matches as JSON here instead of stdout.')
+    def match_warrants_command(path, recent_days, min_score, output):
+        """Match a CSV or JSON wanted-persons list against active and recent bookings."""
+        with open(path, encoding='utf-8-sig') as handle:
+            text = handle.read()
+        entries = read_entries(json.loads(text)) if path.lower().endswith('.json') else read_csv(text)
+
+        started = time.perf_counter()
+        results, searched = match_list(entries, recent_days=recent_days, min_score=min_score)
+        report = json.dumps(results, indent=2)
+        if output:
+            with open(output, 'w', encoding='utf-8') as handle:
+                handle.write(report)
+        else:
+            click.echo(report)
+        click.echo(
+            f'Matched {len(results)} of {len(entries)} entries against {searched} bookings '
+            f'in {time.perf_counter() - started:.1f}s', err=True
+        )
+
+    @app.cli.command('verify-ledger')
+    @click.option('--chunk-size', default=1000, show_default=True, help='Rows read per query.')
+    def verify_ledger_command(chunk_size):
+        """Check the roster hash chain and Merkle tree against the stored bookings."""
+        report = verify_ledger(chunk_size)
+        for error in report['errors']:
+            click.echo(error, err=True)
+        click.echo(f"Checked {report['changes']} changes and {report['records']} bookings; root {report['root']}")
+        if report['errors']:
+            raise click.ClickException(f"{len(report['errors'])} ledger problems found")
+
+    @app.cli.command('scan-consistency')
+    @click.option('--chunk-size', default=SCAN_CHUNK_SIZE, show_default=True, help='Bookings checked per transaction.')
+    @click.option('--pause', default=0.0, show_default=True, help='Seconds to sleep between chunks.')
+    @click.option('--watch', default=0, show_default=True, help='Keep scanning, starting a new pass this many seconds after each one.')
+    def scan_consistency_command(chunk_size, pause, watch):
+        """Check bookings against the consistency rules, resuming from the checkpoint."""
+        while True:
+            result = scan(chunk_size, pause=pause)
+            click.echo(
+                f"Checked {result['scanned']} bookings: {result['opened']} new violations, "
+                f"{result['resolved']} resolved"
+            )
+            if not watch:
+                break
+            time.sleep(watch)
+
+    @app.cli.command('archive-roster')
+    @click.option('--years', default=RETENTION_YEARS, show_default=True, help='Archive bookings released more than this many years ago.')
+    @click.option('--batch-size', default=ARCHIVE_BATCH_SIZE, show_default=True, help='Bookings archived per transaction.')
+    @click.option('--max-batches', type=int, help='Stop after this many batches.')
+    @click.option('--pause', default=0.5, show_default=True, help='Seconds to sleep between batches.')
+    def archive_roster_command(years, batch_size, max_batches, pause):
+        """Move long-released bookings into the compressed archive."""
+        archived = archive_released(years, batch_size, max_batches, pause)
+        click.echo(f'Archived {archived} bookings')
+
+    @app.cli.command('restore-booking')
+    @click.argument('record_id')
+    def restore_booking_command(record_id):
+        """Move one archived booking back onto the roster."""
+        try:
+            record = restore_booking(record_id)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        if record is None:
+            raise click.ClickException(f'{record_id} is not archived')
+        click.echo(f'Restored {record.id} ({record.name})')
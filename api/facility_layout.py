@@ -0,0 +1,24 @@
+"""
+Facility layout used for housing assignment.
+Each location lists its cells with capacity and an optional sex restriction
+('M', 'F' or None). Cells typed on bookings that are not listed here are
+still tracked for occupancy but are never suggested.
+"""
+
+FACILITY_LAYOUT = {
+    'Solon': [
+        {'cell': 'SOL-1', 'capacity': 2, 'sex': 'M'},
+        {'cell': 'SOL-2', 'capacity': 2, 'sex': 'M'},
+        {'cell': 'SOL-3', 'capacity': 2, 'sex': 'M'},
+        {'cell': 'SOL-4', 'capacity': 2, 'sex': 'F'},
+    ],
+    'Main': [
+        {'cell': 'A-101', 'capacity': 2, 'sex': 'M'},
+        {'cell': 'A-102', 'capacity': 2, 'sex': 'M'},
+        {'cell': 'A-205', 'capacity': 2, 'sex': 'M'},
+        {'cell': 'B-103', 'capacity': 2, 'sex': 'F'},
+        {'cell': 'B-205', 'capacity': 2, 'sex': 'F'},
+        {'cell': 'C-301', 'capacity': 1, 'sex': None},
+        {'cell': 'C-302', 'capacity': 1, 'sex': None},
+    ],
+}
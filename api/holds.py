@@ -0,0 +1,94 @@
+"""
+Rule set for holds and detainers written in a booking's holders notes.
+Officers type free text such as "Federal Hold", "Hold for Cuyahoga County"
+or "ICE detainer"; parse_holds() turns it into a hold flag, a hold type and
+the holding agency so they can be stored in indexed columns. A hold word
+alone is not enough: the notes must also name a hold type or agency, or say
+"detainer", so "hold until bond posted" is not a hold.
+"""
+
+import re
+
+# Hold types, checked in order; the first rule that matches names the type
+HOLD_TYPE_RULES = [
+    ('immigration', re.compile(r'\b(ice|immigration|i-?247|ero|dhs)\b')),
+    ('federal', re.compile(r'\b(federal|fed|u\.?\s?s\.? marshals?|usms|usm|fbi|dea|atf)\b')),
+    ('parole', re.compile(r'\b(parole|apa|odrc|probation|ppo)\b')),
+    ('county', re.compile(r'\b(county|sheriff|so)\b|\bco\.')),
+    ('municipal', re.compile(r'\b(municipal|muni|city|village|pd|police)\b')),
+]
+
+# Agencies recognized by name or abbreviation
+AGENCY_ALIASES = [
+    (re.compile(r'\b(ice|immigration and customs enforcement|i-?247|ero)\b'), 'ICE'),
+    (re.compile(r'\b(u\.?\s?s\.? marshals?( service)?|usms|usm)\b'), 'U.S. Marshals'),
+    (re.compile(r'\bfbi\b'), 'FBI'),
+    (re.compile(r'\bdea\b'), 'DEA'),
+    (re.compile(r'\batf\b'), 'ATF'),
+    (re.compile(r'\b(apa|adult parole authority)\b'), 'Adult Parole Authority'),
+    (re.compile(r'\bodrc\b'), 'ODRC'),
+]
+
+# Abbreviations kept in capitals when an agency name is tidied up
+_ABBREVIATIONS = {'pd', 'so', 'sd', 'fbi', 'dea', 'atf', 'ice'}
+
+_HOLD_WORDS = re.compile(r'\b(holds?|detainers?|warrants?)\b')
+_DETAINER = re.compile(r'\bdetainers?\b')
+_NEGATED = re.compile(
+    r'\b(no|none|without)\s+(active\s+)?(holds?|holders?|detainers?|warrants?)\b'
+    r'|\b(holds?|detainers?|warrants?)\s+(lifted|released|cleared|dropped|removed|recalled|satisfied)\b'
+)
+_EXPLICIT_AGENCY = re.compile(
+    r'\b(?:holds?|detainers?|warrants?)\s+(?:for|by|from|out of|with)\s+(?:the\s+)?'
+    r'([a-z][a-z .\'&-]*?)(?=\s*(?:[,;:()/]|\.(?:\s|$)|$|\b(?:on|re|until|per|pending|case|warrant|hold)\b))'
+)
+_COUNTY = re.compile(r'\b([a-z]+)\s+(?:county|co\.)(?!\w)')
+
+
+def _title(name):
+    words = []
+    for position, word in enumerate(name.split()):
+        if word in _ABBREVIATIONS:
+            words.append(word.upper())
+        elif word in ('of', 'and') and position:
+            words.append(word)
+        else:
+            words.append(word.capitalize())
+    return ' '.join(words)
+
+
+def _agency(text):
+    """The holding agency named in lowercase notes, or None."""
+    for pattern, agency in AGENCY_ALIASES:
+        if pattern.search(text):
+            return agency
+    county = _COUNTY.search(text)
+    if county:
+        return f'{county.group(1).capitalize()} County'
+    explicit = _EXPLICIT_AGENCY.search(text)
+    if explicit:
+        name = explicit.group(1).strip(' .-')
+        return _title(name)[:100] if name else None
+    return None
+
+
+def parse_holds(notes):
+    """
+    Extract the hold on a booking from its holders notes.
+    Returns (has_hold, hold_type, holding_agency); the type and agency are
+    None when the notes do not say, and at least one of them is known unless
+    the notes mention a detainer.
+    """
+    text = _NEGATED.sub(' ', (notes or '').lower())
+    if not _HOLD_WORDS.search(text):
+        return False, None, None
+
+    hold_type = None
+    for name, pattern in HOLD_TYPE_RULES:
+        if pattern.search(text):
+            hold_type = name
+            break
+    agency = _agency(text)
+    if hold_type is None and agency is None and not _DETAINER.search(text):
+        return False, None, None
+    return True, hold_type, agency
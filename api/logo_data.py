@@ -1,3 +0,0 @@
-"""SHPD Logo as base64 for PDF generation"""
-
-LOGO_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAADhu0lEQVR4nOyddZhlR7X2f1Vbjkt790iPJhN3ISRYcLtwubgGCe5wscCHBHcCwSU4F7hcNEiQIAlxz0xmMtI91nr6uG2p+v6ofU53zwxJSCBhmnmfp6en+5w+26pWrVrrXe+CQziEQziEQziEQziEQziEQziEQziEQziEQziEQziEQziEQziEQziEQ1hiEPf1CRzCvYejjjrKLZVKtpRS7/uaUkrk8/lg48aN3n1xbodw3+CQATgYcPLJznB5Tz6pkj34flYLuwfFkJY6pbUeBBlXWg0LoS2lxKCGmABLKQajma4FaK3IK3RcINS+h9BoKQRtKURRm3EhAKRkGgiE0KEUclIoHWqpJ9G0pZDTWuuKFHJGIIra1hWgZFlWaevWre178Q4dwt3EIQNwH2PFihWJeDzeF4bhMkJGNXq51mKlUuEKLeQypXSvVrpfaXJKE0cLNKAx/4joCUoBCIEjQUrzu7griP6L0pCMCWK2AL2fA4AQ4AVQ98xrIjpGy9OgBQqNH5rfKWXeozUgNCIaRkJqBHiWECVLMiuELCL1HqGZEELvFIi9WuqdlmXtrtfrhampqfo/5aYewl3GIQNwL+Dkk092isXiiFJqrdBivQ71YSH6cKVYozTLQqXzWgtHaTOppABLChwLYo4gGRNk4pJsQpBPSnrSNpmEIJ+y6E3buA70ZyxsC/JJi7hjHmtvxsKK5rsCUjFJ3JUHmv8IwAs0tVZIZEtQGgo1BRr8UDNXCwmVZqYS4gVQqAZUm4pyI2SuHlKuKypNRbUJjbaiHWi8AEKlI2Nhrk2gQ0uKomUxKRDbpWSbgC1SyK3YbJFSTh3yIO4dHDIA/2CsXLlymSOctRp9okIdq0KOCjVrg1APKy2EVgKExpKQcCXZBPSmLIZyNiO9FsN5h5G8xXDepj9rJnsuKUnHJTFXgA1YwsxQsWAmd/6rFvywr6OvOeDq30Vn5i+E7PgCnf+zeNRozAYjVBCA52uqLUW5rijXQ2arIROlgMliyGQpYKIYMFUOKFQV5Yai7Wt8Y2OQaGP8LDFtSbZbUmwEfastuUFb1tbt27fvvIuP4RDuIg4ZgHuA9cvXrwhleJQW+uRQ6VOUEseGSq8NFZbSIBDEHMglJf0ZyaoBm9UDLqsGHFYNOKzssxnIWeQSFlYMcMT8E9E68rej5VtBx/fXWne3AHrB2+8tiIV2QHTshpiPHEg6S735f+c1BQQa1daUG5rpcsDeYsD4jM/4jM+OaZ+dsz6zFUWpoWj5GtXxiITWlsW4FPImW4prhFTXYVk3HzIK9wyHDMBdxYOx14yvOQrFaUrz4CBUJ4Wh3hCEQioNloRMXDKQlawbcjhsmcsRy2McNmwmem/Gwk5IsJjfYId60QTXWnfn/cLJfTCjM8BEx2npGAMpzL2Qgm6gIgDV0szVAnYXQm6f9Lhtt8ftEx7bJj2mKyGVJgQq8hSk1o4tt0rJdTb6T2BdFc/EbzqUybjrOGQA7gBrV6w9Vkl1tlY8KFDcLwj1SBC51SkXRnpsjlge4+iVMY4ddTl8mcuyXpt4SoIdLXmh+WYmuwmg3Zknfk+w0IPv7BJ0ZHGEuOMHbs5r4Qfoxef5TzJKC20CVmQQLDHvRQTgNRQTxYAtez1u3tnm1l1tNu322FsMqbdBo7EEOBYztsWVQoo/20L/duv4+A3svxk6hAiHDMACrF+/fiD0wgdr9OOCUD/YDxkNQhPjziVh3ZDDsaNxTl0f47hVcdYM2cTTtlnJtDaTPDCrulLzXvzdRderjlZPFrrZIpooC3+G/ffngHlj5G3c0QkJsWDPHxmwrkXZZ7/RSUWofX7ueDH/AE+me5kdw2AJY1glEIBfD9k+HXLLzjZXbW1y83iLbZM+xbrZOtgWOBZ7bUv8SQhxsZb6krGxscm7eTpLEv/2BmDt2rWjhDwuCPWT/DA80w9FXClIxwRrh2zud1iC0w9PcNKaGKODDsQliGhl982kV9Hc+nvRmdhy4b6589XNxBN5EECg8XxNo61peopaS1NpBLR8TbGm8AJNuR5SaymkFEyVfNq+QkqQUlCshlRbIXLfQB+gtCYVk/RlbDTGgNmWYCjvApqEK+hN29iWoC8tcR2ThUjFJMmYJOGKKEjZce2jD+4aioXbHWMkOlmPu3PfrI5RsKMvgBbsmfG5YazFFVuaXHF7i20TPuWW2TI4lg5cW14mLf0zads/2bZt29a//+hLC/+WBmDgqKPS2VrzSYHWL/AD/SAvMGN0OCs4aW2cBx2d4gFHJjl8mQPJaPX0zequlEaru76q7beK7eveaqLAGCadVguZqSgmSwHTJZ+pss9UKWS2ElCoBpTqPtVGQMtTNNohbV8Thho/VN3gYGdSCSnNAh79bNkWlpToA/IABEopgiCcP3ENSqnuDzLaw9u2xJIQtyXxuBVlM2xyKYe+jE1f1mQ1hvI2g3mH4bzNQMaiL2ORS1lYrgBn/hgo3d0idb0n/j7jIAXIhQZBAC3Yttfjstua/HFjnau3tpgoKTSCmK1xLHG5ZfNNBd8bGxsr3fWjLR38WxmADatWrfGRb/QD9cy2L/Kh0oz0WNx/Q5zHnZzmrCOS9PRZZgAFCjyFCu/66t6Z6KIT4Oq4rQABhC3NXDVkz1zAroLP2JTH2IzHrlmPPQWPmYpPuR7QaAW0PUWoNUIILMvCcWziMZdE3CWZSJJIxEmlkqTTaeLxGJlMFtdxSKVTJJIJtFLk83lsx0ErYxwy2Ryu66L1/ltiKSWtVptqtYIUEiEEQRhQKpUQCNrtNtVKlSAMKJfLtNse1VqNRr1Bo9mi2WjQbLdptTw8PyAMQ9AaIQUxW5KK2+RSFn1Zh+G8y8oBl7WDLmuGXFb2uyzrsejPRoFSOzopFW2pQtBK32WPoRNPEJYwmRVHQCioFAOu2Nzk59fW+PPGJrvnQoQQxBxdc23xQ2z58e3bt99815720sC/hQFYs2bNcVrpt/iefkbDg6QLZxwe52n3z/Lw41Pk+m0TLfMU+JrwLqzw3ZXdiia7Lc2o00BTM1sJGJv22TrpsWVvm817moxPBUwUWxSqHo12SBhqpCWJuQ7pVIJsNk0+l6Onp4e+vh76+vro6e0jn8+TyWTIZDIkEgni8TiO6+K4LtIyq7qU0jDyFsUAFl+F6mzOD/jYjbERC7YHGhb9bPbzGqUUWinCMMT3fTzPo9Vq0Ww2qFdrVKpVyqUSc3NzFAoF5uaKFItFiqUylUqVWr1Bqx2gwgDLkiRci96Mw0hvjFUDMQ5fHufwZS7rh2OsHnIYylmQEPPspPDv88YEhh0pbGFI0khqcwG/v7nB9y+r8KfbmtRakIgJYjY/wRLv37Fjx1V38rFLAkvaAKxdu/ZYHYT/rx2IJzfa0J+CJ56e5kUPzbNhbRxsDW2F9ufdzr+F7iDab9+pmZoL2TbpccuuFjePtbhlV5PxqRaFike9HaC1IObaZNJJenvyDA8NMjg0xMjIMEPDQ/T19dPb10s2kyWeSOC4LpZlIUVE+9UarZQZ8Hr+u0kb6q5Lv69rrztRuLuJ/QyKYJ72GxmLzpeUEiEkUopo62HeqbXuGopms0mtWmWuUKBQKDA1NcnE5CTTU9NMTk1TKBSp1hq0PB+BJuHa9GZdVg/GOGpFgmNXJzhmNMZhIy4jvQ7EozRHaLZoOrzz5wgmZStsYeI5IewY9/jqH0r88K9VJkuaZEwQt/mltsW7lrohWJIGYP3o6NFKiHe3ffFf9ZZmOCd46plZXvbIHoZX2MatbGmC8I6HitlXAo40K7yGoKbYOulxw44W125rcsOOBlv3tpgpt2i0QyzLIp2KM9Dfw8jIMKMrV7Jq1SqWL1/OwOAguXyeVCqF4zgIIbsrahiGqDA0q+uCiW3m8N83iReu2uIAAb8D/e5AcYGFvzvQ63d8EsZY7Gsk5j0WC6RAK0XgBzQadcrlEjMzM0zs2cvO8XHGd+5kYmKSqZk5qrUGYRgSdy36czHWDyc4fk2Sk9cnOGF1nMNHYrgZCXLeIKjIINwRbCvyChxBcTLk878p8p2/VNg9p0jFBK7Dryz027aOj1//992AgwNLygCsX78+q4PwfM/Xr640Nf0ZePFD85z78B56hm2zp2+pO9zTW/u4ijQUW/Z4XLW1yeWbG1y3rc7WvQ1KNQ8NZNJJBvt7GR1dwfr161mzdg3Lli1ncHCQdCaD68YQAsIFkzwMw/1W7wOhM1EXfped1VVKpBDdVReEiT0s+gAOGMAIww6tcB7SsvYfDJ3jLni3jrYRquOVaI1e5JmYsP/f8kr2vb6ucbAsrM6XlGjA9zxqtRoz09NM7N3Ljh072Lr1dsbHd0VGoY7WkE06rB9JcuK6FGdsSHLaYQmOXO4i01EqItraBXdgDKQAGZMQk9QLIV/7fYkLf1Vkb1GRTUpcW3zFjjlv2bJly+zf/pSDD0vGAKxbvfppQcjnai3RE7cV5zw4y6se28vQCgdaCtX+2xPfkiAcAa4EJSjPBfx1c5M/3FLn8k01Nu2qMVf1kELQk0+zanQFhx22ng1HbGDt2nUMj4yQyWRwXBetjMsbBAFhGNzpRF+0Oi76shBy3o02EfoA3/Npe23a7TbNZoN2q029VsMPfKrlChpNuVzqGplSqYSOIvlC0P2dUgohBDoKNObzeaSU89sGIcjnc0hpIaUkl+tBCEE2m8VxHJKpJPF4gkQygevGiMViuK6LZdtYUnaNR+fcO95N5+vODETnnliWhWXb2JaNkILA96lWq0xPTbJ923Y2b97M7bffztj4buaKFUKlyacdDl+e4owj0px9bJozNyTp7bdMrMZXaM/EeQ58XEyWImFTmvT43K9KfPG3JSotQSaum44lX7V1fMdX7vLA/BfHQW8AVq9eHbfg6y1fPLXWCHjMSUne/dQBDtsQh7YibKm/6UHbNhA33Ny56YBLb63zs2uqXLapyvhkHT8IyWVTrBpdztFHH8lRRx/NYYcdztDwMMlUCoGJlAe+b1b3BQN7IRaudJ1VTlpWFLiDQCkCz6PZbFKv1SiXy5RLReaKc5SKRcqlEuVymWqlQq1Wpdls0m618DyPIAgIAt/wkEKTwuuswvM79n3OR3ZIBrr7XR/AOuruuj8fHLQsGaUCHWzbxnVdXDdGIpkgk86QzmTJ5nLke/Lk8z309PaSz+fJ5fKkMxni8QSu62BZlolvRJ5RuMBA/C2DudAo2LaNbZt0QbPZZGpykm1bt7Jx463ccstGxsZ3UyxXsKTFqsEEpx+R5fGnZDn72BSDw46JHbQUgf83DBBgxSUkLHZub/Oe78/woyvrJGIW8Zj+pRv3n3PbbXsKBx5ZBw8OagNw5JGrRtoN8edKU6zLJjQffOaAfspDcwI0qh4S6v0vUKCxHAkJCS344011vvuXMpfcUGZ8qgYahgZ6OeboIzjhxBM45tjjWLFylHQmDUDgB/iB313R9sXCiW7bNpZlm5UVje951Ot1yqUSs7MzTE9Nma/pSQqzBUqlYneCd4xKZx7Ijvvfcf07W4EFkft9v89fMwun8t9KAiyY8Ad4eZ8Ve1GcouP+K4XSat6YROfsODbxRIJ0OkMul6e3r4+hoWGGhocZGBxkYGCAXL6HVCqF67oIKU1cJAgIgnCRJ7Xf/ZYSS0ocx8F2HASCer3Gnt27ufWWm7nh+uu5+dZNTEwVUEqzcjDFQ4/L8bQzczzihBSkBTQVoXfgq5cCZNKILPzqsqp+49enxEQZ8kk9awkeePv4+Ka/edMOAhy0BuDwww/vD9vejYWaXnbKGoeLXrWc5atdqAb4gT7ghdmOgKSFrip+fGWVCy4u8NdNRdqez8hQLyefdAJn3P/+HHX0MYyMjGDbNn4Q4Hted4XaF53AVmdFkkISqJBmvc5cocDk5AS7d+1iz+5dTOzdy+zMDJVKmVarSRAEkQsuo5VNdl1uGdEE/9ak/leG7vB/tY6CnHre/e+s9FohEFi2MQ6ZTJb+/n6GR5axYuVKVqwcZXh4mN6+PtLpNJZlo3THKBiewXxacx7GO7FxHAfHcQjCkJnpaW7btJHL//IXrrn2enZPFLAti1MOz/LyR/fztDOzODkLmgHBAcqINOBYQNamtDfgnAv3cOnGNn0ZWXcFx9w2NjZ2L9zWfwoOnlG1D9auWvWzaks+7oz1Dj960wqsjCCohPu/MeKEk7agAd/4Q5kLfznLtbeXkEJz/DEbeNjDH8bp9zuDZcuXIy0Lr+3h+97+Lr0QSGEGreM42JaN1opGo8HMzDR7du9mfMcOxnZsZ/fuXcwVCjQadYIgAASWJbEte97932cF/3fCwmBixzAE0VYAwLYsEskUPb09LF++ktVrVrNqzVpWrhylf3CQVCqFFJIwDPB9v2tM9/USpLRwXIdYLIZWiqnJSa6+6kp+8+tfc8NNm2j7muPX5nnxI/s492E57JyEmjKLyAFiqlbagrbm6R/bw+9vaZNO8Ncd42P3v5du2z8cB+XIW7NmzQbP07flk4K/vGcV+SELvxzu98C0BicpwZFccnmN838ww59vmSVmw6knH8d/PulJnHra6aTSGdrtFu22h1KLjcjCFcV2HFQYUqlU2LN7F9u3bWPL5tsYHxtjemqSer1OGAZIIY37b9vdoN6/4yS/u+gGDpUiDM2Kr5RCSkkymWZwcJDR1as5fMMRrF23nhWjK8nl8tiWdYcem5QS13WJx+M0mg2uv/ZafvJ//8flV15Lsxly6hG9nPeUIZ7wwAwohd9Q+00QrcFJS4I6nHXeOLvmFI6r7j8+Pv7Xe+8O/eNwUI7K1StXv7Ta4nMvfEiGD718CF0OOFBK305b1EuKN359iq9eMk3gt7nfKcfy1Kc/ndPudwauG6PRqOP7/qK/k1JiOw6u6yKFoF6vs3vXLjZtvJWNt9zMjh3bmZ2epu21ERgDYTuOWdn/TVf0fzY6q7vJsPgEvlnx3ZhLb18/a9as46ijj+bIY45h5cpRMpkMWms8z8P3/f2MgW2bTEYYhlx3zdX84H/+h79cfjVKuDz9gf188vnD9I/YhJVwv9iAFCDzNh+4aIaP/qxMLiXesWN8x3vvvbvxj4N952/514OCDQLN0Stjphpvn9e1BidnsWeXzxM/uItrNs2wamU/5zz/VTziUY8mFo9Tr9VoNpvdvxFCYDsO8VgcBBRmZ7h982auu+5aNt5yC5MTe2k2GggpcBwXx7ZxY7FDk/1ewsJ0qeM4kJj3FIqFAlOTk1x+2Z9JxOMMDY9wxNFHc9LJp3DEkUfR19+PEIJ2q4Xv+2itCQKfSrmMZVmcevr9OPHkU/j9Jb/hoq9+hW//dhfXbW/xf28aZcOGGEE5WHQuSoMMNMesjGFJCEN1xH10W+4xDkoDoDWDliUY6bUiJZ3FrztJydTegMe9byc3bJnl7Aedyqtf/wZWrVpDNeKpdyCEIB6PE4vFKJfLXH7N1Vz+lz9z6803Mzs7g1JhFFByyWSzhyb8vxAWplVj8XjXQ9i7dw/j4zu45FcX09vXz5FHHc2ZZz2A4044kZ7eXlO70Gx2318pl7Ftm0c/7vGceNLJfPbTF/DzX/+Bx39AcfHbV7N+lUPQ2GeZUZrhvIVrg9KM3Dd34J7joDQAUWUq1sJa1wi2JUALXvOVKW7YMsd/PO5s3vL2d2DbNnNz82lbrTWuGyOVSrJ7925+d8mv+fOlf2DPnt1opYnFYySTSWRHY/sgwjx9WCySD78j26W1kdrqcPi7JcwHETrxGtu2SSQSKKWoVsr8+Y+X8uc//oHh4RHOfOCDePgjHsXqNWtpNBq02y1T+RgEFOfm6O3v5/+d/15y+Y/w7e/9jJd/cYLfvHMU24ZgoSOgwbEE0tQn3f2Ci/sYB6cBEFqDMGmgfcMYruD28Ta/ub7AERtW8qrXvh5L2lTKle7qrbUmmUqhwpBvXvQ1fvrjH1EqlYjHY6RS6X/JSd8R0ADDXDwQBIJAacr1AFP1Lrt/nIwb4Y4DSoILI93t+dpQlqMRnU/ZWHKxh1VrKYLQFEYZ7RJBImaO1BEHujPpsXsLUkpisTixWBylFHNzBX7w3W/zq1/8jEc/9j946jOfRTqToVatdsdGrVollUrxkpe/kk23beEvt27nqi0DnHZMgn25xAu4U4cMwL2LRTWvi1+y4PYJj1rD4+HHHUtvby+Vyj6TP5miVq3ywfedz7VXX0kmnSWfz9+n7n1XxGPBKQhhGnPUWmbgCcC1IZ2wDvgZXqhJuZonn50jn7aJO4JMQjKQtfnOn0r8eXOLdHx/61FpKM7cEOedTx1grhrS8BQzlZBP/HyOYl3hRpWP1VbIUctdhvMOxVpA0zNMq+lyiBeCH2gqDWXotNL0NrAtYf4vBELOl1Hf25BSEo8niMcTeO023/nW17nxhut4y9vfyeDgELVatRtnaDab5PN5TjrxJG64aTNb9nqcdnyS/f3NA/3i4MLBaQC0Wdpkl9JqYAaWYK4aohT09PQS7pPLdxwHpUI+9uEPcs1VV9DfP3CfTHwhoO1r2oGpWgtCjesIskmrawy8QDPaZ3HC2hQrem2OXB6n6Sne/t1pAi1wrMXnXW+GnLYuyUdevRxUJFsGkJG4Fvz25j0kXLmfB+EHmmU9DseflIJ2aKofK5oLfzmHH2pijqBUV4z22fz8rStJ9drQCCFhc+OmJv/5kZ1UGnDaOpf/OiPHlgmPXTM+kyWf2UpIualotMJ5/X8hkFIYGTFHLNIPvDcehRuL0ef2s/GWW/jQ+97Dez/4EVzXXZQNCsOQnt68CQjXDI9jXwsgZPfHfz2X8S7ioDQAQuiK0oJKQ2FaU80PoDvzPRPJJL+++Bdc+dfL6evr/6dM/kUENQFS7H9iSmGagqQdRvI2hy9zmSgG/PrGOq5txlO5oTjnQTne/YoRaAXgStrTAe/90SylujbstAXHDJTm2FUx06SjGnQ1QC1fcr8NCYbzDtWWNsUunb/r3BdXQDNEN0KEq5kumhXekoKWb2i+F7xwOakBG6pBVEuvePt3p6g0IAgVJ61L8MJn9EM9BE8TthWluvEm9hYDds367Jr12TlrGoTsKfgUGxrbgkY7pNHSOLbAtSS2bTyIf5bHIISgt6+PW26+iV/+4mc85WnPJAgq81Tn+cd34FVemPEXao2UovaPP8N7BwelAQBRUEpTaYQsnFgdI5BNmlWuVqt1q9201kjLQoUhV13xVxzH+Yfv9b1A0/TmdQaE0GhlXN9UTBKLWnaFCqrNkPc8bYhnPSJv6tfzFlddXuOnV1expMS2jBu9Y8YzE6odQlNhS8Fg1ma26i26dqXNvvz4VTFQpvTVtqMIlafoG7A57bAEP7+2RtxdaDnMfUvFjX+uo/qJZtTaSwPFasDb/6ufM09Loss+IBCOxf/70hS/v6XBUM6hWFcs67GhHkAtBAGWLejrkfT1WRyxLhatk+accCWf+s4M7/x+gYQreMCRCY5fneDqrU12THnMVBUVzzxf2xLGMNgC+x/4yDoZoKuvvJL/eOKTkJZFuCDSV6vVQUA2eYAtl4BqUxGGYEt90BYFHZQGQCDmNJpCNNCEWLDiauhNW9i2oFQqo8J5aWspJc1mk5mZGZNL/oeci4kNleohmbjgzA1xTl6bYPWgQ8IV1JqKq7e1+OX1NUr1kHzKQgqzWldbyugOVEKoQk/aIhWXhFFw05aC3YUA3VSmgk9prLhkpMfm5p2LW+eFSpOJWxw9GodAY0vYNRuSS0oycUDCo09M8ZNrqt1uOwvRiQ3o6KKanmkGWqyGPPTYJG992gDUAwIlcPI2v7u8yqcvLtCXsaN7K1jZ74Ay90NrjRPrlFgzr+/XcYZcyWTJlCw32ponn5Hlqf/ZB4WAciVkx7TPxl1tbt7ZZtPuNjumPSaKIYGCXNL0QfxH9FawbYdScY5GvU4imSSE7oJRKpWwhDDXqPXiOI2AQs0UnFmWmLnnZ3Lf4OA0AFJPA8xWFOh9Sl6Vpi9jk3AsSqUSQeAjhaCjbWv4/f+YPhGdfXy1EfL0s7K84fF9rB91jeJt901wjhDs2O5x7mf3cv1Ym560hQS27PXAM6W4wlcMZCW5pMV0VeFiUpqzlYBSXdGTE6gApC1Y0ed03fvOtfuhZnW/zWi/YyZaTHLJDRWOXBHjjGMS4GseeFSSgYxF09fdBqKdObQoOCgEDU9Tqof0pAQXvmgYbIVXBTclKU+FvO5rkziORcwReIH5vBW9JikuADsmuXpzm5vGW2xY5jLSYzOQtcxqmpRgCcZmPDSCdAzWD7tQ8SHQ5DKCE3pjnHBU3JxPW1OpKW4aa/PV35f48VVVUgnTBPUfYQQg0kvsXr5AhSFzc3M4tqQ/ax1gGyCYqagobnHIANyrEIi9As1MJTAry8LgjNIM5SzyGYdCYY5GvUEylQTMqmTbzt9Uxv17EYRQa4a8/1mDvOwpfeBFrrqQRok20OhmCEKwZp3L/7xxOQ95xzgzNbO33lPwIYhWlGhl689aTJSM62tJEweYLgf09LpoX4PQjPbZUTENXQvgBZoNy1zclDAKOJbF9TtalBqKM05MQiNk2YjDSWvj/PamBvEFAQQhNOnEwvQDlBsmnfjpF65gdF2MsOjjOgKk5LVf3cOO6YChvG10CJRpizaUt+d7icQtfnxVlff/cJbBHpuUK8mlJAM5m9E+m+W9DlsnPWKOYCArWTPoGtWeSAXYdiKDFCl3ZNOCs05OctapaR56cZHXXzSFFHK/QOjfDa2NiIk1H3wVUtJut5memSWTtBnJ2yzkmhv6iWamHAUHNQdts5GDMnoplJgUAqZKIQR6cSBPQS5lMZh3KRbLlCslLMsMdq01lm0RTyT+fo27A6DcCHnq/bNm8tcDgroCRzK22+cHl1S45fY2Im6ZgHwpoG+Fy8sf1UuzHSKkYKIUELZC448rEDHBsh6bMEowSyloepq9c8G8z65hdMDuEFCi6zLz5PjViXmTHmq2TflcdltjvrGoDY88IU0YSWx3/lYK0358YeRr16zHMx+Q5zmPykMlGugZm6/+osgP/lqhPzu/doRK05OW9KYlhNHzCDRT5YBcxibhWgQapiqKG8fa/N9VVT71yzlmKobRtWrAoSdnQQCWBbaUXPTLEv9zSZntOwMTDNHgVUJo+DzrCT287JE9VBrhPfYAlNbEYnEcx+nqIVhSGvHSuRIDWYfBnLUo6S8FEMJ0KUAIjRJqzz07i/sOB6cBiIkpS2pvphLQbqnFV6HAigtWDcSoRjX5coEBcGybvr5+1N1p5bMAfqiJ2YKXPKIHAiMoYSctfvyXGmedN87zPrOXh717nD9e38TKWFiOOblnnJWlL22hNBQqIcW6OX+lNViwst/BD413EYSaSlNx+4Q3bwCUZkWfQ9wW3TEZao0jNcetipnJLgRhSzFVDrh1p0ejHBoVY19z9jFJckmJv8+KlowtCHS1FWuGYnz4uYPghwSBxkpKNm9q867vzZBN2YuCcUFovK54wuz3hQQ8zZ5CgGMJbAtcW5B0DS+hJ23TlzYkIz/UHLkiBq5AKY2wzfbjff87y3M/PcFZ543z8gsnCXyB6wgCH2gqzjk7Ry6x+DruDrRS5Ht6cKNyYQDLsigWi1QqVUZ6Y6SScnF3QWG8rImyjxAaK7AOGYB7E9u2bZuVgqlSQ1OsLY5oKa3BhtF+h7bnMzU11Y32a62RUtLfP3Cngpx3Bj/QjOQtDhtxoK2wbAEBfPriOUpNxXCPQ60NH/9ZwUgLh5Kdt3v8aVODRMxEsytNxXTZeAAaQJqGo5VqQK0ZIrSmPy1p+iavKAAUDOdt0gnZ9RTCEPIpyYblrtn/S7M/LdZCJssBt+xsm9y+p1m93OX41XFaXkfZxwgep+PCZAQ0BJ7mAUfGWN5v4bc0tiNRTXj5lyaotDUpVyzaEocKlvc6YEddhyRU65rNe9tUGiGlqF1Z09N4gSZUpta+k7U5dlUcRLT+WoIdUx6NtmYgZ3QAv/ibIp//dRHi0jxqz2QchvL2PTIAHUXm/v5+bMvqjgdpWczOztBotlk1YIzTIsk0aRiRsxWFJSkTY+pun8R9jIMyBgAogdhbb6mVM5WA4eH51aszp1cNuKA0M9PTwHxkVwMDg4Ndgcy7ywNQGpKuwLWikRwdN+aYlJUUMJC1uW2vx7Peu5PxWZ/dswF1T5FNmHZatWbA7jmfow6Pmb9vKR50dIoLzh1mwzKHFX0uQ3mLdEIS1AyrR4aa3rRFT9qiMhNAFIQ7fMQ1QbjApNh2zfo0PONJXL65yWknpFBKI13BI45L8ceNDbQ2E9a2BMnYAs5vRA0mnM/BS8us4JZYTHzvcB5W9jtgma2FFYKUmjc8vo9tkx57SwFTpYDZiqJcD2n6ilTcRimIu3SrOs02RbJxt0fTU+TTZquTTko27WlHz3H+uPeYH6CNERgcGlokkCqFZGZ6Bj8IWDngwD50aCTM1RSVpkIKOb19+/bKPTyT+wwHqwFAWOxs+/r0vcWAY2W8+/uOHubqQRfLkkxOTi1SwFVKMTAwiG0798gDsCRUW4qGp3ATFmGgsJLwpNOz/ObGOlKY3H/Tg1/eUMe1jWFIx60uVz5QsGs2iPix4LU1x652OPbIvnkmX5Q+80O6HkA8IRjM2WybMjlrP9QctSIGCYluBggLtk/5eIGh8V52W5PXehopzUEfelyKD/640F095w3A/PUt5PQHgcbOwGsf18dlH9tFqObrETTmfaP9TvcXfqBJuPCKJ/WaCws0YcuQgkoNxS0727z5W1OUm4pleYs1g04UyzEfcfN4y8R2o/RuEERZAmG2PZYlKFQDCtUQ+x5ULBmP0KJ/YLDrEQoh0GimpiYRwJoBt3ud8w/fxJ8abY2U7Nr35YMJB+UWAMCy5O1BCOMzQZcL0IXSLOu1ScQspqenCXwfIcylqjCkr7+feDx+QI2/uwqTogsZnw7AjtJRjZAXPTLPhecOc8wKF1to6q0QpTR+1KSic55CgNCwc8YzqSTMTibwtSHTeJ0VUUDSwpERZVZrcCQreu1uME9pzQmrY6Yphvl0btjRpFhTtALNnzbV2TPlR9sAxZGjMY5a4dLyzN87liDhiP2GsRWXWJ1rayoeelKaU9clqLXmVZOUiXuyss9wADofIS0BvjJZkVBhudDXK1l3RIwzNsRpB+D7mtUDLvmsBWH0N23FX25rUGkqak3FVCmgJyV50ukZI+mtgZjk2u0tCrXQVH/eTWilcByXgcFBwmgsCClRYcjk5BQxRzI66C4qORcAUjI+4+GFIITccbdP4F8AB60HAGobwM5Zw4hbRNMOYbjHJp92mC3M0Wq1cN0YYWiaYmRzOdKZDHOzs3A3CUG2FJQ9za9uqHH8CUlEI8QPwCHkJU/o5SWPyLNzxmfTLo/rdrS4aazFLbva7J4LiDmSdNw09NhV8OdTZ935K/FamkLVZ08xZE8h4Kwjk/Rl6K6+qwbcbvQ/7giOWx2fT1V5GktKzj4myUDWwpZQriuWAyoEmYGHHZfiqq0tbMvk0+Mui/xcO2Xxs79UWT/scuQqh8DT2CnNuQ/v5UWf3YPShtAUakMjHu6xu5FyKQ1LzhKCZNIyvAgZXaAt2TrpU22aPg1HrnBNALBuMgJhCM94QJ7RfpddBZ+kK3nDE3pZNeqi6qERdtXwrT+VjajoPVjCQqVIJhP09vZ1tQilEHiex2xhjlTCZjhvsai9UFRvsqsQGm9E6m13/wzuexzEBoAxITS7ZwMIjHvblfNTmr6MxWDOYXexQqVSYWhoCN8HpUJSqRT5fA8z03c/diMEpOIWF11a4gUPzTOw3IFygB+CrAVYlmB0xGF0pcsjz0xDAOVSyC+vq/GRnxTYMR1g27B3zvDmhRTYpsict140zS+vr9H2NYVqQLWl+P27VnHG8QlomJzeaL9jgtGBpj9jsW7YgTBqeNEKeM/T+5BOv/HxpEC1FH7TVOrJQPPw41N8/OdRsY8NcWd+C2DHJWM7fc759B5e/qhezj9iCOEH0FA86fQ0H/9ZjG1TPpmE1U0BDmQtCM1zkAmL9393mh9fVeXI5S7L+xxW9TuMDjgcMxrjyttbEXVZcOxoFADUpgO7FJpzH5/n3MfmoaUNn8LS6EZo5LmTNhf9qMAlN9bJpQ5cFXlXocKQTDZLJpNBdQyAtKjVqszOztGXcU0KcIFMpIw4ADtnTeGQQGy9RydxH+NgNgA7pIA9xcAQXxYuoUrjxC1W9sW4bU+Fwuwsy5YtMy8pRSKRoLevz9CE7wESrmC6HPKsT+7hm69eztAqF6ttJrTh4GtUxNi1JOSykqc/tofHnZLhSR/exV9uazJdCSjXFbmMQCsQNkxXAm7d7TGYs4m5Fl4IexZyARSs6LdwLGh5irVDcXpzton4QdRqK9pChHQnJloYmrFvtgwbRlyu3eERd6Up+dXR3l4K3vP9aebqmp9fW+Nt/9VPIiEIPY2Vs3j+2Xne8PVp0nGzYg9mbXJJw2Xo5Mi37G2zYzpgthoSqmbENzDFPnFHkklIAl9x1EoXwk4PRLAS0hgtoSGmo7ZeUGsLbt3a4sdXVfjaH8qkE3anXePdRqhCenp6icXjBL6Jp1iWpFwqUSpXOG6lSz61mAMgBODDrlnftCDXwUG9BThoYwC+709ZUhSmyyHF2mIugI5IL8v6XZptj9nZmUVcAMuyGBoaNk0s7iGTpCdtcc32Ng98xxgfvGiajbe38dqAYyGSNlbawopJQgV+SxHM+aQHLD734hGyCcl0OaRQDcGK8voSjl4RIx2XxB1TACOEYNesKcIBTIyjxybpStqBNqtozHiqSndaW1mGh+9IM6tl1LkXCAONSEseckyKZjs0BsDBxCKk4QtMlAJ60xbbpnz+78qqCTACtEKe+YAcawZsGp4REBnpsRGdLIIUBC1FoaLIJw21uTdtvnJJm5hjFJKDEPoyFmuH3Ig8BE5c8sM/1bjg+3NceWOLoCnM+QOOLfjdzXU+8bM5bEsSc+555E2FisGhIUMC0vMcgEJhlkajycp+19RqLEoBCtrNkIligBS6JWOx8Xt4GvcpDloPYO/evY1ly1ZNVpuqb7aq6Om16AwJpY0AxepBF6U0szOzXbGHzqMcGhr+G42z/n70pi1qbc0H/6/AZ35ZZLTfZrTfZfWgcXkfckyS5csdRD00LnolYN3aGA89NsUP/1ph71zA2lXzI3p0wOlGwEXUZm981jdcAAGEmoGsTTYhmCgpjl9tsiAacOOS629v880/lgmVqU6sNkNmKiFvfmI/Dz8tafTtFDzyhBQf+L9ZXBuwog29AEJBEJoqPCkFF11a5pkPzmHbEHqaVJ/NMx+Q473/W8CyNMv7bWPAFEgbinXFbLQN6qAjSSaje+4HmlWDUQAwUF3P42u/L3LxdXV6U5KjR2N8/ZUjrFnuEJeK814wiCUEH/5Jgbhj3aM0oI6algwODSOk7C4EQkpmZmbw/IDlfa7ZPi20NJagWAsp1TVSiumtW7cetJWAcBB7AACWENuaPuyd88GaL4wxqUDNmkEXSwgmJibQUSqQKBU4ODyEZdv3KBOwEHFHkE/Z+CFs3O3z21vqfOGSEq/44iSnv2UH3/xVGZm0kDKK1Qk468gknh/tJyVRtRKs6HOI2Sa6LzAL+O6CD37kYitNNinoSVvEbGny6FE2kZjkF9dW+cRPC3zjjxX+98oqv7mpwe9vafDza6pgSbMdaCtOWZdg9YDTnXyddIQXKhoRXTkVl1y7rcmfbm5APOLLe4pzzs4zmLVoeYJV/c48kcc2FYxj0z71tqLeVrR8kwUJ1TxvwDAA4yYAqDVYglpZMTFnagzSCYvLNzf51MVFcKSJ73iKp9w/Qzou7jkDUGukkAwNDUWVfvN6iFMTU2itWDtk3KJFR5IwWQ6pthSWZA/sJ0p9UOGgNgBSss0PNeMzPl29qQ6U4ZgnYpKpqSn8IOiSfkKl6OnpjYqC7tlAkgJavma2GlBvBeSTgnVDNtm4pDdt0ZezaHrwtm9Ps3uPj9XR5VOaNYMOQgrGpqMae4BQM9JjkYq2DWAyDlPFEL+lo7oBAa6R+hrIRHn00AT4CMz9yGeN292TMl+DWZtrtzcJayHSNqu9k5M86OgktiXn4wtRYLHtaySmrFhp+OrvipgSZY1qKYaWu/zn6Rna7dCkADtkqACSruQpZ2S4/+ExRvsski74gaLSCJmtBDQ8hRRw3GjMGA4F2KY6cLoSEIs4E9mkRbWp5rMkgSbuChIxeYct3u8KtNbYjm1iQZ0UoBCESjE5OYlrWawedAHNoiEizXas5YOU4vZ7dhb3PQ7aLQCAgC0AYzNB5+d5a60UgzmLbNJlZqZAq9nEcZxuJ9p8T55UOt2VhL67aLRDjh2N8biTe9mwPMZJa2NMlxSPOH8chOHAZ1MWhXLAjWMtVqzIdO1UzBFIGbn3SkRVgZr+jE0+Jdlb7OxLBbO1kGItZLBfokKNtA1tuLbMJZm3wA8RccNZH5/xcSy5yEWOOYLt0z7bp3wOOy5pREZSFk+5f46fXFWFtATHBkcQawe0/HmWZDph8dub62zb0WbdehdZV6AVL35ED9+4tGQKgyKWZdBSbFhu87U3rgBP02goCrWQqVLA7jnDCPzpNRUuv61lUoCdldySbNrj0fA0+aToegrrh12wRJeY1PQ0fqDusZJTJxjc19c/nwKUEq/dZnJ6mnTCZkWfsygD0NEBGJvxo76EYvs9Ool/ARzUBkBLPS4wlWudQNJ8WTD0ZWz6cw6FUpl6vU5vb695KVSkUmny+R6Kc3N3//hArQUnronzinMGjVQW0JuHtUMO125v05+1qRl30fDlOxrSUjBVClBamGo/X3fLglMR029noQ0ILGGEO4t1xeAaF9lWkLHYsMwhl5RgS1Q9RFqC8WmfPXMBzj4JctsStAPBZ39Z5IztLabKIe1o+7G34PHV78+SiEn60hbVpnHZOwU/ri0oVDRfuqTIB1ePmCv3NIcfluDch/WwasCGmMRWmAmttCmNBpIpSGZsVi63OcUWkLbZNetzw3aP1QsCgAC3jLe7E70jWnLEcndejCO6Z402xN17ZgDCMCSd6Sebyy1IAUrq9TpzhTnyadvoAOybAdCCXTM+oBEWB3UKEA5yAyCl3C5EyEQxBI+uag4AoSaZlCzrc9lxW41SscjAwAAAWitisTj9/f1s27rlbh9fADEHrtzSgpkAMP3m7ZTF2588wPMv3EOxFpCOCd76n/2csCGOaoWmWakQ/PamOq4lmCkHhL6puAMgZbN+2OWKLa3oOiHwFdftaBJzBLfsajNR9Llsc5OxaZ8b3zZGpRXi+ZpaS9P0BAlnsY8sBGQSku9eVuGiS8voKB7i2kaY8w+3NruBOkcK0gmTGozCFfRmbL5/eYXLtzRJuIKkG6XyQs3F19U5ajpgMCvpy9rkkhIREyawKKJ0ZEcRqB5y664264Yd+nIWhMrEJDzNrbtaRgcwqkVIuIJ1Q+685oOErRMe7UCRPIC68d8DFYb09vaSTCYJOgbAsqhWKpTKVdYNuPSkDlAGHJgqR4nAhoM6BQgHuQFwXXev1WyVp8phrtpQZNLzr2kNwhGM9rv8tlVkZmaaDUceCRj3z7ItBoaGuh2A765LGXctbtnV5qrNTU47MWn6FNZDHnZKisvft5ptkz5rh1xGVzjoVmjc/x6by/5a4xfX1cilBMV6yEw5ZFhajE37lOptSvUAx3jWWFKQTti8/bvTeAFd3cFkTGJbgtsngy4jzorUdg8ErQ15KRlfEC6J+P6OLbvv0ZE876Lgt4RAS7ZM+N0eBToyIJfc3EAKSMYE+aTFQNZiuMdhZZ/Nqn6HFf0OK3ptRvtt0kmzRXnYcSnojwRG0bTLim1TfleCPAyhLy1Z3mfEOASAZr+ioLuLUCn6BwZwHKerBmxJi7m5ArVanZVH5LFiEZ25AykIW5rdxcDcHt/edc/O4r7HQW0ANm/eXF2+bNXeUk3lpisBmVyUzGY+hbZ2KEYQhExOTi5q3CkQkUdwz0aSY2nqGs7/wQw/O2oVTtpC1QN0K2DlMoeVK6MVLFCIhATX4vIrarzgwr1GDisq6336J3bTaGlma6Z0NuYulggXgBfFCTIJ2V2tBXQnzV3B32ra0a2pEd1/FkFHJKED9RVQ2nAQAqWZKofsKYao7e2F23viDmQTFvmUpFAL2by3zUXfm2XDMpeT1sbZOukzUwm7Cj9BCCP5yEtQEZHJ12yb9LHlPUvgdgp/+gcGkAtSgNIyAeOW57N6KAaO6BK5zBtgrhZSqCosi+n8SH6SvffgRP4FcFAbAAAJ43VPHzkxF7Bu1TyvvzNxVvY7SGByYsJ0yxHCtJ7WisHBISxL3iMPAAS5lMWfN7U491N7ueCFQyT6nM5SSlfX2oNNWz2+9rsS3/hTGY0gmzRUNi0Em/f6IOYr8yy5v96dezcKXzpy4UE4r3vXadhxRwq7USa1aw/u6MhSGMkDG2GKl/b5DOMxaCpNTbEekIpLrtnucenGKeKOYChrkYobwQ+5oIGLEBriFjjaxBZ84y3d09W/87yHhkeic1yQApycRGsdZQD2rQIUTJaCKAWox6+99lr/AB9/UOHgNwAWO3x/nirbiQNqAGXKVGOuZGZmljAIuxNdhYr+gUFcN9btPX93IYC+rMUPr6xy9fYmjzkxzRErYjiWCd7dPulx41iLTbvb1FuaTNIiZi+e4Km7uKft2BWtMfX9UhyQEiuApqeotxTJmKA3Y5GJW4QKk46rGVJSLimx5WJ3X4hOl5+QToMxKY08dkf+oINQzdu4fQ3Fwt9biKiPgXmHaQpizqdQU8zWMCXJ3fsh2Dbl84pP7eHktQmOXeVy3OoEx62Kc8PYfLDw7sBoQ9oMDg4uSgEqpZmamsKWRnh1oRIwYFKAhYCWD3FH7Lx7R//XwkFvAICtWmt2THvAfA05AKFmeZ9NNukwPTNLu9XCsqwoFRjQ09NDKpWmVqtwT2+FEIbaOl1WfO43JTpTSiMQaGxbknAkvdl9KhcPgM4eO1S6W+3XsU+VRogXGBEP14aYkOh91mchoFgP6U0JXvXoPh57cpqVfTZx19B5q03Fpt1tLvpDmR9fVSWdkMSc+b6BzbbisGGH5z2kn4liyHTZZ7occP0Oj6avTbxBgFaaelMRKN09h0zCUJhVRPaRwoijHGiySiGQFgcU9rQtQajgu5dV+fafK7iOYDhnag6yCXmPvICFKcBOBkAIgR/4TM/MkoybeMV+GQABuwuBEUsRBz8HAJaCAZBsRgijC7BvWa3S9Gdt+rMuhUKRWq1KT0+UClSKdCZDNpejXC79w04nGRMkYtaClWPevVwIHf1jJrppMOGHEIa62+QjFRf0pWUU9BNorXjWA7KcsDrOQM7i8GUx/ueyMp/4eZFccl5opFxXrB90+P4bVjJ6mAMtFdF8jXWMJywGRlI88PQMp/9vgfO+M40l51uGNdqa9SMu5zy5D9rREl/XnPmWHcxNh6TjEs/XpGOSD507CEKzczZgrhbyp40NxqZDHNtcS81TkacCtmWClnbUVfdvGQbolhXQG+knKqWZrSmKdWMQ7wkPSIUh6Z4esrnsPAfAsmg2GszMzJJPG7mxRUrA0feufsNBXgbcwUFvALTWY1JoQ5X1iFz86MFFOfVlfS67t9YoFUv09ZtUoFKKWCxGb08v4zv+sXyOrusb/bSve11rqUiTz8iDJxxBf0ayvNdl9aDNYSMu60dcjlhuUlFP+OAutkwGSKF53oNznHBaCmoKUhbH7WqjImEQS0Ar0MQduOhVyxhd7xDOBYaDn7CgrU2BkK/wygo3pnjJU/q4dWebb/65Ql/GirZP2ij8NhU0TEuyYkVRboZRP0azumcSgieflYGsjHoRWLzqQ7u5dnuFFb0WX3n1MgIFN+xosWXCY8e0z+Scz1w9pOl36LiiaxRsy7Ae9zUKJsZgXoc79p7uCkIVksvnSSST3S2AJS0q5TKlYoWVvS59mX3KgCUQGAUnE4AVhwzAvwKklHukVI3pcphsNEOSCdF9cFppRFyyvM+lcUuFubk5DpfzVYG2bTMwNPgPqwfooBN480NN2zOZgkzCQmFWxeNGXY5YFmPdsMv6EYc1gy7Lem1yaQmuMARtjcmhS8nKfodNe31CYMtenxPqirAeYmmz7XDtjt6h6UT00ofnOeLIBLoUlay6Fp/+0Rzf+lOZE1bH+cTzh0gmBX5b47iKlz+6l/+7qoofbS3A6BlCJECCplALqLd1V4JLRX0MCDGdjTTQhomiacw6kLV58IkpSAoedr+UYcy3NXPVkF2zAdunPG6f8Niy12NsxmeiaDyIUBqq774B0M6P9zD+Z64piv/E3BjNZhMwZcDF4hzVeoMVh2Wx49K4ZB0IgWords2FSKHVwa4E1MFBbwDGxsbKy5atmi411Oq5WkgybUMUm9UahCVYNWA6v05PTZqS2AUCkENDw4siwfcUQkC9pQijkt0T18Ro+Zq/bGphWYJ6W/G2Jw3woAdljLhHR9an0z7L6+TOooh6yuL41XEuvr6OFMLoH3SgjHJu3I0q1kKI2fBf9zPyWaECO23xq8trvOkb08RcydXbWiRigk++fBgnCKGtOGK5w/phh417fFKW2ewO5Gy6004IilVF28OUDWNOubdjsHyjBa7aKmqXpTlieQzSlvEgfN39qN6cpLcvxvFHxQFh3OyWZrZqyqI//5si3/lLhXTCQmA6L7U8He27TQbDjfoE3h01oE4KcHBoKGoGEqUApcXs7CzttmcCgDZob8EfSqjUjECLlGLO9/3pv//o/3o46A0AoKVgrNbSq/fOhaxYvpgLACalI4CJicnuSqK1RmnN0PAwlrzrqUCNWf38UNPylBH6jMmuEam1NM86K8PzHpxn1aBNbnmMm26o87B37yQuJUEIm/e0eVArhaoHRicQjZWyIsqfRrU0M3MBuwqmg+4tO1uk4pKWp5ks+Z2iPVBGITgVk5QbmkCb2vwjVrjgRSW2Cr7/1wquKxjIWiRigouvq/GRqsIZsCEAYhbrhmPcOO518/0DWXt+2ZUwWw2MepAbaStq04INS6A9EJam3tCUGyExW9D2Qzbd3KA/a4hBxASqGRL6ICIjZ1sY/96C/n6L/rUx+v9awQvMPS7VQ3rTgvsdlmC03yVQZqu3ZW+bPXMBQkpySblfZuKOH6ChHu9r+IUUTE1OEoah6VIkFsUAwRJMl30qTYVlMbl79+7mXT3kvzKWggFACLZ5AQ8enw04bb9UoGb1oEPMkUxGD1hIiQ5DlFL0DQzguO5dSgUKAbWGwg81vRnJqesStD3NLbs80zYLQcsLWTXgctxpKSj6UA9YM+gwnLeYrZnBt2lPuxtgsiRobfGjP9a4YUeTsRmf8WmfqXJApWG09BMxoyHoByGTxcAIaApAQTYh6ElZzNV8QqVZ2WeTTkYdeixB0FRsm/SIO8ZIxR1Jy1N87tcllvc5UXcdze6C162ycyxJf0bOzwAhmK6Ylb2TZdEaw5WP5LyEhGpDUWspetIWf9zU4pJ3jdOTlPRnbTYsc/nwc4fozQojfAp0W6h1DEFbc8NY22QxagHPekCWtz+5n5Fhx7yugVBTKYf8ZVOTL14yx6Ubm2STpkfhXSnsVFpjWTYDg4PdRiAdbsjExCSWlKZGQbP486JGrU1P4zpLIwAIS8QA2MjNWivGo1Tg4l6BsLzXJpN0mJ6ewWu3u81CVRiSz5lgULPRuMNjKA3ttuJp90/zxNOzbFjusmxVjD9cXuXJH92DZVlY0qS0/rixzquLfcb1RZPJWhy+zGXvrU0sKdg+ZQKWMgrbCyH45M8L/Pm2Jr1pK+qmI3Aci7hr5onWRkNvthKaLU7UTsxxBX0Zi80TPkphKvNsEUXvBbWWptpQXXfZlqb11Xv/dzaSGtcoDEsvGRO0fU3MgZ60Pe9pIExPg7YmGYvEO5VmMGtEGDSAECa453W4CQIhJNU27BrzmCwGhgcgjKMjXcn7vjvLjWMtTl2f4NhVMYZ7HHbN+tSaIa97XC8fevmI2Yc3QxMXidSBsjnBYx6U5jFnZvj8T+d4x3enAesuMSJNHUjMCIEuMACB7zM9NU0yZjHa7+6fApSwc8YnVCDFwV8F2MGSMADKUtsRhmOOEl21WgBCkwrsSTvMzRWp1+tkslkIAsIwJJvNksvlqFWrd3qceltxv8OTPOTsLBQD8EM2LHfpSRlprs7+dMtej2LRpydvEXoKyxGctCbBb29qkHAFe+YCavWQdEqY6HlScMKaODfvbJNPWYsCXZ3VVgjjLRRqIY1WSDIZ/a0jGcxZUZcgbai6EbFHCIHnGd6AjBZ0P2rAYVsSo5LWkRaP7qWGdEyYKsMFv9TAUNa05W54Ru68J71AhUUapRwv0CRck6d3LEP+STiC41fHyGSM+o+MtiaX3trgD7c2uOTmBpY07/NCwclr43zw2YPQDvAbRkcQSzI9E5BNSuJpSVgJsWzBS5/WT7OtePcPZ+mNGoncEcJQkctnyff0LCoDbrVaTM/Okks7jOStRTIfwtwmdswEkSFm450OloMES8IAWEqNSyHZWwwM534fgdBcUjLc43DL7jrlUol8vse8pBTxhJGF3jU+fofHkMKsnL+9uc4zHpYzYpUBLOu1WTvkcOO41+0KNF0J2bTH4/79SXQb0JpT1sWxLbPXnK0GTBRDDss6pgpQwBHLXFMyEBqXOgijTEKgEJgV2ZaCckNRbiiSKRulzWo7lLNN6yoxTxjqoNtLQJt7YgljqGzXiHtYlsS1TVVfNQpeZhIW2ajPn9Kg6yH//YQeXv6oHsqNkLlqwGRRcfyaGDTCLuV5thISLOgmRPQUAqVZN+wabr1nuhOVywEz1ZDBnEMiCmIGStNuhTznQTlEVhKWAjP5heBVX5jkx1dW6M3YvOU/+3jG2VnClsKqBbz6sb189y8Vds2FpGJ3bAHCMIwIYKn5MmDLojY3R7FYZijn0pOWizkAAlCC3QXPVCpqa0lkAGCJGABt27ukF7amSmHca2lcl/kcrgJisLI/xpVb5igUCqxdt878ndbYjsNgVBV4Z3Bt2LirTaumiMcEKtDIlOT4VXGu3tZGY6LUbV9z/fYW9z8p1VWyOXo0Rm9aUm1BvW1Uew5b43YZQWsGXaoNM9lzSclw3mJZj82Ry136szZf/2OJhgf1VshcNWRkyI5cb81Ij3mMel/1GoyBkFJQaYQ8+sQkHztnqNt1x5FGbLMva/Ozq6u88LMThFqQT1nEYyykUxBzIZYQ9PY6rBHRnryl8P2oUEfATCXcj6LbOZ/DRly6smFSsHdOMVc1jT2EMEkPpSCdMCpFeMq8NyH56Z+qfOm3JfIpi7EZn7d8a5qHHJ1keNBCeworbXPy2jhbp6qkFjY5PQDCMKS/f4BYLEazZcqtLSkplkrUag1OWpk0TU4XGgApTDPQYmAWAkvvvtPBcpBgSRiAHTt2zI6MrJwu1MLRQlUxMrBYIFTaRiDU83ym920WKgQDA4PR5LnjTIBjC3bPBWyf9DlqvYvyzX74pHUJ+H25y16TUnD1tpbpVxAZgOV9NqsHHa7f4RGEpq79YTJt/MuW4thVMT76vCE2LHNYN+yauEXKgrQADy6+rsZUyUNJM9EW+rrDeTsKzgmCcEH0SoNtm3iCr0z58Ir1cfACE0dQ0ZtSJo4AZm/fm7KibsKqmxUgbs3X9SvAVwSBnuf/ayORHjkDXZigIqwfcecjs5Zg25RHw1NkEvND0Fdmm7Giz5m/d0Jw+eZG1FbNaBSEStMOgYSFiKTQMwm5qP7qQDApQFMGbFlWNwgoLYuZ6SkarTajgz3gCHSwsAwYKtWQ6bJCSoqNRmPJGICDWhNwAUJLiLFaUzNRNAKhHXTs+NohF1BMTEwAdLkAWptmoVLMl4X+LdiWoNZS3DjeMksWQKA4YXWMdEzQ9kzOuu1r/ryxTrUUImyBCjXEJSesipsJCqbld7Ra+p5mRZ/F65/ey2PPynDEGpdMRgChcbFtwfoR10iLK81kKZgf5QqG8hZOVFzU9NR88E4bwZK4Y0L3LT/iGyAhjGTK2xraKmpNZgpi+nNWV4bLtqDlw68ur3H5DQ1uH/OYng1pNLsaHRH9WjNd8buc+e6DUYYxuGbAMc0Qo9dvn/CigNqCZ6U1MUcQi4J5C59d21Pd7UXCFWza1aY1G0JMQlwyVQ4N6elOh4pgYHCoe5KmGeiCFOBQ7IBKwFPlgGI9xJZMTE1N1e/0MAcJloQHAKYqsNnSD9w163OSTHR/bwQ4YXTAxbUspqamCMOFzUJDBgYHsZ07bxbacQ6u2drkGQ/PR/RQzfphh3zKtLxaNeBw7GicU9YlzCDq9JUTmlPWJfjS70pIYVpg4ykz6YQR+LAbofHLZUQCImI1+jCYs40LrQSTpQUbbWUkwuOOMBLgjWiFjsIgiagNWdyV3D7p8bpP7GGmGvKAI1O85LFZVNssm6b/gFmx+zOWCSRqkHHJbMHnnM/sxQswDUCA41fH+N83rsCyo5scQqG6/yQMQs3yHpvhHtO5SEb76dsnvEifYf69lhQUa4pyXRFPWyhPYzUDXvzwPJfd1uT7l1UYyNtoBC/87AT9GSMdfsLqOJt2t+5UJUhrFfWEGOr2hOjoAUxOTmEJWD1gz5dcdgcX7J1TNDxwbcbu8CAHGZaMAUCzQ+n5bruLqgKV2SenEobt5fkeUkqUUoRhSF9fP8lkslst+LcgANeW3DjehpZCShMHcBzJu582SNyBU9YnGOy1o353AX5H6y/QHL86RjouaHiws+DTqCuSUc5eCmi1BXOzAWOzRrzz9gmPbZNtds6YgFlv2qZUCwwXQHc0BDW9GdNCvFgPKDZCtK/MvlVrhCvpy1hRM1PNRX+sUKqHOBa85D96EMIwCzstzdGYdlgdOWwBpbqJ3MddQagFc7WQektjORLTzkiArynWVLdWoAM/0Iz2OcSS5j1CmhTl9il/Ud8AMEZouhLwi+tqvOC/epEthe+DE9d8/Q3LOGpFjA//eJaWJUnGJbM1zW9ubPDL6+smbnEnXAClNLFYjP6BgUVVgEEQMD01Tcy1WB4pHHc+xqQABeOzPkEIcfvgbgW2L5aMAZBCbtFCRw009jcAQ3mL3ozDzOwczXqdZCoFmLRQJpslm80x2ahzZ61CXdvIeO+eDVgxbBEGoALFkx6cMd15PYyeVdPkuw3bDAg0a4ccRvsdNu4JKNQUE6WQdVmJCECmbL75syLnfXvazKeoXVYnp55wJY5lAlITpYgMBBEZSJJPWOwWIbOVkGpTkc1KlGfiH2uGHPwb61iWkSoXIkoKqHmprZg9X7a7iAUoBHPVkDDUJOJGOyDmCFb0O6bpZ9sEPppR+++F9FzDctasGzHUWtU2GYBiKWRP0d+vDFgKIyn+4Z8UeOQJKZavdqEU4LdMzcKbnzfA/Q5P8MovT7BzNqA/a5NwrW7g8c6IQJ1egPn84hRgu91mplAgm3RY1uscoApQsGfWNx6iFEsmAwBLJwaAsMU2ienZRkBXWQaAEPIpi6Eel1K5Qrlc7rYKU1oRj8ejvPCdZwJsy9Ta37qrDbbs3sCgHkJTmzuasCBpgWV1uw/pUOOkLY5aESdUmnpLGd5Ch8cqNAMZSd1TuI4kn7Lpzdj0pCwyCYkdxeAsaSipppMmZvLGRHdiz9VM26qOC4/QnLY+SRilFxGatq8YytqwIN1t2wIhTbFPf8ZaVH0zUw2j7bvhF2jV2SZEk05CtaWptMLFe3rz5xw+4s4ThiwTSC3V1AEViZJxyUw15Mkf3cXuMQ+r18GxBb6n0WWfB90vxZ/PX80jjksyXfb/LmGQThVgOpPpkoCktKhWqxQKRfqzzmIGJNFnh5rxqApQC333VWT/BbFkDIDWeqcU2p8oKvzORJx/ERkTrOyPUa81mS3Mdl190yPeMW5ht73w34YUglAJrtnW7G41wAx0z4ex3T4/+WOVN39hise/dxe750LsWBRUsuCUdXGE1niBZtuUR7eIP9AcvjxGX8ZMZLlPn5OOJ2FJmKspWm3TD1ErwBEM5U3TrWpLc+OYMU4aoK149IkpDht2mSgGzJRNPf+zH5gDpU3na21IO1IIbBt6M9b8cipgphx2U4cdiuxA1gYhunLd5Yai0dJYC2ajUiZ1ethIzFiaKAOwfdLo/y/cLigN7cAU/fSkJJsnAs5+5zg/vqQMKQsnKQkUBKWA/IDFD84b5alnZClUFxRH3QnCUNHb24cbi3UzAJYlKRXnKFdqrOhzzZZsIQko6pW4q2AqK7XWY3f5gAcBlowBGBsbm7EsMTVbDSnUgvkoPWYgYsGqwRht/wCpQGkxODTcrRS7IwhhvIDrt7egQ3u1wIpbvParU5z65h08/zN7+eyvS/z6xhq37mxDR20nVJy0Nk7cNV1/bp9YUNgTapb3mC4+nTZaftjp7aco1QIKVVM8VG0qSg0FHUFLCUN5p3t+v7reBKltCYGniWclX375Ms7cEOfE1TG+9erlHHtEHHzV3QK4tvFVEo6IOuLOu78zlYWNVzQIvX+coBbSCqI9foQOqWi031mg/y/YMuERKr3IW5BobKEp101VoGsJKi3N8z69hxd9ZA/losLJmGP61RCk4ssvH+G4Udd0D7ozaI1WioHBIWzL7uojSstienqGRrPF6GDMPKtFzUBN/cdUKUBKXbdte8+dH+zgwZIxAEBoSTFRaytmyovpaJ1BurLfRPpnpqcj0Y5OHb1maGjoLqUCAWKOkcculUPjRivAMeo11bYmm7IYyNkkY7LrKUgB+JrDl7kM5YzKzfapNvhR4ExBLmPRk5JMlgIqjYAw1PSkBMetcnnKGVne9dR+1gzazFYVhWrkAUTXNtJjI4BUTPKbm+rctqUFWePlBLWQk46I8dt3j/LH81fz8NOSEChqTUGgAKGJ2eZ+pGIyavU936hkphJ0PZWOF9KfWVgtKJithviBRor5++eHmsGszXDeWpABgK0TflSWbd5XbSqOXenyx/NX85WXLePch/Vw/GqXbEKSS9l897IqD/x/Y2ze6mFHykdBXSFykpc9qhc/VHfaKqxDQRgaHuqmLTspwNnZGcIgZHTAnd/WdGAJZsoh5YbCEmLP9u3by3c6QA4iLJkgIIAl2Nry9am7Cz7HHhHr/l5HT3/NoItjSSYnp1BqYSpQMTAwiG3bd8kAOFFeePMej9P7kigvRGp44FFJPn9JCYEJqDmW4LodLVP4I4EQcjnT0ef2SY9dswGthiIeF+hAIxzBM87K8aCjk5y4Js7aQZflfbYh6SQlpCy27PW5ZlvRTEoZ624Tlvc63WOWm5pXfWWSX5w3ittnmzZggTb8CFdDzGJyzOcjP5njYy8ZgoygJzT9+npSFrk+ByyNCAEJhUpoenxETEPHEvRnFyiRCmMkQrWYSBWEmtFBGzcZiWtE7MEd0143AKg1tH3FcavjjB4eY3SVwxMfkaM2FfCA88aot0wGZ9tUwAsu3Mul7x7FcSHwgbbixNUJ0jFDZb6jYiDTFl4yODSM0vOkLw1MT04hhDDtwPdlU0rzrM2WhSVDAOpgSRkAhN4WRL3xiHLMCwVCV/bZJOMWU1PTeN58KlCFIb39/cSTSXzPu8NUIJgVsB1ortne4vQTklGaT3HMaIyelKTpKyxpWGu37/UolEL68hEP3hGctDbBz6+rM10OmCqFrFpuagJoK17y2LwR2VDCuBadVlvtEBw4eqVLGKXcyFhmVU1ZrBtysS1T7tqTMrLbD3vXOOc9uZ/7HZ4w3P5QU29pLt9c5bzvzFBrKY662CUIjdCFiryh311Zoy9r0Z+RZBIWhVoYKQEZFl6807EnJbGEhoSkWFeEzGsfdnRODht2wTb6+tKFuVLI3mLQVR6KQggs6zPahaoWIpOaXbM+M9WwmyrsTdts2dtm816PYw6LGdqg7m5C7hRKKVw3xsDA4KJWYGEQsHdigrgjDQdA6YV2LaoCDPACSMaWVgoQlpgBEEJsBW0EQvXiqmCUZrjHoTftMFso0Gg0SCaTAFFVYIZ0KkWh2QTnjpOBhrsuuG5ba742P4BlfTZrBh1uGG8Td8xKOVMJ2bynzf37k6h2iNSak9fFidlQaZro8qpRI1giJIYtF4r5Gnk3ItorDb4Jvrmu4IrNDUZ6zKSYLods3N0i7opuYK0vI9m81+dZn9rDsh6bwayhC89UAhOYtExq8b+/Od3tw9eTtpgqK57+id24tnk9FZM0fU0qYXaLUhrdvm//uczh24xm4ZpBl+2T7U61LtDJAGiOHY2DE3lAtikrLtZV1wBARNGNoow6+mOljTqx60ocW9D2Fem4NEpF3Y4jgvEZn6anSCfueCgrpUimUuRyuQVlwCYFOD0zQyZpmxTgwnBCFLMYn/UjzcWloQS8EEvKAGiht0iBMQCBGXTdwH4I+ZRgqMdl20yZSrlMJpMBIpnoZIp8Ty/T03dN6cm1BRt3tWnXFLGYofvKpJHvunpba74wKNBct73F/U/seAqaY0djDGRtdhcCxqY9HpjJRPlzAYFGtzQzxZDdsz7bpyNC0JTPjmmP6VLAyn6X715W4St/KBMqM4FcW5BLWovWw0xSEirJbE0xVTZaCZYFmYTVzdfnU8bbiXiHIE37MI3xcpqe6VLUyVa6lpmk5//vLFqDa0nijulg3Pksc09NR+LetDSqQ3ELcja7CnUabUU+ZYaeEdiUJq0qzHFoK45eHeNZD8zx1d+XqDUVXqB4xaP6GRqy0Q2zXcES/OW2JoFivyrIfRGGIblsjnQm0/UALEtSLlWYmyvRn3NMYHMBB8CKYhZj04birNGHPIB/ZQghJoRQ7C36hG2FZYv5B6o1VsxieZ/LDWNlisUiK0dHgcgAxOIMDA5y28Zb79KxHFuwu+izLSoM0r5xOU5el+Arvyt1C4MsKbh2WwsQWHGjoTeyOs5RK1zGZgKu397izJubXL+jxW172myd9Bmf8ZgqhZTqipY/T1m1LEHcMUQc25akLVPMZAKaHNAZtqQh1/wt7Fs/L2B+dV64Su/zPZe0u6XGoQahBfaCc7Ato7T7+oumGPpxgbVDMU5eF+Pq25vEHdmdsAKT+//V9TX27GyzfNTBL4c4KC54yRBPPC3D1VtbHLHc5QlnpKFlOAlOQtIuhlx8bYW4K++0BkCFIX39fcQTCXyvYwwtisUi5UqN9atjpBOLOQBIwFfsnjOKzFJbS0YJqIMlZQCSyeTedrs+M1cLB0p1RV/P/MA3VYGwos/Fa/vMzEwjFygES0syNDTUTQXemT6gbQlKNc2N4y2O2hAzAz9UnLg6Rjo+H5RyHcGm3S1UzUzm67a3uWGsxUwlZDhv85Nranz/rxWavgk+WUJg2QJHChxbEnMlUiw+n27V4T9AxPTuQnZdBtEdRPsaIClgrq6ZLHtcu73N9y4zfRPSicWqv3FHMFdXvOizE/zvf68gOWhDLYRQcfZpKc6+XzraExi9AScmIG3z4e9Msn06MNqEdwKlFP2DQ9i2jdc2Df+ktJgrFGg22yzvy4Ar0K2FJABBq9lJAdKUcTl5D27ZvySWlAHYuHGjt2LZ6J5KUw1MlkL6+ufLgnVES1s7ZPT/JicnjRhklAkAGBwejlJdd24AjESd4JqtLZ7xyDx2TIAj2LA+wfphh1t3m063SVdSqCke+75d7C367C0FeIEgn5IkXIEfGnWevCMid/hAR7vvJvo9gcZsA2KOOf9Ol+8DJVp6UhZ/vb3JA98xxtue1M/jT8108/5dyaK4xLYl+HDhd2b45C/myKfsO2UCdlK9w0PDCDEvACulYHp6Ct8PWDN0gBSgFBSqIcW6whJiauvWrYV/0K35l8GSMgAAQortLY8T9swFHC33TwWuGnSxLFP+qfTiVGB//wC2dddSgWC2ATeOtyAUKE+waUebG3e0aPlGLRgi6T4tuG6sjWUJUjGLbGK+8s6SZpvw74A7u8z+jM3uQsgLPzfBYT8ucNaGBCevS7Bm0CGTsGj6itt2t/nB5RX+stmIgXZaqN8RFpK90IvbwU9OTgKK1UNOl+fQhQUTpcAUPknGWBwiXBJYegYAscVXOkoF7l8UNNpvk4pbTE1O43t+dyCoqCowFk8QhsGdpgLBkG52F3ye/aGd7Jj2GZ82wpm5aHXvClQII1hxCHeOdEKSUJJdhYCLLq1w0aUVXMdUSQcKWr5pXtKTtk1g8i7Yaq0VjmPT29e7oBmoJAxDJiencB2LVQPu/ilAS7Br1scLIW6xZIRAF2IJGgC9VWAit+bnBXvTEIZyNrmUw8zsLM1mg1g8bpqFKkUuZ6LExblZuNO6QBPo8kLBr25oYFvG1e1xZcQZ/ydd4L8BLGmMayoWef/K5PtjFiRioutJ3NVbHIYmy9PX17+gClDQareZnjYpwBW9zqJWYJ34xo7pAKU0QoolVQTUwZJblixpjQuB6RUY7ON2RrXzA1mHUrlKrVbDisLRKgxJptL09OS7g+TO0AnG5VMW6biMCmr+CRf1bwwZ1V50pNLvzv1VkfpzOptZVAbcbDSYmyvSm96/CrCjjbBz1gehEUIvOQ4ALEEDEBBsl0Ib1RxvH80ppXHjgmV9Maq1BsVCoevqm2ahLv0Dg6h9yoK11oRhcJdjA4dwH0Frwqjhy0KEKqS3r59EPNF9TVpRM9ByjaG8Sy61jxS4EOArJuZ808ZcyiVHA4YlaADa7faUlKIwXQ4o1xeXBWsNOILVgzFarTbT0/umAi2Ghoa7clEdSCnx/YBqtUKjXr/LHsIh3DtQStNqtahUq7RaLaSUi7I4KlQMDAwskn2zLKMOVWs0WTkQQ8TEfhyAdlOx1zQD9aSUY/fyZd0rWHIGYGpqqm5J9pQbiqlyuLgsOIrIrRl0CEPF1NRUNxUIZtvXP9C/gNEOrWaTkWUreO8HP8I5LziX9YdvoN1uU6mUDxmC+xhaaxqNOrVqhf6BAR73hCfy3g9+mLMf9gjq1VqX06GB/oFBZDflK5BSMjU1ie/5rB50TVXnPlWAczXNXC3Eknpy27ZtM/fRZf5TseSCgAC2FNubnj5uz5zP4Wvd+RciVY3VQyYVODk5iY5SgUoplNIMDJqusUoZAUmEoFwqsu6wwzjl1NN44n89mVtvuYWf/Oh/ufqqK7Ck7MqLHcK9AyEE7XabRr3G2vWH8R9PfBL3P+sB9PT0kEim+N0lvyFQYfe5SiEMyYvFHI+pyUmIejJ0FYs6kDBZDKi2NFLI3dz1mONBhSVpABBiu6+0CeDI+VSgBlCa5b0OcVcyPT2N7wfdARGGIf0DA8TicaMYY1k4jsP09BQ33XA9p9/v/gRBwAknncSJJ5/MFZdfxle/+HnGx8fI5fJGZuxQnOCfjmqlguO6PP/cl/IfT/xPUuk0jXqdRrNJoVDg1ptvJuYaw7+o+Uu4oBloqJianMKxBCv77a7SUReREGjb18RjLDkKcAdLbgsAJhWIjhSC2YdHFykE55IOs7MF2u1mVx0oVCH5fJ5UOt2tGLMsizAM+NMfft9dUaqVCvVajTPPeiAf/sQFPPBBZ1MqFQl8/04ZhIdwT6ApFYssW76c937wIzz7eecghKBULOJ5HvF4nOuuvYbJib04kQFQKiSRSNDT20uo5jMAvu8xM1sgGTf1Ifu1AhOwp+ATaoGUS6cZ6L5YkgYA2C5EpAuwT686FPRnJIN5l8JckWq1Ni8QGoakUml6FjSOBEgkklxx+WVsvX3LohLiYnGOdDrNee98F0975rOp1ar4vnfICPwToLWmOFfkhJNO4oMf+yTHHnc8c4UCXlTY4zgOXrvNL376Y6SU80Y9Un3O5fKLdADq9TqzswV6My5DOfuAKcDx2cCkABGHPICDCcIWY1Jo9hR88Bbr1BFq4glj9SvVBsXi3HwqUBvd+N6+/u5gATO4Gs0m3//ed7BtG9uOevFpE30OwpCXvPyVnPPCF1Ot1giCuy5UeQh3DeVSiVNPvx/vfO8H6O3to16vLUr3ZTJZfv+7S9h46y0kIiMNxqj39PQSTyQWeXXlcpliqcJwj0tvWiwiAYlI32HnTCQEKpcmBwCWqAFoNBq7haA0XVFU6uoAqUBYOWBSgTPT0/MCoUohLYv+/oGubFQHqVSK313ya37320voj1JK0rIoFucoF4t4bY9nPee5/McTn0StVj3EGfgHol6vcdjhG/jvt55HIpGg3W4xPTVpWpNJSV9fHxMTe7joy1/CtuxFNG6lFH39/TiOs6gX4Fxhllq9wcr+GCK2TxWQFAQtzd6ijxQ6tG17SXIAYIkagKmpqbptiYliPWT6QKlACaP9LkEQGoXgRalAwdDw8KLP01oTj8fp6enjIx94H9/79rdML4F8nmqlyqc+/lEqlTJaa8596cs49fQzaDYah4zAPwCe16Knt4/Xvekt9PT2IoTgO9/6Bn+69FJy+Tz5nh6uv+463vyG11Eulejt6+t6BlprlFYMDQ9jyXnBVylNALjt+awadE3TkoXcIWn6KxSqCssS01tXrFhyZcAdLEkDACCl2NX0MI009+1WAawZdJASpqemI+Mv5gfM0PCi7rG+7+M4Dh/+xCf5r6c+jY996AO8+fWvYWZ6ijPOPJOBwUHef/67EELgeR6+5+F5HvVajXa7vWg7cQh3Dq00vu/TqNep1xtopalVq6TTGb77rW/yh9/+lqc845lYts0XP3chLzv3BfT3DfCFr36dI48+hkbdyKKblJ9kaHi4K14iIgGVqakptNaREKhYnOOzBBNFP0oBit1ceumS3dMtWQMA4nY/VOwszKcCYT4VODrgEHMkU1NTBGHQ1dJTYUjfQD+xWIwwWjGEENTrddxYjNe94U189ktfZefOnZx7znO58frref2b3sLOsTE+86lP4rouu3aOc+Ipp3LyaaeRyWZpNptUKmU837tvbsVBgjAMqddqVKsVbNvm8COO5CFnP5xqtUIYhlxx2V/40ucu5M1vfwfpdJo3vfbVfOOrX+ENb3oLH//0haxdv55SsdhN+2itcWybgYGhBVWApgPy9NQ0tiVYPeCYngH7pAAniiFt09dx171/J+49LE0eAGBJvVUjGJ8OIOL2zVcFapb12mSTDlPTM7RbTSzLNlWBYUg+lyeZTFKrVQG72z9ucu8Ey0aWcexxx/Glr32Dd573Vl74vGfzpa99g/d96KO85AXncPiGDfT29nHmWQ/gKU9/BjvHx9l2+xb+9MdLufqqKymXS6RTaSzHOcQZiKC1pl6vAYKjjj6GB599NkcfcxyrVq9hanKCW265iWajwQfe+26ec87zOe74E3jhc5/Nnt27+MwXvsyJJ59Mo9GgUa9TKhWx5Hx9RzyRoK+vr5sCFFEKcGpqilTMNj0O920FJkwRkGlfrjfeB7fkXsOSNQBa6C0CGJvxIepC033OIQxkbAbyLoW5EtVqjd7ePsBHKUUqnSaTzVEul4FO3thnYu8exCmnUiqVSKZSfPSTF/CB89/Nuc9/Dl/5+rd5zevfwIWf/hT5XJ7xsR14nkcun+f0+5/JGWc9gJ1jY3z/e9/hD7+7BOl53ZTivys6W6Z6rcaRxxzDs55zDieceBKO6+C1PaQlGRvbQRiGfOkLn2X9YYfxzGc/j3PPeQ7FuQJf/NrXWblylLlCgVg8TrE4R3FuDivK0oRhSE9vH5lsdl4IVEqajSbTM3Pk0w7DeZv9moHqBeXkYulJgS/Ekt0CaK3HhNCmLNhbXBSEhkRCsqzXpVypLk4FKkU8nqC/v39RC2kB3LbJLAZSSuq1GqFSvP1d7+EhZz+Ml7zgeWw48ige9OCHsGXzbWzbupVGo0Hg+1QrFaqVCsuWL+e/33oe/+/d76O3t5dSqXTv3pR/IQghaNTreJ7HOS96MR/+2Cc59bTT8Lw25VKJVquJ1prbNm1iz+5dSCl5+Stfwxtf92rmCgU+/bkvsnzFSorFolFFdhy2b91mSry7zzIkn8+RTCYXVwFWypRKZYZ6HPrSi3sBdhq47IqagQq9tLoB74slawCACUvSmK2ENJt6USBQKw0urOh1abc8ioU5pDXfK9C2bUMdNUoUALixGLfcdCOF2Vkc10UIQbPRoO15nPeu9/DAhzyEV73sXI47/gTOfOADufWWmxnfsYNYPA4Yw1Kv16lUKpxx1ll8+BOf4tjjjqNYnLvXb8x9DSEEtVqVRDLJO959Ps855/mEYUi5XO5yKCzbptVscsXllzEwMMhzn/9C3vuudzI9NcWnP/9FhkZGKEcGVEoT5Lnyisvnf2ae2u26sa4BsCyLQpQCXN4XM0rNC6uAhEC1FHuMEnAoHDF2r92Y+wBL1gDs3LmzaEmxt1hXURutxaq6SFg95OIHAdPT86lAEynGRI6Z7zzjui5Tk5P85c9/7LruQghazSae5/G2d7ybRzzqMXzswx/k6KOPJZvN8quLf47jOIsVfZWiUi4zMDDIu9/3IU486ZTuQP53QGflT6XTvPP893PmWQ+kVCzuR55KJpNcd+01jO3YzsMf+Wi+961v0m63uOCzn2doeIRKtD1DaxLJJGPbt3PdNVcRjwxupxJwaGgEy1qcApydncXzfEb7oxTgPjqApbpithpiSTHned6SrALsYMkaAAAh2FlrK/YWF3MBOrG3VQOGLz4xMTmve681SmsGh4YXDRwhBLF4jB//7w+ZmZ4mkUx200qtZpMwDHjrO97JYx73eH74/e8xsmw5f7r0UnZs32aqBaPPCQJTfNRoNIjFY7z5vHewYtWqbupqqcP3TEv0N77pbRx3/AnMzRWwbBvf97vvsW0TkP3RD77PwOAgl1/2Z4SUXPC5LzCybPn85Md4Co7j8P3vfpt6rY7T6eqkNQI5b8h1ZysnmJ6eRoWK1QPu/kKg0nRzqjYVUrJ39+7dzXvnztw3WNIGQFps8wPYFVUFdmBSgbBq0CHuSCYnJwmDsOs6qlDR19eP47iL6KbxeIKJvXv42pe/RDwe7w42IQRzhQK+7/P6N72Vxz3hiWzaeCvVSplvff0iQx92HBzHoV6r8fWvfgUhJc1mk8HBId72jneRTKcXTYKlCKUU7Xabc154Lg9+6EOZmyuQzWb5w+8u4YrLLyORTCKEIJvLc8mvfsnNN93A5N699Pb28ZFPfIrhkRHm5gqLeBX5nh7+8NtLuPT3vyOVTs8fS2ss26J/YCDic0TNQLVicmICaQlWDbmLqgBNZyTB7oJP0wdLsqQDgLDEDYDQbFYaxqY9YL4dNQChYkWvQyblMD09Q7vdQojIAKiQfE8PyVRqP3mpbDbLJb+6mB/94Pvke3qIxeJkczn+8Lvf8r53/T/K5RJveuvbecazn0sQBFz6+99y8c9+Si6XQynDStu+bSs/+78fMTQ0zGV/+RM/+dEPcWyHVqu1ZEVGOpNfSMmmW2/hG1/7Kvl8nm1bt/Ldb36TwzZsQClFOp1hx/atfP2rX6bZaHLcCSfw4U98iqHhEb719Yv41Mc+guU4xKMKv9s2beRzn7kA13W70X8wW61YPGZSgAuCub7vMzk5RTImGd0nBWi4xTA2ExAoDXJpKgEvxNI2AIhtotMrMEoFdqGgP2vRl3YpFIrU6jUsaz54lMlkTCPJfSakZdvE4nEuvOAT/OJnPzXBQ615/BP/k507d/LKl7yIm268nje99Tye98IX4bU9vvi5C9m48VYymSy2bfMfT/xPvv7VL7Nr5zhhEPLzn/yYlaOjrFixEs/zKJfL3e41BzuCIKBarVKv18lmcxxz7PFcfdWVbN2ymUQyxcc/+iGOOuYYDjtsg+FbeG0+9bGPMja2g9PudwYf/dRniLku/+9tb+GrX/oi//HEJ9HbYyjBW7ds4d3vOI+5wqwpAFrgy4dKkU5lyObz3SIgKS2azSYzswXyKZeRvLW4CCj6Pj5jPDGLpVsE1MGS5QEAaKnHpdBMFAPwO0ow0SBRpnnmYI/DTTvrVErliAsQ9QpMJOjt7Wfn2NiizwzDkKHhYdqtFh9677v5wfe+Q29vH/0DA2w44gh+dfEveMWLX8RrXv/fvOZ1b0QpzUVf+SIfeu/5vP8jH2P5ihWc+YAHsmbdOj7zyY/zrOc+j57eXl7x6tfSPzDApo0b+etlf+Yvf/ojhdlZUuk0juPCQSVII1AqpFar4ToO9zvj/jzwwWdz9LHHMjA4yKte9mLWrFvPxT/7Kbdv3syb3nIetmMDmg9/9MNc+dfLuP9ZD+Cjn7yA3bt28Z53vp1bb76ZBz3kbC77y5/54fe/R6VSZsf2bdiWw4YjjzbFQQtcPMMB6CGVSi9qBlqrVSmVKozkHHrSB1ACDgwJyAwVa/O9e9/ufSxpD8BxnN1S0JgoBbRb+wiEKg2uYHTApd5oUZid7TLIOqnAgcHB/bYArVaLnt5eLvjcF3jO81/I+NgOrrzicsrlMtVyhVWrVqNUyLve/lZe8ZIXMTIywvEnnMT2bbfzgfPfzY5t28jle3jrO97JFVdczrXXXENPby+33HwTmWyW4044gVe85nV87IILefLTn4HWmmq1zMFiAIQQtFpNqtUKp51+P97/kY/z9nefz4POPpuBwUEmJ/YyVyjgODaf/uTHePHLXsGJp5hMyOcv/Ay/uvgXjCxfwRn3P5PPX/hpnv+cZ3L7ls2sWbvOeBOVChtvvZlrr76aE08+lS99/Zuc9cAHUa0ursAMw5D+/gFiC1KA0rIozs1RqdZZ3ucS268ZqADPKEpLNL6We+/t+3dvY0l7AFu3bi0sG1k1PVdVq2erIcuTNvjzvQKFBasHXTzfZ2pqCikXpgJFFEFe3CzUsiz27t4NCF7x6tdy8imn8eH3n8/UxATv/eCH6R8YZPNtm9iy+TauvfoqvnHRV6lXq6TSabZt3cIrXvIijj/xJM55wYt47ev/m69++Ysopbju2mt41GMeR6NeR2tNX18fL33FqzjrAQ/iM5/6BLdvvo1cPh+pGP/rGoNKpUIymeSlr3wVj3z0Y0Gbcl4VKnL5PDfdcCO1SpUffv9/OOW003nwQx7KB97zLn7/20uo1Wpk0mka9Rrf/953WLZsOc96zvM45rjjWX/YYeRyeT7+kQ/SarV441vexpOf+nTcmMvWLZsXibuaFKBicGhoUSbHkpKZ6RlabY/RwV5wBHph3FVCuRIyXQ6Qkjlo77n37+C9iyVtAAAlJeO1tlo9UQxYPrIgSBR9XzMYQwCTkxOLUoFaw8DAAFLKRQbAtm1KpRKbb9tELpfjuBNO4ILPfoHz3vJGXvi8Z/HJCz/PaWecwVFHH81/PPFJlEpz3HD9dfzkRz9i584xnvHM53DN1Vfx0hc9nwc+6MEcdvgRXHfNVdxw3bXsHB9jZNkyGo0GzWaTVqvFkUcdxYc+/kku/NQn+e1vfkm+oz34L4hyqcTo6tW8+W1vZ8MRR1Eul7r5fdu2CXyfP/zuEpqtBkMjIySTKV70vGeTzqR58tOewR9+dwlzhQJP/K8nc+YDHsTIyAiWZRNPJKjXqrzhta/k1ptv5gMf+Tin3+8MGo06s7MzjO3YMZ/+iyAQ9A0MoDtl3pGBmJqaJAxD1gzGQOzLARBMlRWlhsKyxJJPAcIS3wIACKG2eQHsmvFBzgt+aw0ozepBB9eRTE5OEYYhQs5nAvoHBnEct1sWDIZIEgQBN994I0IIyqUS2VyOj33qQo4+5jhefu4LuOqvl2NZNvV6jUQiySMf9Vje9d73Y0mLvoF+Pvulr/Khj36C2cIs111zFbZtUy6X+elP/o94PDEvUKI1pVIJ13V501vP47GPfwLFUmm/bcm/AsrlEqvXruX8D3yY9YdvoFCYXUTuSaUzXH3lldx04/UkEgl279rJlVdczvPPPZdvfu8HPPyRj2LP7t28/NWv5QUveglDQ0M0m01CFVIozPKal7+UrZs3c+EXvsypp51OoTCLkJKx7duZnp5cZAB0pOg8NDiMVvPNQLXWTExMYgnB6kHnAEKgsGfOp+mBlEubAtzBkjcAUshtio6+2/76gCM9NumExfTMLF67jVygENzb20sikVg04YQQuI7DdddeTb1ex7ZtqtUqtm3z3g99hJNOPpXXvuJl3HTTDeTzPXiex9xcgd6+Po465hh+/pOfUKtVOfnUU/nYJz/D6974Jnr7+vC8Nr+++OfccP11ZDKZRcdr1Ou0221e/bo38ujHPo5yqfQvIzYihKBarbJydDXvfu8HGBwcMiW5EbTWxGJxGvUa3/rG16hVawgET3rKU7nw81/mP//rKcRicS751S9xHIfjjz+BueIcjUYjUv9p8+bXvYZdu3Zywee/yOEbjmBuznTpdmyHq678K77nLVYB0ho3FqNvn3oO3w+YnJwi7lqs6DtAFaAUjM/4+KFGsvQ5APBvYAA6go67Zn3Q+xoAzWDWojftUpwr0Ww2FvHIM9ks2dz+vQJjsRjjY2PcdMMNJBLJrl6AVorzP/AhTj71NF77ipdy80030tPbC0AikeAJT/wvbtu0kW23b6HtebTbLR75mMfysQs+w2Mf/wTmZgtc8ImP0Ww2icfjXTqr4zgEgY/v+7zyNa/juBNPpFqt3js38E7QarVIJpO86a3nMTyyjGq1grtAktuyLNKZNN/42le48pqrOe74E3nfhz/GS17+SuLJBNVqlVqtyiW/+RUPeNCDWTG6CrQmmUrRard502tfze7du/j057/ImjVru7UTrhtjdnaGKy6/jFgsvuicwjAknV4s7mpKulsU5ubIJm2Ge+zFrcCi751xosUhD2BJQCK3SxFJhPv7GIBQk09ZjPS6FEtlyqXyoqrARCJB74Ja8u5nRvr/P/nxjwjDANu2u/RepTXv+cCHOPXU03nNK17KbZs2okLFFz97IYlkktHRVfzq4l8Qj8WMsvDcHJlMlv9+63m87Z3v5vbNt3HBxz9KIpnEcRyklBRmjTsdBEaZ6BWvfh2pVKqriHtfQWtFs9nkOee8gCOPPppyuUQsFmNqchIVGmZlvqeXS371K7550dd4+lOfzoc+/gmOOuYYinNztJpNEokk1193LRMTE9zv/mfynW9+nU0bb0UgePPro5X/c19g9eq1i6onk6kkv7vk10xM7MWNxRadlwpDch1597DDAZBUq1WKxRKDOYeBjNxfCjyEnbOhqQIU6pAHsBQgXDEuhfYnSgFeK9ynWSgQF6zoj1FvNCnMznYDbJ2Vd2BgYL9moQCJZJKbbrieq668gnTauOydCkGtFO9+/4c4+ZRTec3LX8revbupN+q8+Q2vZW6uwB//8Hsm9k50C1ca9TrVapX/fPJTeO+HPsJPf/wjvvONr5Pv6SGdybBx4618+QufI5lM0mw2Wbt+PU95+jPxPG9RfOLeRrPR5NTTTufRj3s85XKZXD7PVVf8lW9/8+vEI+N56803cv673s6Tn/YM3nLe/8OybSrRFqZjOH/x05+gw5CPfegDXPLrX5JKpXnLG1/Lrp07ueCzX2D16jWUSvPbingiQWF2ll/87KfEY/H9ZNhDpejrHyAWi6F1pwrQpjg3R7lSZ6QvRjyxuAxYSAG+Zs+chxAaYOyffwfveyx5A7Bt27ZZS4qJQk1RqC5WCO4IhM6nAie7jSU7enL9AwPdVOBCWJaFlIJvXvRVarUqsWgV6ngCWivO/+CHOf6EE3n9q1/BYx77eD72qc8wOrqK3bt28aMf/A/xRKIbnQ6DgMLsLA85+2G8+vX/zQWf+CgX/+ynpFIp7nfG/bn6yiv5/ve+SzaXIwwCDjvscKQQXZbbvQ2tNZ7vsXrNGlzXJZlIsHXLFj7ywffz4Ic8lL7+AcbHxnjzG17LSSedwqtf93pqtRrNRqPrhqXTaa65+kr+eOnvyeXzPP9FL+ajn/w0X/r8hWzZssW4/evWLVr5pZQkEgm+++1vMrF3L/FEYr/z0krR3z+AZdkLyoAlszMzNJstUwTmiMXPVEK1rpguKywpKo7jLPkUIPwbGABMKnBPtamY2LcqEEAYA4CGycl58VfTVFIzPDyCFPKAQbdUMsXW27fwnW9+g3Q6040fdKv9YjHe/5GPcdzxJ/LiFzyX3r4+vvT1b/HSV7yKH3z/e2y89VbS6XQ3FK2Uolgs8oxnP4dnP+/5vOvtb+OPf/g969av57nPfwGf+8wF3HLTTeRyOa7462W02i0ajca9XkRktA1qoOHaa6421ZBK8Z53vp1jjzueRz7mMUxO7OWNr3kl/f0DvPO970cpRavV7K7WjuPgeR6f+8ynOfGkk/nqt77LU572DN72pjeyaeNGPvO5L3LEkUdRKZcX3ftsLseVf/0rv/jpT8hk0gc8P40p5+44Bh0jOzk5SRAErB5yQe6fApwpB5TqIbZk99atWyv/pNv3L4V/BwOAJcSYF2j2zPn76wJozWifg21JZmZmUUp1B6kKFf0Dg4vaSi+CEGSzWX7yox/yx0v/QD7fE/1aoNH86dI/IITgAx/5OKvXrOVlLzqHib17ec0b3shRRx3NZy/4JCCw3fkGpkHgU6/VePmrXsNjH/8fvOn1r+H3v72E5z7/BTz4IWdz/jvfzuzMDLt37eIRj3oMz3z2c9Fad2XJ/9loNBpUqxXOOPMBvPjlr6RYLNJsNvnsBZ+kVJzjHe95L4XZAq99xUtRSvGBj36CZCpFvV6fl14Xgmw2x//+4H/YtXOMt7/rfJYvX85b//v1XH/dtXz8ggs57oQTuOrKKygUZrv3P5VOMzM1xec+8ymEEBFFejE6gcehoaH53g7CqP5OT08hpDA6ALCYTyUFe+YC6p5GSL1k+wDsi38LAyAktysVBQLFvlWBsKLfIRW3mJycwvO8Rb0C51OBB67ScxwXKSUXfOwj3L7FsPUAMukM111zNR/70AfJZrN89JOfxnZcXveql3Ht1Vfz6te/ke3btvLDH/wP2Wx20eTwPI9Wq8Vb3/EuHvaIR/HaV76MP116Ke/70EdxXJfz3/kOGo0G/7+98w6Po7ra+O/emdle1CV3yza26R2D6TUUU206IfQOCZDQS4AQQjWmQwgJoTfbNNMxvZtqirtsSVZdrba3mbnfH7NaS7apH6FJ7/PYAo92d2Z27rn3nnPe9x0yZCinnn4mV157PRtstDHd0SiF/5E/oVKOL19FZSVnnXsBl11xFRtsuDGGYfDAvfcw66knueb6m3B73Jx47JEkk0mm3Xwb1dXVJOOJPl16gWCQL7/8nHvv/g/Hn3QKLsPgwnPP5vnnnuHKa6ay5TbbMPOxR7ntphvxen1IIZzvwLK59uoraWpsxO/3rzbg2baN2+2iqrpmRQWguMVqb+/AbWgMr3JUQHpevYIGbGJaIITsFxUA6C8BALFAAUvaC45QxMqlwDKd8qBOZ6SLdKpvKTAcLiMYCpeyyStDFUtWiUSMf/ztMjo7Opx9um1zyO//wFtvvMbfLr2YocOGc/V101je3MwJRx/BrTdOo6qqmnv/fRdzP/2UUDhcSoz5AwHy+Tz5fI6LLrmMzSduxYnHHskXn8/lxlvvYO5nn/LRnPcpmAVi3d2sMW4cl/39Ko445jhyuRyZdPpHCwJCiJIP4pZbb8M1025ip9/tSi6bIZlMEItGue/euznr3AtYc621Oebww+hoa2PaLbczaMgQYrEYHq+31E/h9XrJZXPcOPVapBS8/+67HPn7g3no/ns586xzmLT3Pjw+/TEuv/SvHPr7P1BTW4uu63g8Hm65cRrvv/s2ZcUguzr0+DuWla/wAhRFVef29g7CPoPBFcaqVmA4JCDbUY/76ke5eb8C9IsAoKRaKGWxxruSTwgWVPgldeVuurvjxGPdfUuBPi/l5eXfaO6hlCIYCrNs2VIuOOcvLF60EJ/PR/2o0fzj2qk8N2sW//jbpWy48Sb8+ezz0HSNxsZGOjs7iEa7uPLyy+iKdFJZVcUXn89l9osvEAqFyOdyWJbFFVddw+ZbbMlxRx1OpLOTa66/EU03mPfllxQKeZKJBPl8nsOPPIpzL7gYTdf6LLl/KIQQmGaBeDzG/gcdwvl/vZTysjKiXU4tfvHihbR3tHPiyaex4y67cNThh9LR1sZNt9/J6NFjiHZ1ES4ro3HZUma/9CI+nw+vz8fNN0zl/ffexTRNFi5YQDqVZp/J+3PUsSfw1OMz+esF53LcCSex+557oesGhUKBq674O7OeeoLyIhX462DZFqFwmIA/uCIBKCXJRIJIV5SqkEF1SF+1CchWLO1whEAlsl+UAKGfBAC9oDdJoezl0QJmtq9AKEoh3IJhVW6SqTSRSGRFKdC2MQyDyqqq75RtLysrY8G8r/jjScdz0blnc91VVxDrjvHH089g5vRHufqKy9lhp52oGzSYQw7/A1dffwOTDziQ5uYmLjz3HCzTYtjwEdww9RruuPVmdMPgxuun0tbWxu133c3uk/bi2CN+Tz6f58K/Xsbczz5l+fJmXG43+XyOaFcX2++4E+de+Fd0XSObzf6/goBlWcRjcQ4+9HBOPPlU8vl8SXXXtCxeffll9tx7X/bZbzLHHHEYqWSCB6c/ztjx47n+2qtobW3hozkfcMrxx5DJZKirG8Sdt93KjEcfZrvtd+TcCy7m0r//g0AwyH5TDuCVl1/iovPPYbfd92Sd9dfn1pumccWlF3PScUfzxIxHCYfDfTr+Vn/ONhUVlbg9fYVAo9EosXiSwZUu/L6VzECLLMDGiIkUIDH7zRbgt04GAmDhGkNbB81b0hFJ2LVdSZOayt7mkSA1GFZlkM8X6Oho79OLL6WktrYOpVb0lK8OtmWhgGNPPBnLtIpswPd57pmncbsd+bC7/nkbiUScqqoqlixayOFFk4vdJ+3JGaeezBmnncy0W27jquum8ceTT6S9rZ2GhsW8+srLHH7EUfzpzL+g6zp//tPJHHvCKZSVlfHWG29w8KGHkc1ksG2bSKSTiVttzXEnncoN115daib6IUjE42y3w04ceexxJIs2Z0II3G4PSxYtpHHpUrbedjvO/OMpmAWLG269g0ULF3DrTTewbGkDmUyGWU89wcGHHc6RxxzHTdOu487bb+Gs8y5kvykHEAgESsKp777zFg/dfy/5XI45cz7gjddfJRgKUVdXx4TNt+DAgw/j8RmP0d7WWuo0XO33YNtU19Sg6zq5oqiK1LRiCTDH8KoQuEBl+pYAU2lFe8xEkyqRh988DbgH/SIA8Morphw8oimZo7Y9ZlFT44hPQK9SYLULWyk62tsRUOoFWFFSkt8YAISUJBNxpNA48Y+nEYl0ksvliXVHaWhYwmeffsJbb7zOIw/ej8/nJx6Ls7zZmb3Hr7U21914C6efciJHHnYwN9/+L+558GHOPvN0mhubGFFfz/333M1D99/Dmmuti2G4+c+dd+Byu3n9ldnstc++GIazVO5J1u0+aU/mvPceb77xKqFQ+Hvfslw2S1V1DceecCJmoUA+ny+V01wuF7NfeolcPscjD95PJNLJxptsxl8vOJclixczbPgIhJA8N+tpzj7vQvbZbwqXXXwB9/z3P5x9zvlMOfAgEokEtrL54IP3iXR2cMetN1NRUckuu+3BRhtvzOg11qC6usYxYS0v55OPP6Lj9rZvDGZOUlBRW1vXh9YthaSjo52CaTpegFKsIgTaGS/QlbTRNNGxbNnS7u99w36l6BdbAAAhWZIrOHrvq5YCYUSNC10TtLS0YtsrBrpt2dTU1GIY+jeW2YQQeNwepj/6EHPnfoYCLMukrLycTSdsznEnnMQNt9zOmWefR7isjHnzvuSLuXNxuVxEu7oYN348t911N/lcjv323I3lzc3c88AjTNhiC2pqavjnf+7hgIMPI5lMEAgEyOVyxGIx5s//ig/ef8+RxCqeh6ZpKKU44uhjCIXCFIqehF93+kqt/EeRy+WYtPc+1NYNKpmjqiLJpr29jVdnv0wumyUS6SQcLiOZTLDu+htwx7//y+922x2f38+/73uQTTabwBGHHsRjjzzEP666jv0PPoRoNApKEe3q4p233sBWMOWAg7jptn/yl3PPY8edd2Hw4KElDb9EPM6//3kH2WwGXf/6OctZsWnU1NWVeBTFI7S1tiFwpOBXuRcS2rot0nmFhljKL1lw4UdG/1gBAJqQ8zK27ei9FVmBpYfAVgyrNPC5ddra2ikU8g4t2LaxbYvyigo8Hg+FgvmNe1CX2013NMp/77qTcy9y3IJzuVxp6Wy4XOy3/wFsPnFLzvvLmTwxczoTJk5ESkl3dzdDhgzh5jv+xc03TOW0k45nz732ZfjIkbw6+2UADjjoECbttTcdHR18Mfcz3nz9dV5/bTZPzJzBxC23xu1209nRQWtrC5tO2JzuWByvP0CiPULBsnG7wLYlugQE5E1FJm9jmbBiRSTw6Cbl5eVstfU22LZNe3s7bS0trLPe+ni9Xp6Y/hiNyxrYYKNN2Hrb7dho440ZPGQofn8Al9vFXXfczojhI5n90gv8647bGTFiBLf/6z+MX2ttuqNRbNvGFwzxwnPPEuno5G9XXMWWW29NJpMhmUj0YV9WVlbx1JOP88H77xIMhr7xO7ZtG7fLRXV1TalqI6TEtCxa29pw65IR1Qas8HsplQCXdRbIWwpNk795IdDe6DcBQKAWQdHzTbGSWahDC64IGHR0RshkMrg9HiycpFIwFMIfCNDVGYGVhCdWRjAU4pXZL7PeBhuyz35TiEQ6S7NRPpcjms8zdNgwjjzmOC46/xzmf/UlY9YYSyKRIB6P4/V6OeeCi9lhx525757/8uILzyKEYMG8efgDgZIk2Q4778Lvdtud2S+9yCUXns/HH85hi622QkrJbbfcwgMPPMLSBXPJmYrqsJt1R7iJJgqk84qmLpuOuEVVQLLdml42GuUl4HEWg9GUxfQ32ggPGVG01VY8eO89bDphAv6An1h3N4898jD7TN6f0/98NkKT5HM5Cvk8qXSK7mgXixctYMnixTQvb+KEk05h9732Lq10lFK4XC4y6TSPPvwg2++0M9tsvz1dkUgf/QClFOGyMhYtWsi/77wdt9vzrbkMp8zoI1xWViJwyWIQbmvvIOjTGVph9CEBFfd7NHQUUDYI+dsXAu2NfhMApJALBBbLOk2wFFIK7J4HwVZUBCQ1ZQZLIjFisRiD/H4KOMIgfr+f8vJKOtrav/VzNE3D6/Vyx603M2jwYDadsDldkUjpuFKKWHc3m22+OaPHjOHfd/6Tf1w7tWSGkc1myefzbDJhczbbYiKffPQRl110Aa/MfomNN9vMkdfOZslls3g8HrbdfgfWWnsdHp/xGFttsw2PPDqDjz/+mLHVBUZUedhuvTJG1rr5clmG9Ud4eHpOHNNWnLdvJb/fNsTQQS7Qi1siCXg1urpifGlX4Q8E+fCD95g37yuOPfEkdF3ntVdnE4t1c+AhhyGkKBF7AEI+H3Pef4/GxmWcdsaf2X3SXni8HpLJJMl4orjyEgSCQWY8+gjNTU389bLLSSaTfSjXPc1C3d3dXP33vxGPxQiHy76109G2nBJgMBjsJQSqEYvFiES6qAq7qAprqwqB2oplHQUQCk3JL7/9afrtoN/kAJSmGqVU9vKohZ1jBQEcwFZobsmgChepdIbuaBdaSRnIxuV2U1Vd/Z1KgUopPB4PlmVx5eWX8cXcuVRUVvZJSrlcLrxeL8ccfyJvvvE6r82eTSi8IlFn2zbx7m7SqRQ77LQTB//+cF5+8QXa29pKpCOlFPl8AY/Xy8GH/Z4vv/yc4084jen33cHxO5UxakgFFx8ylI1H+/hyWYaJawa4+9UYQkre+NtIzj2ihqGDDMhbWEkTK2lC0oJ4geZogerqKlwuF6/OfpkhQwZTWVlJJp3miRnT2Xrb7VhjjbHkc7kVgptSIqTkyZkzWGfd9Tn08D/g8XqIdkUwC4WiA4/C5/PR0d7OP2+/hb33ncwa48YjoJRjUEoRDAbJ5/NcefmlzJ/3FaFQ+Du1OVuWRUVlJZ5eIi5SSuKxGLF4krpyFyHfSixA4bAAGztNpBAoTS371g/6DaHfBIBcLtehCaJdSZNYejWsQMNJBOZyeTo6Oorim8Xecimpqa0tlQK/DUopAoEA6XSac/78J95/9x0qKyvx+ny0trQwc/qjpDMZdv7druy2xySuufLvtLW2EggEnCAhJW6Ph4fuv48Xn3+eyQcciMfr4fHpj+H3BxBC4PX5eO2Vl5nx2CNstMkm5JWPtgXvMO3YUTR12Zw3pZZExuLlT5MctE0Fp/yzmfVHuHntipEMH25gdRcwMzYIgeaWjkmmV4BLYiuKZbQs8776ijFrjMPr8/HZp5+ytKGBww4/gvnzvuKe//zbybJLiT8Q4LNPPuH9997hyGOcsuFtN91AIp4oDW7D5cLtdjPt2qtxu90ce8KJuN1u5nzwPq/Ofhm32015RQXxeIzz/nwGc95/vySo8l1g2TY1NTUY+oqErdQ0IpEI6UyOIZUucK0kBCghm1V0xC2kIK9pWr8pAUI/CgDLly9PSykaY2mbtm5zVa9A4QiEWrblZIxLZqFOrqCublBpFv8uyOWyjF9zLTafuBVn/vFUnpg5g1AwxKjRo/n04084+dij+WjOHC669G9UVFZy2cUXoIpGl8q20Q2DtdZZl4vPP4eP5nzASaf8kUcffpCFC+Y7FlhKscbYsdx393849rhTqfXneeyCdXh6ToI/71NNJGHy5HsJzptSy77/WMoWY/08eN4wkAozbqIZAj2kA4Klywt8Nj/L5/OyJDssakKORmEmkyWdTjFk6FCkkLw6+yU23Hhj4vEYxx55OD6/H38ggK47tNtbb5rG1ttux8j6ek4+9mgKBZO6wYMxTUc0pbysjHv+829efeVlrrruBlwuN5dddCG33DCN+lGjqK6pYf68eZx49FFks1l2n7Sno3nwHYMuQG3doD4lWyklbW2t5POmIwSqrcoCjCQsIkkLTarlixYt+k2bga6MfhMAAKQUi7N5RXNkdaxAGFljoElJS0sLtuphBTr88sqqKjTtm0uBfT9LY8niRey73xSOO/FkLrv4Aq742yVIKfnHtdexxtixHPOHw7jz9ts45/wLaWtt4++XXYImJT6fj3QqxRYTt+T3RxzJ6aeeRCaTYf0NNuTGqdc6QpfAuutvwLobbcGCLz7i4T8P4/H3Euy8vp9hlTpXPNbOLccP4aibG6kMajx89lCwbaysjR7WyWVh6kMRNjtrCVuet4RJVzSy++WNrPOnhTwxJ4mhHE0DTdMcT8NUioUL5hdXNWew4867cMBBh5DL5QiGQjx0/320t7Wx7fY7ctyRhxMOl3HCKaeSz+XQNI3y8goeffgh/nv3XZx93oW0t7Uyea/d+eSTj7jyuqlM2GIijz38EMcdeThDhw/j8quuoXHpUkeo9Tt0MyqlkEJQVVW1in5DW2srYDOy1kng9vkGJbRGTZJZhZCiaeXDv3X0myQggBRqccF2hB+Rq5YCh1e58Lk12traMXux6qyiWajb7XYUeL6DLLeu68Tjce6797/ccPNtDBo8mCsu/SsffTiHcy+8mH9cdz077LwzU6+5mldefpH1N9iQl196ASEEZ551DqFQiHg8xoEHH4rb4+H2W25m1OhRfPnFF/zrjtv58znnMueDOTzz3Ms8eM46tHUXaI8VuPC4QfzhkiVc8ftBPPxWjOc/TjLvxjXArSBlo5UZvPBGgqNvbsa04Jgdy9h1wwDVYR0FtEVNrp3ZRHNrpMSM1HWdtrZWmhob6Yp0cujhR3LCyaeQTqcJBUO8+fpr3Hf33QwfOYKbp01lw4024S/nnY9ZKKDrOj6fj4cfvJ+bp01l/Q034rVXZvPZpx+z/0GHcMJJp9LVFeH0U0/mhWef4eDDDuecCy7i4QfuZ+7cz76R+NMbSjlt21W9FJyEkNiWRUtLK25DOm7AtlrFDLSx0yRnKryG6DccgB70qwCA5CuUQ/pAiVVKgbVlGmG/TiTSRTabxTAMLMvCsizKysrwB4PEotHvfNMCgQDvvvUmDz14P4ce/gfGjh3H1Guu4vgjD2evfSdz/Mmn8sjMJ5n+8MM8O+spfD4vTz/5OE3LlvGX885n3Pg1yaQz7Df5AOrrR3Pj1GswCwUevP8eBg0ezEuvvc9O403226qKKf9o4KEzhzPj2S7qa92sOcTNxPMWc9XhdYwc44K4CSGdOx6LcPwtyzl+twqmHlGLt0qDvO30xgvF2PU8pNOVnHRvhFQqja7p6LrOV19+QTKZ5Myzz2XfKQeQSiYJBAJ8PvczrvjbJSQS3XS0uzns8CPZb/8DyBcKGG43iXicG6+/jumPPkwgECDS2cmmEyZw/sWXUFFRwQP33cM/b70ZfyDI1dffwK57TGLhvHncfdc/8fm835nLYFsOcauisqqXEGhPCbCdgMdgSKXRJwHYUwJc0p7HViCkGggAv2VoSlsqhEVTpAB2kRbcawVQHtCoDrloi8ZIJBJUVVdDoYBtW/gCfsrLyunq7PzOnyelhtvj5s7bbmH06DGsv+GGXHnt9bzw3DP8645beemF55m8/wFst8NOTJi4BY3LGvn4wzm8985bnHPG6Uw+8CB222MSHq+HCZtvwZr/vIunn3yCJ2ZO54ZpN2AYLmbeMJ7/vBBh5/WDaAHJA6/HeOCMYfzlnhbqynT+uGcFpEwIGtw/q5vjb2jiuuOGcPph1ZAxsbrNPl1xurCoKXehzC4ikS4s21mCf/jBB2y40cZMOeAgx8EnFOLdt97ikovOx1Y2Bx92OFMOOIj6UaOdHvx8njdfe5X//PtfxLu7mTzlQDbaZFPGjh8HCl6d/TIP3ncvrS3LmXLgwRx06O8ZNHgQkY4Orr3qCmLdUULhsu98ry3bJhgKEwqFVvQASI1kMkE0GqMsoFMd6isEWioBdhb7D2T/0AHsjX4VAISdbxBC0txlQU45LLCejJCt8HgkQ6rcLGhNEu3qorauzjlU5LFXVVezYN73oYorvF4f8XiMf1x+KZdc/g9GjBjJrntMYqtttuWh++/lrjvv4KknHicUDjNkyBBGjKxny2225Y3XXuOm669j1pOPs81227PJZhOorKpmh513ZpNNN+Pk085i3/UyVFXqPPNRkofOHsYjL0SZOM7RyLvrxW5uOGYQ+ARYGp/OzXDYtEYuP2IQp/++GmJ5Cr1UkksTraUYVO7CEDkam5qxTJNUKsWXX3zODjvuhNfnWKY/PmM6N069ls0mbM4hv/8Dw4YPJxaL8eGc9/l87me8Ons2n3w0h7KKSnbdbQ9cLoPXX5vNvf/9N/F4nOXNTWwxcSuuvHYqQ4cPRwCJRIKp11zFnA/ep7z8u2f/wSkBVlZW4fX5nLIjjg5gPBajO5ZgfJ1B2Nc3AyiEwwpsjjosQCEcCfn+hH4VAHLQrEm62uNWRXfKpizUNxEoDMGIaheZbI6OjnbWlusUjzkyUzW9ZKa+69LUqWuHaG5s5Ny/nMnZ513AehtsgM/n45gTTuKLz+fS1tbGsSecxBeff87SJYtJJhNommSNsWOJx2NMf+RhZk6fjsvtRpOCYLgSzDRnTx7G02/H2WS0F3w6T81JctOxddz8bITyoMahW4egYIMpOOLGZnbfKMR5v6+GeKE0+HUdcMvidChAKmrKNIJuRWdHF6FwmLbWVrqjUcatuSbvvfM2jz3yELOefBy3x0NrawtXX3E5qVSSQqFAwTRLTUpDhg4jEAwy99NP8Hg91NbVcejvj+Cdt98ik8lwxlnnMHzECCzTojvWzdSrr+SN11+lrKwcISTfJx9n2458m6EbFIpy6ZqmEensJJlMM7y6HOEWznanBxIKWUVLVwEplGVZdr/qAYB+FgCampoygwePaIml7Yr2uElZ+QrbbVuBJqG+1oVl231KgQ4E1dU1P/izg6EQnR3tnHvWmSWxC4/Hwwknn8pJxx1NNNLFeRf/lfa2VnKZLPl8jnwuTy6fd3j4CUdWy7Ztbr/zv6zt6WDICA+XPtLBRftXM+/LNJVBSbDS4K6Xujlk6zAiKEHAXbOizFue46nzh4Ftk88rNAmaX4OM4uUP0ry/IINLF2yzto+N1/QyuFynK9qNUvDO22+RSiW48vLLSlujvfadzNBhw/D7AwQCAdxuN8Fiw47X68Xn96NpGh6PB5fLhcvlNFPN++pLrr7ibxx5zHGsMXYsuVyOz+d+xrTrrmbJooWUlVcgv+fg7zEDra6uQsoVpVohJW3t7eTzeUcJWAc72+uFEroSFpGkjSZEW2PjsrYf/AX/StGvAgCAlCxJ5+21myImY+vdpURgTymwvsZAk4KWlpbSTG/bNrZyeOaapqFsG/EDDDpDwSAF0+TKv/+NV15+id8fcSRbbbMdZ/zlHK696h8MHjqELbfehlwmh9vtwePxoWkaLrfLMdrQNEzTIp64heO3DxFtzYGCIfUept7bzu4bB1m4KMvSjgL7bxECFHa34ooZnZy+ZyWDR7iwuk10CTKs8+b7aU66o4WmSJ5xQ9wULMVlj3SwxTgvyQy4Yh0sW7qUSGcn6224ARM234KNN9mUwUOG4vV6nXo7CmWr4k+ndKoV25rNIj3ZKur0NTUu45wz/8SELSZy1HEnsHjhAh5+4H5mzngMj8fdS8fv+1XinBKgpKa2rsRmFEKUTF9RMKq22EHZ+4WaoCVaIJFRSI2l9JEJ6R/odwFAEyzIWtDUubI2GGArBle68Lg02traME2zFy246DfvdmMr9b0bKJRtk8hkOOrY4xk3bjy33DSNP51yEutvsCE77rwLY9ZYg8suuoArrpnK+htu6BBnsIjHu4l1d1M/ajQ+f4A333ybaGsDe20+jlc+T7PxGA9YNl82ZTl5t3JufCbKyBqD9Ua6QQiemJOgI1bgpN9VQNZCKJBlBtNfjDH5ymUctm0Zs84fxpBaxytvQVOeSx7t5J35GezFTzFu7HhOO+NMJm65FeGyMrq7o2QyWccKrRflVkpZEj5pb2sjl8sSLi9H2Q6ZKplM8dcLz6Ozs5N9Ju/PReeexSsvv4TX5+OMv5zN8BEj+Pulfy1Rj7/XvVUK3TCcLZq9wgvQLq7kNF06FYBVzEAFyyJOCdDnEg3f8yv9TaBfNQIBKCGWKgSNkQKwskAoDCrTCXpXlAJ7C4SWlZfj9wdW8Qr8LhBFm/E577/HJhM254Zb7uDyK6+mqqqaB++/l67OCPFEgrNOP43XX5lNRWUlPp8Pl8vNzOmPceG5Z/PRnPf5/It5jKiU1NR6+HhJli3H++hYXsDrkbjKdF76LMUWY/3gdzLe97zSzc7rBRg81EDlFNKvMffzDAdc08j5+1dzz4XDGDJEB9MGDdbYKMD2a7pIJhPsufd+XDV1GrvuvgcIwd13/YuPP/yo1GorpcTldhMMhQgGgzQ1LuOmG6Zy5d8vpasrgt/no7Kykva2Ns464zTeefNNvF4vjzz0AG3tbZx46h+587/3ctgfjmD+vHlEo13fyPf/Oti2hdfro6Kiso8VWKFQoKOzE79HY0jlanQAhaC508S2AaH6XQIQ+uEKQNrMEygaOgpQdAorPReWojqkUR02iHR1k0wkqKiqgkIBy7IJBBy12e6iQeX3hc/n5cM57/PsrKfYeZdd2WzCFkzYYiLxWIx4PE48FuOZp5/knD+fwf4HHczvjziK2rpB/Pmc87jn33dx7ll/JpXXOGq7KlDQEjVZa6iLFz9NMbrWBRmb+ctz/GG7MtAhttzivYUZrjmiDlAICdiCE25fzo7r+fnbMXWQMinkFIZbgEfj4muX8LdHWjj3nDM45NBDkZrky88/5/prr+adt97k+ptupbKyikQiTj6fp7u7my+/+JyXXniO9997lw033ITT/3I2Y9YYRyqZ4Kknn+DGqdcydOhQrrvxZuoGDSIQCFJWVo6ma2hSMu+rr5j+6MO4Xe4fpGHYQ9kOhcOlFYCUknQ6TWdHhIqgi0Flel8vQAAFSzudioEUsl/RgHvQ7wKA0tRSKYrtwAXVNwLY4PFKhla6aZiXJBrtorq21nmdsnEXLacXLfxh/SJSaui6wX/vupN111ufcDhMKpnC5XbT0dbGkKFDuejSvzFxq625adpU3nnrLfaZPIVtt9+B0874M7vusSfHHncKa9RCrNvE5xaIoM685gJrD3fT1F4gk1OsM9wNAj5aksW0FRPHep1r9Wg8/06Sj5fk+PCaerAtbFNhBDTQJRff0cTfZ3ZxySUXcvgfDqOttZUnZs7gzttuIVxWxuAhQ2he3sxjjz7MZx9/zNKlS+jsdMxU1lt/A665/kYmbD6RaFeEF59/lumPPMz8eV8xef8DOfq4E7CVzScffYjP6yu6HecJBILcfdeddLa3lzwVvi8sy6K8vLyPlbss0oC7Y3FGV+uUB2SfHb6UgOn0AAihsIU9EAD6AwzDaM7lCon2mBVMpmwCgd6lQIUwYFi1m/THUTraO1hzrbUBx3Ne03SqqqqdXvzvUQrsDZ/PR1NTE9OuvZoL/nopgUCAgmnS1RVh2nXXEAwFmbDFRPadvD+vv/oKd9x6M48+/ADrrbcBa66zPh63wdghbpZ15KkJ6yAVy6MFdt84wLzlObxuwbBKHRR8sDDL4HKDYVU9y1/Jf16OstP6fsaO8YBtI/06bc1Zzru3hf++2s2fTz+JCZttzB233szjM6azbGkDxxx3ImPGjuPKyy/l8emPEgwEGTx0KNtstwPDR4ygpsYJko3LlvL3Sy/m008+pqlxGVXVNew7eQrhsjAXnXc2jcuWsdY663DUscdjuFz4fD4euPceXnjuGULfovbzTbBtp1XbKAqNQLEEGOkkmcowdHwYzS2h0DsCCKysosXpATB1Xe83bkC90e8CwMKFC+NDBo9YHk2pcW0xi0DYoG8pUDilQNOmrb0NIRyz0B5Dkdq6Qf9vtkg4HObtt97k0osu4OTTTmfI0KFM2nsf1lt/A1564XnmzfuSbCYDQDAYJNrVxaynnmTWrFlUVNQwsraeecuzVIU0MCGTs6kt03n5sxSVAZ2Q35ntvmjKMW6IGzwCTEWyy+SdBRkuO7gGvILmBRZ/+fcSXvokTiIvqav08eSMR7j3P/9EahqbTdiCCy+5jE0325yzzvgjhuFi9z32xFaKZCJOw5LFvPPWm7S3tdLdHSWZTFLI53F7PAT8AbxeL1999SW6pjN0+HCmHHgQG260MUJKEvE4d95+Gw/cdw9+fwBN/+5Eq97oSUTW1NUhpeyTlOxoayeXyzOyxu2UAHO9Xigd9aOOhImui46ysrLW1X/Cbxv9LgCAw//I5NW4tpjJaNlLYlo5fw2rNBACOtracXSBBUrZ2EpRU1uLpkmUshHi+5cCwclQl5WV8cF773LGH09ip112ZcLmExkydChTDjyITDrNJ598zMMP3E93d5Txa67N1ttsiyV0Hn/oXkJeRWfCojasQ15hKYHfI2mJmpQHNHA7OvdNkQKbj/U5qV5NML8lTyZns+V4H6RsDr12MR36OM6/9ECGDXEy6NlsjkIhT01tHXV1gwiXhXn6ycd58/XXEALuuvN2hg4bzrBhw/F4vYxfay123X0PampryefzLFu6lI/mfMBHcz6guzvKLrvuzjbbbkdFZSWFQoGFCxfw2Sef8Nwzs1gwfx6BQKCkF/BDoHoCc2mr1lMCFLS1t2ErxbBqV8kfsPdD0NZtkkgrhGD5nDlzflqH1V8I+mUAEFItLOTZqbGzyAqk2AsAYDseAR5D0NrWhmWaSCmwLKcUWF1djcvlwrYVP1Bu3zkHIQiFw6RTaR558H6enDmDUCiE4TJIxBO0tCxnxMh6/nz2+Wy/447U1NXx3nsf8fiDdyOETS6vqA1LClnLyWi7BK3dBWdVoAnIKhIZm4pg8SSlYHFbnpBPY2SNTuvyPF8uN9lgYy/NyxYSaW8uOf5su/0ODB8xElC88Oyz/ONvlyKFoKyiglQyRTwWZ4O9N2bfKfsTDDoORvFEHCEEE7aYyH5T9uezTz/h3rv/wy03XM+9d/+b6poabNsmmUySSiTQdJ1wOPy9NBZWhx47teqaGoepWby3trLpaO9Al8IRAlWqbwlQg+VRi5wJhkG/EgLtjX4ZACRyvq0UDe0mjlAdfUhBQys1Qn4X7e0djqKvlNDDCiyvIBAIkojHi320/z+43W5cLheWZRGLdZPP5akfPYbfH3k0W261NRUVFaTTaTKpdOkBt2xBPGNTHtB6vOwc9Py3FJh5i3TOptxfXKUIiKUt/B4JusDv1Qh5Je1tbSxZ7CGTSYOCNcaOw+v10rBkMQ/dfx9PPj6D7XbYkS8+/4wDDjqYrbfdngfvvYdbb5zGkzNnsMuuu1FeUcHW226Px+Mhl3VkwtZZdz0uv/Jq5nzwAS88O4t333m7RC32BwI/2KxkZdi2jcfrpaqqulSeFUJSyOdpbW3F59GKSsCrlgCXdhSwbIUXMRAA+hME1iIhJEs782ArpOhVIbIU1SGdqpBOJOLsa8vKyjBxHja/308oFKa7O/rjnY8Q6LqOrmnYtqKsrIxtt9ue2ro6UqkU77/7Dk8+PhMbA93Q0TQNWylH3ruXuGHv2TRvKnIF2yHAFBWP0jmFIZ18QLBKZ/IWYe59J84Wm9cwduxYEIK21hZuvuF6Pv3kY9xuD5dc/g9s2+S9d95m3fU2oLy8nBNOOZU999mX++65m+uu/gdDhg5zOgYjnbS2tLDhRpsw5cADCYZCbLPtdsyf53gXuFyuH23g98ARbS0jGAqtoAFrkkwmQ0dHhPKAQV2Z3tcKDEA5ZrFFY5h+Ywa6MvpnAFDGEilMmiIW5Hvq48WDNvh9kkEVbpoWOazAyspK55Bt4/F4qKisZMmS/8GkIQQ+n49PP/6I44/6A4cefgQ777obW269DflCgVdffQNl2QihcOmSVM6mtHQRYKnitkQpfG5J0KvREi2UnvhynySTtymYCkOHcUPcCJnnnbfe4r//vtPpEtR1Bg8ezL6Tp3DYH47C6/NywD57MmHzLRg2fASxWAyf38+I+lG4PT5GjBzFqNFjWLRwAT6/j4033ZQddt4Fvz/AB++9x3/+dQdfffkFwWDoB1VNvg2WZVNWVo7P5+tjBpqIx+mKxhhR4XZKgL2VgCVgOW7AAhD6wAqgXyFPvlmTWqq12/SnMzY+34o9gLIVwiMZUunitbkxIpFOxo4f7xxTCl03SvvZ/wV67MZTqSQ3Tr2WWU89yc6/25Vtt9+Bqtoh/P3TD5zGF68kmbFx6Y6/IRb4XJLOuOkEM13g1gWpXPHBV1AV1khkLBIZRYUUdHYlqa0dzi03XcuzTz/F66/OpqOjnXAozNjxaxIOhzj/nLOwbcWf/nwWHq8HqUmali1l2vU38fLsF5m41XYcevgfGDJ0KB6Pl0QizryvvuTWG6fx4QcfYNsWwWDwfzL4wekBqK6pcbwGipUTWSwBJpJphqwRwvCsVAIUAjurWB41kVIBLP2fnNyvAP0yADQ1NUWHDBnRFkvbo7qSFr7AilKgUiA0GFnjomBadHZ0IEsCoY6jSE1tXfF3f1gvwHeBx+PF7XKzbGkDt998I/fefRe6y0deaSRzgqBH0J2yEW5HysvO2Qwu1/loSdZp+jEEVSGdpmKnGxaMHewmW1AsWJ5nwkiD9eqDXDZzPsuWNXLEUUez5977kEo5Yh/d0W5OOfV0XnvpGQ48+DAWLF7Giy+/wccff8yc995mVFmau89cn4feWMx5Z/2FcFkZLpdBIh4jmUgA4PV60X6EPMnXoYcFWFNTW7JDA6cE2BmJkMvnGVZpOEKg+V4v1CAat+iM22hCRJRS/Y4F2IN+GQAAJaAhlVWjlkdNhg5eQT5RxVJgfa1DFW5pael1zGGT1NbVoclvNgv9MSCKAqFKKUzTJJ1KYtoakYRFdVjn4yVZcIEuFdGUxZBKg86EiZm10cs16msN5i/PgwlYilG1BoPKDV7+LMmEzXz8brNythrbyYmnnsuZfzqOdddZi0LB5LEZT3PvfQ8yJhxl03WG89KLz/P2K0/jNWB0rY6Vtzl612Ec/oca9ts8yCZ/XkR7ZxSP4Xjz+fz+H32vv1oohUCUhFsUlCjc7a1t2JZNfa0b5KokoM64RTJjIYVY3tDQkF3t+/cD9NcAgBQsyljssKzDZDMpVikFjqx24TIkrW3tjjKtlCjLwip1nRnYtv2TPOhCCAzDQNMhkzRp7syz3kgvL3ySAk1QHtBZ3mUyZpCL7pRNZ9yirkpjg3ovT89JkknaeL2AXzJp4wD3vxHn3P2rwQPTzx3NGXcuY9qVlyBdIWzbJKinOGePWo7ZZV22OHcx5+5bzYm/K0PTIZaE9c9cRH2NAQmTtm6TjCnwely49P9dMFwdbKXQdM0RArWd4NxDumptaUHTYESN0euLLUIKmiIm6bzCMOiXJKAe9Ds24AqIhbZSRbNQsZJTEAyp0An5DNrb2snlcshetGCn79z3P8sDfO0Z45h3zltecGb7uAk5xcgag3nL84wd7MKyFYvaHP/DTUZ76E5ZfNWcA11C3uaYnctpaC9w/6sx0MHjhVvOqOfD69bkwdMqeOKsOj69YV3OPG0kd7zQRVfC4tidy9GCEkIab83LYFo4fANb8WVTgWTWRvsZniRl27jdHioqKvvQgM1Cgda2drxunRFVTgmwZAYqAOkkAAuWQEr6JQegB/02AEjBPCiahRZLgSVYiqqQRmXIIBLpIplMllyBLcsi0MM8+wG04P8PhHBUiz5dmsXwa2hSEOsyWXuomy8ac4QqdKrDOu8vzIKCtYe5qCnTeeGTNBhg522Gj3Rx4u8qOOWfLUSaTPBKSJsMqnGx9cZhNl0viGeIi7lvJDj7njYuOqAGd7mGStlgSh5/P8Faw9xUVWtgwYeLs9g2pQD5U8Kybfz+AGXl5b2UgHtKgJ2U+Q0Gla+GBYhgSbtDB5fIfqcE3Bv9NwAgm6WApq4C9BLHBMCGkE9SW+aiO54iHo+Vlvo9AqGVveSnf0q4DMHnjXnI24yuM5izKMN6Iz0s7yqAEmwyystrX6QgDwQlu28U5KE3Y5B1ZLLJWFx1eA1jBrnZ8vwGli81ocxwNoPSoQR/PifDdhctYb8JYU7ax1EVFrogEzV56oM4U7YIOTqCacW7C9IYuuRnGP/OaqyinEBghUaDpmkkEwm6Y3GqQwblwb5egE4JUNHYWXDKv1r/UwLujX4bAIRLLJNC5dtjNrms3dcpyFbgFgyrcpHOZOjqjCC1FV6Bhq5TXf2/KwV+E1yapDlq8lVjjgljvbz+RRq9QsdtCJqbc+yxcYA5i7IkukxAccT2YeY153jtszR4JWbOBrfihb8Opzygs+YfF3DJP9t497Msr89Jc8b1LWz0l8Vss5afR88aCpZFwQS8Go+8FSdrwn4TgqAUjW15vmzO4zZ+htEPWLZFZVUVLpej0gROCTAajRJPJBlU4cLtWckLTAB5RUu3iRT9uwQI/TgALFq0qF2TYnlX0iKSsFb1CtQE9TUuCnmTtrY2ZwVQcviV1NTVFbUEf1onKU1CtqB4ek6CiWv5WdSah4zNVmv6eO7jJLtuECCds3n18wwoWGsNDzuu5+fyRzoBga4LCimbcJnk7StHculBtTz+XoLJVy/jkOubePOrNHecOJjpFw4DzaaQsTFcAjKKK6Z3cujWYaoGG4Bg9tw0XUkL4ydO/oFz321bUVNbh6ZrpTZpTUo6OzrIZvKMKLIAV64AxNM2HTELKYgnk8nmn/zkf0HotwEAQJM0J7M2LVGzz50odgSsUgoUFGvPKKqqq/7fRJYfAiHA45LMfC8JbsnIWoPXPk6yx8ZBXv08jbdcZ+u1vNz9ahRsAUJx6UE1vPRZksdfiUNIRwgopGzA5o8HVPDhtfW8c8Uo3rtyFO9eVc8fdg9D3sLM2s62IaBxzYwIy6MmF0yuAsuGLDzydgJDE6tIK/6UqK6uKeVvnRKgpLW1FdOyGFnjgr5NgKBBe8ykO63QpWjq6OhI/hzn/UtBvw4AQqqFOdPJCK9iFlr0CnTpzgNl9zKpdFiBtRiGC6V++m2AzyX4vDHH+5+mOGybMh56I45vsIuasMbHn6f4055VPP9RiqZGh+uw/jpeTtmtgiNvbqar2UQPOV97oaCwEo4K79BajUHV0jEQTTjLfiFAC+t8PjfHWf9t49KDaqge6sz+H3yV5t0FaXyeH0aJ/v9C2fYKr4ZeAi1KKVpbW5HSUXheRQhUEzRHTNJ5GwRLfpaT/wWhfwcAxCLbhsZOp19+5UTg4Aodn0ejszNCvlDoJRBqU1FZgc/nLRlR/pTQpNPscvXjnYwd5yNbsGman+GoHcu488Uo22wSZFiVwdWPR8DQIGcx9chaRlS72PnSZVgJMEISiUORNU2FmSv+sRQ2RQmBMp14u8nvLmtg0iYB/rhfJWRMkJJ/vhAlbzpv/3PAVgq3201VVVVJCFQIgWkWaGtrw+PSi0rAK1UAhGBpp0nBAl30PzPQldGvAwDS4YEv6zRXUGl7YCtqwhoVAYPOSBepVGpFALAtQqGww0D7GRKBACGfxgufppnzSYpT96jkisc6WHODAKYFn3ye4h+H1fDPF6I0LsmBFAgvvHjxCNpjJpud00B3h41W4UJ3iaItlvNHSjDcAq3CYMH8POudsZiqoMb0vwwFZYFL44NPU8x4L0nY/zONfpxyrD8QoKysvI8QaC6Xo7MzQsinU1e+Eguw+P02dhacuCD7rw5AD/p1ABCWWCiForHTBHMliXALyvwatRVuumMJ4rHuUi+AbVl4fT4qKit/llIgOMlAXROc/u8WNhjvR5Pw5htxLj24hise62DS1mE2Ge3hlDtbQdcga1NZq/HhNfWYpmLMSQv47xNRLFMgAzpa8Y/066TTcP19naz7p4WMG+zm7Svq0X3CaSkuwIUPdmDaYGg/3+bfLjo2BwLBUhCWUpJMJujqilEVNqgJrewFCFjQFCkgBUhkvw8A/bYVGEBpapmUmMujpl7IgmH0EgawFcItGV5lMGdRN5GOTkaOrHdepxSGYfxspcAehHwaHy7OcfF/WvnH4YM4dGojMy4cwVZr+rjxsQ4eOnM4w46dx91PR/nDPuVYkQLVNRofX1vP+fd38Kd/tXDZI+1ss6avZJzR0FFg9mcpCpbiisPqOH1yJWBjZ21kucHUezp4/Ys0NWXfz7zjx4ZlO2agbo/bcSPG6QFwSoAJ1qrz4vP2dQMWUkBB0RRxlIAtYfXrNmDo5yuApVVLOzUh2iNJm66E1WcPYBdLgSNrPOTzBUcgtLgFcKyoBFXV1Shl/+SVgB4IoCpkcN1TXTz7UZI/TarilJubOeXAWj5cnGVZR547Tx7CUTc389FHabRyHTNlIXTF34+r5csbxnD6npWkcop352d4d6HT5nv5oTXMv3kMpx9cCQUTK2sjywxeeDXO3x7rpDyg8zNO/qUSYGVVNZqm9+kB6GjvIJ3JOSVA10pVGgmptE1rt4kmiRmG0a9LgNDPVwDMoSCH0JDM2INbowVqa1fsaYtKMQyvcgQr21rbHPGIYqZZKaitrUOK/z0r8Jtg6M5W5bjbWvjXiYNZc5iX6+5v5a5ThnLwtUs5d3Idp+1eyQ4XL+G9K0exxngPdtREFUxqqzRO2reSk/aucJb3AtBwpoWcjRkz0TTQKgxeeyvJETe14NIlHpfgZ4p5fVBXV9dLsVkghaC9rQ3T/JoSoBR0xE26UzZSiuULFy6M/2wn/wtBv14BAEgpmrKmoqnLXLUUqGyGVxsYmqCjowO7aH4JjhRVTW0tuvHD5Kx/LCgFHkPgcUmOvqWZ7pRNW9Ti5lmd3HzcUG6a1cE+m4U4YMsyJp63hNffSSErDDSXwM7bWEkTlbHAtKBgoTIWVsJCFWx0r0SEXDz5YoyDpzZh2hDwyp998Cul0KSkpra2zwpMAa1trQgBw6uLW5SVegBaoiapHGiIfmcFvjr07xUAIFDzbBvHK1AIihOKAxuGVbnwe3RaW9tKpUDbtoulwEq8Xh/5fK6UIPw5oACvS6BJjalPdrLleC+L2rIsbstx4m5VPPZWN5uO9oISTLmqkdP3quTPe1Wgl+mQtx0BkSKEAM0QoEti7Sb/mN7CbS9E8bgkId/PP/jB4WO43I7deG8SkGWadLS34zYkI6pcYK8Y/z0lwKaIiWkpDEM1/Eyn/4tCvw8AjiecXVQIVn0EgrGgtkyjPOCis7OTTDqN1+sFKEpdOaaY7e0Zvqeh7Y8OpZysfNiv8/6iHEGv5P2FWV78LMOBW5axqDWH17DZdm0vV87s5NG34xyydZhdNggwps7A0Jxrz+RhQUueJ+ckefCNGE0Rk7KAhkv/ZSz7wQkAPr+fsvKKFT0AxRJge3snQZ/O4MqVWIACELC0I4+NQMD8n+n0f1Ho9wFAIJYIWewFKDh1cLunsmcrKgIaNeUGi9oTxGIx/IGAc8i28Xp9hMvKae2lGvRzQwjwuSV5EzRNpytpM+3pCEPKdXQN4hmb6pBBU8Tikkc6ue7JLqfhyXB2g4msxfKoSSav8LslVWG92AL9815Xb9iWRSgYJOD3l3oANCnpjsfpjHRRHXZRE1xNCdCGhnYTgeq3ZqAro9/nAPJ2fokUqtDSVcBaiRWIrdDcguGVLpKpDJFI54peANvG7XZRXVONZX+/XoCfYjBp0glmHpejDtyVtmlPKAq2wFLOXr4qqKNJQWPE5KuWPF+15GnptnEZGpVBHa9b8r9ObTqEKode8F3vi2VZVFZV417JDLQ7GiUWSzK40o3f15cGLCRQUDRGCk7Tk11o+LGv5deIfr8C8Hg8nZaV7+pIWLVdKZvqihUx0VYgdcGQShf5fIFIR0epG1AphZSSmpo6lK2+UyVACDAt5Yh5Cqel1xmozk9NOMIajlLtjzf0hFh9044QYOjif87ms22wi23Hlg2WpbAUWLZTzuvROgr5NFy6/Nakqm07QqCGrpPv6QGQkq5IhEw2y+CKALgcd6QSpCCdtmmN2WhSZfPQ70uAMBAAWLhwYW7I4BHNyayq7YxbVFdp9FYIRsDIWhe2bdHe3o6gRyHY+a3aujrEdywF5gpQEZAcsV2YjrhFS7RAZ8KiO2WTyFhk8pArWEgpCHo1dG31s6KTsF8RdHq6An9KVp5pO+YjpuUMbIETTNzGivMQAgqmIpa20DWBRxcEPIKwT6cyIKkJ69SWGQyt0hlZbXD7c1HmLMk57kVfgx42Zk2xBNhzD6SUtLa1ki9YjKx2gSZK/QEASEEkYRJLWUghWpqamrr+t3fo14F+HwAANMGibEFt1BQxWXONFWahqrg+ra9xoWmS1pZWbGUXHzzbmYm+Rykwk7cYWuHm4mPqnGkxozDzNomsTXfSpitpsbC1wPR34rz4WQq/R8NtiNIAM21FLG3j0qA6pOE2NAqmojttEU1auHRJ0Lti8AggU1DkCiuSm363M+Ov7nSFgFxBkcnboJwB5HOvqPsLHBJOPO2srYdWagyucBHwSLJ5m4aOAo2dJj63htctSOcUY+o0TvpdNTVhneqQTmVQI+wT+DwSDOEsezTAp/HaF2nemJfF5/n69Y+z8tKora0tOQOLovGn06uhHCVgVJ8KIJqgtdsimVNI2b9FQHpjIAAASLHQtBUNHXkQ/pVKgYrhVQZ+t0ZrWzuFQgFRtBJyBEIrcLvdWJb1raVA24aqoA55C3I22ArdLykvNyi3FfWWYuP1fRy4c5i7noxy9r1tSKFj6M7ATGUtDpwY5sjtQ4ypc2HogoIFnXGTd+Zn+ddLUT5ZmqMyWOT8W4qRVRpVIR3LcgbPsohJIqtWK+JpWoqakGRwhQu3Lgl6JAtacizrsjA0J3fQlbDYZk0fp+9ZwaZjPAR8xb2LrUimbKa/k+SvD7eTzCosC8JejQN3LQeUc82qF+tKrDAtQTpeDApVsjJb/T20MQyDiqqq0v5fSIFlWbS3teEyZNELkJWUgB0SUM4Er7v/OgGtjIEAAEgcZdhl7Y6abt9SoKK2XKc86KKjo5N0Oo3H48GynGRUuCyMPxCkO/rNK0pHYkBRW6aDKDoQCcHipY6q7ohqg3CFhkqYCE1w1JRKFrflufm5bsJ+jWTG4urDazl6vwrH5cZSYEhAUFElGTvey+E7hDnuluU88laC8oBGLG1x4ZRKjt6vEtIWuCQnXLech99OUBHoG6yUgu6Uze+3CXHpcbWQU+DX+NsdbVzzZITKgE5XwuKQrYLccuoQMBTkFbikc3VZRSAgOHy/CsYOdjHlmkbyClpjFqmOAn6/wMw7Ov4ISGZtokmLjrhFe8wkmrR4a17qG5f/UCwB+vxUlFf06QHI5XK0trUT9BoOr2FlJWAcnoOyFdoADbiEgQAAoFgsBSztLIDlKASXKkg2lPkFlSGD5d0xUokEfp+PAsVSoM9PeXk5kc6Ob/sMFDgU1WLDEV7JtY9H+M/sGEOrdE7etYLT9qnAzlnIjMmxO5Vz72sxOmImh20T4uh9KyBhFrOTki8X5fC4BPVDXKhYAeGV3HHCIL5ozDG/xUQo4VxH0dAE5awKVju5Fv8xV1DO7GnaUBAYGggEqZzNGnUG044aBMKGhA1C8sL7CTIFmz02DKDpoCJ5Nt/MzxHblXHNk13EUjbdKRt/UEd3QWe34pCpjTR3WWQLNum8TaGgKNjgd0sCHtm3fXcl2LZFMBQsmoH2yIBpxGIxIl1RKoIGtSGtTw+ALJUACwgESqh53+Gp6Bfo92VAAA2zWQhFa7cFOVYpBbo9kqGVLhKpNNFotCQQats2bpeb6l4daV8HhZPhH1SmU1pfmNCZsNB0SWfC5uKHOvhkQRbplZBXDK/WGVRhIAWctGs5FOzizK9z5l3tTDyvgS3OaeD6GV0Ij4bK2BDSOHrHcnKForCHEGCqIpW3mHX/muW1FDiGowWcz7EUbsPp/svkbSZvHsQol87n+HSunBFhjysa2e+qZs64u724GgByFgdMDBH0SLrTRc3F4iGPAY2dJk1dFnkTXLog6FtRdvymwQ/06sD09tIB0IjHYsTjSWrKXM62pHcJUDj3uiliIqRCs7XGb/6U/oOBAADkoFkTItIRt4imLCcpVYRSgCEYWe0imy3Q3t6O1qsUqGmS2rq6b2UF2srx5qgp052HUwgo2ESSFl6XIOTTUOAYlcgiwaWY3R832GD9EW7I2uDVeO/LNHe+GMXj0igowdSnOmlrKyAMATmLrdfyEvY5+YG+xkUK0179+BfFvzL53ptngdflJAMNTbD5OK+jm6AJcnGLB9+MEfLqVIcNHn07zrJmZxWCBWsNczG0UieVsWmLFZmWNgS8ghE1BobuXBtITMv53Gz+a1Ynve+jZVFTU4tuGKX7rWmSrq4IqXSW4dUuhLv3Eg6QgnxW0RazkEIVLGk1fcvH9BsMBACgqakpIzVaYmmL9u6+tODepUDLtmhrbS35z/WMk6rqGr6tbm/bCrchqA4VZWolJLOKroRT9rNshSZgcLnuPLwCLAu6kyYb1nscA49iAu21z9MoKfB5BEGvJJOHRa0F0J3ZvjbsZNst23Zouz1jQUks++vPUwD5An1mT48hsG3wuYVzbpYCTdAZN0lkFF6XxGMIsoWisEpABynQ3Ro1YZ2sqWjtsShXTs4g4BZEYgUSGZOCaeExBMMrdYZX6nyTwppTAnSEQGUvQVYpJW1tbeTzBUZUuxwz0JV0ACMJk66khSZF29KlS9u/8cvqRxjIARQhpViSybNOc9RknHSX/t0pBcKIGjeaFLS2tmAXS0+2srGVoqq6Gl3XsItClauDrSDgFlQGistTTRCJWzR0OAKVpqnYY+MAm4zxOMk1XdIesWjuMllzqGdFxtxSzG/JYxT9DHvGdyxj01O+8LoEAa90vPP6NAeolYtjfSAEZAt2j8smAB5DogCXJvC6ZClDnzNVcZAppBT43ZJpT0V4+K0YbTGTRNpmWWcBn1uwvNvhGisFwrQ5fLsytlvbz+g6R8i0OqQxvNbgrS8zTL66Cbchi6uDvujRYahZqQQI0NrSilKKUbUu57P6fLnQErV6qh9L6SMU1r8xEACKkKh5BVvs6SzBS2OpaBaqGFZl4HFptLV1YBbMPgrBVVXVuN0eR5v+6wKArQh6dcr8RZK6rQh6BZceVE1TpEBFUOO4ncpBAzOv0EMaz38SI5q0Suq2zrZB0dZtOnLdJag+dX0pBHpxbSf6/hqm+fUNS0KIYhKwpzyn8LhEr/dYUbbrESalSK1xuySvfZUhV1Cl7ka/W2BokpaoVXrPQk6x15YBp4LRc4OVAq+kvsaF1yUdwc7V3EalFLphUF1Tu6IEKJwSYGtrKy5DMLzKEQLtuR/CuSE0dhbImwqva0AJuDcGAsAKNICiKVLAyXv3KgXaUBfWCPl0Ip1dZLMZdMMAy8KyLMrKy/EHAsS6u7/2hlq20wXoczsBoFCAipDglAPKHf3+njp5wUYv14m3WFz3ZBcBr6QmtGLmNQsQS1ulOr7CMSrxulY0LzhJf4FA4OoZSN+hS1AAOZPSFgQodfZZyikMOOUMgUsXuDTl/H7xMwMeScCz0nsKaO02wSoGVXAoyEbP+gVnPk45M7rPLehOrX6VsjotRiklhUKBzs4IPo/OoAp9VScg4Ui/OzFDDJCAemEgAPRAslgASztMsIoCoT3PkaWoDGnUhA06olESiQRV1dWYhYJjFup31GmjkcjXvr1lK2f/7xLOEh/lMFRMsSIT43a64776Mssp/2xlcZtJmc8h8/S04mXzNumcXZqVlXK2/n63LJ1vwe7p/us1yIoHTWv1g4vib+ZNG9MS6IZzjh7DSSTmTZtMrtjEYzp7f7chiWX7btqV6vVTgFbMF5B3XusyoCNm8/xr3bRGTVq7LVq7TTriFpGkRbYAbtfqo5Wjxhzqo8YspSSTTtMZ6aIi4KKubDVmoMqpACBAaGqgB6AXBgJAEVLKxVJYNEech1X0bgawweMRDKn0sOjLFNFoF7V1dc4hpfC4PVRUVrJwweop5k4TENSVac5gVwrDp3Hvi3GenpNg/GCX0+yTtZnbmOPNr9Jk81AekGhC4em1984WbDL5FW68jg4ATgtwz/48b5POWUip0EtEH7GqScZKEMJJAlp28cFQTg5Al4J8AeIZq7Q38rmdJb6KOR8qcMZdd8oqJedcurOX70paJDI2waAAXbC8y+T421pRAlyGRBY7gnVN4PsGBqJlWVRUVOLzejF7mYHGYjG6u2OMrTUoD6zUAyCBovmLI30+0AXYGwMBoAhN01qktONtcSsUTytCgRXHlFIIl2REjYvMR110tLez9trrOMeKib/q6hpUL4eaPigOvNoyoyjAD+iS9xZkePD1BOGgVnroNenw+cN+Qc5U6FLg1kUpB5ArFJt5eq0A3IZDsik2G5DKKdJ5hSbESjkAh4X3dQNMCEHeUpiWjVsIUA65R9cgm1d0Je3SOt5lCEJ+iVUc7HlL4XcLTvldObXlGoPKdJq6TC5/rJPulCKasgiGDUdkJawxpMogkXUSlt9hdwI4fRcVlZUYhkGhUAAcGnBnZyfJVIahVeVIt3C2GD2QArNo/yaFKliWPSAF1gsDAaCIhQsXxocOHtEUS1trdcRMQuEVt8Z2Kl8MrzKwTIuO9naEkKWBLoTDCvy6ydWZI5XTBNSTzTcV3SmLipBGWS+DjZWTdiu/p2U7q46eX7OKe++QTyudaHfKJu2QXnr1AThv9k2NQEKAaTosP39xpncZAl0KCrZiedR0zl8pcEsGhQ0sy6HjFgrgDQguPaQawhJ0aPgyy98fi5DIKDoTNsOLnPxyv6TcJ4ilbVSxW9EuXpdpK9y6xND6XntP1r+mtg4pV1CGpZR0tLeRyxcYXiwB9nFrk4Jo0nIarqRor6mp7mhsHOgD6sFAH0AvCERjJq9ojToCoSsnv0dUu5AC2trai+U0UZKorq2rQ9M07NV4Bdq2kzWvKy8O0mI2vyNuFbPpK5x5+pyPcOi02cKK7h1NsiKZhrOnrw5qhH0ryotNkQKZvI2mgVGqFjhNN99GWixYNgWruJfAWcYbmvOBi1rz9Gwl0ASjB7kw7SIdWDhsxXjKgqQJSYtE2slV5C1FW6wouqrA7dXwuqRj0pmySGYsTMvGY8CwCh2fu88q3vkKiiur2rrakiuzEE6is6OjA6WUQwISij7fgAYt3SbxjEITtMyZM6fwzXegf2FgBdALQmNJoSAcgVDpK/27UwqEYdVOKbC1tRXTdEpxluUkp5xSoBtlq1XCas8yvTpU7AKUkE7bdCXMr6saAk4pLZNVtMctxkmnczDsl3gNSSxtgSHI5mzGDXGBV0DGUTT6oimPaQlceq+gIpzZv2d1rFaM8Z7DxeZERb5HIrx43rrmBLDPl+WKyTznDTYd7UEVtxV5y8bnMgh4ZCnIRZJWUbcAJ6iKHhKUYvIWYSaM9TJ2sJtBZRq1ZTq1ZY6f34m3tfDw2w6hacU9VBi6Qc1KJUDbtmltbcOQThlxlTyHFLRETfImuF0D+/+VMRAAekHCfIViSXuxFCh6PUyWYkiFTtBv0N7eSS6bRdM0LMtyNOrCYXw+H8lkgpVvq6UUfo+gNlx8oKUgkbGJZexvNNjQBOQsm8+W5th6U7/DuCvT2GKcj9uej5LySixbMXmL0IoXmfDWvDRSW2EftmItrYilLCIJE9PUSgFAKef3vC4noOXN4jbBBndx8LsNwdzGLM3tBYbU6ZCz2X5dH+sN9/DW/AwoOG23CqRfotImQncChpOvEM72AWe5rwoWp+xd5pQveiJNsakIv8bIGgOr18oCirwLj4fy8grsYgJQSEmhkKettR2fR2NolbGqF6BwSECmrfAMCIGugoEA0AtKqvlQLAUW812lwVMs49WEXUS6oiQTCcorKpxDtk0gECBcVkYs1r3K+1qWosynUVdpOC29BmSXmySzaqWGnr4QAlya5MkP4py0V4UTEfI2fz+0Gr9bMH95jv02D7HdBn7slIUMaCxYlOPt+Wl8LlkaKD3nrxQcvm2Y7df24TKgYAlshx5Le7zA85+kyatiAHDuCIburCQMTRBJWNz3WoyzjqhBdRUwPJL/njaE/8yOMrzKxZE7hCBjOpyELMx4L4FblxTsYjuwBK2HMNRzb0Wv6dqSkFWU+bXSNqfn7ti2hT9QRigcLvUAaFKSTqfp6OykPOisIPoIgTqX4PArADFAA14FAwGgF5RSS6SA5q4C5O2VSoEKn1dSV26wbGGaWCxGVXW1c8i28Xi8VFZWsWTxqqtMtyFIZhUn3d7C0AqD0bUuGruc/njtGwIAgN8jeHdBln8/G+XIKRUQMykPC645odaZ7SSQsRwGoZBc9kgHqRyEvA53qKejzrScAXHqfhUlslFpePkEy77KMuvDBpSCfEGVBqhhFHMAQhH0atz6XDeTNg6y1npe6DYZNUzn0mNqnffL2g7jyatz/T3tzFmUozyoEU9btMctMMHKKToSFl0Jm/a4RWu0wPKoSUvUorW7QEfMpC1mUR7Q+pAynRJgBX6/f4UQqNSIx+N0dceor3BT7u/LAly5BCiR/d4LcGUMBIC+aNEEiY64FcxkbLzeXk+gDXgEQyrdZD6LEensZI1x45xDSqHrGtU1qzcLNXRBpgAPvZko6dS5dUnwOxht6FLg92qcc187mZzFibtWIAKyWEpUThdhUCcftTjnvuU88UGSiqCObSuUEoR9GgR0Z7VdGvO951bnv61iB7BtKydohDTIK4KaQ2KybYXfK4mnLfa/tolr/1DLrpsEHOakDSgBmqS1zeT6p9q58yVHyEQTEPRqfNGYY6+Ll9KZdIRAUlmbXFFT0FbOdksKJ+/hMURJCq10+y2bqqoaDJeLTDoNOCzA7miUVCrDkDEhDLd0Il0PhMDKKVq6LKRQ2NIeYAGuhIEA0AvLli3rHjx4RFtX0g52JiyGBYySa46tQGqC+loXedOkra0NWWIF9mSoBwErMtQ96FHBKg9oK/gFfHNTTum1OIw8gcZ5D3Rw96txtl7TxxqDXAR9knxBMa85x3OfpFjcXqAi6Bh3KuFo/738aYpE2iKTd3r0e6oOjkqwk+ALeCWfN+Yc2S8hePmzFG0xi1jaJp62yBZUSUcw5NPoSioOu6GZdYe5WXuYu8hIVCztKPDZshydSYsyv+6U8pSzCknkFG/Pz6JpoihgKvC6nSYgASDonZPsc2+UUihbUVNbi7ZyCbCjnWyuwPAaFxhg987xa9Adt4gkbTQhOnw+3/Lv+Uj85jEQAPpCaYKGVE6Nae6yGDZ0hd2PKiapRtUYCKCltaXXQHZq1FXV1aUa9dcTbr5TW37fk1Lg0qEiaLAsYnLX7FgpqDgBxWnNrQzqpa21JkF3S65+IkLBUsVgVTwHViTXes5TkzhCncDlMyIUzBWUgLBfw1OckZVytiWWrfPl8gKfLMuXFhRacfYunUevtmBdCsL+byh5fBsEVNfUOO9XPG8hBG2trdiW5VQAxEpip5pwSo0ZCylF8xdffJH/4Sfw28RAAFgJmhCLM5ZiWWeBzYW3NKCcUqBiWLUjmNnW2oZlWY4nnWVh2TZVVVW4XAa2bZf8A35MSOH0/PvcfWfIrwsqSoHXreFesaUvHuj1O8X/EawYPB5Dw2OseO9SyqAXNOk0IPX+5+8b2L4rbNtG03Wqq2ucRialEFJi24qWllY0TThuwKovKxIpHOmxPLiMARbg6jAQAFaGpEHZxcxxz8gqVQJgUJmO36fT0Rkhl8uVZtBSn7rPT7q4R/1fofcM/m2Qoq/C2erfrS9Wpxj83V/948O2bTxuD5XVVSUXJiEEpmnS3t6O16UxtGqlCkBPCbAjj2UrBGJAB3A1GOgEXAlKqHkCp5sOW/UdPJaiOqxRFTKIRKKkU6kV+oCWRTAU6lOmGsCPA9u2CQQdxmVvGnA2myES6SLk16kN6311AIt/L+so9FAklv4Mp/6Lx0AAWAlCiMVCKho7C1BYaaa1IeyXDK5w0x2LE+uOosneXoEeysorSmKVA/hx0LvRyu7FAozHY0S6uqkJu6gOrkYJ2FI0RSynCVrIgR6A1WAgAKyEfD7fJAW51m6bTKavWaiyFbgkQ6tcpNNZOjsjSG2FQKhhFPep3yRsN4DvDcu2qaisclqteyoARTPQRDLFkEo3hleuIgRKzqa5q4AUCuyBFcDqMBAAVsLy5cs7paStO+3Uq3v36ioFaIphlS4KZoHOTscs1Ml4O8o8VdVVparAAH4EKIVt21RVVaPpeqnPwjED7SKbKzhGIPrKCUCIp23aYxa6FDHDb7T+PBfwy8ZAAFgNNElzImvTtrJCcPFnfa2TcV7e3FysYYvSoB8yZGjJtHIA/3/0MP+GDBtaIiI6JUBJc3MzhYLplADlSp4CmqAzYRPP2AjJ8nnz5iV+pkv4RWMgAKwGUooFuQI0dBZgBWempBA8qtaFoes0NCwtsgKd21gwC4wZOxZ/MIhpmj/b+f+WYJkmHo+b8ePXwiyYpaYrpWwaGhqQUjB6kGMGykolwKaISTqvkFIMLP+/BgMBYDUQqPm2UixsKfLfeycCTYd+WxV2saRhKbFYDF13qqn5XI6hw4az0UYbk0wMTDg/BhLJBGuvsy6jx4whn3PERzRNI51Os2jhIsr8BmsPc4O5kheghIWteQqmQArxxc92Ab9wDASA1UCTfCwEfNGYA0v1pewWFINqDDYaE6SxqY35877C7XZ8BGzbxjItfn/EUdTU1tLdHS1uBX6KavlvCwqIx2MEgkH+cNSxJflvALfbzZLFi1nc0MjaIwOMH+outWxDcdemBJ8tzYJQSMFHP89V/PIxEABWAws+1CX25405cgmryFsvHrMAl2DPTUPkciYvvfAiUspSNSCTSTNk6FAuvORvDB8xkq6uCLlc9me6kl8n8vk80UgntbV1XHDxZYwdN55UKgU4GgAul4vZL79IIpllj43D4BNYvZWApYCMxadLc2gSLKwPf65r+aVjIACsBkuXLm1x6XzaGLH4ZGl+heklxW1mzmLyhCCjh4Z45dU3+PijDwmFwqXficfjjB03nmuuv5FDDz8Sl8tFNNpFPj/Qiv5NKBQKdEejCCGYfMBBXDvtZjbceOOSxoJSimAwyPx5X/Hccy9SVxXgoC1DULD7VgBcgq+aTRa0FjB00bBs2bKvfpYL+hVgIAB8DaQUM/MWPP5+AjTRl5ueV5TXGZyxVw2xZIGbb7yR7miUQCBQyv4nEnHcbjdHH3scU2+6lSkHHIRerF0XCgOBoDfMQqG0XZq01z5ce8PNnHjqHwkEA8RjMcAZ/P5AgGwmw43TptHWHufk3WoYXu/G7uVNIARgCGbNSZDKgUtXs4CBxoyvwcDm9GtQX18/Lpe1v6oKSt76+0j8fjBzzuBWgGEIkBqTLl3K028vZ9ddtubcCy7C5/MRj8dL7yOEwOPx4vF4WLxoITOnP8rrr8wmmUri9wcwDONrzuC3D9M0SaWSeDxetthyK/advD/j1lyTfD5PJp3uU0oNBIOYZoGrr7icmU+8yFbr1fHqZSOQLkUht0IlWTcEyhJsecFSGjos/G62WNjQ8M7Pc4W/fAwEgG/AyGEjZ8fSarurDqvimP3KMaO9S3sK3afR0W7zu8sa+GheO1tN3Ig/n3U2I+tHEY/HS9r14AQCr9eH4TJYtHABT86YwezZL5LNZAkEAqVKQn+AM/BTGIbOVltvx977TWbcmmtimRbpdKrPwNd1g1AoxPLmJqZNvYbnX3yTcSOreebCEdSPMCgkrT4PsV6mM/2FOMfe1kbIx6cNjUvX/+mv8NeDgQDwDRgzcuR2mTyzK/2CNy8fSSAsKGTsXnLhCj2s09pUYPLVTbz1WQcjh1Vx+BF/YJfddsfj8ZBKJjFNR2QUnCSWz+vF5XLxxeefM/3Rh3n37TfJ53L4/AF03WBVN4DfBizTJJVOo2sam2w2gX2n7M96G2yIZZqk0+k+akqapuEPBLBMk5deeJ67/vUvFi1pZb2xVTz2l2GMGePGjK0IyAow3AJVEGx1/lKWdNr4PRy4cMmSh3+GS/3VYCAAfAtGjRjxQleCnY7aPsi1p9VB3KRg9dK0BPSARi6uOP3fbdz5QitWIceETdZj/wMOZPOJEzFcLlLJZB+WoJASv8+H1DS+/OJzHn/sUd5+603y+RyBQABN++2sCCzLIpVKoWkam2y6GftO3p91N9gApRTpVGqVge/z+7Etiznvv8ejjzzMG299gC0MDt6mhpuOrSNcpWEm+hKuNAmizOBv/2pXVz/RLSpDfLBk6dJNf+pr/bVhIAB8C9YYPnxUXslF8bTFf08dpCbtGBZWV2ElySocMoohefbNBH9/rIPX50ZwaYqJEzbioEMOYcONN0FISTqV6hMIpJT4fD6k1Pji87nMfOwR3nrzDUcF1x9A+ybjgF84LMsinUqhUGw6YXP2m3Ig663vrMjT6XTf+6Bp+H0+EIK5n37Cg/ffz+tvvEMmB5utWcHZ+1Wx37YhsBVmpm9OTwBahc6b76bUflc3C49bw62pDRc0NHz8E17urxIDAeA7YHR9/bHZPHcYwubxc4ap9db1CCtqYtO3TdjQAb8OGZt7Z8e5cVYn78/rwuuWbLn5puw7eQobbbopUghS6XQf2W4pJT6/HykkH334ATMefZSP5ryPbdv4/P5fVSCwLKskirLe+huwz36T2XTCFggpvjYACiH49JNPmPHYo7z+xtvEU3nWH13OibtWcezO5ciggKRJwVxVDEUv02lYlFO7/m2ZiGc1/G7OXdiw+B8/5TX/WjEQAL4jRo8ceVsqJ4/3GxYzzx6m1lnXI4gWKKhVzS11Q4BPQyVs/vVSN9Oe6mDu4hg+r8bWW27GwYcextrrrIu9miWwlBr+gB+lFB9/+CEzH3uED+d8gG3b+H/hgcC2LFLpNKBYd70N2Hfy/myy2WZomk4qlVxl4Ht9PnRNZ968L3n4gQd4efZrJJJ51hhexh8nVXPczuUYZRIyFma+b15E4RA1ZZnO0kU5tcfljaIjKQh57EcXLl26/0975b9eDASA74HRI0fOTGbl3gG3xd2nDFFbTvALEiaFglrtjdRdArwa2S6Lu17q5tbnIsxdHCUc8rDt1hPZd8oU1llnPWxlr34v7OsJBHOYOf1RPpzzAUrZ+Hy/rEBg2zbpdArbVqy3/vrsM3l/Ntl0ArqukUqnsUrEKIWUWp+BP3P6Y7z88qtEutKsMTzMcbtUcezOZYRrdMhYWHm1SkpUKTAMIKTz0ccZddi0ZtGREIR8vL6oYcl2DNT9vzMGAsD3xBojRz6QysuDCoUCF0yuUqftWynQbeyUjWWvekMFoLmdQJDrsrjzxW6mPtHBoqYY4bCbbbeeyD6TJ7PeehtgWhaZ1WTDfX4/KPhwzvs8/MB9fPbpp0ghnNzBzxgIbNsmk05jWibjxq/FAQcdwoSJEx2yTirVhxEphMDr82IYLr768gsenz6dl2e/RqQryfBBYU7arZqTdi0nWKNB1sbKrdTdR69Z3y8ByV1PR9UFD7QLhY7fw7PDRo7Y85VXXhmgYX4PDASAH4DR9fUXFgpc2p202G4tD1ceXqPGj/cKchYqa6/ibAu9AoFHo7vV5PYXuvnnC50saowRDrn53S47st+UKYwZOw6zYJLJrD4QWKbJe++8w8zpjzL3s08QQuL3O0nEnworBr7FuPHj2Xu/KWy51da43O7VD3yvF5fLTcOSxcyY/iiznnmerq4Uw+pCHLFjJSfvVkHtUAOyNnbO7svrL0IKkG4JHo2GRVnOu7+Dpz9ME/LruHR76uKGhjN+shvwG8JAAPiBWKO+fmfTUvcmMtQYms3vtwlxxqQKaoe5IGdh5dQqMxg4CSzNLcEtibaa3P58lDtf6GRRU4yqyiA77rgt++w7mTXGrT4Q6LqOz++nkC/w3rtv8/j0x5j72U+zIigNfNNk7Pg12We/yUzcams8Hi+pdApzNY1PLreLhsWLeeLxGTz33Iu0tnUztC7MUTtWcuKu5dQNNSBvY2VXnfGh7woq2mIybVYX/345RiovCHqIaVIduWjp0hn/s4v+jWMgAPw/MHToUK9b0y7JmfwlmYUyn+CwrUOcsWcF5YP0b5zRnEDgrAhirSY3PRvl1mc6aG7rCQTbsfe++zF27HgKhTyZTGalDjknEJiFAu+9+w4zH3uUz+d+ihROcu3H9CVQSpFOpzHNAuPGr8Xe++3HxK22wePxkE6lVul49Hg8Jcruk4/P4PnnX6KlLUpNZZCjd67mT5MqqRlqQM7CzqqSXVqf+0MxUHoliXaTG2dF+c+rMTpiioBX4Na4vYB97rJly6I/2oX2QwwEgB8Bo0aNWkOZ9mV5kwNTWcWgMsER25dx/C5lhGudZFYPj6A3inLVpRXB8mV5bn4myn9md7K8LU5VZZCddtyO/Q86mPr6UeRyuW8MBO++8zYP3X8f8+d9hWHoeL3/v0CglCKTSZPP5akfNZopBx3MVtts63Q4plad8T0eDx6Pl6amZUx/5BGefe4FWtui1FQGOGSbKk7bo5L60S7I29jZ1QdGKCZPfTrpTpO7Xu7mny900xCxCXolbp2nhS7PWbRo0dwffGEDKGEgAPyIGDN8+NqW0C7JF9TkVFYxqFxw9PZlnLRbOd5KrZjVtlGq720vJbc8ElyS5mV5bnomyj2zIzS3xRhUV8Fuu+7Mnnvvy/CRI8l/TSDw+/1kMhneeO1Vnpg5nfnz5v2gQKBsRSabJp/LMXLUaPbaZz+23X4HAsHg1874Ho+H5uZmZj35BE899QyNze1UVwY5ZNtKTt2tgtGj3WDaqMzqcyTQM/A1zG6b256P8s8Xu1naaeP3SDy6el5KLh4g9vy4GAgA/wPU19dvJmz112yB3VIZxcgayfE7l3Pk9mE8FRpkizmClV6nAF0ohEcDl6RlWZ4bn41y90sdLG9PMHhQJbv+bif22GtvRo4cRT6/aiAwDANfTyB41QkEC+Z/ha5/eyBwZvwM+XyO+lFj2HPvfdh2+x0IhkKkU6k+egalpb7Hw/KmJp5+6kmemfUMSxvbqK4IcOi21Zy2RwX1o90OXz/rVElWh55yqRWzuOe1BLc+18VXy01n4Bu8pkkuWtjQ8Or/4ysZwNdgIAD8DzF69IiJtikuzOXZNZWzGVWjc9xOZRy5QxnuCglpCztvY6/ma5C9VgRNSwtcNbOTB17rpLMryeBBFey66y7sudc+DB85klw2SzabXX0gSKd54/XXeHz6oyyYPx9D11fJEZQGfi7HyFGj2HPvfdluhx0JBkOk06lVhEw8Hg8er5flzc3MeupJZj39DEsb2wmHfUyZWME5+1UzZsx3GPjFhikrbnPfa3FuKQ58n9sZ+AJ56eJli1/6cb6NAawOAwHgJ8CY+vpdLFtdmsuLCemsRX2tzsm7lnH0juUQADL2Kp1uPdB6VgSGZMHCHDc83cWDr3fS2ZVyAsHvdmLfyfszZNgwMpkMuW8IBK+/9ipPzpzBgvlfIYVESomtbCzLZmT9KPbcex+222FHAsEQmZUHvgC324PP56O9tZXHZ85g1tOzeg38Sv64RyXrrukF21nqm6vpi4AVA5+M4sFXY1z/VBfzlpt4PRK3zie6xsULGxoe/3G/hQGsDgMB4CdEfX39zljqkmyBLdI5m7WHGJy4axmHbF3m9LqnLazCqlsDKLLdvBpokkWLslz/dIQHX4vQ2ZVk+LBa9txzd3bbY08GDR5MNpMll1s1EPj9ftLpDLNfeoF33noT0ywgpcZmm2/BDjvtvNqlPkLgdrnx+bx0dHTw/KxZPP7EEyxc3ExZ2M9+Eys5fVIl64z3OO68aeubZ3yvhLRixjtJdcOsLvFxQx6PS+J18bEm+evAwP9pMRAAfgaMHjFiNwtxcTbHhEzOZu2hBifvVs4hW4cg4GwNzMLXrAikQHgFaCtWBA+81kkkmmTkiFomTZrEbntMYtCgQWS+JhB4PB4sy8K2FVIKNE0jm8tRWN2M7/XR0dHOC88+wxNPPMn8RY2EA17227KaM/asZJ3x7uLA/7qlvkLXJfg1SCtmvp3ghlldfNSQw+3S8Bp8okl1yUAt/+fBQAD4GTGmvv4A01IXZQti7WzOYq0hOifuWsFh24bBL74lEIDwStAlCxbkuHJ6B4+8GSGeyFA/opY99tid3SbtSd2gwWSzfbcGQog+OQDbtlcECSFwu934vF46Ozp4/tlneOLxJ5i/uBmf18Pem1dy7n5VvZb6Cutr6nm6LsAvIauY8WaSG2Z18XFDDrdLx2uoxZrGZYsaGv7zo97UAXwvDASAXwDG1NdPMW11YTbHepmczUb1Lk6fVMmemwfAIyBt8nVGQ6WtgRR88mWG65+IMOOdCLF4mvoRdewxaXd2230SdYMHlxJ9q7MtE0Lgcrnw+nxEOjp47plZPPnEU8xf3Ijf52X3TSs5fc9KtljPB8KGtLPHXx10HWePn4cXPkhx3VMR3p6XxePS8LhYrA8M/F8MBgLALwhj6uunWJZ9cTov18kVLDapd3Ha7hXsuUWwGAhWvyJQgC5B+CQIycefZ5n6VCcz316xIthr7z3ZfdJeVFZVY9sWlmn22gLoaJpGd7SL5599hpkzZjJvUSNen5dJm1Zwxp5VbL6e19GQTluYX+N+rusCfBIKihc/SDHtqShvzc+i6Rp+l1qiaVy6qKHhbn6rmme/QgwEgF8gRo8ceaBpqcuzeTE6X7DYeLSHU3crZ6/Ng+AVkLKwTJuVScgC0DTAqxUDQZrrn4ow850IsWSG0fVD2GbrrVhn3XWpqaktVQc6Otr58vPPef31N/hq4TK8bhd7bFbJnyZVMXF9H0j1LQMfZ8YvwIsfpLj+6S7enpdF1yReFy1SExcuWbrkX//r+zaA74+BAPALxqgRo46ybfuCdJ76fMFi41FuTtu9gr22CIKruDX4ukEpcWZjIfn4iyxTn+zkqfe66IpncBkaPp8Xt9tNPp8nlc6Qz5mEgx5+t1E5f5pUxRYb+EB8y8DXcAa+KXjx/QTTnu7irfk5h7noUu2azhXDR468aYCi+8vFQAD45UOOGjHiCNvmwkxejswVLCaOc/OXvavYbiM/6MpZEVhqlRUBFAepVwMl+HJhlhc/TfHxkjSt0TyxlEnIp1NTZrDuCB87re9n/TU8oOH0JnxNz25p4NuCdz9Lc83jEV6am8HQNLzOwP+7Dbc3NDQMeKL9wjEQAH49EGPq648umOr8TI6Rpm2z9XgPf9yjgu03CjiBIGN9bbJQl4BHOqQDW0EBlKkQunAOagosBTn722d8W/DOpymuf6qLl+dmUEj8Hto0qa6yhbhlYOD/ejAQAH6FGDNixNF5m79mcmKoZdlsvaaHP06qYPsNA2B884pACKfNWEgA4ehrFcf+6vj4sPLAd/IKL3+WQQmJz60iui4uL6+svGnOnDmF1b/DAH6pGAgAv1KMGTPGrQrWqaZtn53OiSqruCI4fVIF225YXBF8w/79u0CXOA08SvBuceC/9Jkz4/vcKqFLcU2qLHNt26dtqR/twgbwk2IgAPzKMXjwYJ/XcJ9csOyzMnlRZds2W4338KdJFWy3SeBbE3mrg5NA1EAI3v04zdSnunh5bgqFhs9NXJdca0tuaGho6P5fXdcAfhoMBIDfCEaOHOnRlDilYKlz0nkqlWWz64Y+/jSpgk3W/vZSHvRKGArB3K+yTH2yiyfmJFFK4veohEsX16Hr1y1cuDD+9e8ygF8TBgLAbwy9VgRnp3OiUpOKbdb0cPKuFWy7kQ90nEBg9rI20ylVCt75JM0tz3bx0mdpcpbE71ZJXYqr0eW0xYsXx37eqxvAj42BAPAbxeDBg31e3XVK3uKsTJ5KpSy2XtPLqbtVsMMGfvAAeQWGgAK8NTfDTbO6ePGzNBYSv1vFDSmusyXTBpb6v10MBIDfOIpbg1MLljonk6fCtm02qndz3M5l7Ly+n9e/yHD7C1HeWZAFJD43CZfOwFK/n2AgAPQT1NbW+n0e35G2qc7MWmKkshVVQUEkaQMSt2G3G5q8xhLqnwMzfv/BQADoh3C4BpxYMNVGuia+NHRucft8D3zxxRf5b3/1AAYwgN8Ehg4d6v25z2EAAxjAAAYwgAEMYAADGMAABjCAAQxgAP97/B/toqGUabb8EwAAAABJRU5ErkJggg=="
@@ -0,0 +1,42 @@
+"""
+Outgoing email through SendGrid.
+The API key and sender come from SENDGRID_API_KEY and SENDER_EMAIL.
+"""
+
+import os
+import base64
+from sendgrid import SendGridAPIClient
+from sendgrid.helpers.mail import Mail, Attachment, FileContent, FileName, FileType, Disposition
+
+
+class EmailNotConfigured(Exception):
+    """Raised when SENDGRID_API_KEY is not set."""
+
+
+def send_email(recipients, subject, html_content, attachment=None):
+    """
+    Send one message. attachment is an optional (filename, mime type, bytes) tuple.
+    Returns the SendGrid response.
+    """
+    sendgrid_api_key = os.getenv('SENDGRID_API_KEY')
+    sender_email = os.getenv('SENDER_EMAIL', 'jailroster@shakerpd.com')
+    if not sendgrid_api_key:
+        raise EmailNotConfigured('SendGrid API key not configured')
+    
+    message = Mail(
+        from_email=sender_email,
+        to_emails=recipients,
+        subject=subject,
+        html_content=html_content
+    )
+    if attachment:
+        filename, mime_type, content = attachment
+        message.attachment = Attachment(
+            FileContent(base64.b64encode(content).decode()),
+            FileName(filename),
+            FileType(mime_type),
+            Disposition('attachment')
+        )
+    
+    print(f"[EMAIL] Sending '{subject}' from {sender_email} to {recipients}")
+    return SendGridAPIClient(sendgrid_api_key).send(message)
@@ -9,6 +9,24 @@ from datetime import timedelta
 from .models.roster import db
 from .routes.auth import auth_bp
 from .routes.roster_db import roster_bp
+from .routes.persons import persons_bp
+from .routes.charges import charges_bp
+from .routes.housing import housing_bp
+from .routes.court import court_bp
+from .routes.deadlines import deadlines_bp
+from .routes.analytics import analytics_bp
+from .routes.snapshots import snapshots_bp
+from .routes.warrants import warrants_bp
+from .routes.cases import cases_bp
+from .routes.autocomplete import autocomplete_bp
+from .routes.headcount import headcount_bp
+from .routes.ledger import ledger_bp
+from .routes.consistency import consistency_bp
+from .routes.archive import archive_bp
+from .commands import register_commands
+from .migrations import upgrade_schema
+from .security import check_secret_key, check_ssn_keys
+from .models.housing import sync_facility_layout, rebuild_occupancy
 
 def create_app():
     """Create and configure the Flask application."""
@@ -16,6 +34,9 @@ def create_app():
     app = Flask(__name__, static_folder='static', static_url_path='')
     
     # Configuration
+    # Refuse to start in production on the development default or without dedicated SSN keys
+    check_secret_key()
+    check_ssn_keys()
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=8)
     app.config['SESSION_COOKIE_SECURE'] = True  # Always use secure cookies in production
@@ -54,10 +75,30 @@ def create_app():
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(roster_bp, url_prefix='/api/roster')
+    app.register_blueprint(persons_bp, url_prefix='/api/persons')
+    app.register_blueprint(charges_bp, url_prefix='/api/charges')
+    app.register_blueprint(housing_bp, url_prefix='/api/housing')
+    app.register_blueprint(court_bp, url_prefix='/api/court')
+    app.register_blueprint(deadlines_bp, url_prefix='/api/deadlines')
+    app.register_blueprint(analytics_bp, url_prefix='/api/analytics')
+    app.register_blueprint(snapshots_bp, url_prefix='/api/snapshots')
+    app.register_blueprint(warrants_bp, url_prefix='/api/warrants')
+    app.register_blueprint(cases_bp, url_prefix='/api/cases')
+    app.register_blueprint(autocomplete_bp, url_prefix='/api/autocomplete')
+    app.register_blueprint(headcount_bp, url_prefix='/api/headcount')
+    app.register_blueprint(ledger_bp, url_prefix='/api/ledger')
+    app.register_blueprint(consistency_bp, url_prefix='/api/consistency')
+    app.register_blueprint(archive_bp, url_prefix='/api/archive')
+    
+    # Register CLI maintenance commands
+    register_commands(app)
     
     # Create database tables
     with app.app_context():
         db.create_all()
+        upgrade_schema()
+        if sync_facility_layout():
+            rebuild_occupancy()
     
     # Serve the React frontend
     @app.route('/')
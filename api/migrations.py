@@ -0,0 +1,217 @@
+"""
+Lightweight schema upgrades for existing databases.
+db.create_all() only creates missing tables, so columns and indexes added to
+existing models are applied here on startup.
+"""
+
+from cryptography.fernet import InvalidToken
+from sqlalchemy import inspect, text
+from .models.roster import db, Roster
+from .models.name_search import NameTrigram, create_trigram_index, backfill_trigrams
+from .models.ledger import build_ledger
+from .security import UNREADABLE_SSN, secret_derived_fernet
+
+BACKFILL_CHUNK_SIZE = 500
+
+
+def add_missing_columns_and_indexes():
+    """
+    Add any model columns and indexes that are missing from existing tables,
+    and rebuild indexes whose columns have changed.
+    """
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {col['name'] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            print(f"[MIGRATION] Added column {table.name}.{column.name}")
+
+        existing_indexes = {idx['name']: idx['column_names'] for idx in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            columns = [column.name for column in index.columns]
+            if index.name in existing_indexes and existing_indexes[index.name] != columns:
+                index.drop(bind=db.engine)
+                print(f"[MIGRATION] Dropped index {index.name} to rebuild it")
+            elif index.name in existing_indexes:
+                continue
+            index.create(bind=db.engine)
+            print(f"[MIGRATION] Created index {index.name}")
+
+
+def backfill_name_keys(chunk_size=BACKFILL_CHUNK_SIZE):
+    """Populate Roster.name_key for rows written before the column existed."""
+    updated = 0
+    while True:
+        records = Roster.query.filter(
+            Roster.name_key.is_(None), Roster.name != ''
+        ).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        for record in records:
+            # Re-assigning the name runs the validator that sets name_key
+            record.name = record.name
+            if record.name_key is None:
+                record.name_key = ''
+        db.session.commit()
+        updated += len(records)
+    if updated:
+        print(f"[MIGRATION] Backfilled name_key for {updated} records")
+    return updated
+
+
+def backfill_sort_keys(chunk_size=BACKFILL_CHUNK_SIZE):
+    """Populate the parsed name columns and cell_sort_key for rows written before they existed."""
+    updated = 0
+    while True:
+        records = Roster.query.filter(db.or_(
+            db.and_(Roster.last_name.is_(None), Roster.name != ''),
+            db.and_(Roster.cell_sort_key.is_(None), Roster.cell.isnot(None), Roster.cell != '')
+        )).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        for record in records:
+            # Re-assigning runs the validators that parse the name and build the cell key
+            record.name = record.name
+            record.cell = record.cell
+            if record.last_name is None:
+                record.last_name = ''
+            if record.cell_sort_key is None:
+                record.cell_sort_key = ''
+        db.session.commit()
+        updated += len(records)
+    if updated:
+        print(f"[MIGRATION] Backfilled sort keys for {updated} records")
+    return updated
+
+
+def backfill_ssn_protection(chunk_size=BACKFILL_CHUNK_SIZE):
+    """
+    Encrypt and blind-index SSNs still held in the legacy plaintext column.
+    Runs in primary-key chunks with a commit per chunk so it can be stopped
+    and resumed; converted rows no longer match the filter.
+    """
+    updated = 0
+    while True:
+        records = Roster.query.filter(
+            Roster.legacy_ssn.isnot(None)
+        ).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        for record in records:
+            if record.legacy_ssn.strip() == UNREADABLE_SSN:
+                # The masked placeholder is no SSN, and the setter would leave it in place
+                record.legacy_ssn = None
+                record.ssn_encrypted = None
+                record.ssn_index = None
+            else:
+                # The setter encrypts, indexes and clears the plaintext column
+                record.ssn = record.legacy_ssn
+        db.session.commit()
+        updated += len(records)
+        print(f"[MIGRATION] Protected SSNs for {updated} records")
+    return updated
+
+
+def rekey_ssns(old_secret, chunk_size=BACKFILL_CHUNK_SIZE):
+    """
+    Re-encrypt and re-index SSNs encrypted with keys derived from old_secret
+    (a SECRET_KEY used before dedicated SSN keys were set) under the current
+    SSN keys, in primary-key chunks. Rows the old key cannot read are left
+    alone, so a rerun skips those already converted. Returns the rows re-keyed.
+    """
+    old_fernet = secret_derived_fernet(old_secret)
+    updated = 0
+    last_id = ''
+    while True:
+        records = Roster.query.filter(
+            Roster.id > last_id,
+            Roster.ssn_encrypted.isnot(None)
+        ).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        for record in records:
+            try:
+                ssn = old_fernet.decrypt(record.ssn_encrypted.encode('ascii')).decode('utf-8')
+            except InvalidToken:
+                continue
+            record.ssn = ssn
+            updated += 1
+        db.session.commit()
+        last_id = records[-1].id
+    return updated
+
+
+def backfill_charges(chunk_size=BACKFILL_CHUNK_SIZE, reparse=False):
+    """
+    Parse the free-text charges of rows that have no charge rows yet, in
+    primary-key chunks. With reparse, rows that already have charge rows are
+    parsed again, so they follow changes to the offense table.
+    """
+    updated = 0
+    last_id = ''
+    while True:
+        query = Roster.query.filter(
+            Roster.id > last_id,
+            Roster.charges.isnot(None),
+            Roster.charges != ''
+        )
+        if not reparse:
+            query = query.filter(~Roster.charge_items.any())
+        records = query.order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        for record in records:
+            if reparse:
+                record.charge_items = []  # The parser only rebuilds rows when the text changes or none are left
+            # Re-assigning the text runs the parser; the stored flags are left as entered
+            record.charges = record.charges
+        db.session.commit()
+        updated += len(records)
+        last_id = records[-1].id
+    return updated
+
+
+def backfill_holds(chunk_size=BACKFILL_CHUNK_SIZE, recheck=False):
+    """
+    Extract hold fields for rows written before they existed, in primary-key
+    chunks. With recheck, rows already flagged as holds are parsed again
+    instead, so they follow changes to the rule set.
+    """
+    updated = 0
+    last_id = ''
+    while True:
+        query = Roster.query.filter(Roster.has_hold.is_(True) if recheck else Roster.has_hold.is_(None))
+        records = query.filter(Roster.id > last_id).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        for record in records:
+            # Re-assigning the notes runs the rule set that sets the hold fields
+            record.holders_notes = record.holders_notes
+        db.session.commit()
+        updated += len(records)
+        last_id = records[-1].id
+    return updated
+
+
+def upgrade_schema():
+    """Bring an existing database up to date with the current models."""
+    add_missing_columns_and_indexes()
+    # The ledger's genesis covers the bookings written before it existed, so
+    # it is built before any backfill below writes through the ledger
+    if build_ledger():
+        print("[MIGRATION] Built the roster ledger")
+    backfill_name_keys()
+    backfill_sort_keys()
+    create_trigram_index()
+    # The trigram side table is built once when it first appears; writes keep it current after that
+    if NameTrigram.query.first() is None:
+        backfill_trigrams()
@@ -0,0 +1,245 @@
+"""
+Retention archive for bookings released long ago.
+archive_released() moves bookings released more than RETENTION_YEARS ago
+out of the roster in bounded batches. Each booking is written as one JSON
+line, with its photo, charges, feed history, deadline alerts and data
+violations, to a gzip file partitioned by release month
+(<ARCHIVE_DIR>/<year>/roster-<year>-<month>.jsonl.gz). Every batch appends
+one gzip member per partition, so a restore seeks straight to the member
+holding the booking. The archived_bookings table keeps a small index of
+who was archived and where.
+Feed rows stay in roster_changes as thin ledger links; only their data
+payloads move to the archive, so the hash chain still verifies.
+"""
+
+import base64
+import gzip
+import json
+import os
+import time
+from datetime import datetime, date
+from sqlalchemy import inspect
+from sqlalchemy.orm import selectinload
+from .roster import db, Roster
+from .change import RosterChange
+from .deadline import DeadlineAlert
+from .consistency import DataViolation
+
+ARCHIVE_DIR = os.getenv('ROSTER_ARCHIVE_DIR', 'archive')
+RETENTION_YEARS = int(os.getenv('ROSTER_RETENTION_YEARS', '7'))
+ARCHIVE_BATCH_SIZE = 200
+
+
+class ArchivedBooking(db.Model):
+    """Model for the index entry of an archived booking."""
+
+    __tablename__ = 'archived_bookings'
+
+    roster_id = db.Column(db.String(50), primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    name_key = db.Column(db.String(200), nullable=True, index=True)
+    dob = db.Column(db.Date, nullable=True)
+    arrest_date_time = db.Column(db.DateTime, nullable=True)
+    release_date_time = db.Column(db.DateTime, nullable=False, index=True)
+    archive_file = db.Column(db.String(200), nullable=False)  # Relative to ARCHIVE_DIR
+    offset = db.Column(db.BigInteger, nullable=False)  # Start of the gzip member holding the booking
+    archived_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'id': self.roster_id,
+            'name': self.name,
+            'dob': self.dob.isoformat() if self.dob else '',
+            'arrestDateTime': self.arrest_date_time.isoformat() if self.arrest_date_time else '',
+            'releaseDateTime': self.release_date_time.isoformat(),
+            'archiveFile': self.archive_file,
+            'archivedAt': self.archived_at.isoformat()
+        }
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, memoryview)):
+        return base64.b64encode(bytes(value)).decode('ascii')
+    return value
+
+
+def _row_values(instance):
+    """Column values of a mapped instance keyed by attribute name, JSON-ready."""
+    return {
+        attr.key: _json_value(getattr(instance, attr.key))
+        for attr in inspect(type(instance)).column_attrs
+    }
+
+
+def _column_value(model, key, value):
+    """Turn an archived JSON value back into the column's Python type."""
+    if value is None:
+        return None
+    column_type = inspect(model).column_attrs[key].columns[0].type
+    if isinstance(column_type, db.DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, db.Date):
+        return date.fromisoformat(value)
+    if isinstance(column_type, db.LargeBinary):
+        return base64.b64decode(value)
+    return value
+
+
+def partition_path(release_date_time):
+    return os.path.join(str(release_date_time.year), f'roster-{release_date_time:%Y-%m}.jsonl.gz')
+
+
+def _archive_entries(records):
+    """One archive entry per booking, with its history and related rows from three queries."""
+    roster_ids = [record.id for record in records]
+    history, alerts, violations = {}, {}, {}
+    for change in RosterChange.query.filter(RosterChange.roster_id.in_(roster_ids)).order_by(RosterChange.id):
+        history.setdefault(change.roster_id, []).append({'id': change.id, 'data': change.data})
+    for alert in DeadlineAlert.query.filter(DeadlineAlert.roster_id.in_(roster_ids)):
+        alerts.setdefault(alert.roster_id, []).append(_row_values(alert))
+    for violation in DataViolation.query.filter(DataViolation.roster_id.in_(roster_ids)):
+        violations.setdefault(violation.roster_id, []).append(_row_values(violation))
+
+    return [
+        {
+            'booking': _row_values(record),
+            'charges': [_row_values(item) for item in record.charge_items],
+            'history': history.get(record.id, []),
+            'alerts': alerts.get(record.id, []),
+            'violations': violations.get(record.id, []),
+        }
+        for record in records
+    ]
+
+
+def _append_member(relative_path, entries, archive_dir):
+    """Append entries as one gzip member, flushed to disk; returns the member's offset."""
+    path = os.path.join(archive_dir, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'ab') as f:
+        offset = f.tell()
+        with gzip.GzipFile(fileobj=f, mode='wb') as member:
+            for entry in entries:
+                member.write(json.dumps(entry, separators=(',', ':')).encode('utf-8') + b'\n')
+        f.flush()
+        os.fsync(f.fileno())
+    return offset
+
+
+def archive_batch(cutoff, batch_size=ARCHIVE_BATCH_SIZE, archive_dir=None, now=None):
+    """
+    Archive up to batch_size bookings released before cutoff, oldest first.
+    Files are written and synced before the bookings are deleted, so a crash
+    in between leaves the bookings in place to be archived again.
+    Returns the number archived.
+    """
+    archive_dir = archive_dir or ARCHIVE_DIR
+    now = now or datetime.now()
+    records = Roster.query.options(selectinload(Roster.charge_items)).filter(
+        Roster.release_date_time < cutoff
+    ).order_by(Roster.release_date_time, Roster.id).limit(batch_size).all()
+    if not records:
+        return 0
+
+    partitions = {}
+    for record, entry in zip(records, _archive_entries(records)):
+        partitions.setdefault(partition_path(record.release_date_time), []).append((record, entry))
+
+    roster_ids = [record.id for record in records]
+    for relative_path, items in partitions.items():
+        offset = _append_member(relative_path, [entry for _, entry in items], archive_dir)
+        for record, _ in items:
+            db.session.merge(ArchivedBooking(
+                roster_id=record.id, name=record.name, name_key=record.name_key, dob=record.dob,
+                arrest_date_time=record.arrest_date_time, release_date_time=record.release_date_time,
+                archive_file=relative_path, offset=offset, archived_at=now
+            ))
+
+    DeadlineAlert.query.filter(DeadlineAlert.roster_id.in_(roster_ids)).delete(synchronize_session=False)
+    DataViolation.query.filter(DataViolation.roster_id.in_(roster_ids)).delete(synchronize_session=False)
+    RosterChange.query.filter(RosterChange.roster_id.in_(roster_ids)).update(
+        {'data': None}, synchronize_session=False
+    )
+    for record in records:
+        db.session.delete(record)
+    db.session.commit()
+    return len(records)
+
+
+def archive_released(years=RETENTION_YEARS, batch_size=ARCHIVE_BATCH_SIZE, max_batches=None,
+                     pause=0.0, archive_dir=None, now=None):
+    """
+    Archive bookings released more than `years` years ago in batches of
+    batch_size, each its own short transaction, sleeping pause seconds between
+    batches so live requests are not starved. Returns the number archived.
+    """
+    now = now or datetime.now()
+    try:
+        cutoff = now.replace(year=now.year - years)
+    except ValueError:  # Feb 29
+        cutoff = now.replace(year=now.year - years, day=28)
+
+    archived = batches = 0
+    while max_batches is None or batches < max_batches:
+        count = archive_batch(cutoff, batch_size, archive_dir, now)
+        if not count:
+            break
+        archived += count
+        batches += 1
+        if pause:
+            time.sleep(pause)
+    return archived
+
+
+def read_archived(entry, archive_dir=None):
+    """The archived JSON entry for an index row, read from its gzip member."""
+    path = os.path.join(archive_dir or ARCHIVE_DIR, entry.archive_file)
+    with open(path, 'rb') as f:
+        f.seek(entry.offset)
+        # Reading runs on into later members; the booking is in the first one
+        with gzip.GzipFile(fileobj=f, mode='rb') as member:
+            for line in member:
+                archived = json.loads(line)
+                if archived['booking']['id'] == entry.roster_id:
+                    return archived
+    return None
+
+
+def booking_from_archive(archived):
+    """A transient booking rebuilt from an archive entry."""
+    record = Roster(id=archived['booking']['id'])
+    for key, value in archived['booking'].items():
+        if key != 'id':
+            # Assigning charges re-runs the parser that rebuilds the charge rows
+            setattr(record, key, _column_value(Roster, key, value))
+    return record
+
+
+def restore_booking(roster_id, archive_dir=None):
+    """
+    Put an archived booking back in the roster with its charges and feed
+    history payloads, and drop it from the index. Returns the booking, or
+    None if it is not archived. Raises ValueError if the id is in use.
+    """
+    entry = db.session.get(ArchivedBooking, roster_id)
+    if entry is None:
+        return None
+    if db.session.get(Roster, roster_id) is not None:
+        raise ValueError(f'Booking {roster_id} is already on the roster')
+    archived = read_archived(entry, archive_dir)
+    if archived is None:
+        raise ValueError(f'Booking {roster_id} is missing from {entry.archive_file}')
+
+    record = booking_from_archive(archived)
+    db.session.add(record)
+
+    for change in archived['history']:
+        RosterChange.query.filter(RosterChange.id == change['id']).update(
+            {'data': change['data']}, synchronize_session=False
+        )
+    db.session.delete(entry)
+    db.session.commit()
+    return record
@@ -0,0 +1,110 @@
+"""
+SQLAlchemy model for the roster changes feed.
+Every insert, update and delete of a booking appends a row in the same
+transaction, carrying the booking's non-sensitive fields after the change.
+Consumers keep the last change id they have seen and read forward from it,
+so they never rescan the roster to catch up. Rows are sealed into the
+ledger's hash chain and Merkle tree as they are written.
+Ids are handed out in commit order: a writer takes the ledger_head row lock
+before its feed rows draw ids and holds it until commit, so a reader that
+has seen id N can never later find a committed id below N, and advancing a
+cursor to latest_change_id() skips nothing.
+changed_at is UTC, like Roster.created_at/updated_at; feed_time() converts a
+local wall-clock moment for comparison with it.
+"""
+
+import json
+from datetime import datetime, date, timezone
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from .roster import db, Roster
+from .ledger import seal_changes
+
+# Columns never copied into the feed
+EXCLUDED_FIELDS = {'legacy_ssn', 'ssn_encrypted', 'suspect_photo_base64'}
+
+
+class RosterChange(db.Model):
+    """Model for one committed change to a booking."""
+
+    __tablename__ = 'roster_changes'
+
+    id = db.Column(db.Integer, primary_key=True)
+    roster_id = db.Column(db.String(50), nullable=False, index=True)
+    operation = db.Column(db.String(10), nullable=False)  # insert, update or delete
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)  # UTC
+    data = db.Column(db.Text, nullable=True)  # JSON field values after the change; null for deletes
+    # Ledger: digest of the whole booking, chain link and Merkle root after this change
+    record_hash = db.Column(db.String(64), nullable=True)
+    chain_hash = db.Column(db.String(64), nullable=True)
+    merkle_root = db.Column(db.String(64), nullable=True)
+
+    def fields(self):
+        return json.loads(self.data) if self.data else None
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'id': self.id,
+            'rosterId': self.roster_id,
+            'operation': self.operation,
+            'changedAt': self.changed_at.isoformat(),
+            'data': self.fields()
+        }
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def change_fields(record):
+    """The booking's non-sensitive column values, JSON-ready."""
+    return {
+        attr.key: _json_value(getattr(record, attr.key))
+        for attr in inspect(Roster).column_attrs
+        if attr.key not in EXCLUDED_FIELDS
+    }
+
+
+def feed_time(moment):
+    """A naive local datetime as the naive UTC the feed's changed_at uses."""
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def latest_change_id():
+    """Id of the most recent change, 0 if none; doubles as the roster generation."""
+    return db.session.query(db.func.max(RosterChange.id)).scalar() or 0
+
+
+def changes_since(change_id, limit=None):
+    """Changes after a given id, oldest first."""
+    query = RosterChange.query.filter(RosterChange.id > change_id).order_by(RosterChange.id)
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+
+@event.listens_for(Session, 'after_flush')
+def _record_changes(session, flush_context):
+    """Append a feed row for every booking written in this flush."""
+    now = datetime.utcnow()
+    changes = []  # (feed row, booking written)
+    for record in session.new:
+        if isinstance(record, Roster):
+            changes.append(({'roster_id': record.id, 'operation': 'insert', 'changed_at': now,
+                             'data': json.dumps(change_fields(record))}, record))
+    for record in session.dirty:
+        if isinstance(record, Roster) and session.is_modified(record, include_collections=False):
+            changes.append(({'roster_id': record.id, 'operation': 'update', 'changed_at': now,
+                             'data': json.dumps(change_fields(record))}, record))
+    for record in session.deleted:
+        if isinstance(record, Roster):
+            changes.append(({'roster_id': record.id, 'operation': 'delete', 'changed_at': now, 'data': None}, None))
+
+    if changes:
+        connection = session.connection()
+        # Locks the ledger head before any feed id is drawn, keeping ids in commit order
+        seal_changes(connection, changes)
+        connection.execute(RosterChange.__table__.insert(), [row for row, _ in changes])
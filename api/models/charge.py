@@ -0,0 +1,160 @@
+"""
+SQLAlchemy model for individual charges on a booking.
+Roster.charges stays the free-text field officers type; it is parsed into one
+Charge row per offense with an Ohio Revised Code statute, degree and felony
+flag so charge-level questions can be answered through an index.
+"""
+
+import re
+from .roster import db
+
+# Common offenses mapped to (ORC section, degree). The degree is only given
+# where the offense name fixes it; offenses whose degree turns on value, drug,
+# amount or priors (theft, burglary, vandalism, drug trafficking) have None and
+# are classified only by an explicit degree in the text. Words that do not name
+# one section ("possession", "trafficking") are left out. Longer phrases are
+# matched first so "felonious assault" is not read as "assault".
+OFFENSE_STATUTES = {
+    'aggravated robbery': ('2911.01', 'F1'),
+    'aggravated burglary': ('2911.11', 'F1'),
+    'aggravated menacing': ('2903.21', None),
+    'felonious assault': ('2903.11', None),
+    'domestic violence': ('2919.25', None),
+    'violation of protection order': ('2919.27', None),
+    'receiving stolen property': ('2913.51', None),
+    'driving under suspension': ('4510.11', None),
+    'obstructing official business': ('2921.31', None),
+    'resisting arrest': ('2921.33', None),
+    'failure to comply': ('2921.331', None),
+    'criminal damaging': ('2909.06', None),
+    'criminal trespass': ('2911.21', None),
+    'disorderly conduct': ('2917.11', None),
+    'reckless operation': ('4511.20', None),
+    'reckless driving': ('4511.20', None),
+    'carrying concealed weapon': ('2923.12', None),
+    'having weapons under disability': ('2923.13', 'F3'),
+    'identity fraud': ('2913.49', None),
+    'drug trafficking': ('2925.03', None),
+    'drug possession': ('2925.11', None),
+    'possession of drug paraphernalia': ('2925.14', None),
+    'shoplifting': ('2913.02', None),
+    'petty theft': ('2913.02', 'M1'),
+    'theft': ('2913.02', None),
+    'burglary': ('2911.12', None),
+    'robbery': ('2911.02', None),
+    'kidnapping': ('2905.01', None),
+    'rape': ('2907.02', 'F1'),
+    'vandalism': ('2909.05', None),
+    'menacing': ('2903.22', None),
+    'assault': ('2903.13', None),
+    'omvi': ('4511.19', None),
+    'ovi': ('4511.19', None),
+    'dui': ('4511.19', None),
+}
+
+_OFFENSES_BY_LENGTH = sorted(OFFENSE_STATUTES, key=len, reverse=True)
+
+
+def _fixed_degrees():
+    """{statute code: degree} for codes whose every listed offense has the same known degree."""
+    degrees = {}
+    for code, degree in OFFENSE_STATUTES.values():
+        degrees.setdefault(code, set()).add(degree)
+    return {code: found.pop() for code, found in degrees.items() if len(found) == 1 and None not in found}
+
+
+_DEGREE_BY_CODE = _fixed_degrees()
+
+_CHARGE_SEPARATORS = re.compile(r'[,;/\n]+')
+_STATUTE_CODE = re.compile(r'\b(\d{4}\.\d{2,3})\b')
+_DEGREE = re.compile(r'\b([MF])\s*-?\s*([1-5])\b', re.IGNORECASE)
+
+
+def _find_offense(text):
+    """Return the first known offense phrase in lowercase text."""
+    for offense in _OFFENSES_BY_LENGTH:
+        if re.search(r'\b' + re.escape(offense) + r'\b', text):
+            return offense
+    return None
+
+
+def parse_charge(description):
+    """
+    Classify one charge description.
+    An explicit statute code or degree in the text wins over what a
+    recognized offense implies; the degree stays None unless the text gives
+    one or the offense fixes it.
+    """
+    text = description.lower()
+    offense = _find_offense(text)
+    statute_code, degree = OFFENSE_STATUTES.get(offense, (None, None))
+
+    code_match = _STATUTE_CODE.search(text)
+    if code_match:
+        statute_code = code_match.group(1)
+        degree = _DEGREE_BY_CODE.get(statute_code, degree)
+
+    degree_match = _DEGREE.search(description)
+    if degree_match:
+        degree = f'{degree_match.group(1).upper()}{degree_match.group(2)}'
+
+    # "Felony Theft" or "Misdemeanor Possession" overrides the default class
+    if re.search(r'\bfelony\b', text) and not (degree or '').startswith('F'):
+        degree = None
+        is_felony = True
+    elif re.search(r'\bmisdemeanor\b', text) and not (degree or '').startswith('M'):
+        degree = None
+        is_felony = False
+    else:
+        is_felony = degree.startswith('F') if degree else None
+
+    return {
+        'description': description[:200],
+        'statute_code': statute_code,
+        'degree': degree,
+        'is_felony': is_felony
+    }
+
+
+def parse_charges(text):
+    """Split a free-text charges field into classified charges."""
+    descriptions = [part.strip() for part in _CHARGE_SEPARATORS.split(text or '')]
+    return [parse_charge(description) for description in descriptions if description]
+
+
+def statute_code_for(offense):
+    """Resolve an offense name ("OVI") or statute code ("4511.19") to a statute code."""
+    offense = (offense or '').strip()
+    if _STATUTE_CODE.fullmatch(offense):
+        return offense
+    return OFFENSE_STATUTES.get(offense.lower(), (None, None))[0]
+
+
+class Charge(db.Model):
+    """Model for a single charge on a booking."""
+
+    __tablename__ = 'charges'
+
+    id = db.Column(db.Integer, primary_key=True)
+    roster_id = db.Column(db.String(50), db.ForeignKey('roster.id', ondelete='CASCADE'), nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False, default=0)
+
+    description = db.Column(db.String(200), nullable=False)
+    statute_code = db.Column(db.String(20), nullable=True, index=True)
+    degree = db.Column(db.String(2), nullable=True)  # M1-M4, F1-F5
+    is_felony = db.Column(db.Boolean, nullable=True)
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'description': self.description,
+            'statuteCode': self.statute_code or '',
+            'degree': self.degree or '',
+            'felony': self.is_felony
+        }
+
+    def summary(self):
+        """Short label used in reports, e.g. "2913.02 Theft (M1)"."""
+        parts = [self.statute_code, self.description]
+        label = ' '.join(part for part in parts if part)
+        return f'{label} ({self.degree})' if self.degree else label
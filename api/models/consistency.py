@@ -0,0 +1,230 @@
+"""
+SQLAlchemy models for the roster data-consistency scanner.
+The scanner walks the roster in primary-key chunks, checking each booking
+against RULES, and commits its violations together with a checkpoint after
+every chunk, so it holds no long locks and resumes where it stopped. The
+first pass covers every booking; after that a pass only rechecks bookings
+that appear in the changes feed since the previous pass began.
+"""
+
+import time
+from datetime import datetime
+from .roster import db, Roster
+from .change import RosterChange, latest_change_id
+from ..bonds import parse_bond
+
+SCAN_CHUNK_SIZE = 500
+CHECKPOINT_NAME = 'roster_consistency'
+
+SEX_CONFLICT = 'sex_conflict'
+CHARGE_CLASS = 'charge_class'
+RELEASE_BEFORE_ARREST = 'release_before_arrest'
+UNPARSEABLE_BOND = 'unparseable_bond'
+
+# Columns a chunk loads; rules get one row of these at a time
+SCAN_COLUMNS = (
+    Roster.id, Roster.sex_m, Roster.sex_f, Roster.misdemeanor, Roster.felony,
+    Roster.arrest_date_time, Roster.release_date_time, Roster.bond
+)
+
+
+def _sex_conflict(row):
+    if row.sex_m and row.sex_f:
+        return 'Both sex_m and sex_f are set'
+
+
+def _charge_class(row):
+    # Exactly one class: the booking's most serious, as derive_offense_level sets it
+    if bool(row.misdemeanor) == bool(row.felony):
+        return 'Both misdemeanor and felony are set' if row.misdemeanor else 'Neither misdemeanor nor felony is set'
+
+
+def _release_before_arrest(row):
+    if row.arrest_date_time and row.release_date_time and row.release_date_time < row.arrest_date_time:
+        return f'Released {row.release_date_time.isoformat()} before arrest {row.arrest_date_time.isoformat()}'
+
+
+def _unparseable_bond(row):
+    try:
+        parse_bond(row.bond)
+    except ValueError as e:
+        return str(e)
+
+
+# Rule name -> check returning a detail message when the row violates it
+RULES = {
+    SEX_CONFLICT: _sex_conflict,
+    CHARGE_CLASS: _charge_class,
+    RELEASE_BEFORE_ARREST: _release_before_arrest,
+    UNPARSEABLE_BOND: _unparseable_bond,
+}
+
+
+class DataViolation(db.Model):
+    """Model for a booking that breaks a consistency rule."""
+
+    __tablename__ = 'data_violations'
+    __table_args__ = (
+        db.Index('ix_data_violations_open', 'resolved_at', 'roster_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    roster_id = db.Column(db.String(50), nullable=False)
+    rule = db.Column(db.String(30), nullable=False, index=True)
+    detail = db.Column(db.String(200), nullable=True)
+    detected_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+    resolved_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'id': self.id,
+            'rosterId': self.roster_id,
+            'rule': self.rule,
+            'detail': self.detail or '',
+            'detectedAt': self.detected_at.isoformat(),
+            'resolvedAt': self.resolved_at.isoformat() if self.resolved_at else ''
+        }
+
+
+class ScanCheckpoint(db.Model):
+    """Model for the progress of a chunked scan."""
+
+    __tablename__ = 'scan_checkpoints'
+
+    name = db.Column(db.String(50), primary_key=True)
+    since_change_id = db.Column(db.Integer, nullable=True)  # Null until the first full pass completes
+    through_change_id = db.Column(db.Integer, nullable=True)  # Feed position the running pass covers; null between passes
+    last_id = db.Column(db.String(50), nullable=False, default='')  # Last booking id checked in the running pass
+    chunks = db.Column(db.Integer, nullable=False, default=0)
+    passes = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'mode': 'full' if self.since_change_id is None else 'incremental',
+            'running': self.through_change_id is not None,
+            'lastId': self.last_id,
+            'sinceChangeId': self.since_change_id,
+            'throughChangeId': self.through_change_id,
+            'chunks': self.chunks,
+            'passes': self.passes,
+            'updatedAt': self.updated_at.isoformat(),
+            'completedAt': self.completed_at.isoformat() if self.completed_at else ''
+        }
+
+
+def get_checkpoint():
+    checkpoint = db.session.get(ScanCheckpoint, CHECKPOINT_NAME)
+    if checkpoint is None:
+        checkpoint = ScanCheckpoint(name=CHECKPOINT_NAME, last_id='', chunks=0, passes=0, updated_at=datetime.now())
+        db.session.add(checkpoint)
+    return checkpoint
+
+
+def find_violations(row):
+    """{rule: detail} for every rule a scanned row breaks."""
+    violations = {}
+    for rule, check in RULES.items():
+        detail = check(row)
+        if detail:
+            violations[rule] = detail[:200]
+    return violations
+
+
+def _next_chunk(checkpoint, chunk_size):
+    """The next booking ids of the running pass, in primary-key order."""
+    if checkpoint.since_change_id is None:
+        column = Roster.id
+        query = db.session.query(column)
+    else:
+        column = RosterChange.roster_id
+        query = db.session.query(column).filter(
+            RosterChange.id > checkpoint.since_change_id,
+            RosterChange.id <= checkpoint.through_change_id
+        ).distinct()
+    return [row[0] for row in query.filter(column > checkpoint.last_id).order_by(column).limit(chunk_size).all()]
+
+
+def _check_chunk(roster_ids, now):
+    """Record new violations and resolve fixed ones for a chunk of booking ids. Returns (opened, resolved)."""
+    rows = db.session.query(*SCAN_COLUMNS).filter(Roster.id.in_(roster_ids)).all()
+    found = {(row.id, rule): detail for row in rows for rule, detail in find_violations(row).items()}
+
+    opened = resolved = 0
+    open_violations = DataViolation.query.filter(
+        DataViolation.resolved_at.is_(None), DataViolation.roster_id.in_(roster_ids)
+    ).all()
+    already_open = set()
+    for violation in open_violations:
+        key = (violation.roster_id, violation.rule)
+        if key in found:
+            already_open.add(key)
+            violation.detail = found[key]
+        else:
+            violation.resolved_at = now  # Fixed, or the booking is gone
+            resolved += 1
+    for (roster_id, rule), detail in found.items():
+        if (roster_id, rule) not in already_open:
+            db.session.add(DataViolation(roster_id=roster_id, rule=rule, detail=detail, detected_at=now))
+            opened += 1
+    return opened, resolved
+
+
+def scan(chunk_size=SCAN_CHUNK_SIZE, max_chunks=None, pause=0.0):
+    """
+    Continue the consistency scan from its checkpoint, committing after each
+    chunk and sleeping pause seconds between chunks. Stops when the pass is
+    complete or after max_chunks. Returns a summary of what was done.
+    """
+    checkpoint = get_checkpoint()
+    if checkpoint.through_change_id is None:
+        checkpoint.through_change_id = latest_change_id()
+        checkpoint.last_id = ''
+        db.session.commit()
+
+    scanned = opened = resolved = chunks = 0
+    while max_chunks is None or chunks < max_chunks:
+        roster_ids = _next_chunk(checkpoint, chunk_size)
+        now = datetime.now()
+        if not roster_ids:
+            checkpoint.since_change_id = checkpoint.through_change_id
+            checkpoint.through_change_id = None
+            checkpoint.last_id = ''
+            checkpoint.passes += 1
+            checkpoint.completed_at = now
+            checkpoint.updated_at = now
+            db.session.commit()
+            break
+
+        chunk_opened, chunk_resolved = _check_chunk(roster_ids, now)
+        checkpoint.last_id = roster_ids[-1]
+        checkpoint.chunks += 1
+        checkpoint.updated_at = now
+        db.session.commit()
+
+        scanned += len(roster_ids)
+        opened += chunk_opened
+        resolved += chunk_resolved
+        chunks += 1
+        if pause:
+            time.sleep(pause)
+
+    return {
+        'scanned': scanned,
+        'opened': opened,
+        'resolved': resolved,
+        'chunks': chunks,
+        'complete': checkpoint.through_change_id is None,
+        'checkpoint': checkpoint.to_dict()
+    }
+
+
+def violation_counts():
+    """{rule: open violations} from one grouped query."""
+    rows = db.session.query(DataViolation.rule, db.func.count(DataViolation.id)).filter(
+        DataViolation.resolved_at.is_(None)
+    ).group_by(DataViolation.rule).all()
+    return dict(rows)
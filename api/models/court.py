@@ -0,0 +1,114 @@
+"""
+SQLAlchemy model for cached court transport manifests.
+A manifest lists the active inmates due in each court on one day. Manifests
+are built from the court_date index and cached per day; any write touching
+a booking on that day (before or after the change) drops the cached day in
+the same transaction.
+"""
+
+import json
+from datetime import datetime
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from .roster import db, Roster
+
+
+class CourtManifest(db.Model):
+    """Model for a cached per-day transport manifest."""
+
+    __tablename__ = 'court_manifests'
+
+    court_date = db.Column(db.Date, primary_key=True)
+    payload = db.Column(db.Text, nullable=False)  # JSON manifest
+    pdf = db.Column(db.LargeBinary, nullable=True)  # Rendered on first PDF request
+    built_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def manifest(self):
+        return json.loads(self.payload)
+
+
+def build_manifest(day):
+    """Group the active inmates due in court on a day by court packet, then case ticket."""
+    records = Roster.query.filter(
+        Roster.court_date == day,
+        Roster.release_date_time.is_(None)
+    ).order_by(Roster.court_packet, Roster.court_case_ticket, Roster.name).all()
+
+    courts = {}
+    for record in records:
+        court = courts.setdefault(record.court_packet or '', {
+            'courtPacket': record.court_packet or '',
+            'inmates': []
+        })
+        court['inmates'].append({
+            'id': record.id,
+            'name': record.name,
+            'dob': record.dob.isoformat() if record.dob else '',
+            'jailLocation': record.jail_location,
+            'cell': record.cell or '',
+            'courtCaseTicket': record.court_case_ticket or '',
+            'ocaNumber': record.oca_number or '',
+            'charges': record.charges or '',
+            'bond': record.bond or ''
+        })
+
+    return {
+        'courtDate': day.isoformat(),
+        'count': len(records),
+        'courts': list(courts.values())
+    }
+
+
+def get_manifest(day):
+    """
+    Return the cached manifest row for a day, building and storing it if
+    missing. When another request stores the same day first, its row is used.
+    """
+    cached = db.session.get(CourtManifest, day)
+    if cached is None:
+        cached = CourtManifest(court_date=day, payload=json.dumps(build_manifest(day)))
+        db.session.add(cached)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            cached = db.session.get(CourtManifest, day)
+    return cached
+
+
+def court_days(start, end):
+    """Distinct days with active inmates due in court, from a range scan of the court_date index."""
+    rows = db.session.query(Roster.court_date).filter(
+        Roster.court_date >= start,
+        Roster.court_date <= end,
+        Roster.release_date_time.is_(None)
+    ).distinct().order_by(Roster.court_date).all()
+    return [day for (day,) in rows]
+
+
+def precompute_manifests(start, end):
+    """Build and cache manifests for every court day in a range."""
+    days = court_days(start, end)
+    for day in days:
+        get_manifest(day)
+    return days
+
+
+@event.listens_for(Session, 'before_flush')
+def _invalidate_manifests(session, flush_context, instances):
+    """Drop cached manifests for the old and new court dates of changed bookings."""
+    days = set()
+    for record in session.new:
+        if isinstance(record, Roster) and record.court_date:
+            days.add(record.court_date)
+    for record in list(session.dirty) + list(session.deleted):
+        if not isinstance(record, Roster):
+            continue
+        if record in session.dirty and not session.is_modified(record):
+            continue
+        history = inspect(record).attrs.court_date.load_history()
+        days.update(day for day in (list(history.deleted) + list(history.unchanged) + list(history.added)) if day)
+
+    if days:
+        session.execute(CourtManifest.__table__.delete().where(CourtManifest.court_date.in_(days)))
@@ -0,0 +1,99 @@
+"""
+SQLAlchemy model for initial-appearance deadline alerts.
+An active inmate is overdue when they have no court date and were arrested
+more than INITIAL_APPEARANCE_HOURS ago, or when their court date falls on a
+day after the deadline (arrest plus INITIAL_APPEARANCE_HOURS). Both
+conditions are range scans of the (release_date_time, court_date,
+arrest_date_time) index, the second comparing the two columns it carries.
+"""
+
+import os
+from datetime import datetime, timedelta
+from .roster import db, Roster
+
+DEFAULT_DEADLINE_HOURS = int(os.getenv('INITIAL_APPEARANCE_HOURS', '48'))
+
+NO_COURT_DATE = 'no_court_date'
+COURT_DATE_LATE = 'court_date_late'
+
+
+class DeadlineAlert(db.Model):
+    """Model for a recorded deadline violation."""
+
+    __tablename__ = 'deadline_alerts'
+    __table_args__ = (
+        db.Index('ix_deadline_alerts_open', 'resolved_at', 'roster_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    roster_id = db.Column(db.String(50), db.ForeignKey('roster.id', ondelete='CASCADE'), nullable=False)
+    alert_type = db.Column(db.String(30), nullable=False)
+    detected_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+    resolved_at = db.Column(db.DateTime, nullable=True)
+
+    booking = db.relationship('Roster')
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'id': self.id,
+            'rosterId': self.roster_id,
+            'name': self.booking.name if self.booking else '',
+            'alertType': self.alert_type,
+            'detectedAt': self.detected_at.isoformat(),
+            'resolvedAt': self.resolved_at.isoformat() if self.resolved_at else ''
+        }
+
+
+def _deadline_day(hours):
+    """SQL expression for the day an active inmate's initial appearance is due."""
+    if db.engine.dialect.name == 'postgresql':
+        return db.cast(Roster.arrest_date_time + timedelta(hours=hours), db.Date)
+    return db.func.date(Roster.arrest_date_time, f'+{hours} hours')
+
+
+def find_overdue(hours=DEFAULT_DEADLINE_HOURS, now=None):
+    """Return (booking, alert type) pairs for active inmates past their deadline."""
+    now = now or datetime.now()
+    active = Roster.query.filter(Roster.release_date_time.is_(None))
+
+    no_court_date = active.filter(
+        Roster.court_date.is_(None),
+        Roster.arrest_date_time < now - timedelta(hours=hours)
+    ).order_by(Roster.arrest_date_time).all()
+
+    court_date_late = active.filter(
+        Roster.court_date.isnot(None),
+        Roster.court_date > _deadline_day(hours)
+    ).order_by(Roster.court_date).all()
+
+    return [(record, NO_COURT_DATE) for record in no_court_date] + \
+        [(record, COURT_DATE_LATE) for record in court_date_late]
+
+
+def check_deadlines(hours=DEFAULT_DEADLINE_HOURS, now=None):
+    """
+    Record alerts for newly overdue inmates and resolve alerts that no longer apply.
+    Returns (opened, resolved) counts.
+    """
+    now = now or datetime.now()
+    overdue = {(record.id, alert_type) for record, alert_type in find_overdue(hours, now)}
+
+    open_alerts = DeadlineAlert.query.filter(DeadlineAlert.resolved_at.is_(None)).all()
+    already_open = set()
+    resolved = 0
+    for alert in open_alerts:
+        key = (alert.roster_id, alert.alert_type)
+        if key in overdue:
+            already_open.add(key)
+        else:
+            alert.resolved_at = now
+            resolved += 1
+
+    opened = 0
+    for roster_id, alert_type in overdue - already_open:
+        db.session.add(DeadlineAlert(roster_id=roster_id, alert_type=alert_type, detected_at=now))
+        opened += 1
+
+    db.session.commit()
+    return opened, resolved
@@ -0,0 +1,170 @@
+"""
+SQLAlchemy model for physical headcounts and their reconciliation.
+Officers submit what they counted per cell, either a total or the names
+seen. Expected totals come from one grouped query over active bookings;
+cells counted by name additionally fetch the active names for those
+locations in one query. The result is stored with its timestamp so later
+counts can be compared against it.
+"""
+
+import json
+from datetime import datetime
+from .roster import db, Roster
+from .housing import cell_key
+from .population import ALL_LOCATIONS
+from ..normalize import normalize_name
+
+
+class Headcount(db.Model):
+    """Model for one submitted headcount and its discrepancies."""
+
+    __tablename__ = 'headcounts'
+
+    id = db.Column(db.Integer, primary_key=True)
+    counted_at = db.Column(db.DateTime, default=datetime.now, nullable=False, index=True)
+    counted_by = db.Column(db.String(100), nullable=True)
+    locations = db.Column(db.String(200), nullable=False)  # Comma-separated locations covered
+    counted = db.Column(db.Integer, nullable=False)
+    expected = db.Column(db.Integer, nullable=False)
+    discrepancy_count = db.Column(db.Integer, nullable=False)
+    result = db.Column(db.Text, nullable=False)  # JSON per-cell reconciliation
+
+    def to_dict(self, include_cells=True):
+        """Convert the model to a dictionary for JSON serialization."""
+        result = {
+            'id': self.id,
+            'countedAt': self.counted_at.isoformat(),
+            'countedBy': self.counted_by or '',
+            'locations': self.locations.split(','),
+            'counted': self.counted,
+            'expected': self.expected,
+            'difference': self.counted - self.expected,
+            'discrepancyCount': self.discrepancy_count
+        }
+        if include_cells:
+            result.update(json.loads(self.result))
+        return result
+
+
+def _expected_totals():
+    """{(location, cell): active bookings} across the facility, from one grouped query."""
+    rows = db.session.query(
+        Roster.jail_location, Roster.cell, db.func.count(Roster.id)
+    ).filter(
+        Roster.release_date_time.is_(None)
+    ).group_by(Roster.jail_location, Roster.cell).all()
+
+    totals = {}
+    for jail_location, cell, count in rows:
+        key = cell_key(jail_location, cell) or cell_key(jail_location, 'UNASSIGNED')
+        totals[key] = totals.get(key, 0) + count
+    return totals
+
+
+def _expected_names(locations, keys):
+    """{(location, cell): [(normalized name, id, name)]} of active bookings in the given cells."""
+    rows = db.session.query(Roster.id, Roster.name, Roster.jail_location, Roster.cell).filter(
+        Roster.release_date_time.is_(None),
+        Roster.jail_location.in_(locations)
+    ).all()
+    names = {}
+    for booking_id, name, jail_location, cell in rows:
+        key = cell_key(jail_location, cell) or cell_key(jail_location, 'UNASSIGNED')
+        if key in keys:
+            names.setdefault(key, []).append((normalize_name(name), booking_id, name))
+    return names
+
+
+def _submitted_counts(counts, default_location):
+    """Merge submitted cell counts into {(location, cell): {'total': int, 'names': [...] or None}}."""
+    submitted = {}
+    for item in counts:
+        key = cell_key(item.get('jailLocation') or default_location, item.get('cell'))
+        if key is None:
+            raise ValueError('Every count needs a cell')
+        entry = submitted.setdefault(key, {'total': 0, 'names': None})
+        names = item.get('names')
+        if names is not None:
+            names = [name for name in names if str(name).strip()]
+            entry['names'] = (entry['names'] or []) + names
+            entry['total'] += len(names)
+        else:
+            total = item.get('total')
+            if not isinstance(total, int) or total < 0:
+                raise ValueError('Each count needs a non-negative total or a list of names')
+            entry['total'] += total
+    return submitted
+
+
+def reconcile(counts, jail_location=None, counted_by=None, now=None):
+    """
+    Compare a headcount with the active roster and store the result.
+    counts is a list of {'jailLocation', 'cell', 'total'} or
+    {'jailLocation', 'cell', 'names': [...]}. Every active cell in the
+    counted locations is reconciled; cells with bookings that were not
+    submitted count as zero. jail_location='*' covers the whole facility.
+    """
+    whole_facility = jail_location == ALL_LOCATIONS
+    submitted = _submitted_counts(counts, None if whole_facility else jail_location)
+    expected = _expected_totals()
+    if whole_facility:
+        locations = {key[0] for key in expected} | {key[0] for key in submitted}
+    elif jail_location:
+        locations = {jail_location}
+    else:
+        locations = {key[0] for key in submitted}
+    if not locations:
+        raise ValueError('No counts submitted')
+    expected = {key: total for key, total in expected.items() if key[0] in locations}
+    named_cells = {key for key, entry in submitted.items() if entry['names'] is not None}
+    roster_names = _expected_names(locations, named_cells) if named_cells else {}
+
+    cells = []
+    for key in sorted(set(expected) | {key for key in submitted if key[0] in locations}):
+        entry = submitted.get(key, {'total': 0, 'names': None})
+        cell = {
+            'jailLocation': key[0],
+            'cell': key[1],
+            'counted': entry['total'],
+            'expected': expected.get(key, 0),
+            'difference': entry['total'] - expected.get(key, 0),
+            'countedByName': entry['names'] is not None
+        }
+        if entry['names'] is not None:
+            # Names are matched as multisets, so two inmates with the same name need two counted names
+            on_roster = {}
+            for name_key, booking_id, name in roster_names.get(key, []):
+                on_roster.setdefault(name_key, []).append((booking_id, name))
+            counted_names = {}
+            for name in entry['names']:
+                counted_names.setdefault(normalize_name(name), []).append(name)
+            missing, unexpected = [], []
+            for name_key, bookings in on_roster.items():
+                seen = len(counted_names.get(name_key, []))
+                missing += sorted(bookings)[seen:]
+            for name_key, names in counted_names.items():
+                unexpected += names[len(on_roster.get(name_key, [])):]
+            cell['missing'] = [
+                {'id': booking_id, 'name': name}
+                for booking_id, name in sorted(missing, key=lambda booking: (booking[1], booking[0]))
+            ]
+            cell['unexpected'] = sorted(unexpected)
+        cells.append(cell)
+
+    discrepancies = [
+        cell for cell in cells
+        if cell['difference'] or cell.get('missing') or cell.get('unexpected')
+    ]
+
+    headcount = Headcount(
+        counted_at=now or datetime.now(),
+        counted_by=counted_by,
+        locations=','.join(sorted(locations)),
+        counted=sum(cell['counted'] for cell in cells),
+        expected=sum(cell['expected'] for cell in cells),
+        discrepancy_count=len(discrepancies),
+        result=json.dumps({'cells': cells, 'discrepancies': discrepancies})
+    )
+    db.session.add(headcount)
+    db.session.commit()
+    return headcount
@@ -0,0 +1,228 @@
+"""
+SQLAlchemy model for cell occupancy.
+The cells table holds the facility layout plus running occupancy counters.
+Counters are adjusted in the same flush as every booking, move, release and
+delete, so occupancy and housing suggestions never scan active bookings.
+"""
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from .roster import db, Roster
+from ..facility_layout import FACILITY_LAYOUT
+
+HOUSING_FIELDS = ('jail_location', 'cell', 'release_date_time', 'sex_m', 'sex_f', 'felony')
+
+
+def cell_key(jail_location, cell):
+    """Normalize a (location, cell) pair as typed on a booking."""
+    cell = (cell or '').strip().upper()
+    if not cell:
+        return None
+    return (jail_location or '').strip() or 'Solon', cell
+
+
+class Cell(db.Model):
+    """Model for a housing cell and its current occupancy."""
+
+    __tablename__ = 'cells'
+
+    jail_location = db.Column(db.String(100), primary_key=True)
+    cell = db.Column(db.String(50), primary_key=True)
+
+    # Layout; cells only seen on bookings have no capacity and are not in the layout
+    capacity = db.Column(db.Integer, nullable=True)
+    sex_restriction = db.Column(db.String(1), nullable=True)
+    in_layout = db.Column(db.Boolean, default=False, nullable=False)
+
+    # Occupancy counters over active bookings
+    occupied = db.Column(db.Integer, default=0, nullable=False)
+    male_count = db.Column(db.Integer, default=0, nullable=False)
+    female_count = db.Column(db.Integer, default=0, nullable=False)
+    felony_count = db.Column(db.Integer, default=0, nullable=False)
+
+    def free_beds(self):
+        """Beds left, or None when the cell has no known capacity."""
+        if self.capacity is None:
+            return None
+        return max(self.capacity - self.occupied, 0)
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'jailLocation': self.jail_location,
+            'cell': self.cell,
+            'capacity': self.capacity,
+            'sexRestriction': self.sex_restriction or '',
+            'inLayout': self.in_layout,
+            'occupied': self.occupied,
+            'free': self.free_beds(),
+            'male': self.male_count,
+            'female': self.female_count,
+            'felony': self.felony_count
+        }
+
+
+def _housing_state(values):
+    """Return (cell key, counter deltas) for an active booking, or None if it occupies no cell."""
+    if values['release_date_time'] is not None:
+        return None
+    key = cell_key(values['jail_location'], values['cell'])
+    if key is None:
+        return None
+    return key, {
+        'occupied': 1,
+        'male_count': 1 if values['sex_m'] else 0,
+        'female_count': 1 if values['sex_f'] else 0,
+        'felony_count': 1 if values['felony'] else 0
+    }
+
+
+def _committed_values(record):
+    """Values of the housing fields as last written to the database."""
+    attrs = inspect(record).attrs
+    values = {}
+    for field in HOUSING_FIELDS:
+        history = attrs[field].load_history()
+        if history.deleted:
+            values[field] = history.deleted[0]
+        elif history.unchanged:
+            values[field] = history.unchanged[0]
+        else:
+            values[field] = None
+    return values
+
+
+def _current_values(record):
+    return {field: getattr(record, field) for field in HOUSING_FIELDS}
+
+
+def _apply(deltas, state, sign):
+    if state is None:
+        return
+    key, counters = state
+    totals = deltas.setdefault(key, dict.fromkeys(counters, 0))
+    for name, value in counters.items():
+        totals[name] += sign * value
+
+
+@event.listens_for(Session, 'before_flush')
+def _maintain_occupancy(session, flush_context, instances):
+    """Adjust cell counters for bookings being inserted, moved, released or deleted."""
+    deltas = {}
+    for record in session.new:
+        if isinstance(record, Roster):
+            _apply(deltas, _housing_state(_current_values(record)), 1)
+    for record in session.dirty:
+        if isinstance(record, Roster) and session.is_modified(record):
+            old_state = _housing_state(_committed_values(record))
+            new_state = _housing_state(_current_values(record))
+            if old_state != new_state:
+                _apply(deltas, old_state, -1)
+                _apply(deltas, new_state, 1)
+    for record in session.deleted:
+        if isinstance(record, Roster):
+            _apply(deltas, _housing_state(_committed_values(record)), -1)
+
+    for (jail_location, cell_name), counters in deltas.items():
+        if not any(counters.values()):
+            continue
+        cell = session.get(Cell, (jail_location, cell_name))
+        if cell is None:
+            cell = Cell(jail_location=jail_location, cell=cell_name, **counters)
+            session.add(cell)
+            continue
+        # SQL-side increments so concurrent workers do not lose updates
+        for name, delta in counters.items():
+            if delta:
+                setattr(cell, name, getattr(Cell, name) + delta)
+
+
+def sync_facility_layout():
+    """
+    Load FACILITY_LAYOUT into the cells table.
+    Returns True if the table was empty, meaning occupancy still has to be built.
+    """
+    was_empty = Cell.query.first() is None
+    listed = set()
+    for jail_location, cells in FACILITY_LAYOUT.items():
+        for spec in cells:
+            key = cell_key(jail_location, spec['cell'])
+            listed.add(key)
+            cell = db.session.get(Cell, key)
+            if cell is None:
+                cell = Cell(jail_location=key[0], cell=key[1])
+                db.session.add(cell)
+            cell.capacity = spec['capacity']
+            cell.sex_restriction = spec.get('sex')
+            cell.in_layout = True
+
+    for cell in Cell.query.filter(Cell.in_layout.is_(True)).all():
+        if (cell.jail_location, cell.cell) not in listed:
+            cell.in_layout = False
+            cell.capacity = None
+            cell.sex_restriction = None
+    db.session.commit()
+    return was_empty
+
+
+def rebuild_occupancy():
+    """Recompute every cell counter from active bookings with a single grouped query."""
+    rows = db.session.query(
+        Roster.jail_location,
+        Roster.cell,
+        db.func.count(Roster.id),
+        db.func.sum(db.case((Roster.sex_m.is_(True), 1), else_=0)),
+        db.func.sum(db.case((Roster.sex_f.is_(True), 1), else_=0)),
+        db.func.sum(db.case((Roster.felony.is_(True), 1), else_=0))
+    ).filter(
+        Roster.release_date_time.is_(None)
+    ).group_by(Roster.jail_location, Roster.cell).all()
+
+    totals = {}
+    for jail_location, cell_name, occupied, male, female, felony in rows:
+        key = cell_key(jail_location, cell_name)
+        if key is None:
+            continue
+        counters = totals.setdefault(key, [0, 0, 0, 0])
+        for i, value in enumerate((occupied, male, female, felony)):
+            counters[i] += value or 0
+
+    for cell in Cell.query.all():
+        cell.occupied, cell.male_count, cell.female_count, cell.felony_count = totals.pop(
+            (cell.jail_location, cell.cell), (0, 0, 0, 0)
+        )
+    for (jail_location, cell_name), counters in totals.items():
+        occupied, male, female, felony = counters
+        db.session.add(Cell(
+            jail_location=jail_location, cell=cell_name, occupied=occupied,
+            male_count=male, female_count=female, felony_count=felony
+        ))
+    db.session.commit()
+
+
+def suggest_cells(sex=None, felony=False, jail_location=None, limit=10):
+    """
+    Rank free layout cells for a new booking.
+    Cells that are full, restricted to the other sex, or already housing the
+    other sex are excluded. Cells that would mix felony and misdemeanor
+    inmates rank last, then emptier cells rank first.
+    """
+    query = Cell.query.filter(Cell.in_layout.is_(True))
+    if jail_location:
+        query = query.filter(Cell.jail_location == jail_location)
+
+    ranked = []
+    for cell in query.all():
+        if not cell.free_beds():
+            continue
+        if sex and cell.sex_restriction and cell.sex_restriction != sex:
+            continue
+        if (sex == 'M' and cell.female_count) or (sex == 'F' and cell.male_count):
+            continue
+
+        mixed = (cell.occupied - cell.felony_count) if felony else cell.felony_count
+        load = cell.occupied / cell.capacity
+        ranked.append(((mixed > 0, load, cell.jail_location, cell.cell), cell))
+
+    ranked.sort(key=lambda item: item[0])
+    return [cell for _, cell in ranked[:limit]]
@@ -0,0 +1,435 @@
+"""
+Tamper evidence for the roster: a hash chain over the changes feed and a
+Merkle tree over current bookings.
+Every feed row carries the digest of the booking it wrote and a chain hash
+folding that digest into the previous row's chain hash, so rewriting or
+dropping a past change breaks every later link. Each booking also owns a
+leaf of a binary Merkle tree stored node by node; a write rehashes only the
+path from its leaf to the root, O(log n), and the root after each change is
+kept on its feed row, so any point in time has a fixed root. Writers lock
+the single ledger_head row, so links are appended one transaction at a time.
+"""
+
+import hashlib
+import json
+from datetime import datetime, date
+from sqlalchemy import inspect, select, tuple_
+from .roster import db, Roster
+
+# day_number/total_number are rewritten in bulk every day outside the feed;
+# updated_at is stamped per statement and can differ from the flushed
+# instance when updates are batched
+DIGEST_EXCLUDED_FIELDS = {'day_number', 'total_number', 'updated_at'}
+MAX_DEPTH = 64
+HEAD_ID = 1
+
+
+def _sha256(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def leaf_hash(roster_id, record_hash):
+    return _sha256(b'\x00', roster_id, b'\x00', record_hash)
+
+
+def node_hash(left, right):
+    return _sha256(b'\x01', left, right)
+
+
+# Hash of an empty subtree at each level
+EMPTY_HASHES = [_sha256(b'\x00')]
+for _ in range(MAX_DEPTH):
+    EMPTY_HASHES.append(node_hash(EMPTY_HASHES[-1], EMPTY_HASHES[-1]))
+
+
+def chain_hash(previous, roster_id, operation, changed_at, record_hash):
+    return _sha256(previous, '|', roster_id, '|', operation, '|', changed_at.isoformat(), '|', record_hash or '')
+
+
+def tree_depth(leaf_count):
+    return (leaf_count - 1).bit_length() if leaf_count > 1 else 0
+
+
+class LedgerHead(db.Model):
+    """Model for the current end of the hash chain and the Merkle root (a single row)."""
+
+    __tablename__ = 'ledger_head'
+
+    id = db.Column(db.Integer, primary_key=True)
+    genesis_at = db.Column(db.DateTime, nullable=False)
+    genesis_root = db.Column(db.String(64), nullable=False)  # Merkle root of the bookings that predate the chain
+    genesis_hash = db.Column(db.String(64), nullable=False)
+    chain_hash = db.Column(db.String(64), nullable=False)
+    leaf_count = db.Column(db.Integer, nullable=False, default=0)
+    root = db.Column(db.String(64), nullable=False)
+
+
+class MerkleLeaf(db.Model):
+    """Model for the leaf position owned by a booking."""
+
+    __tablename__ = 'merkle_leaves'
+
+    roster_id = db.Column(db.String(50), primary_key=True)
+    position = db.Column(db.Integer, nullable=False, unique=True)
+
+
+class MerkleNode(db.Model):
+    """Model for one stored Merkle tree node; level 0 holds the leaves."""
+
+    __tablename__ = 'merkle_nodes'
+
+    level = db.Column(db.Integer, primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)
+    hash = db.Column(db.String(64), nullable=False)
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, memoryview)):
+        return hashlib.sha256(bytes(value)).hexdigest()
+    return value
+
+
+def record_hash(record):
+    """Digest of every stored field of a booking, photo and encrypted SSN included."""
+    values = {
+        attr.key: _json_value(getattr(record, attr.key))
+        for attr in inspect(Roster).column_attrs
+        if attr.key not in DIGEST_EXCLUDED_FIELDS
+    }
+    return _sha256(json.dumps(values, sort_keys=True, separators=(',', ':')))
+
+
+class MerkleTree:
+    """Path updates against the stored nodes, caching the nodes touched in one transaction."""
+
+    def __init__(self, connection, leaf_count):
+        self.connection = connection
+        self.leaf_count = leaf_count
+        self.nodes = {}  # (level, position) -> hash, None when not stored
+        self.dirty = set()
+
+    def _load(self, keys):
+        missing = [key for key in keys if key not in self.nodes]
+        if not missing:
+            return
+        table = MerkleNode.__table__
+        rows = self.connection.execute(
+            select(table.c.level, table.c.position, table.c.hash).where(
+                tuple_(table.c.level, table.c.position).in_(missing)
+            )
+        )
+        for level, position, node in rows:
+            self.nodes[(level, position)] = node
+        for key in missing:
+            self.nodes.setdefault(key, None)
+
+    def get(self, level, position):
+        node = self.nodes.get((level, position))
+        return node if node is not None else EMPTY_HASHES[level]
+
+    @property
+    def root(self):
+        if not self.leaf_count:
+            return EMPTY_HASHES[0]
+        self._load([(tree_depth(self.leaf_count), 0)])
+        return self.get(tree_depth(self.leaf_count), 0)
+
+    def set_leaf(self, position, value):
+        """Store a leaf and rehash the path above it."""
+        self.leaf_count = max(self.leaf_count, position + 1)
+        depth = tree_depth(self.leaf_count)
+        self._load([(level, (position >> level) ^ 1) for level in range(depth)])
+        self.nodes[(0, position)] = value
+        self.dirty.add((0, position))
+        for level in range(depth):
+            index = position >> level
+            if index % 2:
+                parent = node_hash(self.get(level, index - 1), self.get(level, index))
+            else:
+                parent = node_hash(self.get(level, index), self.get(level, index + 1))
+            self.nodes[(level + 1, index >> 1)] = parent
+            self.dirty.add((level + 1, index >> 1))
+
+    def save(self):
+        """Write the rehashed nodes: one DELETE and one INSERT batch."""
+        if not self.dirty:
+            return
+        table = MerkleNode.__table__
+        keys = sorted(self.dirty)
+        self.connection.execute(table.delete().where(tuple_(table.c.level, table.c.position).in_(keys)))
+        self.connection.execute(table.insert(), [
+            {'level': level, 'position': position, 'hash': self.nodes[(level, position)]}
+            for level, position in keys
+        ])
+        self.dirty.clear()
+
+
+def root_from_leaves(leaves):
+    """Merkle root of a full list of leaf hashes (None for empty positions), built bottom-up."""
+    if not leaves:
+        return EMPTY_HASHES[0]
+    level_hashes = [node if node is not None else EMPTY_HASHES[0] for node in leaves]
+    level = 0
+    while len(level_hashes) > 1:
+        if len(level_hashes) % 2:
+            level_hashes.append(EMPTY_HASHES[level])
+        level_hashes = [node_hash(level_hashes[i], level_hashes[i + 1]) for i in range(0, len(level_hashes), 2)]
+        level += 1
+    return level_hashes[0]
+
+
+def _lock_head(connection):
+    table = LedgerHead.__table__
+    head = connection.execute(select(table).where(table.c.id == HEAD_ID).with_for_update()).first()
+    if head is None:
+        # Only reached on a database that has never been built; upgrade_schema builds it at startup
+        now = datetime.utcnow()
+        genesis_hash = _sha256('genesis|', now.isoformat(), '|', EMPTY_HASHES[0])
+        connection.execute(table.insert(), {
+            'id': HEAD_ID, 'genesis_at': now, 'genesis_root': EMPTY_HASHES[0], 'genesis_hash': genesis_hash,
+            'chain_hash': genesis_hash, 'leaf_count': 0, 'root': EMPTY_HASHES[0]
+        })
+        head = connection.execute(select(table).where(table.c.id == HEAD_ID)).first()
+    return head
+
+
+def seal_changes(connection, changes):
+    """
+    Extend the chain and the tree with a flush's feed rows, in order.
+    changes is a list of (feed row dict, booking or None for deletes); each
+    row gains record_hash, chain_hash and merkle_root before it is inserted.
+    """
+    head = _lock_head(connection)
+    leaves = MerkleLeaf.__table__
+    roster_ids = list({row['roster_id'] for row, _ in changes})
+    positions = dict(connection.execute(
+        select(leaves.c.roster_id, leaves.c.position).where(leaves.c.roster_id.in_(roster_ids))
+    ).all())
+
+    tree = MerkleTree(connection, head.leaf_count)
+    previous = head.chain_hash
+    new_leaves = []
+    removed = []
+    for row, record in changes:
+        roster_id = row['roster_id']
+        if record is None:
+            row['record_hash'] = None
+            if roster_id in positions:
+                tree.set_leaf(positions.pop(roster_id), EMPTY_HASHES[0])
+                removed.append(roster_id)
+        else:
+            row['record_hash'] = record_hash(record)
+            if roster_id not in positions:
+                positions[roster_id] = tree.leaf_count
+                new_leaves.append({'roster_id': roster_id, 'position': tree.leaf_count})
+            tree.set_leaf(positions[roster_id], leaf_hash(roster_id, row['record_hash']))
+        previous = chain_hash(previous, roster_id, row['operation'], row['changed_at'], row['record_hash'])
+        row['chain_hash'] = previous
+        row['merkle_root'] = tree.root
+
+    tree.save()
+    if removed:
+        connection.execute(leaves.delete().where(leaves.c.roster_id.in_(removed)))
+    if new_leaves:
+        connection.execute(leaves.insert(), new_leaves)
+    connection.execute(LedgerHead.__table__.update().where(LedgerHead.id == HEAD_ID).values(
+        chain_hash=previous, leaf_count=tree.leaf_count, root=tree.root
+    ))
+
+
+def build_ledger(chunk_size=1000):
+    """
+    Start the ledger on an existing database: give every booking a leaf,
+    store the whole tree and record its root as the genesis of the chain.
+    Runs once, in one transaction; later writes extend it incrementally.
+    """
+    if db.session.get(LedgerHead, HEAD_ID) is not None:
+        return None
+    leaves = []
+    last_id = ''
+    while True:
+        records = Roster.query.filter(Roster.id > last_id).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        leaves += [(record.id, leaf_hash(record.id, record_hash(record))) for record in records]
+        last_id = records[-1].id
+        db.session.expunge_all()
+
+    nodes = [{'level': 0, 'position': position, 'hash': leaf} for position, (_, leaf) in enumerate(leaves)]
+    level_hashes = [leaf for _, leaf in leaves]
+    level = 0
+    while len(level_hashes) > 1:
+        if len(level_hashes) % 2:
+            level_hashes.append(EMPTY_HASHES[level])
+        level_hashes = [node_hash(level_hashes[i], level_hashes[i + 1]) for i in range(0, len(level_hashes), 2)]
+        level += 1
+        nodes += [{'level': level, 'position': position, 'hash': node} for position, node in enumerate(level_hashes)]
+    root = level_hashes[0] if level_hashes else EMPTY_HASHES[0]
+
+    for start in range(0, len(leaves), chunk_size):
+        db.session.execute(MerkleLeaf.__table__.insert(), [
+            {'roster_id': roster_id, 'position': start + offset}
+            for offset, (roster_id, _) in enumerate(leaves[start:start + chunk_size])
+        ])
+    for start in range(0, len(nodes), chunk_size):
+        db.session.execute(MerkleNode.__table__.insert(), nodes[start:start + chunk_size])
+
+    now = datetime.utcnow()
+    genesis_hash = _sha256('genesis|', now.isoformat(), '|', root)
+    head = LedgerHead(
+        id=HEAD_ID, genesis_at=now, genesis_root=root, genesis_hash=genesis_hash,
+        chain_hash=genesis_hash, leaf_count=len(leaves), root=root
+    )
+    db.session.add(head)
+    db.session.commit()
+    return head
+
+
+def root_at(when=None):
+    """
+    The chain position and Merkle root in effect at a local point in time
+    (now by default), or None before the ledger started.
+    """
+    from .change import RosterChange, feed_time
+    head = db.session.get(LedgerHead, HEAD_ID)
+    if head is None:
+        return None
+    query = RosterChange.query.filter(RosterChange.chain_hash.isnot(None))
+    if when is not None:
+        when = feed_time(when)
+        if when < head.genesis_at:
+            return None
+        query = query.filter(RosterChange.changed_at <= when)
+    change = query.order_by(RosterChange.id.desc()).first()
+    if change is None:
+        return {'changeId': None, 'changedAt': head.genesis_at.isoformat(),
+                'chainHash': head.genesis_hash, 'root': head.genesis_root}
+    return {'changeId': change.id, 'changedAt': change.changed_at.isoformat(),
+            'chainHash': change.chain_hash, 'root': change.merkle_root}
+
+
+def inclusion_proof(roster_id):
+    """
+    Proof that a booking's current contents are in the current Merkle root:
+    its leaf and the sibling hashes from the leaf up, or None if it has no leaf.
+    """
+    head = db.session.get(LedgerHead, HEAD_ID)
+    leaf = db.session.get(MerkleLeaf, roster_id)
+    record = db.session.get(Roster, roster_id)
+    if head is None or leaf is None or record is None:
+        return None
+
+    depth = tree_depth(head.leaf_count)
+    keys = [(0, leaf.position)] + [(level, (leaf.position >> level) ^ 1) for level in range(depth)]
+    stored = dict(((level, position), node) for level, position, node in db.session.query(
+        MerkleNode.level, MerkleNode.position, MerkleNode.hash
+    ).filter(tuple_(MerkleNode.level, MerkleNode.position).in_(keys)).all())
+
+    siblings = []
+    for level in range(depth):
+        sibling = (level, (leaf.position >> level) ^ 1)
+        siblings.append({
+            'hash': stored.get(sibling) or EMPTY_HASHES[level],
+            'side': 'left' if (leaf.position >> level) % 2 else 'right'
+        })
+    digest = record_hash(record)
+    current_leaf = leaf_hash(roster_id, digest)
+    return {
+        'rosterId': roster_id,
+        'position': leaf.position,
+        'recordHash': digest,
+        'leafHash': stored.get((0, leaf.position), ''),
+        'siblings': siblings,
+        'root': head.root,
+        'chainHash': head.chain_hash,
+        'verified': stored.get((0, leaf.position)) == current_leaf and verify_proof(current_leaf, siblings, head.root)
+    }
+
+
+def verify_proof(leaf, siblings, root):
+    """Fold a leaf hash with its siblings and compare with a root."""
+    node = leaf
+    for sibling in siblings:
+        node = node_hash(sibling['hash'], node) if sibling['side'] == 'left' else node_hash(node, sibling['hash'])
+    return node == root
+
+
+def verify_ledger(chunk_size=1000):
+    """
+    Check the whole ledger from the stored data alone: every chain link,
+    every booking against its latest feed digest and its leaf, and the root
+    rebuilt from scratch. Returns a report whose 'errors' list is empty when
+    nothing was altered outside the application.
+    """
+    from .change import RosterChange
+    head = db.session.get(LedgerHead, HEAD_ID)
+    if head is None:
+        return {'changes': 0, 'records': 0, 'root': None, 'errors': ['Ledger has not been built']}
+    errors = []
+
+    # Chain links, oldest first
+    previous = head.genesis_hash
+    latest_hashes = {}
+    last_root = head.genesis_root
+    changes = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(
+            RosterChange.id, RosterChange.roster_id, RosterChange.operation, RosterChange.changed_at,
+            RosterChange.record_hash, RosterChange.chain_hash, RosterChange.merkle_root
+        ).filter(
+            RosterChange.id > last_id, RosterChange.chain_hash.isnot(None)
+        ).order_by(RosterChange.id).limit(chunk_size).all()
+        if not rows:
+            break
+        for change_id, roster_id, operation, changed_at, digest, link, merkle_root in rows:
+            if chain_hash(previous, roster_id, operation, changed_at, digest) != link:
+                errors.append(f'Change {change_id}: chain link does not match')
+            previous = link
+            latest_hashes[roster_id] = digest
+            last_root = merkle_root
+        changes += len(rows)
+        last_id = rows[-1][0]
+    if previous != head.chain_hash:
+        errors.append('Chain head does not match the last change')
+
+    # Current bookings against their digests and leaves
+    positions = dict(db.session.query(MerkleLeaf.roster_id, MerkleLeaf.position).all())
+    leaves = [None] * head.leaf_count
+    records = 0
+    last_id = ''
+    while True:
+        batch = Roster.query.filter(Roster.id > last_id).order_by(Roster.id).limit(chunk_size).all()
+        if not batch:
+            break
+        for record in batch:
+            digest = record_hash(record)
+            if record.id in latest_hashes and latest_hashes[record.id] != digest:
+                errors.append(f'Booking {record.id}: contents differ from its last recorded change')
+            position = positions.pop(record.id, None)
+            if position is None or position >= head.leaf_count:
+                errors.append(f'Booking {record.id}: not in the Merkle tree')
+                continue
+            leaves[position] = leaf_hash(record.id, digest)
+        records += len(batch)
+        last_id = batch[-1].id
+        db.session.expunge_all()
+    for roster_id in positions:
+        errors.append(f'Booking {roster_id}: in the Merkle tree but missing from the roster')
+
+    stored_leaves = dict(db.session.query(MerkleNode.position, MerkleNode.hash).filter(MerkleNode.level == 0).all())
+    for position, leaf in enumerate(leaves):
+        if leaf is not None and stored_leaves.get(position) != leaf:
+            errors.append(f'Leaf {position}: stored hash does not match its booking')
+
+    root = root_from_leaves(leaves)
+    if root != head.root:
+        errors.append('Rebuilt Merkle root does not match the ledger head')
+    if root != last_root:
+        errors.append('Rebuilt Merkle root does not match the root recorded with the last change')
+    return {'changes': changes, 'records': records, 'root': root, 'errors': errors}
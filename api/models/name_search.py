@@ -0,0 +1,165 @@
+"""
+Trigram index over normalized booking names for fuzzy name search.
+On Postgres the pg_trgm extension indexes roster.name_key directly with a
+GIN index. Other databases get a name_trigrams side table holding one row
+per (trigram, booking), kept in step with every name change in the same
+flush. Either way the database returns a short list of candidates sharing
+trigrams with the query, which is then ranked in Python on whole-name
+similarity and on the parsed last/first names.
+"""
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+from .roster import db, Roster
+from ..normalize import normalize_name, parse_name, trigrams, bigrams, similarity
+
+CANDIDATE_LIMIT = 200
+MIN_SIMILARITY = 0.3
+
+
+class NameTrigram(db.Model):
+    """Model for one trigram of a booking's normalized name (non-Postgres databases)."""
+
+    __tablename__ = 'name_trigrams'
+
+    trigram = db.Column(db.String(3), primary_key=True)
+    roster_id = db.Column(db.String(50), primary_key=True, index=True)
+
+
+def uses_pg_trgm(bind=None):
+    return (bind or db.engine).dialect.name == 'postgresql'
+
+
+def create_trigram_index():
+    """Create the pg_trgm extension and GIN index on Postgres; no-op elsewhere."""
+    if not uses_pg_trgm():
+        return
+    with db.engine.begin() as conn:
+        conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS ix_roster_name_key_trgm ON roster USING gin (name_key gin_trgm_ops)'
+        ))
+
+
+def _trigram_rows(roster_id, name_key):
+    return [{'trigram': trigram, 'roster_id': roster_id} for trigram in trigrams(name_key)]
+
+
+@event.listens_for(Session, 'after_flush')
+def _maintain_trigrams(session, flush_context):
+    """Rewrite the side-table trigrams of bookings whose name was inserted, changed or deleted."""
+    connection = session.connection()
+    if uses_pg_trgm(connection):
+        return
+
+    table = NameTrigram.__table__
+    stale_ids = []
+    rows = []
+    for record in session.new:
+        if isinstance(record, Roster):
+            rows += _trigram_rows(record.id, record.name_key)
+    for record in session.dirty:
+        if isinstance(record, Roster) and inspect(record).attrs.name_key.history.has_changes():
+            stale_ids.append(record.id)
+            rows += _trigram_rows(record.id, record.name_key)
+    for record in session.deleted:
+        if isinstance(record, Roster):
+            stale_ids.append(record.id)
+
+    if stale_ids:
+        connection.execute(table.delete().where(table.c.roster_id.in_(stale_ids)))
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+def backfill_trigrams(chunk_size=500):
+    """Build side-table trigrams for bookings that have none, in primary-key chunks."""
+    if uses_pg_trgm():
+        return 0
+    indexed = db.session.query(NameTrigram.roster_id)
+    table = NameTrigram.__table__
+    updated = 0
+    last_id = ''
+    while True:
+        records = db.session.query(Roster.id, Roster.name_key).filter(
+            Roster.id > last_id,
+            Roster.name_key.isnot(None),
+            Roster.id.notin_(indexed)
+        ).order_by(Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+        rows = []
+        for roster_id, name_key in records:
+            rows += _trigram_rows(roster_id, name_key)
+        if rows:
+            db.session.execute(table.insert(), rows)
+        db.session.commit()
+        updated += len(records)
+        last_id = records[-1][0]
+    return updated
+
+
+def _status_filter(status):
+    """Predicate on the roster row for a status filter, or None for any status."""
+    if status == 'active':
+        return Roster.release_date_time.is_(None)
+    if status == 'released':
+        return Roster.release_date_time.isnot(None)
+    return None
+
+
+def _candidate_ids(name_key, limit, status=None):
+    """
+    Ids of bookings sharing the most trigrams with a normalized name. The
+    status filter is applied here, before the limit, so matches with the
+    wanted status are not crowded out by others.
+    """
+    status_filter = _status_filter(status)
+    if uses_pg_trgm():
+        query = db.session.query(Roster.id).filter(Roster.name_key.op('%')(name_key))
+        if status_filter is not None:
+            query = query.filter(status_filter)
+        rows = query.order_by(db.func.similarity(Roster.name_key, name_key).desc()).limit(limit).all()
+        return [row[0] for row in rows]
+
+    query_trigrams = trigrams(name_key)
+    shared = db.func.count(NameTrigram.trigram)
+    query = db.session.query(NameTrigram.roster_id, shared).filter(NameTrigram.trigram.in_(query_trigrams))
+    if status_filter is not None:
+        query = query.join(Roster, Roster.id == NameTrigram.roster_id).filter(status_filter)
+    rows = query.group_by(NameTrigram.roster_id).order_by(shared.desc()).limit(limit).all()
+    return [roster_id for roster_id, _ in rows]
+
+
+def fuzzy_search(name, limit=20, status=None, min_score=MIN_SIMILARITY):
+    """
+    Bookings whose names resemble a typed name, best first, as (booking, score).
+    Score blends trigram similarity of the normalized names with how well the
+    parsed last and first names agree, so "Smith, Jon" ranks John Smith above
+    Smith Jones.
+    """
+    name_key = normalize_name(name)
+    if not name_key:
+        return []
+    candidate_ids = _candidate_ids(name_key, max(CANDIDATE_LIMIT, limit), status)
+    if not candidate_ids:
+        return []
+
+    query = Roster.query.filter(Roster.id.in_(candidate_ids))
+
+    query_trigrams = set(trigrams(name_key))
+    last, first, _ = parse_name(name)
+    ranked = []
+    for record in query.all():
+        record_trigrams = set(trigrams(record.name_key))
+        shared = len(query_trigrams & record_trigrams)
+        whole = shared / len(query_trigrams | record_trigrams) if record_trigrams else 0.0
+
+        ordered = (similarity(bigrams(last), bigrams(record.last_name)) +
+                   similarity(bigrams(first), bigrams(record.first_name))) / 2
+        score = round(0.6 * whole + 0.4 * ordered, 3)
+        if score >= min_score:
+            ranked.append((score, record))
+
+    ranked.sort(key=lambda item: (-item[0], item[1].name))
+    return [(record, score) for score, record in ranked[:limit]]
@@ -0,0 +1,122 @@
+"""
+SQLAlchemy model for the person master index.
+Each Person groups the bookings (Roster rows) of one individual, so repeat
+bookings can be found without re-matching names across the whole roster.
+"""
+
+from datetime import datetime
+from .roster import db, Roster
+from ..normalize import parse_name, first_names_compatible
+
+
+class Person(db.Model):
+    """Model for an individual who may have several bookings."""
+
+    __tablename__ = 'persons'
+    __table_args__ = (
+        db.Index('ix_persons_last_name_key_dob', 'last_name_key', 'dob'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Normalized identity keys
+    last_name_key = db.Column(db.String(100), nullable=False)
+    first_name_key = db.Column(db.String(100), nullable=True)
+    dob = db.Column(db.Date, nullable=False)
+
+    # Display name taken from the first linked booking
+    name = db.Column(db.String(200), nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    bookings = db.relationship('Roster', backref='person', lazy='dynamic')
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'dob': self.dob.isoformat() if self.dob else '',
+            'createdAt': self.created_at.isoformat() if self.created_at else ''
+        }
+
+    @staticmethod
+    def identity_keys(record):
+        """Return the (last, first, dob) blocking keys for a booking, or None if it cannot be linked."""
+        last, first, _ = parse_name(record.name)
+        if not last or not record.dob:
+            return None
+        return last, first, record.dob
+
+    @staticmethod
+    def match_or_create(record, block_cache=None):
+        """
+        Find the Person for a booking, creating one if no existing person matches.
+        Candidates are looked up through the (last_name_key, dob) index and
+        compared on first name. Returns None when the booking has no DOB.
+
+        block_cache, when given, maps (last, dob) to the persons already seen in
+        that block so batch linking does not re-query the same block.
+        """
+        keys = Person.identity_keys(record)
+        if keys is None:
+            return None
+        last, first, dob = keys
+
+        if block_cache is not None and (last, dob) in block_cache:
+            candidates = block_cache[(last, dob)]
+        else:
+            candidates = Person.query.filter_by(last_name_key=last, dob=dob).all()
+            if block_cache is not None:
+                block_cache[(last, dob)] = candidates
+
+        for person in candidates:
+            if first_names_compatible(person.first_name_key, first):
+                # Prefer the full first name over an initial
+                if first and (not person.first_name_key or len(first) > len(person.first_name_key)):
+                    person.first_name_key = first
+                return person
+
+        person = Person(last_name_key=last, first_name_key=first, dob=dob, name=record.name)
+        db.session.add(person)
+        candidates.append(person)
+        return person
+
+    @staticmethod
+    def prior_bookings(person_id, exclude_id=None):
+        """Return a person's bookings, newest arrest first, through the indexed person_id join."""
+        query = Roster.query.join(Person, Roster.person_id == Person.id).filter(Person.id == person_id)
+        if exclude_id:
+            query = query.filter(Roster.id != exclude_id)
+        return query.order_by(Roster.arrest_date_time.desc()).all()
+
+
+def link_unassigned_bookings(chunk_size=500):
+    """
+    Link existing bookings that have no person yet.
+    Rows are walked in (dob, id) order so each (last name, DOB) block is
+    clustered in memory once and reused for every booking in it.
+    """
+    linked = 0
+    last_seen = None
+    block_cache = {}
+    while True:
+        query = Roster.query.filter(Roster.person_id.is_(None), Roster.dob.isnot(None))
+        if last_seen is not None:
+            query = query.filter(db.tuple_(Roster.dob, Roster.id) > db.tuple_(*last_seen))
+        records = query.order_by(Roster.dob, Roster.id).limit(chunk_size).all()
+        if not records:
+            break
+
+        for record in records:
+            person = Person.match_or_create(record, block_cache)
+            if person is not None:
+                record.person = person
+                linked += 1
+        db.session.commit()
+
+        last_seen = (records[-1].dob, records[-1].id)
+        # Blocks for earlier DOBs are complete and will not be needed again
+        block_cache = {key: value for key, value in block_cache.items() if key[1] >= last_seen[0]}
+
+    return linked
@@ -0,0 +1,253 @@
+"""
+Jail population over time.
+Population per bucket is computed with a sweep over the booking intervals
+[arrest, release) that overlap the requested span. Buckets that ended before
+today are cached in population_buckets; a booking edit that moves an arrest
+or release time into the past drops only the cached buckets it affects.
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from .roster import db, Roster
+
+BUCKET_SIZES = {'day': timedelta(days=1), 'hour': timedelta(hours=1)}
+ALL_LOCATIONS = '*'
+
+
+class PopulationBucket(db.Model):
+    """Model for a cached population bucket of one location (or '*' for the whole facility)."""
+
+    __tablename__ = 'population_buckets'
+
+    bucket_size = db.Column(db.String(10), primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    jail_location = db.Column(db.String(100), primary_key=True)
+
+    population = db.Column(db.Integer, nullable=False)  # Count at the start of the bucket
+    peak = db.Column(db.Integer, nullable=False)
+    admissions = db.Column(db.Integer, nullable=False)
+    releases = db.Column(db.Integer, nullable=False)
+    bed_days = db.Column(db.Integer, nullable=True)  # Bookings present at any time in the bucket
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'start': self.bucket_start.isoformat(),
+            'population': self.population,
+            'peak': self.peak,
+            'admissions': self.admissions,
+            'releases': self.releases,
+            'bedDays': self.bed_days
+        }
+
+
+def location_key(jail_location):
+    return (jail_location or '').strip() or 'Solon'
+
+
+def floor_bucket(moment, bucket_size):
+    """Start of the bucket containing a moment."""
+    if bucket_size == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def booking_intervals(start, end, *extra_columns):
+    """
+    (arrest, release, location, *extra_columns) for bookings present at any
+    time in [start, end). Active and released bookings are fetched separately
+    so each query is a range scan on the index led by release_date_time.
+    """
+    columns = (Roster.arrest_date_time, Roster.release_date_time, Roster.jail_location) + extra_columns
+    active = db.session.query(*columns).filter(
+        Roster.release_date_time.is_(None),
+        Roster.arrest_date_time < end
+    )
+    released = db.session.query(*columns).filter(
+        Roster.release_date_time > start,
+        Roster.arrest_date_time < end
+    )
+    return [
+        (arrest, release, location_key(location)) + tuple(extras)
+        for arrest, release, location, *extras in active.all() + released.all()
+        if release is None or release > arrest
+    ]
+
+
+def sweep(intervals, bucket_starts, bucket_size):
+    """
+    Sweep sorted admission/release events across consecutive buckets.
+    Returns {bucket_start: {location: (population, peak, admissions, releases, bed_days)}},
+    with ALL_LOCATIONS holding the facility total. Population is the count at
+    the bucket's first instant; bed_days counts every booking present at any
+    time during the bucket.
+    """
+    span_start = bucket_starts[0]
+    span_end = bucket_starts[-1] + BUCKET_SIZES[bucket_size]
+
+    current = {ALL_LOCATIONS: 0}
+    events = []
+    for arrest, release, location in intervals:
+        current.setdefault(location, 0)
+        if arrest < span_start:
+            current[location] += 1
+            current[ALL_LOCATIONS] += 1
+        else:
+            events.append((arrest, 1, location))
+        if release is not None and release < span_end:
+            events.append((release, -1, location))
+    # Releases sort before admissions at the same instant so peaks are not overstated
+    events.sort(key=lambda item: (item[0], item[1]))
+
+    results = {}
+    position = 0
+    for bucket_start in bucket_starts:
+        bucket_end = bucket_start + BUCKET_SIZES[bucket_size]
+        stats = {location: [0, 0, 0, 0, 0] for location in current}
+
+        # Events exactly on the boundary take effect before the bucket's first instant
+        while position < len(events) and events[position][0] <= bucket_start:
+            _, delta, location = events[position]
+            for key in (location, ALL_LOCATIONS):
+                current[key] += delta
+                stats[key][2 if delta > 0 else 3] += 1
+            position += 1
+        for location, entry in stats.items():
+            entry[0] = entry[1] = entry[4] = current[location]
+
+        while position < len(events) and events[position][0] < bucket_end:
+            _, delta, location = events[position]
+            for key in (location, ALL_LOCATIONS):
+                current[key] += delta
+                entry = stats[key]
+                entry[1] = max(entry[1], current[key])
+                if delta > 0:
+                    entry[2] += 1
+                    entry[4] += 1
+                else:
+                    entry[3] += 1
+            position += 1
+        results[bucket_start] = {location: tuple(entry) for location, entry in stats.items()}
+    return results
+
+
+def population_series(start, end, bucket_size='day', now=None):
+    """
+    Population per bucket and location for [start, end), capped at the current bucket.
+    Buckets that ended before today come from the cache when present; the
+    rest are swept in one pass and those from before today are stored.
+    Today's buckets are always recomputed, so late or backdated entries
+    for today never leave a stale hourly bucket behind.
+    """
+    now = now or datetime.now()
+    step = BUCKET_SIZES[bucket_size]
+    current_bucket = floor_bucket(now, bucket_size)
+    today = floor_bucket(now, 'day')
+
+    bucket_starts = []
+    bucket_start = floor_bucket(start, bucket_size)
+    while bucket_start < end and bucket_start <= current_bucket:
+        bucket_starts.append(bucket_start)
+        bucket_start += step
+    if not bucket_starts:
+        return {}
+
+    cached_rows = PopulationBucket.query.filter(
+        PopulationBucket.bucket_size == bucket_size,
+        PopulationBucket.bucket_start >= bucket_starts[0],
+        PopulationBucket.bucket_start <= bucket_starts[-1],
+        PopulationBucket.bucket_start < today
+    ).all()
+    results = {}
+    for row in cached_rows:
+        if row.bed_days is None:
+            continue
+        results.setdefault(row.bucket_start, {})[row.jail_location] = (
+            row.population, row.peak, row.admissions, row.releases, row.bed_days
+        )
+    # A bucket is only complete in the cache if its facility total was stored
+    results = {key: value for key, value in results.items() if ALL_LOCATIONS in value}
+
+    missing = [bucket for bucket in bucket_starts if bucket not in results]
+    if missing:
+        span = [missing[0] + step * i for i in range(int((missing[-1] - missing[0]) / step) + 1)]
+        swept = sweep(booking_intervals(span[0], span[-1] + step), span, bucket_size)
+        for bucket in missing:
+            results[bucket] = swept[bucket]
+            if bucket < today:
+                for location, (population, peak, admissions, releases, bed_days) in swept[bucket].items():
+                    db.session.merge(PopulationBucket(
+                        bucket_size=bucket_size, bucket_start=bucket, jail_location=location,
+                        population=population, peak=peak, admissions=admissions, releases=releases,
+                        bed_days=bed_days
+                    ))
+        db.session.commit()
+
+    return {bucket: results[bucket] for bucket in bucket_starts}
+
+
+def _naive(moment):
+    """Drop tzinfo the way the DateTime columns store it."""
+    return moment.replace(tzinfo=None) if moment is not None and moment.tzinfo else moment
+
+
+def _interval_values(record, committed):
+    """(arrest, release, location) of a booking, before or after pending changes."""
+    if not committed:
+        return _naive(record.arrest_date_time), _naive(record.release_date_time), location_key(record.jail_location)
+    values = []
+    attrs = inspect(record).attrs
+    for field in ('arrest_date_time', 'release_date_time', 'jail_location'):
+        history = attrs[field].load_history()
+        if history.deleted:
+            values.append(history.deleted[0])
+        elif history.unchanged:
+            values.append(history.unchanged[0])
+        else:
+            values.append(None)
+    return _naive(values[0]), _naive(values[1]), location_key(values[2])
+
+
+def _stale_ranges(old, new, now):
+    """Time ranges whose population changes when a booking goes from old to new (either may be None)."""
+    def span(values):
+        arrest, release, location = values
+        return (arrest, release or now, location) if arrest else None
+
+    old, new = (span(values) if values else None for values in (old, new))
+    if old and new and old[2] == new[2]:
+        ranges = []
+        if old[0] != new[0]:
+            ranges.append((min(old[0], new[0]), max(old[0], new[0])))
+        if old[1] != new[1]:
+            ranges.append((min(old[1], new[1]), max(old[1], new[1])))
+        return [(old[2], start, end) for start, end in ranges]
+    return [(values[2], values[0], values[1]) for values in (old, new) if values]
+
+
+@event.listens_for(Session, 'before_flush')
+def _invalidate_population(session, flush_context, instances):
+    """Drop cached buckets overlapping any change to a booking's interval or location."""
+    now = datetime.now()
+    ranges = []
+    for record in session.new:
+        if isinstance(record, Roster):
+            ranges += _stale_ranges(None, _interval_values(record, False), now)
+    for record in session.dirty:
+        if isinstance(record, Roster) and session.is_modified(record):
+            ranges += _stale_ranges(_interval_values(record, True), _interval_values(record, False), now)
+    for record in session.deleted:
+        if isinstance(record, Roster):
+            ranges += _stale_ranges(_interval_values(record, True), None, now)
+
+    table = PopulationBucket.__table__
+    for location, start, end in ranges:
+        # Only buckets from before today are cached, so changes from today onward need no invalidation
+        if start >= floor_bucket(now, 'day'):
+            continue
+        session.execute(table.delete().where(
+            table.c.jail_location.in_((location, ALL_LOCATIONS)),
+            table.c.bucket_start >= floor_bucket(start, 'day'),
+            table.c.bucket_start <= end
+        ))
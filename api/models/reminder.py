@@ -0,0 +1,163 @@
+"""
+SQLAlchemy model for the court date reminder queue.
+Each active booking with an upcoming court date has one queue row keyed by
+booking id, with the time its reminder should fire. Rows are rescheduled in
+the same flush that changes a court date, release or delete, and the worker
+takes due rows off the fire_at index in batches, so neither side scans the
+roster.
+"""
+
+import os
+from datetime import datetime, date, time, timedelta
+from html import escape
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from .roster import db, Roster
+
+REMINDER_LEAD_DAYS = int(os.getenv('COURT_REMINDER_LEAD_DAYS', '1'))
+REMINDER_HOUR = int(os.getenv('COURT_REMINDER_HOUR', '8'))
+REMINDER_BATCH_SIZE = 100
+
+
+def reminder_recipients():
+    """Addresses from COURT_REMINDER_EMAIL (comma-separated)."""
+    return [address.strip() for address in os.getenv('COURT_REMINDER_EMAIL', '').split(',') if address.strip()]
+
+
+def fire_time(court_date):
+    """When the reminder for a court date goes out: REMINDER_HOUR, REMINDER_LEAD_DAYS before."""
+    return datetime.combine(court_date - timedelta(days=REMINDER_LEAD_DAYS), time(hour=REMINDER_HOUR))
+
+
+class CourtReminder(db.Model):
+    """Model for a queued court date reminder."""
+
+    __tablename__ = 'court_reminders'
+    __table_args__ = (
+        db.Index('ix_court_reminders_due', 'sent_at', 'fire_at'),
+    )
+
+    roster_id = db.Column(db.String(50), primary_key=True)
+    court_date = db.Column(db.Date, nullable=False)
+    fire_at = db.Column(db.DateTime, nullable=False)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        """Convert the model to a dictionary for JSON serialization."""
+        return {
+            'rosterId': self.roster_id,
+            'courtDate': self.court_date.isoformat(),
+            'fireAt': self.fire_at.isoformat(),
+            'sentAt': self.sent_at.isoformat() if self.sent_at else ''
+        }
+
+
+def _wanted_court_date(record):
+    """Court date that should have a pending reminder, or None."""
+    if record.release_date_time is not None or record.court_date is None:
+        return None
+    if record.court_date < date.today():
+        return None
+    return record.court_date
+
+
+@event.listens_for(Session, 'before_flush')
+def _schedule_reminders(session, flush_context, instances):
+    """Queue, move or drop reminders for bookings whose court date or release changed."""
+    table = CourtReminder.__table__
+    for record in list(session.new) + list(session.dirty):
+        if not isinstance(record, Roster):
+            continue
+        attrs = inspect(record).attrs
+        if record not in session.new and not (
+            attrs.court_date.history.has_changes() or attrs.release_date_time.history.has_changes()
+        ):
+            continue
+
+        court_date = _wanted_court_date(record)
+        reminder = session.get(CourtReminder, record.id)
+        if court_date is None:
+            if reminder is not None:
+                session.delete(reminder)
+        elif reminder is None:
+            session.add(CourtReminder(roster_id=record.id, court_date=court_date, fire_at=fire_time(court_date)))
+        elif reminder.court_date != court_date:
+            reminder.court_date = court_date
+            reminder.fire_at = fire_time(court_date)
+            reminder.sent_at = None
+
+    deleted_ids = [record.id for record in session.deleted if isinstance(record, Roster)]
+    if deleted_ids:
+        session.execute(table.delete().where(table.c.roster_id.in_(deleted_ids)))
+
+
+def due_reminders(now=None, limit=REMINDER_BATCH_SIZE):
+    """Unsent reminders whose fire time has passed, earliest first, locked against other workers."""
+    now = now or datetime.now()
+    return CourtReminder.query.filter(
+        CourtReminder.sent_at.is_(None),
+        CourtReminder.fire_at <= now
+    ).order_by(CourtReminder.fire_at).limit(limit).with_for_update(skip_locked=True).all()
+
+
+def _reminder_email(bookings):
+    """Subject and HTML body listing the inmates due in court."""
+    rows = ''.join(
+        f'<tr><td>{escape(record.name)}</td><td>{record.court_date.strftime("%m/%d/%Y")}</td>'
+        f'<td>{escape(record.court_packet or "")}</td><td>{escape(record.court_case_ticket or "")}</td>'
+        f'<td>{escape(record.jail_location or "")} {escape(record.cell or "")}</td></tr>'
+        for record in bookings
+    )
+    subject = f'Court Date Reminder - {len(bookings)} inmate{"s" if len(bookings) != 1 else ""}'
+    html_content = f'''
+    <p>The following inmates are due in court:</p>
+    <table border="1" cellpadding="4" cellspacing="0">
+    <tr><th>Name</th><th>Court Date</th><th>Court</th><th>Case/Ticket</th><th>Housing</th></tr>
+    {rows}
+    </table>
+    <p>Shaker Police Department</p>
+    '''
+    return subject, html_content
+
+
+def send_due_reminders(send, now=None, batch_size=REMINDER_BATCH_SIZE):
+    """
+    Deliver due reminders one batch per message until the queue has none left.
+    send(subject, html_content) delivers a message; if it raises, the batch
+    stays queued for the next run. Returns the number of reminders sent.
+    """
+    now = now or datetime.now()
+    sent = 0
+    while True:
+        reminders = due_reminders(now, batch_size)
+        if not reminders:
+            break
+        bookings = {
+            record.id: record for record in
+            Roster.query.filter(Roster.id.in_([reminder.roster_id for reminder in reminders])).all()
+        }
+        # Court dates that already passed are dropped rather than sent late
+        current = [reminder for reminder in reminders if reminder.court_date >= now.date()]
+        if current:
+            records = [bookings[reminder.roster_id] for reminder in current if reminder.roster_id in bookings]
+            if records:
+                send(*_reminder_email(records))
+        for reminder in reminders:
+            reminder.sent_at = now
+        db.session.commit()
+        sent += len(current)
+    return sent
+
+
+def schedule_existing_reminders():
+    """Queue reminders for active bookings with upcoming court dates that have none. Returns the number queued."""
+    queued = db.session.query(CourtReminder.roster_id)
+    records = db.session.query(Roster.id, Roster.court_date).filter(
+        Roster.release_date_time.is_(None),
+        Roster.court_date >= date.today(),
+        Roster.id.notin_(queued)
+    ).all()
+    for roster_id, court_date in records:
+        db.session.add(CourtReminder(roster_id=roster_id, court_date=court_date, fire_at=fire_time(court_date)))
+    db.session.commit()
+    return len(records)
@@ -4,15 +4,52 @@ This replaces the in-memory data store with a persistent PostgreSQL database.
 """
 
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy import Integer, Date, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import validates
+from sqlalchemy.sql.expression import FunctionElement
+from datetime import datetime, date
 import json
+from ..normalize import normalize_name, parse_name, natural_sort_key, normalize_identifier
+from ..security import encrypt_ssn, read_ssn, ssn_blind_index, UNREADABLE_SSN
+from ..holds import parse_holds
 
 db = SQLAlchemy()
 
+class custody_days_sql(FunctionElement):
+    """
+    SQL expression for calendar days in custody, counting the arrest day as day 1:
+    custody_days_sql(arrest_date_time, release_date_time, today).
+    """
+    type = Integer()
+    inherit_cache = True
+
+@compiles(custody_days_sql)
+def _compile_custody_days(element, compiler, **kw):
+    arrest, release, today = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f'(COALESCE(CAST({release} AS DATE), {today}) - CAST({arrest} AS DATE) + 1)'
+
+@compiles(custody_days_sql, 'sqlite')
+def _compile_custody_days_sqlite(element, compiler, **kw):
+    arrest, release, today = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f'(CAST(julianday(COALESCE(date({release}), {today})) - julianday(date({arrest})) AS INTEGER) + 1)'
+
+
 class Roster(db.Model):
     """Model for jail roster records."""
     
     __tablename__ = 'roster'
+    __table_args__ = (
+        db.Index('ix_roster_name_key_dob', 'name_key', 'dob'),
+        # Roster list sorts, ending in the id tiebreak so the index supplies the whole order
+        db.Index('ix_roster_name_sort', 'last_name', 'first_name', 'middle_name', 'id'),
+        db.Index('ix_roster_cell_sort', 'jail_location', 'cell_sort_key', 'id'),
+        db.Index('ix_roster_oca_number', 'oca_number'),
+        db.Index('ix_roster_court_case_ticket', 'court_case_ticket'),
+        # Active bookings (release IS NULL) by court date, then arrest time
+        db.Index('ix_roster_custody_deadline', 'release_date_time', 'court_date', 'arrest_date_time'),
+    )
     
     # Primary key
     id = db.Column(db.String(50), primary_key=True)
@@ -20,21 +57,37 @@ class Roster(db.Model):
     # Basic inmate information
     jail_location = db.Column(db.String(100), default='Solon', nullable=False)
     cell = db.Column(db.String(50), nullable=True)
+    cell_sort_key = db.Column(db.String(100), nullable=True, index=True)  # Natural-sort key set from cell
     day_number = db.Column(db.String(10), nullable=True)
     total_number = db.Column(db.String(10), nullable=True)
     name = db.Column(db.String(200), nullable=False)
+    name_key = db.Column(db.String(200), nullable=True)  # Normalized name for matching
+    # Parsed from name on write, for sorting
+    last_name = db.Column(db.String(100), nullable=True)
+    first_name = db.Column(db.String(100), nullable=True)
+    middle_name = db.Column(db.String(100), nullable=True)
     dob = db.Column(db.Date, nullable=True)
-    ssn = db.Column(db.String(20), nullable=True)
+    # SSNs are stored encrypted with a keyed-hash blind index for lookups.
+    # The legacy plaintext column is only read until the backfill clears it.
+    legacy_ssn = db.Column('ssn', db.String(20), nullable=True)
+    ssn_encrypted = db.Column(db.Text, nullable=True)
+    ssn_index = db.Column(db.String(64), nullable=True, index=True)
     sex_m = db.Column(db.Boolean, default=False)
     sex_f = db.Column(db.Boolean, default=False)
+    person_id = db.Column(db.Integer, db.ForeignKey('persons.id'), nullable=True, index=True)
     
     # Arrest and charges
     oca_number = db.Column(db.String(50), nullable=True)
-    arrest_date_time = db.Column(db.DateTime, nullable=True)
+    arrest_date_time = db.Column(db.DateTime, nullable=True, index=True)
     misdemeanor = db.Column(db.Boolean, default=False)
     felony = db.Column(db.Boolean, default=False)
     charges = db.Column(db.Text, nullable=True)
     
+    charge_items = db.relationship(
+        'Charge', backref='booking', cascade='all, delete-orphan',
+        order_by='Charge.position'
+    )
+    
     # Court information
     court_packet = db.Column(db.String(100), nullable=True)
     inst = db.Column(db.String(100), nullable=True)
@@ -42,11 +95,15 @@ class Roster(db.Model):
     bond_change_notice = db.Column(db.Boolean, default=False)
     bond = db.Column(db.String(100), nullable=True)
     waiver = db.Column(db.String(100), nullable=True)
-    court_date = db.Column(db.Date, nullable=True)
+    court_date = db.Column(db.Date, nullable=True, index=True)
     
     # Release information
     release_date_time = db.Column(db.DateTime, nullable=True)
     holders_notes = db.Column(db.Text, nullable=True)
+    # Hold fields extracted from holders_notes on write
+    has_hold = db.Column(db.Boolean, nullable=True, index=True)
+    hold_type = db.Column(db.String(30), nullable=True, index=True)
+    holding_agency = db.Column(db.String(100), nullable=True, index=True)
     charging_docs = db.Column(db.String(100), nullable=True)
     
     # Photo storage (Base64 encoded)
@@ -56,6 +113,136 @@ class Roster(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    @hybrid_property
+    def custody_days(self):
+        """Calendar days in custody, counting the arrest day as day 1."""
+        if not self.arrest_date_time:
+            return None
+        end = self.release_date_time.date() if self.release_date_time else date.today()
+        return (end - self.arrest_date_time.date()).days + 1
+    
+    @custody_days.expression
+    def custody_days(cls):
+        return custody_days_sql(cls.arrest_date_time, cls.release_date_time, literal(date.today(), Date))
+    
+    @staticmethod
+    def refresh_custody_counts(include_released=False):
+        """
+        Rewrite the legacy day_number/total_number strings with one set-based UPDATE.
+        day_number is this booking's custody days; total_number is the sum over
+        all bookings of the same person. Only active bookings change daily, so
+        released bookings are skipped unless include_released is set.
+        Returns the number of rows updated.
+        """
+        other = db.aliased(Roster)
+        person_total = db.select(db.func.sum(other.custody_days)).where(
+            other.person_id == Roster.person_id
+        ).scalar_subquery()
+        
+        statement = db.update(Roster).where(Roster.arrest_date_time.isnot(None))
+        if not include_released:
+            statement = statement.where(Roster.release_date_time.is_(None))
+        statement = statement.values(
+            day_number=db.cast(Roster.custody_days, db.String),
+            total_number=db.cast(
+                db.case((Roster.person_id.is_(None), Roster.custody_days), else_=person_total),
+                db.String
+            ),
+            updated_at=Roster.updated_at  # Derived values are not edits
+        )
+        result = db.session.execute(statement, execution_options={'synchronize_session': False})
+        db.session.commit()
+        return result.rowcount
+    
+    @validates('name')
+    def _set_name(self, key, value):
+        self.name_key = normalize_name(value)
+        self.last_name, self.first_name, self.middle_name = parse_name(value)
+        return value
+    
+    @validates('cell')
+    def _set_cell(self, key, value):
+        self.cell_sort_key = natural_sort_key(value)
+        return value
+    
+    @validates('oca_number', 'court_case_ticket')
+    def _set_identifier(self, key, value):
+        return normalize_identifier(value)
+    
+    @validates('charges')
+    def _set_charges(self, key, value):
+        if value != self.charges or not self.charge_items:
+            self.charge_items = [
+                Charge(position=position, **parsed)
+                for position, parsed in enumerate(parse_charges(value))
+            ]
+        return value
+    
+    @validates('holders_notes')
+    def _set_holders_notes(self, key, value):
+        self.has_hold, self.hold_type, self.holding_agency = parse_holds(value)
+        return value
+    
+    def derive_offense_level(self):
+        """
+        Set the misdemeanor/felony flags from the classified charges, when any
+        are classified. The flags name the booking's most serious class, so
+        exactly one is set: a booking with any felony charge is a felony.
+        Only called when a request leaves the flags out; flags an officer
+        sent are never overwritten.
+        """
+        classified = [item.is_felony for item in self.charge_items if item.is_felony is not None]
+        if classified:
+            self.felony = any(classified)
+            self.misdemeanor = not self.felony
+    
+    @property
+    def ssn(self):
+        """Decrypted SSN, or UNREADABLE_SSN when the stored value cannot be decrypted."""
+        if self.ssn_encrypted:
+            return read_ssn(self.ssn_encrypted, self.id)
+        return self.legacy_ssn
+    
+    @ssn.setter
+    def ssn(self, value):
+        value = (value or '').strip()
+        if value == UNREADABLE_SSN:
+            return  # The masked placeholder echoed back; keep the stored ciphertext
+        self.ssn_encrypted = encrypt_ssn(value) if value else None
+        self.ssn_index = ssn_blind_index(value)
+        self.legacy_ssn = None
+    
+    @staticmethod
+    def find_by_ssn(ssn):
+        """Return bookings with an exact SSN match using the blind index."""
+        index = ssn_blind_index(ssn)
+        if index is None:
+            return []
+        return Roster.query.filter(Roster.ssn_index == index).all()
+    
+    def find_duplicates(self, limit=10):
+        """
+        Return ids of existing bookings that look like this one.
+        A candidate shares the OCA number, or the normalized name and DOB.
+        Both lookups are index probes, so the cost does not grow with history.
+        """
+        candidates = []
+        if self.oca_number:
+            candidates += db.session.query(Roster.id).filter(
+                Roster.oca_number == self.oca_number
+            ).limit(limit).all()
+        if self.name_key and self.dob:
+            candidates += db.session.query(Roster.id).filter(
+                Roster.name_key == self.name_key,
+                Roster.dob == self.dob
+            ).limit(limit).all()
+        
+        ids = []
+        for (candidate_id,) in candidates:
+            if candidate_id != self.id and candidate_id not in ids:
+                ids.append(candidate_id)
+        return ids[:limit]
+    
     def to_dict(self):
         """Convert the model to a dictionary for JSON serialization."""
         return {
@@ -64,16 +251,19 @@ class Roster(db.Model):
             'cell': self.cell,
             'dayNumber': self.day_number,
             'totalNumber': self.total_number,
+            'custodyDays': self.custody_days,
             'name': self.name,
             'dob': self.dob.isoformat() if self.dob else '',
             'ssn': self.ssn or '',
             'sexM': self.sex_m,
             'sexF': self.sex_f,
+            'personId': self.person_id,
             'ocaNumber': self.oca_number or '',
             'arrestDateTime': self.arrest_date_time.isoformat() if self.arrest_date_time else '',
             'misdemeanor': self.misdemeanor,
             'felony': self.felony,
             'charges': self.charges or '',
+            'chargeItems': [item.to_dict() for item in self.charge_items],
             'courtPacket': self.court_packet or '',
             'inst': self.inst or '',
             'courtCaseTicket': self.court_case_ticket or '',
@@ -83,6 +273,9 @@ class Roster(db.Model):
             'courtDate': self.court_date.isoformat() if self.court_date else '',
             'releaseDateTime': self.release_date_time.isoformat() if self.release_date_time else '',
             'holdersNotes': self.holders_notes or '',
+            'hasHold': bool(self.has_hold),
+            'holdType': self.hold_type or '',
+            'holdingAgency': self.holding_agency or '',
             'chargingDocs': self.charging_docs or '',
             'suspectPhotoBase64': self.suspect_photo_base64.decode('utf-8') if self.suspect_photo_base64 else ''
         }
@@ -142,4 +335,18 @@ class Roster(db.Model):
         if photo_data:
             record.suspect_photo_base64 = photo_data.encode('utf-8') if isinstance(photo_data, str) else photo_data
         
+        if 'misdemeanor' not in data and 'felony' not in data:
+            record.derive_offense_level()
+        
         return record
+
+
+from .charge import Charge, parse_charges
+from . import housing  # Registers occupancy maintenance for bookings
+from . import court  # Registers court manifest cache invalidation
+from . import population  # Registers population bucket invalidation
+from . import change  # Registers the roster changes feed
+from . import snapshot  # Registers the daily snapshots table
+from . import reminder  # Registers court date reminder scheduling
+from . import name_search  # Registers the name trigram index
+from . import headcount  # Registers the headcounts table
@@ -0,0 +1,221 @@
+"""
+SQLAlchemy model for daily roster snapshots.
+A snapshot is the booked (not yet released) roster as of midnight ending a
+day, stored as zlib-compressed JSON rows of key fields. Each snapshot records
+the last change id it reflects, so the next day's snapshot is the previous
+one plus the changes feed in between rather than a scan of the roster.
+"""
+
+import json
+import zlib
+from datetime import datetime, date, time, timedelta
+from .roster import db, Roster
+from .change import RosterChange, latest_change_id, feed_time
+
+# Key fields kept per booking, in payload column order
+SNAPSHOT_FIELDS = (
+    'id', 'name', 'jail_location', 'cell', 'arrest_date_time', 'release_date_time',
+    'court_date', 'bond', 'felony', 'misdemeanor'
+)
+
+# Fields reported as changed when diffing two snapshots
+DIFF_FIELDS = tuple(field for field in SNAPSHOT_FIELDS if field != 'id')
+
+
+def _camel(field):
+    head, *rest = field.split('_')
+    return head + ''.join(part.capitalize() for part in rest)
+
+
+def public_fields(fields):
+    """Snapshot fields keyed the way the API names them (jailLocation, courtDate, ...)."""
+    return {_camel(field): value for field, value in fields.items()}
+
+
+class RosterSnapshot(db.Model):
+    """Model for the roster as of the midnight ending snapshot_date."""
+
+    __tablename__ = 'roster_snapshots'
+
+    snapshot_date = db.Column(db.Date, primary_key=True)
+    change_id = db.Column(db.Integer, nullable=False)  # Last change reflected
+    booking_count = db.Column(db.Integer, nullable=False)
+    payload = db.Column(db.LargeBinary, nullable=False)
+    built_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+
+    def bookings(self):
+        """{booking id: {field: value}} with values as ISO strings where applicable."""
+        rows = json.loads(zlib.decompress(self.payload))
+        return {row[0]: dict(zip(SNAPSHOT_FIELDS, row)) for row in rows}
+
+    def to_dict(self, include_bookings=False):
+        """Convert the model to a dictionary for JSON serialization."""
+        result = {
+            'date': self.snapshot_date.isoformat(),
+            'changeId': self.change_id,
+            'count': self.booking_count,
+            'builtAt': self.built_at.isoformat()
+        }
+        if include_bookings:
+            bookings = sorted(self.bookings().values(), key=lambda row: row['name'] or '')
+            result['bookings'] = [public_fields(fields) for fields in bookings]
+        return result
+
+
+def snapshot_moment(day):
+    """Midnight at the end of a day."""
+    return datetime.combine(day + timedelta(days=1), time.min)
+
+
+def _booked_at(fields, moment):
+    """Whether a booking is in custody at a moment: arrested (if known) before it and not yet released."""
+    arrest = fields.get('arrest_date_time')
+    if arrest and datetime.fromisoformat(arrest).replace(tzinfo=None) >= moment:
+        return False
+    release = fields.get('release_date_time')
+    return not release or datetime.fromisoformat(release).replace(tzinfo=None) >= moment
+
+
+def _row(fields):
+    return [fields.get(field) for field in SNAPSHOT_FIELDS]
+
+
+def _encode(rows):
+    return zlib.compress(json.dumps(rows, separators=(',', ':')).encode('utf-8'), 9)
+
+
+def _json_fields(values):
+    return {
+        field: value.isoformat() if isinstance(value, (datetime, date)) else value
+        for field, value in zip(SNAPSHOT_FIELDS, values)
+    }
+
+
+def _seed_bookings(moment):
+    """
+    Bookings in custody at a past moment, read from the roster table, and the
+    last change id they reflect. Bookings written since the moment are taken
+    from their last feed row before it instead, so later admissions and edits
+    do not leak into the seed.
+    """
+    cutoff = feed_time(moment)
+    first_after = db.session.query(db.func.min(RosterChange.id)).filter(RosterChange.changed_at >= cutoff).scalar()
+    change_id = first_after - 1 if first_after else latest_change_id()
+
+    earlier = {}  # Booking changed since the moment -> feed data before it (None if none)
+    if first_after:
+        touched = db.session.query(RosterChange.roster_id).filter(RosterChange.id >= first_after).distinct()
+        earlier = {roster_id: None for roster_id, in touched.all()}
+        rows = db.session.query(RosterChange.roster_id, RosterChange.data).filter(
+            RosterChange.id < first_after,
+            RosterChange.roster_id.in_(list(earlier))
+        ).order_by(RosterChange.id).all()
+        for roster_id, data in rows:
+            earlier[roster_id] = data
+
+    columns = [getattr(Roster, field) for field in SNAPSHOT_FIELDS]
+    query = db.session.query(*columns, Roster.created_at).filter(
+        Roster.created_at < cutoff,
+        db.or_(Roster.arrest_date_time.is_(None), Roster.arrest_date_time < moment),
+        db.or_(Roster.release_date_time.is_(None), Roster.release_date_time >= moment)
+    )
+    bookings = {}
+    for *values, _ in query.all():
+        booking_id = values[0]
+        # Bookings written before the feed existed have no earlier row; their current state stands in
+        if booking_id not in earlier or earlier[booking_id] is None:
+            bookings[booking_id] = _json_fields(values)
+    for booking_id, data in earlier.items():
+        fields = json.loads(data) if data else None
+        if fields is not None and _booked_at(fields, moment):
+            bookings[booking_id] = {field: fields.get(field) for field in SNAPSHOT_FIELDS}
+        elif data is not None:
+            bookings.pop(booking_id, None)
+    return bookings, change_id
+
+
+def take_snapshot(day):
+    """
+    Build and store the snapshot for a day.
+    With an earlier snapshot on hand, its rows are carried forward, releases
+    that have since taken effect are dropped, and feed changes committed
+    before the snapshot moment are replayed, stopping at the first change
+    made after it. Without one, the roster table is read once to seed the
+    chain. Raises ValueError for a day that has not ended yet.
+    """
+    moment = snapshot_moment(day)
+    if moment > datetime.now():
+        raise ValueError(f'{day.isoformat()} has not ended yet')
+    previous = RosterSnapshot.query.filter(
+        RosterSnapshot.snapshot_date < day
+    ).order_by(RosterSnapshot.snapshot_date.desc()).first()
+
+    if previous is None:
+        bookings, change_id = _seed_bookings(moment)
+    else:
+        bookings = {
+            booking_id: fields for booking_id, fields in previous.bookings().items()
+            if _booked_at(fields, moment)
+        }
+        changes = db.session.query(
+            RosterChange.id, RosterChange.roster_id, RosterChange.changed_at, RosterChange.data
+        ).filter(RosterChange.id > previous.change_id).order_by(RosterChange.id).all()
+
+        change_id = previous.change_id
+        for next_id, roster_id, changed_at, data in changes:
+            if changed_at >= feed_time(moment):
+                break
+            change_id = next_id
+            fields = json.loads(data) if data else None
+            if fields is not None and _booked_at(fields, moment):
+                bookings[roster_id] = {field: fields.get(field) for field in SNAPSHOT_FIELDS}
+            else:
+                bookings.pop(roster_id, None)
+    rows = [_row(fields) for fields in bookings.values()]
+
+    rows.sort(key=lambda row: row[0])
+    snapshot = db.session.get(RosterSnapshot, day) or RosterSnapshot(snapshot_date=day)
+    snapshot.change_id = change_id
+    snapshot.booking_count = len(rows)
+    snapshot.payload = _encode(rows)
+    snapshot.built_at = datetime.now()
+    db.session.add(snapshot)
+    db.session.commit()
+    return snapshot
+
+
+def take_missing_snapshots(through=None):
+    """
+    Snapshot every day from the one after the latest snapshot through a day
+    (default: yesterday, i.e. the day that ended at the most recent midnight).
+    Returns the snapshots built.
+    """
+    through = through or date.today() - timedelta(days=1)
+    latest = db.session.query(db.func.max(RosterSnapshot.snapshot_date)).scalar()
+    day = latest + timedelta(days=1) if latest else through
+    built = []
+    while day <= through:
+        built.append(take_snapshot(day))
+        day += timedelta(days=1)
+    return built
+
+
+def diff_snapshots(older, newer):
+    """
+    Compare two snapshots.
+    Returns {'added': [...], 'removed': [...], 'changed': [...]}, where
+    changed entries list the fields that differ with their old and new values.
+    """
+    before, after = older.bookings(), newer.bookings()
+    added = [public_fields(after[booking_id]) for booking_id in sorted(after.keys() - before.keys())]
+    removed = [public_fields(before[booking_id]) for booking_id in sorted(before.keys() - after.keys())]
+    changed = []
+    for booking_id in sorted(before.keys() & after.keys()):
+        fields = {
+            _camel(field): {'from': before[booking_id][field], 'to': after[booking_id][field]}
+            for field in DIFF_FIELDS
+            if before[booking_id][field] != after[booking_id][field]
+        }
+        if fields:
+            changed.append({'id': booking_id, 'name': after[booking_id]['name'], 'fields': fields})
+    return {'added': added, 'removed': removed, 'changed': changed}
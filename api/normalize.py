@@ -0,0 +1,140 @@
+"""
+Normalization helpers for matching roster records.
+Names are typed by hand in both "Last, First M" and "First Last" order, so
+matching is done on normalized keys rather than on the raw strings.
+"""
+
+import re
+import unicodedata
+
+# Generational suffixes and single-letter initials are ignored when matching
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+_NON_ALPHA = re.compile(r'[^a-z\s]')
+
+
+def _ascii_lower(value):
+    """Lowercase a string and strip accents."""
+    value = unicodedata.normalize('NFKD', value or '')
+    return value.encode('ascii', 'ignore').decode('ascii').lower()
+
+
+def name_tokens(name):
+    """Split a name into lowercase alphabetic tokens."""
+    cleaned = _ascii_lower(name).replace(',', ' ').replace('-', ' ')
+    return _NON_ALPHA.sub('', cleaned).split()
+
+
+def normalize_name(name):
+    """
+    Build an order-independent key for a name.
+
+    "Smith, John D" and "John Smith Jr." both normalize to "john smith".
+    """
+    tokens = [t for t in name_tokens(name) if len(t) > 1 and t not in NAME_SUFFIXES]
+    return ' '.join(sorted(tokens)) or None
+
+
+def parse_name(name):
+    """
+    Split a name into (last, first, middle) normalized tokens.
+
+    Names containing a comma are read as "Last, First Middle"; otherwise the
+    last token is taken as the surname ("First Middle Last"). Missing parts
+    are returned as None.
+    """
+    name = name or ''
+    if ',' in name:
+        last_part, _, given_part = name.partition(',')
+        last_tokens = [t for t in name_tokens(last_part) if t not in NAME_SUFFIXES]
+        given_tokens = [t for t in name_tokens(given_part) if t not in NAME_SUFFIXES]
+    else:
+        tokens = [t for t in name_tokens(name) if t not in NAME_SUFFIXES]
+        last_tokens = tokens[-1:]
+        given_tokens = tokens[:-1]
+
+    last = ' '.join(last_tokens) or None
+    first = given_tokens[0] if given_tokens else None
+    middle = ' '.join(given_tokens[1:]) or None
+    return last, first, middle
+
+
+def first_names_compatible(a, b):
+    """Treat first names as the same person if equal or one is an initial of the other."""
+    if not a or not b:
+        return True
+    if len(a) == 1 or len(b) == 1:
+        return a[0] == b[0]
+    return a == b
+
+
+_DIGIT_RUNS = re.compile(r'(\d+)')
+
+
+def natural_sort_key(value, width=6):
+    """
+    Sort key that orders embedded numbers numerically: "SOL-2" before "SOL-10".
+    Digit runs are zero-padded to a fixed width so the key sorts correctly as plain text.
+    """
+    value = (value or '').strip().upper()
+    if not value:
+        return None
+    return _DIGIT_RUNS.sub(lambda match: match.group(1).zfill(width), value)
+
+
+def normalize_identifier(value):
+    """Strip surrounding whitespace from an identifier, returning None when blank."""
+    value = (value or '').strip()
+    return value or None
+
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'), **dict.fromkeys('dt', '3'),
+    'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+}
+
+
+def soundex(token):
+    """American Soundex code of a lowercase token, so "smith" and "smyth" share a key."""
+    token = ''.join(c for c in (token or '') if c.isalpha())
+    if not token:
+        return None
+    code = token[0].upper()
+    previous = _SOUNDEX_CODES.get(token[0])
+    for c in token[1:]:
+        digit = _SOUNDEX_CODES.get(c)
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in 'hw':
+            previous = digit
+    return code.ljust(4, '0')
+
+
+def bigrams(value):
+    """Set of letter pairs in a string, padded so short names still compare."""
+    value = f' {value or ""} '
+    return {value[i:i + 2] for i in range(len(value) - 1)}
+
+
+def similarity(a, b):
+    """Dice coefficient of two bigram sets, from 0.0 to 1.0."""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def trigrams(value):
+    """
+    Trigrams of each word, padded the way pg_trgm pads them
+    (two spaces before, one after), without duplicates.
+    """
+    grams = []
+    for word in (value or '').split():
+        padded = f'  {word} '
+        for i in range(len(padded) - 2):
+            gram = padded[i:i + 3]
+            if gram not in grams:
+                grams.append(gram)
+    return grams
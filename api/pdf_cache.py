@@ -0,0 +1,95 @@
+"""
+Cache of rendered PDF reports.
+A report is keyed by the roster generation (the latest change id), the
+report type and its filters, so any write to the roster changes the key and
+stale documents are never served. Rendered bytes are kept in a small
+in-memory LRU shared by the process and written to PDF_CACHE_DIR so other
+workers and restarts reuse them. The disk keeps one file per report type:
+storing a report removes that type's other files, whether from an older
+generation or for filters that have gone stale (such as yesterday's date).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from .models.change import latest_change_id
+
+PDF_CACHE_DIR = os.getenv('PDF_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'jailroster-pdf-cache'))
+MEMORY_ENTRIES = 16
+
+
+class PdfCache:
+    """Rendered reports in memory and on disk, keyed by (generation, report type, filters)."""
+
+    def __init__(self, directory=PDF_CACHE_DIR, memory_entries=MEMORY_ENTRIES):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()  # File name -> PDF bytes, least recently used first
+
+    @staticmethod
+    def _filters_digest(filters):
+        return hashlib.sha256(json.dumps(filters or {}, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+    def _remember(self, name, data):
+        with self.lock:
+            self.memory[name] = data
+            self.memory.move_to_end(name)
+            while len(self.memory) > self.memory_entries:
+                self.memory.popitem(last=False)
+
+    def _read_disk(self, name):
+        try:
+            with open(os.path.join(self.directory, name), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, report_type, name, data):
+        """Write atomically, then drop this report type's other files."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.directory, name))
+            # The generation is all digits, so other report types sharing this prefix are left alone
+            for path in glob.glob(os.path.join(self.directory, f'{report_type}-[0-9]*-*.pdf')):
+                if os.path.basename(path) != name:
+                    os.unlink(path)
+        except OSError as e:
+            print(f"[PDF CACHE] Could not write {name}: {e}")
+
+    def get(self, report_type, filters, render):
+        """
+        Return (PDF bytes, cache hit) for a report, calling render() to build
+        it when neither memory nor disk has the current generation.
+        """
+        digest = self._filters_digest(filters)
+        name = f'{report_type}-{latest_change_id()}-{digest}.pdf'
+
+        with self.lock:
+            data = self.memory.get(name)
+            if data is not None:
+                self.memory.move_to_end(name)
+                return data, True
+        data = self._read_disk(name)
+        if data is not None:
+            self._remember(name, data)
+            return data, True
+
+        data = render()
+        self._remember(name, data)
+        self._write_disk(report_type, name, data)
+        return data, False
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+
+
+pdf_cache = PdfCache()
@@ -0,0 +1,229 @@
+"""
+Flask routes for roster analytics.
+"""
+
+from flask import Blueprint, request, jsonify, send_file
+from datetime import datetime, timedelta
+from fpdf import FPDF
+import csv
+import io
+from .auth import require_auth
+from .roster_db import add_report_header, add_report_footer, pdf_bytes, table_row
+from ..models.roster import db
+from ..models.population import population_series, BUCKET_SIZES, ALL_LOCATIONS
+from ..billing import billing_report, month_bounds
+from ..analytics_engine import roster_columns, METRICS, GROUP_BY_FIELDS
+
+analytics_bp = Blueprint('analytics', __name__)
+
+def parse_datetime_arg(name, default):
+    """Read an ISO date or datetime query parameter, raising ValueError if it is malformed."""
+    value = request.args.get(name)
+    if not value:
+        return default
+    return datetime.fromisoformat(value)
+
+@analytics_bp.route('/population', methods=['GET'])
+@require_auth
+def get_population():
+    """
+    Jail population per bucket, for the facility and per location.
+    Query parameters: from, to (default: the last 30 days), bucket (day/hour)
+    and location (restrict the per-location series to one location).
+    """
+    bucket = request.args.get('bucket', 'day')
+    if bucket not in BUCKET_SIZES:
+        return jsonify({'error': 'bucket must be day or hour'}), 400
+    
+    try:
+        end = parse_datetime_arg('to', datetime.now())
+        start = parse_datetime_arg('from', end - timedelta(days=30))
+    except ValueError:
+        return jsonify({'error': 'from and to must be ISO dates or datetimes'}), 400
+    
+    try:
+        series = population_series(start, end, bucket)
+        location_filter = request.args.get('location')
+        
+        total = []
+        locations = {}
+        for bucket_start, stats in series.items():
+            for location, (population, peak, admissions, releases, bed_days) in stats.items():
+                point = {
+                    'start': bucket_start.isoformat(),
+                    'population': population,
+                    'peak': peak,
+                    'admissions': admissions,
+                    'releases': releases,
+                    'bedDays': bed_days
+                }
+                if location == ALL_LOCATIONS:
+                    total.append(point)
+                elif not location_filter or location == location_filter:
+                    locations.setdefault(location, []).append(point)
+        
+        return jsonify({
+            'bucket': bucket,
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'total': total,
+            'locations': locations
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def billing_csv(report):
+    """Render a billing report as CSV: detail lines followed by location totals."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Location', 'Name', 'Booking ID', 'Arrest', 'Release', 'First Day', 'Last Day', 'Bed-Days'])
+    for line in report['details']:
+        writer.writerow([
+            line['jailLocation'], line['name'], line['id'], line['arrestDateTime'],
+            line['releaseDateTime'], line['firstDay'], line['lastDay'], line['bedDays']
+        ])
+    writer.writerow([])
+    writer.writerow(['Location', 'Total Bed-Days'])
+    for location in report['locations']:
+        writer.writerow([location['jailLocation'], location['bedDays']])
+    writer.writerow(['All Locations', report['totalBedDays']])
+    return output.getvalue().encode('utf-8')
+
+def billing_pdf(report):
+    """Render a billing report as PDF, one table per location."""
+    pdf = FPDF(orientation='L', unit='mm', format='A4')
+    pdf.add_page()
+    
+    month_label = datetime.strptime(report['month'], '%Y-%m').strftime('%B %Y')
+    add_report_header(pdf, f'Bed-Day Billing Report - {month_label}')
+    
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_y(35)
+    pdf.set_font('Arial', '', 9)
+    pdf.cell(0, 5, f'Report Generated: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}', ln=True, align='R')
+    pdf.cell(0, 5, f'Total Bed-Days: {report["totalBedDays"]}', ln=True, align='R')
+    pdf.ln(3)
+    
+    col_widths = [70, 40, 45, 45, 30, 30, 20]
+    headers = ['Name', 'Booking ID', 'Arrest', 'Release', 'First Day', 'Last Day', 'Bed-Days']
+    
+    for location in report['locations']:
+        lines = [line for line in report['details'] if line['jailLocation'] == location['jailLocation']]
+        
+        pdf.set_font('Arial', 'B', 12)
+        pdf.set_fill_color(220, 220, 220)
+        pdf.cell(0, 8, f'{location["jailLocation"]} - {location["bedDays"]} bed-days', ln=True, fill=True)
+        pdf.ln(2)
+        
+        pdf.set_font('Arial', 'B', 9)
+        pdf.set_fill_color(70, 130, 180)  # Steel blue
+        pdf.set_text_color(255, 255, 255)
+        for i, header in enumerate(headers):
+            pdf.cell(col_widths[i], 8, header, border=1, fill=True, align='C')
+        pdf.ln()
+        
+        pdf.set_text_color(0, 0, 0)
+        pdf.set_font('Arial', '', 8)
+        for idx, line in enumerate(lines):
+            # Alternate row colors
+            if idx % 2 == 0:
+                pdf.set_fill_color(245, 245, 245)
+            else:
+                pdf.set_fill_color(255, 255, 255)
+            
+            row_data = [
+                line['name'],
+                line['id'],
+                line['arrestDateTime'][:16].replace('T', ' '),
+                line['releaseDateTime'][:16].replace('T', ' '),
+                line['firstDay'],
+                line['lastDay'],
+                line['bedDays']
+            ]
+            table_row(pdf, col_widths, row_data, 7)
+        pdf.ln(5)
+    
+    add_report_footer(pdf)
+    return pdf_bytes(pdf)
+
+@analytics_bp.route('/billing', methods=['GET'])
+@require_auth
+def get_billing():
+    """
+    Bed-day billing report for a month.
+    Query parameters: month (YYYY-MM, default: current month), location and
+    format (json, csv or pdf).
+    """
+    month = request.args.get('month', datetime.now().strftime('%Y-%m'))
+    try:
+        month_bounds(month)
+    except ValueError:
+        return jsonify({'error': 'month must be YYYY-MM'}), 400
+    
+    output_format = request.args.get('format', 'json')
+    if output_format not in ('json', 'csv', 'pdf'):
+        return jsonify({'error': 'format must be json, csv or pdf'}), 400
+    
+    try:
+        report = billing_report(month, request.args.get('location'))
+        
+        if output_format == 'csv':
+            return send_file(
+                io.BytesIO(billing_csv(report)),
+                mimetype='text/csv',
+                as_attachment=True,
+                download_name=f'bed_day_billing_{month}.csv'
+            )
+        if output_format == 'pdf':
+            return send_file(
+                io.BytesIO(billing_pdf(report)),
+                mimetype='application/pdf',
+                as_attachment=True,
+                download_name=f'bed_day_billing_{month}.pdf'
+            )
+        return jsonify(report), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@analytics_bp.route('/stats', methods=['GET'])
+@require_auth
+def get_stats():
+    """
+    Ad-hoc grouped statistics from the in-memory columnar roster.
+    Query parameters: metric (count, avgStayDays, totalStayDays, felonyRatio),
+    groupBy (jailLocation, cell, degree, arrestHour, arrestWeekday, sex, status),
+    status (active/released), location, from and to (arrest time range).
+    """
+    metric = request.args.get('metric', 'count')
+    group_by = request.args.get('groupBy', 'jailLocation')
+    if metric not in METRICS:
+        return jsonify({'error': f'metric must be one of {", ".join(METRICS)}'}), 400
+    if group_by not in GROUP_BY_FIELDS:
+        return jsonify({'error': f'groupBy must be one of {", ".join(GROUP_BY_FIELDS)}'}), 400
+    
+    try:
+        arrested_from = parse_datetime_arg('from', None)
+        arrested_to = parse_datetime_arg('to', None)
+    except ValueError:
+        return jsonify({'error': 'from and to must be ISO dates or datetimes'}), 400
+    
+    try:
+        groups = roster_columns.aggregate(
+            metric=metric,
+            group_by=group_by,
+            status=request.args.get('status'),
+            jail_location=request.args.get('location'),
+            arrested_from=arrested_from,
+            arrested_to=arrested_to
+        )
+        return jsonify({
+            'metric': metric,
+            'groupBy': group_by,
+            'generation': roster_columns.last_change_id,
+            'groups': groups
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,66 @@
+"""
+Flask routes for the retention archive.
+Archiving itself runs from the CLI (flask archive-roster) so it never ties
+up a web worker.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth, require_role
+from ..models.roster import db
+from ..models.archive import ArchivedBooking, read_archived, booking_from_archive, restore_booking
+from ..normalize import normalize_name
+
+archive_bp = Blueprint('archive', __name__)
+
+@archive_bp.route('', methods=['GET'])
+@require_auth
+def search_archive():
+    """Search the archive index by ?name= (normalized match) or ?id=, newest release first."""
+    try:
+        query = ArchivedBooking.query
+        if request.args.get('id'):
+            query = query.filter(ArchivedBooking.roster_id == request.args['id'])
+        if request.args.get('name'):
+            query = query.filter(ArchivedBooking.name_key == normalize_name(request.args['name']))
+        entries = query.order_by(ArchivedBooking.release_date_time.desc()).limit(
+            request.args.get('limit', 100, type=int)
+        ).all()
+        return jsonify([entry.to_dict() for entry in entries]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@archive_bp.route('/<record_id>', methods=['GET'])
+@require_auth
+def get_archived(record_id):
+    """Get an archived booking as it was when archived, read from its archive file."""
+    entry = db.session.get(ArchivedBooking, record_id)
+    if entry is None:
+        return jsonify({'error': 'Archived record not found'}), 404
+    
+    try:
+        archived = read_archived(entry)
+        if archived is None:
+            return jsonify({'error': f'Record missing from {entry.archive_file}'}), 500
+        return jsonify({
+            **entry.to_dict(),
+            'record': booking_from_archive(archived).to_dict(),
+            'historyCount': len(archived['history'])
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@archive_bp.route('/<record_id>/restore', methods=['POST'])
+@require_role('admin')
+def restore_archived(record_id):
+    """Move an archived booking back onto the roster."""
+    try:
+        record = restore_booking(record_id)
+        if record is None:
+            return jsonify({'error': 'Archived record not found'}), 404
+        return jsonify(record.to_dict()), 200
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,29 @@
+"""
+Flask routes for booking form suggestions.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth
+from ..models.roster import db
+from ..autocomplete import autocomplete, FIELDS
+
+autocomplete_bp = Blueprint('autocomplete', __name__)
+
+@autocomplete_bp.route('', methods=['GET'])
+@require_auth
+def get_suggestions():
+    """
+    Suggest previously used values starting with a prefix, most used first.
+    Query parameters: field (name, charge, cell, bond or courtPacket), prefix and limit.
+    """
+    field = request.args.get('field', '')
+    if field not in FIELDS:
+        return jsonify({'error': f'field must be one of {", ".join(FIELDS)}'}), 400
+    prefix = request.args.get('prefix', '')
+    
+    try:
+        suggestions = autocomplete.suggest(field, prefix, min(request.args.get('limit', 10, type=int), 50))
+        return jsonify({'field': field, 'prefix': prefix, 'suggestions': suggestions}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
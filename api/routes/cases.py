@@ -0,0 +1,42 @@
+"""
+Flask routes for incidents and their co-defendants.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth
+from ..cases import case_bookings, case_summary, list_cases
+
+cases_bp = Blueprint('cases', __name__)
+
+@cases_bp.route('', methods=['GET'])
+@require_auth
+def get_cases():
+    """
+    List cases with their status.
+    Query parameters: minBookings (default 2, i.e. cases with co-defendants)
+    and status=active (only cases with someone still in custody).
+    """
+    try:
+        cases = list_cases(
+            min_bookings=request.args.get('minBookings', 2, type=int),
+            status=request.args.get('status')
+        )
+        return jsonify(cases), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@cases_bp.route('/<path:number>', methods=['GET'])
+@require_auth
+def get_case(number):
+    """Get every booking tied to an OCA or court case/ticket number, with the case status."""
+    try:
+        bookings = case_bookings(number)
+        if not bookings:
+            return jsonify({'error': 'Case not found'}), 404
+        return jsonify({
+            'case': number,
+            **case_summary(bookings),
+            'records': [record.to_dict() for record in bookings]
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
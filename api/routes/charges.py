@@ -0,0 +1,57 @@
+"""
+Flask routes for charge-level queries over the normalized charges table.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth
+from ..models.roster import db, Roster
+from ..models.charge import Charge, statute_code_for
+
+charges_bp = Blueprint('charges', __name__)
+
+def _active_only():
+    """Whether to restrict results to inmates still in custody (the default)."""
+    return request.args.get('status', 'active') != 'all'
+
+@charges_bp.route('', methods=['GET'])
+@require_auth
+def search_charges():
+    """Find bookings held on a charge, by statute code (?code=4511.19) or offense name (?offense=OVI)."""
+    try:
+        code = request.args.get('code') or statute_code_for(request.args.get('offense'))
+        if not code:
+            return jsonify({'error': 'A known statute code or offense is required'}), 400
+        
+        query = db.session.query(Charge.roster_id).filter(Charge.statute_code == code)
+        if _active_only():
+            query = query.join(Roster, Roster.id == Charge.roster_id).filter(Roster.release_date_time.is_(None))
+        booking_ids = [roster_id for (roster_id,) in query.distinct().all()]
+        
+        return jsonify({
+            'statuteCode': code,
+            'count': len(booking_ids),
+            'bookingIds': booking_ids
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@charges_bp.route('/summary', methods=['GET'])
+@require_auth
+def charge_summary():
+    """Count bookings per statute code and degree."""
+    try:
+        query = db.session.query(
+            Charge.statute_code,
+            Charge.degree,
+            db.func.count(db.distinct(Charge.roster_id))
+        ).filter(Charge.statute_code.isnot(None))
+        if _active_only():
+            query = query.join(Roster, Roster.id == Charge.roster_id).filter(Roster.release_date_time.is_(None))
+        rows = query.group_by(Charge.statute_code, Charge.degree).all()
+        
+        return jsonify([
+            {'statuteCode': code, 'degree': degree or '', 'count': count}
+            for code, degree, count in rows
+        ]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
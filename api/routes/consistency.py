@@ -0,0 +1,56 @@
+"""
+Flask routes for the roster data-consistency scanner.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth
+from ..models.roster import db
+from ..models.consistency import DataViolation, RULES, get_checkpoint, scan, violation_counts
+
+consistency_bp = Blueprint('consistency', __name__)
+
+@consistency_bp.route('/violations', methods=['GET'])
+@require_auth
+def get_violations():
+    """List recorded violations; open only unless ?all=true, optionally for one ?rule= or ?rosterId=."""
+    rule = request.args.get('rule')
+    if rule and rule not in RULES:
+        return jsonify({'error': f'Unknown rule: {rule}'}), 400
+    
+    try:
+        query = DataViolation.query
+        if request.args.get('all', '').lower() not in ('1', 'true', 'yes'):
+            query = query.filter(DataViolation.resolved_at.is_(None))
+        if rule:
+            query = query.filter(DataViolation.rule == rule)
+        if request.args.get('rosterId'):
+            query = query.filter(DataViolation.roster_id == request.args['rosterId'])
+        violations = query.order_by(DataViolation.detected_at.desc(), DataViolation.id.desc()).limit(
+            request.args.get('limit', 500, type=int)
+        ).all()
+        return jsonify([violation.to_dict() for violation in violations]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@consistency_bp.route('/status', methods=['GET'])
+@require_auth
+def get_status():
+    """Get the scan checkpoint and open violation counts per rule."""
+    try:
+        counts = violation_counts()
+        return jsonify({
+            'checkpoint': get_checkpoint().to_dict(),
+            'openViolations': {rule: counts.get(rule, 0) for rule in RULES}
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@consistency_bp.route('/scan', methods=['POST'])
+@require_auth
+def run_scan():
+    """Continue the scan now for at most ?maxChunks= chunks (default 20)."""
+    try:
+        return jsonify(scan(max_chunks=request.args.get('maxChunks', 20, type=int))), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
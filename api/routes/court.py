@@ -0,0 +1,168 @@
+"""
+Flask routes for the court calendar and per-day transport manifests.
+"""
+
+from flask import Blueprint, request, jsonify, send_file
+from datetime import datetime, date, timedelta
+from fpdf import FPDF
+import io
+from .auth import require_auth
+from .roster_db import add_report_header, add_report_footer, pdf_bytes, fit_text, table_row
+from ..models.roster import db
+from ..models.court import get_manifest, court_days
+from ..models.reminder import CourtReminder, send_due_reminders, reminder_recipients
+from ..mailer import send_email
+
+court_bp = Blueprint('court', __name__)
+
+def parse_date_arg(name, default):
+    """Read an ISO date query parameter, raising ValueError if it is malformed."""
+    value = request.args.get(name)
+    if not value:
+        return default
+    return date.fromisoformat(value)
+
+@court_bp.route('/calendar', methods=['GET'])
+@require_auth
+def get_calendar():
+    """Get transport manifests for each court day between from and to (default: the next 7 days)."""
+    try:
+        start = parse_date_arg('from', date.today())
+        end = parse_date_arg('to', start + timedelta(days=7))
+    except ValueError:
+        return jsonify({'error': 'from and to must be dates (YYYY-MM-DD)'}), 400
+    
+    try:
+        days = court_days(start, end)
+        return jsonify({
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'days': [get_manifest(day).manifest() for day in days]
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@court_bp.route('/manifest/<day>', methods=['GET'])
+@require_auth
+def get_day_manifest(day):
+    """Get the transport manifest for one day."""
+    try:
+        court_date = date.fromisoformat(day)
+    except ValueError:
+        return jsonify({'error': 'Date must be YYYY-MM-DD'}), 400
+    
+    try:
+        return jsonify(get_manifest(court_date).manifest()), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def generate_manifest_pdf(manifest):
+    """Render a transport manifest, one table per court."""
+    pdf = FPDF(orientation='L', unit='mm', format='A4')
+    pdf.add_page()
+    
+    court_date = date.fromisoformat(manifest['courtDate'])
+    add_report_header(pdf, f'Court Transport Manifest - {court_date.strftime("%A, %B %d, %Y")}')
+    
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_y(35)
+    pdf.set_font('Arial', '', 9)
+    pdf.cell(0, 5, f'Manifest Built: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}', ln=True, align='R')
+    pdf.cell(0, 5, f'Total Inmates: {manifest["count"]}', ln=True, align='R')
+    pdf.ln(3)
+    
+    col_widths = [50, 25, 30, 20, 40, 30, 62, 20]
+    headers = ['Name', 'DOB', 'Location', 'Cell', 'Case / Ticket #', 'OCA #', 'Charges', 'Bond']
+    
+    for court in manifest['courts']:
+        pdf.set_font('Arial', 'B', 12)
+        pdf.set_fill_color(220, 220, 220)
+        pdf.cell(0, 8, f'{court["courtPacket"] or "No Court Packet"} ({len(court["inmates"])})', ln=True, fill=True)
+        pdf.ln(2)
+        
+        pdf.set_font('Arial', 'B', 9)
+        pdf.set_fill_color(70, 130, 180)  # Steel blue
+        pdf.set_text_color(255, 255, 255)
+        for i, header in enumerate(headers):
+            pdf.cell(col_widths[i], 8, header, border=1, fill=True, align='C')
+        pdf.ln()
+        
+        pdf.set_text_color(0, 0, 0)
+        pdf.set_font('Arial', '', 8)
+        for idx, inmate in enumerate(court['inmates']):
+            # Alternate row colors
+            if idx % 2 == 0:
+                pdf.set_fill_color(245, 245, 245)
+            else:
+                pdf.set_fill_color(255, 255, 255)
+            
+            dob = date.fromisoformat(inmate['dob']).strftime('%m/%d/%Y') if inmate['dob'] else ''
+            row_data = [
+                inmate['name'],
+                dob,
+                inmate['jailLocation'],
+                inmate['cell'],
+                inmate['courtCaseTicket'],
+                inmate['ocaNumber'],
+                fit_text(pdf, inmate['charges'], col_widths[6]),
+                inmate['bond']
+            ]
+            table_row(pdf, col_widths, row_data, 7)
+        pdf.ln(5)
+    
+    add_report_footer(pdf)
+    return pdf_bytes(pdf)
+
+@court_bp.route('/manifest/<day>/pdf', methods=['GET'])
+@require_auth
+def get_day_manifest_pdf(day):
+    """Download the transport manifest for one day as PDF."""
+    try:
+        court_date = date.fromisoformat(day)
+    except ValueError:
+        return jsonify({'error': 'Date must be YYYY-MM-DD'}), 400
+    
+    try:
+        cached = get_manifest(court_date)
+        if cached.pdf is None:
+            cached.pdf = generate_manifest_pdf(cached.manifest())
+            db.session.commit()
+        
+        return send_file(
+            io.BytesIO(cached.pdf),
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=f'court_manifest_{court_date.isoformat()}.pdf'
+        )
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@court_bp.route('/reminders', methods=['GET'])
+@require_auth
+def get_reminders():
+    """List queued court date reminders not yet sent, by fire time."""
+    try:
+        reminders = CourtReminder.query.filter(
+            CourtReminder.sent_at.is_(None)
+        ).order_by(CourtReminder.fire_at).all()
+        return jsonify([reminder.to_dict() for reminder in reminders]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@court_bp.route('/reminders/send', methods=['POST'])
+@require_auth
+def send_reminders():
+    """Send all due court date reminders now."""
+    recipients = reminder_recipients()
+    if not recipients:
+        return jsonify({'error': 'COURT_REMINDER_EMAIL not configured'}), 500
+    
+    try:
+        sent = send_due_reminders(lambda subject, html_content: send_email(recipients, subject, html_content))
+        return jsonify({'sent': sent}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,59 @@
+"""
+Flask routes for the initial-appearance deadline monitor.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth
+from ..models.roster import db
+from ..models.deadline import DeadlineAlert, find_overdue, check_deadlines, DEFAULT_DEADLINE_HOURS
+
+deadlines_bp = Blueprint('deadlines', __name__)
+
+@deadlines_bp.route('', methods=['GET'])
+@require_auth
+def get_overdue():
+    """List active inmates past their initial-appearance deadline (?hours= overrides the default)."""
+    try:
+        hours = request.args.get('hours', DEFAULT_DEADLINE_HOURS, type=int)
+        overdue = find_overdue(hours)
+        return jsonify({
+            'hours': hours,
+            'count': len(overdue),
+            'overdue': [
+                {
+                    'id': record.id,
+                    'name': record.name,
+                    'arrestDateTime': record.arrest_date_time.isoformat() if record.arrest_date_time else '',
+                    'courtDate': record.court_date.isoformat() if record.court_date else '',
+                    'alertType': alert_type
+                }
+                for record, alert_type in overdue
+            ]
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@deadlines_bp.route('/alerts', methods=['GET'])
+@require_auth
+def get_alerts():
+    """List recorded alerts; open alerts only unless ?all=true."""
+    try:
+        query = DeadlineAlert.query
+        if request.args.get('all', '').lower() not in ('1', 'true', 'yes'):
+            query = query.filter(DeadlineAlert.resolved_at.is_(None))
+        alerts = query.order_by(DeadlineAlert.detected_at.desc()).all()
+        return jsonify([alert.to_dict() for alert in alerts]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@deadlines_bp.route('/check', methods=['POST'])
+@require_auth
+def run_check():
+    """Run the deadline check now and record alerts."""
+    try:
+        hours = request.args.get('hours', DEFAULT_DEADLINE_HOURS, type=int)
+        opened, resolved = check_deadlines(hours)
+        return jsonify({'opened': opened, 'resolved': resolved}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,53 @@
+"""
+Flask routes for physical headcounts.
+"""
+
+from flask import Blueprint, request, jsonify, session
+from .auth import require_auth
+from ..models.roster import db
+from ..models.headcount import Headcount, reconcile
+
+headcount_bp = Blueprint('headcount', __name__)
+
+@headcount_bp.route('', methods=['POST'])
+@require_auth
+def submit_headcount():
+    """
+    Reconcile a physical headcount against the active roster.
+    Body: {"jailLocation": optional location or "*" for the whole facility,
+    "counts": [{"jailLocation", "cell", "total"} or {"jailLocation", "cell", "names": [...]}]}.
+    """
+    data = request.get_json()
+    if not data or not isinstance(data.get('counts'), list):
+        return jsonify({'error': 'counts is required'}), 400
+    
+    try:
+        headcount = reconcile(data['counts'], data.get('jailLocation'), counted_by=session.get('user_id'))
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+    return jsonify(headcount.to_dict()), 201
+
+@headcount_bp.route('', methods=['GET'])
+@require_auth
+def list_headcounts():
+    """List recent headcounts, newest first, without per-cell detail (?limit=, default 50)."""
+    try:
+        headcounts = Headcount.query.order_by(Headcount.counted_at.desc()).limit(
+            request.args.get('limit', 50, type=int)
+        ).all()
+        return jsonify([headcount.to_dict(include_cells=False) for headcount in headcounts]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@headcount_bp.route('/<int:headcount_id>', methods=['GET'])
+@require_auth
+def get_headcount(headcount_id):
+    """Get a stored headcount with its per-cell reconciliation."""
+    headcount = db.session.get(Headcount, headcount_id)
+    if headcount is None:
+        return jsonify({'error': 'Headcount not found'}), 404
+    return jsonify(headcount.to_dict()), 200
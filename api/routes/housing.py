@@ -0,0 +1,55 @@
+"""
+Flask routes for cell occupancy and housing assignment suggestions.
+"""
+
+from flask import Blueprint, request, jsonify
+from .auth import require_auth
+from ..models.housing import Cell, suggest_cells
+from ..models.charge import parse_charges
+
+housing_bp = Blueprint('housing', __name__)
+
+@housing_bp.route('/occupancy', methods=['GET'])
+@require_auth
+def get_occupancy():
+    """Get the live occupancy map, grouped by location."""
+    try:
+        locations = {}
+        for cell in Cell.query.order_by(Cell.jail_location, Cell.cell).all():
+            location = locations.setdefault(cell.jail_location, {
+                'jailLocation': cell.jail_location,
+                'capacity': 0,
+                'occupied': 0,
+                'cells': []
+            })
+            location['capacity'] += cell.capacity or 0
+            location['occupied'] += cell.occupied
+            location['cells'].append(cell.to_dict())
+        
+        return jsonify(list(locations.values())), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@housing_bp.route('/suggestions', methods=['GET'])
+@require_auth
+def get_suggestions():
+    """
+    Rank free cells for a new booking.
+    Query parameters: sex (M/F), felony (true/false) or charges (free text,
+    classified with the charge parser), jailLocation and limit.
+    """
+    try:
+        sex = request.args.get('sex', '').upper() or None
+        if sex not in (None, 'M', 'F'):
+            return jsonify({'error': 'sex must be M or F'}), 400
+        
+        if 'felony' in request.args:
+            felony = request.args.get('felony', '').lower() in ('1', 'true', 'yes')
+        else:
+            felony = any(charge['is_felony'] for charge in parse_charges(request.args.get('charges', '')))
+        
+        limit = request.args.get('limit', 10, type=int)
+        cells = suggest_cells(sex=sex, felony=felony, jail_location=request.args.get('jailLocation'), limit=limit)
+        return jsonify([cell.to_dict() for cell in cells]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
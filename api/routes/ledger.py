@@ -0,0 +1,40 @@
+"""
+Flask routes for the roster ledger (hash chain and Merkle proofs).
+"""
+
+from flask import Blueprint, request, jsonify
+from datetime import datetime
+from .auth import require_auth
+from ..models.ledger import root_at, inclusion_proof
+
+ledger_bp = Blueprint('ledger', __name__)
+
+@ledger_bp.route('/root', methods=['GET'])
+@require_auth
+def get_root():
+    """Get the chain hash and Merkle root in effect at a point in time (?at=ISO datetime, default now)."""
+    at = request.args.get('at')
+    try:
+        when = datetime.fromisoformat(at) if at else None
+    except ValueError:
+        return jsonify({'error': 'at must be an ISO datetime'}), 400
+    
+    try:
+        root = root_at(when)
+        if root is None:
+            return jsonify({'error': 'The ledger did not exist at that time'}), 404
+        return jsonify(root), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@ledger_bp.route('/proof/<record_id>', methods=['GET'])
+@require_auth
+def get_proof(record_id):
+    """Get the Merkle inclusion proof of a booking's current contents."""
+    try:
+        proof = inclusion_proof(record_id)
+        if proof is None:
+            return jsonify({'error': 'Record not found in the ledger'}), 404
+        return jsonify(proof), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,38 @@
+"""
+Flask routes for the person master index.
+"""
+
+from flask import Blueprint, jsonify
+from .auth import require_auth
+from ..models.person import Person
+
+persons_bp = Blueprint('persons', __name__)
+
+@persons_bp.route('/<int:person_id>', methods=['GET'])
+@require_auth
+def get_person(person_id):
+    """Get a person from the master index."""
+    try:
+        person = Person.query.get(person_id)
+        if not person:
+            return jsonify({'error': 'Person not found'}), 404
+        return jsonify(person.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@persons_bp.route('/<int:person_id>/bookings', methods=['GET'])
+@require_auth
+def get_person_bookings(person_id):
+    """Get every booking linked to a person, newest arrest first."""
+    try:
+        person = Person.query.get(person_id)
+        if not person:
+            return jsonify({'error': 'Person not found'}), 404
+        
+        bookings = Person.prior_bookings(person_id)
+        return jsonify({
+            'person': person.to_dict(),
+            'bookings': [booking.to_dict() for booking in bookings]
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
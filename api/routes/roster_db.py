@@ -3,27 +3,48 @@ Flask routes for roster management using SQLAlchemy database.
 """
 
 from flask import Blueprint, request, jsonify, send_file, current_app
-from functools import wraps
-from datetime import datetime
+from functools import wraps, lru_cache
+from datetime import datetime, date
 import io
 import os
 import traceback
-import base64
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Attachment, FileContent, FileName, FileType, Disposition
 from fpdf import FPDF
+from sqlalchemy.orm import selectinload
 from ..models.roster import db, Roster
+from ..models.person import Person
+from ..mailer import send_email
+from ..cases import group_by_case
+from ..models.name_search import fuzzy_search
+from ..pdf_cache import pdf_cache
 
-# Try to import logo, but don't fail if it doesn't exist
-try:
-    from ..logo_data import LOGO_BASE64
-    HAS_LOGO = True
-except ImportError:
-    HAS_LOGO = False
-    LOGO_BASE64 = None
+LOGO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'shpd-logo.png')
 
 roster_bp = Blueprint('roster', __name__)
 
+_last_generated_id = 0
+
+def generate_record_id():
+    """Generate a unique millisecond-timestamp ID, even for records created in the same millisecond."""
+    global _last_generated_id
+    _last_generated_id = max(int(datetime.now().timestamp() * 1000), _last_generated_id + 1)
+    return str(_last_generated_id)
+
+# Sortable fields for the roster list, resolved lazily so SQL expressions are built per request.
+# A tuple sorts on each column in turn; name and cell use the indexed keys set on write,
+# and those indexes end in id so the id tiebreak (appended below) is read from them too.
+ROSTER_SORT_FIELDS = {
+    'name': lambda: (Roster.last_name, Roster.first_name, Roster.middle_name),
+    'cell': lambda: (Roster.jail_location, Roster.cell_sort_key),
+    'custodyDays': lambda: Roster.custody_days,
+    'arrestDateTime': lambda: Roster.arrest_date_time,
+    'courtDate': lambda: Roster.court_date,
+    'releaseDateTime': lambda: Roster.release_date_time,
+}
+
+def allow_duplicates():
+    """Check whether the request overrides the duplicate booking check."""
+    return request.args.get('allowDuplicate', '').lower() in ('1', 'true', 'yes')
+
 def require_auth(f):
     """Decorator to require authentication."""
     @wraps(f)
@@ -56,13 +77,83 @@ def require_role(required_role):
 @roster_bp.route('', methods=['GET'])
 @require_auth
 def get_roster():
-    """Get all roster records."""
+    """
+    Get roster records.
+    Optional query parameters, applied in the database:
+    status (active/released), minDays/maxDays (days in custody),
+    hold (any, or a hold type such as federal), holdingAgency,
+    sort (one of ROSTER_SORT_FIELDS) and order (asc/desc).
+    groupBy=case returns the records grouped by incident with case status.
+    """
     try:
-        records = Roster.query.all()
+        query = Roster.query.options(selectinload(Roster.charge_items))
+        
+        status = request.args.get('status')
+        if status == 'active':
+            query = query.filter(Roster.release_date_time.is_(None))
+        elif status == 'released':
+            query = query.filter(Roster.release_date_time.isnot(None))
+        
+        min_days = request.args.get('minDays', type=int)
+        if min_days is not None:
+            query = query.filter(Roster.custody_days >= min_days)
+        max_days = request.args.get('maxDays', type=int)
+        if max_days is not None:
+            query = query.filter(Roster.custody_days <= max_days)
+        
+        hold = request.args.get('hold')
+        if hold == 'any':
+            query = query.filter(Roster.has_hold.is_(True))
+        elif hold:
+            query = query.filter(Roster.hold_type == hold)
+        holding_agency = request.args.get('holdingAgency')
+        if holding_agency:
+            query = query.filter(Roster.holding_agency == holding_agency)
+        
+        sort = request.args.get('sort')
+        if sort:
+            if sort not in ROSTER_SORT_FIELDS:
+                return jsonify({'error': f'sort must be one of: {", ".join(ROSTER_SORT_FIELDS)}'}), 400
+            columns = ROSTER_SORT_FIELDS[sort]()
+            if not isinstance(columns, tuple):
+                columns = (columns,)
+            descending = request.args.get('order') == 'desc'
+            columns += (Roster.id,)  # Tiebreak in the same direction, so one index scan yields the order
+            query = query.order_by(*[column.desc() if descending else column.asc() for column in columns])
+        
+        records = query.all()
+        if request.args.get('groupBy') == 'case':
+            return jsonify(group_by_case(records)), 200
         return jsonify([record.to_dict() for record in records]), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@roster_bp.route('/fuzzy', methods=['GET'])
+@require_auth
+def fuzzy_name_search():
+    """
+    Find bookings by a misspelled or reordered name (?name=), best match first.
+    Optional query parameters: status (active/released) and limit.
+    """
+    name = request.args.get('name', '').strip()
+    if not name:
+        return jsonify({'error': 'name is required'}), 400
+    
+    try:
+        matches = fuzzy_search(
+            name,
+            limit=min(request.args.get('limit', 20, type=int), 100),
+            status=request.args.get('status')
+        )
+        results = []
+        for record, score in matches:
+            result = record.to_dict()
+            result['score'] = score
+            results.append(result)
+        return jsonify(results), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @roster_bp.route('/<record_id>', methods=['GET'])
 @require_auth
 def get_record(record_id):
@@ -85,22 +176,52 @@ def create_record():
             return jsonify({'error': 'No data provided'}), 400
         
         # Generate a unique ID
-        new_id = str(int(datetime.now().timestamp() * 1000))
+        new_id = generate_record_id()
         data['id'] = new_id
         
         # Create the record from the dictionary
         record = Roster.from_dict(data)
         record.id = new_id
         
+        # Reject likely duplicate bookings unless explicitly overridden
+        if not allow_duplicates():
+            candidate_ids = record.find_duplicates()
+            if candidate_ids:
+                return jsonify({
+                    'error': 'Possible duplicate booking',
+                    'candidateIds': candidate_ids
+                }), 409
+        
+        # Link the booking to the person master index
+        record.person = Person.match_or_create(record)
+        
         # Save to database
         db.session.add(record)
         db.session.commit()
         
-        return jsonify(record.to_dict()), 201
+        response = record.to_dict()
+        response['priorBookingIds'] = [
+            booking.id for booking in Person.prior_bookings(record.person_id, exclude_id=record.id)
+        ] if record.person_id else []
+        return jsonify(response), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@roster_bp.route('/search/ssn', methods=['POST'])
+@require_auth
+def search_by_ssn():
+    """Find bookings by exact SSN. The SSN is sent in the body to keep it out of URLs and logs."""
+    try:
+        data = request.get_json()
+        if not data or not data.get('ssn'):
+            return jsonify({'error': 'SSN is required'}), 400
+        
+        records = Roster.find_by_ssn(data['ssn'])
+        return jsonify([record.to_dict() for record in records]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @roster_bp.route('/<record_id>', methods=['PUT'])
 @require_auth
 def update_record(record_id):
@@ -141,7 +262,8 @@ def update_record(record_id):
         record.total_number = data.get('totalNumber', record.total_number)
         record.name = data.get('name', record.name)
         record.dob = parse_date(data.get('dob', '')) or record.dob
-        record.ssn = data.get('ssn', record.ssn)
+        if 'ssn' in data:
+            record.ssn = data['ssn']
         record.sex_m = data.get('sexM', record.sex_m)
         record.sex_f = data.get('sexF', record.sex_f)
         record.oca_number = data.get('ocaNumber', record.oca_number)
@@ -149,6 +271,8 @@ def update_record(record_id):
         record.misdemeanor = data.get('misdemeanor', record.misdemeanor)
         record.felony = data.get('felony', record.felony)
         record.charges = data.get('charges', record.charges)
+        if 'charges' in data and 'misdemeanor' not in data and 'felony' not in data:
+            record.derive_offense_level()
         record.court_packet = data.get('courtPacket', record.court_packet)
         record.inst = data.get('inst', record.inst)
         record.court_case_ticket = data.get('courtCaseTicket', record.court_case_ticket)
@@ -165,6 +289,10 @@ def update_record(record_id):
         if photo_data:
             record.suspect_photo_base64 = photo_data.encode('utf-8') if isinstance(photo_data, str) else photo_data
         
+        # Link to the person master index once the name and DOB allow it
+        if record.person_id is None:
+            record.person = Person.match_or_create(record)
+        
         db.session.commit()
         
         return jsonify(record.to_dict()), 200
@@ -193,31 +321,65 @@ def delete_record(record_id):
 # PDF Export
 # ============================================================================
 
-def generate_pdf_report(records):
-    """Generate a professionally formatted PDF report from roster records."""
-    pdf = FPDF(orientation='L', unit='mm', format='A4')
-    pdf.add_page()
+def fit_text(pdf, text, width):
+    """Shorten text with an ellipsis so it fits in a cell of the given width."""
+    text = str(text)
+    if pdf.get_string_width(text) <= width - 2:
+        return text
+    while text and pdf.get_string_width(text + '...') > width - 2:
+        text = text[:-1]
+    return text + '...'
+
+def charge_lines(pdf, record, width):
+    """Render each parsed charge on its own line, falling back to the free-text field."""
+    labels = [item.summary() for item in record.charge_items] or [record.charges or '']
+    return [fit_text(pdf, label, width) for label in labels]
+
+def table_row(pdf, col_widths, row_data, line_height, stacked_line_height=4.5):
+    """Draw a table row; list values are drawn as stacked lines and set the row height."""
+    line_count = max(1, max(len(data) if isinstance(data, list) else 1 for data in row_data))
+    row_height = max(line_height, stacked_line_height * line_count)
+    if pdf.get_y() + row_height > pdf.page_break_trigger:
+        pdf.add_page()
     
+    x, y = pdf.get_x(), pdf.get_y()
+    for i, data in enumerate(row_data):
+        if isinstance(data, list):
+            text = '\n'.join(data + [''] * (line_count - len(data)))
+            pdf.multi_cell(col_widths[i], row_height / line_count, text, border=1, align='L', fill=True)
+        else:
+            pdf.cell(col_widths[i], row_height, str(data), border=1, align='L', fill=True)
+        x += col_widths[i]
+        pdf.set_xy(x, y)
+    pdf.ln(row_height)
+
+@lru_cache(maxsize=1)
+def report_logo():
+    """The department logo, decoded on first use and kept for the life of the process; None if unavailable."""
+    try:
+        from PIL import Image
+        with open(LOGO_PATH, 'rb') as f:
+            logo = Image.open(io.BytesIO(f.read()))
+            logo.load()
+        return logo
+    except Exception as e:
+        print(f"[PDF WARNING] Logo not available, reports will omit it: {e}")
+        return None
+
+def add_report_header(pdf, title):
+    """Draw the department banner with logo and report title at the top of the page."""
     # Header Section
     pdf.set_fill_color(25, 25, 112)  # Navy blue background
     pdf.rect(0, 0, 297, 30, 'F')
     
-    # Add logo from base64
-    if HAS_LOGO and LOGO_BASE64:
+    # Logo on the left, from the in-memory image
+    logo = report_logo()
+    if logo is not None:
         try:
-            import tempfile
-            logo_bytes = base64.b64decode(LOGO_BASE64)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp:
-                tmp.write(logo_bytes)
-                tmp_path = tmp.name
-            pdf.image(tmp_path, x=10, y=5, w=20)  # Logo on the left
-            os.unlink(tmp_path)  # Clean up temp file
-            print("[PDF] Logo added successfully")
+            pdf.image(logo, x=10, y=5, w=20)
         except Exception as e:
             print(f"[PDF ERROR] Could not add logo: {e}")
             traceback.print_exc()
-    else:
-        print("[PDF WARNING] Logo data not available, skipping logo")
     
     # Title
     pdf.set_text_color(255, 255, 255)  # White text
@@ -225,13 +387,43 @@ def generate_pdf_report(records):
     pdf.set_y(8)
     pdf.cell(0, 10, 'SHAKER HEIGHTS POLICE DEPARTMENT', ln=True, align='C')
     pdf.set_font('Arial', 'B', 14)
-    pdf.cell(0, 6, 'Jail Roster Report', ln=True, align='C')
+    pdf.cell(0, 6, title, ln=True, align='C')
+
+def add_report_footer(pdf):
+    """Draw the confidentiality footer below the last table."""
+    pdf.ln(5)
+    pdf.set_font('Arial', 'I', 8)
+    pdf.set_text_color(100, 100, 100)
+    pdf.cell(0, 5, 'This document is confidential and for official use only.', ln=True, align='C')
+    pdf.cell(0, 5, 'Shaker Heights Police Department - Jail Management System', ln=True, align='C')
+
+def pdf_bytes(pdf):
+    """Return the rendered PDF as bytes."""
+    pdf_output = pdf.output(dest='S')
+    if isinstance(pdf_output, str):
+        return pdf_output.encode('latin-1')
+    else:
+        return bytes(pdf_output)  # Convert bytearray to bytes
+
+def generate_pdf_report(records, generated_at=None):
+    """
+    Generate a professionally formatted PDF report from roster records.
+    The page shows only the report date, so a cached copy stays correct all
+    day; the render time goes in the document's creation-date metadata.
+    """
+    generated_at = generated_at or datetime.now()
+    pdf = FPDF(orientation='L', unit='mm', format='A4')
+    pdf.set_title('Jail Roster Report')
+    pdf.set_creation_date(generated_at)
+    pdf.add_page()
+    
+    add_report_header(pdf, 'Jail Roster Report')
     
     # Reset text color and add metadata
     pdf.set_text_color(0, 0, 0)
     pdf.set_y(35)
     pdf.set_font('Arial', '', 9)
-    pdf.cell(0, 5, f'Report Generated: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}', ln=True, align='R')
+    pdf.cell(0, 5, f'Report Date: {generated_at.strftime("%B %d, %Y")}', ln=True, align='R')
     pdf.cell(0, 5, f'Total Records: {len(records)}', ln=True, align='R')
     pdf.ln(3)
     
@@ -251,8 +443,8 @@ def generate_pdf_report(records):
         pdf.set_fill_color(70, 130, 180)  # Steel blue
         pdf.set_text_color(255, 255, 255)
         
-        col_widths = [25, 15, 40, 20, 30, 60, 25, 30]
-        headers = ['Location', 'Cell', 'Name', 'OCA #', 'Arrest Date', 'Charges', 'Bond', 'Court Date']
+        col_widths = [25, 15, 40, 20, 30, 12, 60, 25, 30]
+        headers = ['Location', 'Cell', 'Name', 'OCA #', 'Arrest Date', 'Days', 'Charges', 'Bond', 'Court Date']
         
         for i, header in enumerate(headers):
             pdf.cell(col_widths[i], 8, header, border=1, fill=True, align='C')
@@ -273,8 +465,8 @@ def generate_pdf_report(records):
             arrest_date = record.arrest_date_time.strftime('%m/%d/%Y %H:%M') if record.arrest_date_time else ''
             court_date = record.court_date.strftime('%m/%d/%Y') if record.court_date else ''
             
-            # Truncate long text
-            charges = (record.charges or '')[:40] + '...' if record.charges and len(record.charges) > 40 else (record.charges or '')
+            # One line per charge
+            charges = charge_lines(pdf, record, col_widths[6])
             
             # Row data
             row_data = [
@@ -283,14 +475,13 @@ def generate_pdf_report(records):
                 record.name or '',
                 record.oca_number or '',
                 arrest_date,
+                record.custody_days or '',
                 charges,
                 record.bond or '',
                 court_date
             ]
             
-            for i, data in enumerate(row_data):
-                pdf.cell(col_widths[i], 7, str(data), border=1, align='L', fill=True)
-            pdf.ln()
+            table_row(pdf, col_widths, row_data, 7)
         
         pdf.ln(5)
     
@@ -306,8 +497,8 @@ def generate_pdf_report(records):
         pdf.set_fill_color(169, 169, 169)  # Gray
         pdf.set_text_color(255, 255, 255)
         
-        col_widths_rel = [25, 15, 40, 30, 30, 50, 30]
-        headers_rel = ['Location', 'Cell', 'Name', 'Arrest Date', 'Release Date', 'Charges', 'Notes']
+        col_widths_rel = [25, 15, 40, 30, 30, 12, 50, 30]
+        headers_rel = ['Location', 'Cell', 'Name', 'Arrest Date', 'Release Date', 'Days', 'Charges', 'Notes']
         
         for i, header in enumerate(headers_rel):
             pdf.cell(col_widths_rel[i], 8, header, border=1, fill=True, align='C')
@@ -328,8 +519,8 @@ def generate_pdf_report(records):
             arrest_date = record.arrest_date_time.strftime('%m/%d/%Y') if record.arrest_date_time else ''
             release_date = record.release_date_time.strftime('%m/%d/%Y %H:%M') if record.release_date_time else ''
             
-            # Truncate long text
-            charges = (record.charges or '')[:35] + '...' if record.charges and len(record.charges) > 35 else (record.charges or '')
+            # One line per charge; truncate long notes
+            charges = charge_lines(pdf, record, col_widths_rel[6])
             notes = (record.holders_notes or '')[:20] + '...' if record.holders_notes and len(record.holders_notes) > 20 else (record.holders_notes or '')
             
             # Row data
@@ -339,41 +530,42 @@ def generate_pdf_report(records):
                 record.name or '',
                 arrest_date,
                 release_date,
+                record.custody_days or '',
                 charges,
                 notes
             ]
             
-            for i, data in enumerate(row_data):
-                pdf.cell(col_widths_rel[i], 7, str(data), border=1, align='L', fill=True)
-            pdf.ln()
-    
-    # Footer
-    pdf.ln(5)
-    pdf.set_font('Arial', 'I', 8)
-    pdf.set_text_color(100, 100, 100)
-    pdf.cell(0, 5, 'This document is confidential and for official use only.', ln=True, align='C')
-    pdf.cell(0, 5, 'Shaker Heights Police Department - Jail Management System', ln=True, align='C')
+            table_row(pdf, col_widths_rel, row_data, 7)
     
-    # Return PDF as bytes
-    pdf_output = pdf.output(dest='S')
-    if isinstance(pdf_output, str):
-        return pdf_output.encode('latin-1')
-    else:
-        return bytes(pdf_output)  # Convert bytearray to bytes
+    add_report_footer(pdf)
+    return pdf_bytes(pdf)
+
+def roster_pdf():
+    """
+    The full roster report, served from the PDF cache while the roster is
+    unchanged. Days in custody move at midnight, so the date is part of the
+    key. The time of each export is stamped on the download name rather than
+    the cached page.
+    """
+    pdf_data, cached = pdf_cache.get(
+        'roster', {'date': date.today()},
+        lambda: generate_pdf_report(Roster.query.options(selectinload(Roster.charge_items)).all())
+    )
+    print(f"[PDF] Roster report {'served from cache' if cached else 'rendered'}, size: {len(pdf_data)} bytes")
+    return pdf_data
 
 @roster_bp.route('/export/pdf', methods=['GET'])
 @require_auth
 def export_pdf():
     """Export roster as PDF."""
     try:
-        records = Roster.query.all()
-        pdf_data = generate_pdf_report(records)
+        pdf_data = roster_pdf()
         
         return send_file(
             io.BytesIO(pdf_data),
             mimetype='application/pdf',
             as_attachment=True,
-            download_name=f'jail_roster_{datetime.now().strftime("%Y-%m-%d")}.pdf'
+            download_name=f'jail_roster_{datetime.now().strftime("%Y-%m-%d_%H%M")}.pdf'
         )
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -393,55 +585,26 @@ def export_pdf_email():
         if not recipient_email:
             return jsonify({'error': 'Email address is required'}), 400
         
-        # Get SendGrid API key and sender email from environment variables
-        sendgrid_api_key = os.getenv('SENDGRID_API_KEY')
-        sender_email = os.getenv('SENDER_EMAIL', 'jailroster@shakerpd.com')
-        
-        print(f"[EMAIL] SendGrid Config - Sender: {sender_email}, Recipient: {recipient_email}")
-        
-        if not sendgrid_api_key:
+        if not os.getenv('SENDGRID_API_KEY'):
             return jsonify({'error': 'SendGrid API key not configured'}), 500
         
-        # Generate PDF
-        print("[EMAIL] Generating PDF...")
-        records = Roster.query.all()
-        pdf_data = generate_pdf_report(records)
-        print(f"[EMAIL] PDF generated, size: {len(pdf_data)} bytes")
-        
-        # Encode PDF as base64
-        encoded_pdf = base64.b64encode(pdf_data).decode()
+        pdf_data = roster_pdf()
         
-        # Create email message
         current_date = datetime.now().strftime("%Y-%m-%d")
         current_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        message = Mail(
-            from_email=sender_email,
-            to_emails=recipient_email,
-            subject=f'Jail Roster Report - {current_date}',
-            html_content=f'''
+        response = send_email(
+            recipient_email,
+            f'Jail Roster Report - {current_date}',
+            f'''
             <p>Dear Recipient,</p>
             <p>Please find attached the Jail Roster Report generated on {current_datetime}.</p>
             <p>This report contains all current inmate records in the system.</p>
             <p>Best regards,<br>Shaker Police Department</p>
-            '''
+            ''',
+            attachment=(f'jail_roster_{datetime.now().strftime("%Y-%m-%d_%H%M")}.pdf', 'application/pdf', pdf_data)
         )
         
-        # Attach PDF
-        print("[EMAIL] Attaching PDF to email...")
-        attachment = Attachment(
-            FileContent(encoded_pdf),
-            FileName(f'jail_roster_{current_date}.pdf'),
-            FileType('application/pdf'),
-            Disposition('attachment')
-        )
-        message.attachment = attachment
-        
-        # Send email via SendGrid
-        print("[EMAIL] Sending email via SendGrid...")
-        sg = SendGridAPIClient(sendgrid_api_key)
-        response = sg.send(message)
-        
         print(f"[EMAIL] SendGrid response - Status: {response.status_code}")
         print(f"[EMAIL] Email sent successfully to {recipient_email}")
         
@@ -494,14 +657,35 @@ def import_json():
         
         # Import records
         imported_count = 0
-        for record_data in data:
+        duplicates = []
+        block_cache = {}
+        check_duplicates = not allow_duplicates()
+        for index, record_data in enumerate(data):
             try:
                 record = Roster.from_dict(record_data)
+                record.id = generate_record_id()
+                
+                # Earlier records from this file are flushed by the lookup, so
+                # duplicates within the file are caught as well
+                if check_duplicates:
+                    candidate_ids = record.find_duplicates()
+                    if candidate_ids:
+                        duplicates.append({'index': index, 'name': record.name, 'candidateIds': candidate_ids})
+                        continue
+                
+                record.person = Person.match_or_create(record, block_cache)
                 db.session.add(record)
                 imported_count += 1
             except Exception as e:
                 print(f"Error importing record: {str(e)}")
         
+        if duplicates:
+            db.session.rollback()
+            return jsonify({
+                'error': f'{len(duplicates)} possible duplicate bookings found; nothing was imported',
+                'duplicates': duplicates
+            }), 409
+        
         db.session.commit()
         
         return jsonify({'message': f'Successfully imported {imported_count} records'}), 200
@@ -0,0 +1,76 @@
+"""
+Flask routes for daily roster snapshots.
+"""
+
+from flask import Blueprint, request, jsonify
+from datetime import date, datetime
+from .auth import require_auth
+from ..models.roster import db
+from ..models.snapshot import RosterSnapshot, take_snapshot, diff_snapshots, snapshot_moment
+
+snapshots_bp = Blueprint('snapshots', __name__)
+
+def find_snapshot(value):
+    """Look up a snapshot by ISO date, raising ValueError if the date is malformed."""
+    return db.session.get(RosterSnapshot, date.fromisoformat(value))
+
+@snapshots_bp.route('', methods=['GET'])
+@require_auth
+def list_snapshots():
+    """List stored snapshots, newest first, without their bookings."""
+    try:
+        snapshots = RosterSnapshot.query.order_by(RosterSnapshot.snapshot_date.desc()).all()
+        return jsonify([snapshot.to_dict() for snapshot in snapshots]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@snapshots_bp.route('/diff', methods=['GET'])
+@require_auth
+def get_diff():
+    """Compare the snapshots for two days (?from=YYYY-MM-DD&to=YYYY-MM-DD)."""
+    try:
+        older = find_snapshot(request.args.get('from', ''))
+        newer = find_snapshot(request.args.get('to', ''))
+    except ValueError:
+        return jsonify({'error': 'from and to must be dates (YYYY-MM-DD)'}), 400
+    if older is None or newer is None:
+        return jsonify({'error': 'Snapshot not found'}), 404
+    
+    try:
+        diff = diff_snapshots(older, newer)
+        return jsonify({
+            'from': older.snapshot_date.isoformat(),
+            'to': newer.snapshot_date.isoformat(),
+            **diff
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@snapshots_bp.route('/<day>', methods=['GET'])
+@require_auth
+def get_snapshot(day):
+    """Get the roster as of the midnight ending a day."""
+    try:
+        snapshot = find_snapshot(day)
+    except ValueError:
+        return jsonify({'error': 'Date must be YYYY-MM-DD'}), 400
+    if snapshot is None:
+        return jsonify({'error': 'Snapshot not found'}), 404
+    return jsonify(snapshot.to_dict(include_bookings=True)), 200
+
+@snapshots_bp.route('/<day>', methods=['POST'])
+@require_auth
+def build_snapshot(day):
+    """Build (or rebuild) the snapshot for a day now."""
+    try:
+        snapshot_date = date.fromisoformat(day)
+    except ValueError:
+        return jsonify({'error': 'Date must be YYYY-MM-DD'}), 400
+    if snapshot_moment(snapshot_date) > datetime.now():
+        return jsonify({'error': 'A snapshot can only be built for a day that has ended'}), 400
+    
+    try:
+        return jsonify(take_snapshot(snapshot_date).to_dict()), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,60 @@
+"""
+Flask routes for matching wanted-persons lists against the roster.
+"""
+
+from flask import Blueprint, request, jsonify
+import csv
+import json
+import time
+from .auth import require_auth
+from ..warrant_match import read_entries, read_csv, match_list, RECENT_DAYS, MIN_SCORE
+
+warrants_bp = Blueprint('warrants', __name__)
+
+def read_uploaded_entries():
+    """Entries from an uploaded file, a CSV body or a JSON body (a list, or {'entries': [...]})."""
+    upload = request.files.get('file')
+    if upload:
+        text = upload.read().decode('utf-8-sig')
+        if upload.filename.lower().endswith('.json'):
+            return read_entries(json.loads(text))
+        return read_csv(text)
+    if request.mimetype == 'text/csv':
+        return read_csv(request.get_data(as_text=True))
+    
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get('entries')
+    if not isinstance(data, list):
+        raise ValueError('Provide a CSV or JSON file, a text/csv body, or a JSON list of entries')
+    return read_entries(data)
+
+@warrants_bp.route('/match', methods=['POST'])
+@require_auth
+def match_warrants():
+    """
+    Match a list of wanted persons (name, dob, ssn, oca/identifier, reference)
+    against active bookings and bookings released in the last recentDays days.
+    Query parameters: recentDays and minScore.
+    """
+    try:
+        entries = read_uploaded_entries()
+    except (ValueError, UnicodeDecodeError, csv.Error) as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        started = time.perf_counter()
+        results, searched = match_list(
+            entries,
+            recent_days=request.args.get('recentDays', RECENT_DAYS, type=int),
+            min_score=request.args.get('minScore', MIN_SCORE, type=float)
+        )
+        return jsonify({
+            'entries': len(entries),
+            'bookingsSearched': searched,
+            'matched': len(results),
+            'seconds': round(time.perf_counter() - started, 3),
+            'matches': results
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
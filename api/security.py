@@ -0,0 +1,103 @@
+"""
+Protection for sensitive identifiers stored on roster records.
+SSNs are stored encrypted (Fernet) alongside a keyed-hash blind index, so
+exact-match lookups compare HMACs and never need the plaintext.
+The keys come from SSN_ENCRYPTION_KEY and SSN_INDEX_KEY, kept apart from
+the session SECRET_KEY so rotating the session secret leaves stored SSNs
+readable. Only in development are they derived from SECRET_KEY when unset;
+production refuses to start without them, or on the default SECRET_KEY.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import re
+from cryptography.fernet import Fernet, InvalidToken
+
+DEFAULT_SECRET_KEY = 'dev-secret-key-change-in-production'
+UNREADABLE_SSN = '***-**-****'  # Shown in place of an SSN that cannot be decrypted with the current key
+
+_fernet = None
+_index_key = None
+
+
+def is_production():
+    """Whether the app runs in production: FLASK_ENV=production or a Render/Vercel deployment."""
+    return os.getenv('FLASK_ENV') == 'production' or bool(os.getenv('RENDER') or os.getenv('VERCEL'))
+
+
+def check_secret_key():
+    """Raise RuntimeError in production when SECRET_KEY is unset or the development default."""
+    if is_production() and os.getenv('SECRET_KEY', DEFAULT_SECRET_KEY) == DEFAULT_SECRET_KEY:
+        raise RuntimeError('SECRET_KEY must be set to a private value in production')
+
+
+def check_ssn_keys():
+    """Raise RuntimeError in production when SSN_ENCRYPTION_KEY or SSN_INDEX_KEY is unset."""
+    if is_production() and not (os.getenv('SSN_ENCRYPTION_KEY') and os.getenv('SSN_INDEX_KEY')):
+        raise RuntimeError('SSN_ENCRYPTION_KEY and SSN_INDEX_KEY must be set in production')
+
+
+def _derive_key(purpose, secret=None):
+    """Derive a 32-byte key for a purpose from a secret (default: SECRET_KEY)."""
+    secret = secret or os.getenv('SECRET_KEY', DEFAULT_SECRET_KEY)
+    return hashlib.sha256(f'{purpose}:{secret}'.encode('utf-8')).digest()
+
+
+def secret_derived_fernet(secret):
+    """The cipher a development setup derives from a secret, for re-keying SSNs encrypted with it."""
+    return Fernet(base64.urlsafe_b64encode(_derive_key('ssn-encryption', secret)))
+
+
+def _get_fernet():
+    """Return the Fernet cipher for SSN_ENCRYPTION_KEY, derived from SECRET_KEY in development."""
+    global _fernet
+    if _fernet is None:
+        check_ssn_keys()
+        key = os.getenv('SSN_ENCRYPTION_KEY') or base64.urlsafe_b64encode(_derive_key('ssn-encryption'))
+        _fernet = Fernet(key)
+    return _fernet
+
+
+def _get_index_key():
+    """Return the HMAC key for the blind index from SSN_INDEX_KEY, derived from SECRET_KEY in development."""
+    global _index_key
+    if _index_key is None:
+        check_ssn_keys()
+        configured = os.getenv('SSN_INDEX_KEY')
+        _index_key = configured.encode('utf-8') if configured else _derive_key('ssn-index')
+    return _index_key
+
+
+def normalize_ssn(ssn):
+    """Reduce an SSN to its digits, returning None when blank."""
+    digits = re.sub(r'\D', '', ssn or '')
+    return digits or None
+
+
+def encrypt_ssn(ssn):
+    """Encrypt an SSN for storage."""
+    return _get_fernet().encrypt(ssn.encode('utf-8')).decode('ascii')
+
+
+def decrypt_ssn(token):
+    """Decrypt a stored SSN, raising InvalidToken if it was encrypted with another key or is corrupt."""
+    return _get_fernet().decrypt(token.encode('ascii')).decode('utf-8')
+
+
+def read_ssn(token, record_id=None):
+    """Decrypt a stored SSN for display, returning UNREADABLE_SSN (and logging) when it cannot be."""
+    try:
+        return decrypt_ssn(token)
+    except (InvalidToken, ValueError):
+        print(f"[SSN WARNING] Could not decrypt the SSN of booking {record_id}; check SSN_ENCRYPTION_KEY")
+        return UNREADABLE_SSN
+
+
+def ssn_blind_index(ssn):
+    """Keyed hash of the normalized SSN used for exact-match lookups."""
+    digits = normalize_ssn(ssn)
+    if digits is None:
+        return None
+    return hmac.new(_get_index_key(), digits.encode('utf-8'), hashlib.sha256).hexdigest()
@@ -0,0 +1,270 @@
+"""
+Batch matching of a wanted-persons list against active and recent bookings.
+Bookings are indexed once under blocking keys (SSN blind index, OCA number,
+DOB and surname Soundex), so each list entry is only compared with the
+bookings sharing one of its keys. Names are compared on normalized tokens:
+exact keys first, then bigram similarity of the whole name and of the
+parsed last/first names. Large lists are split across a process pool.
+"""
+
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, date, timedelta
+from .models.roster import db, Roster
+from .normalize import (
+    normalize_name, parse_name, first_names_compatible, normalize_identifier,
+    soundex, bigrams, similarity
+)
+from .security import ssn_blind_index
+
+RECENT_DAYS = 30
+MIN_SCORE = 0.75
+MAX_CANDIDATES = 5
+POOL_THRESHOLD = 2000  # Entries below this are matched in-process
+POOL_CHUNK_SIZE = 1000
+
+# Accepted column names for each input field, lowercase
+INPUT_COLUMNS = {
+    'reference': ('reference', 'ref', 'id', 'warrant', 'warrantnumber', 'warrant_number'),
+    'name': ('name', 'fullname', 'full_name'),
+    'last_name': ('last', 'lastname', 'last_name', 'surname'),
+    'first_name': ('first', 'firstname', 'first_name'),
+    'dob': ('dob', 'dateofbirth', 'date_of_birth', 'birthdate'),
+    'ssn': ('ssn',),
+    'oca_number': ('oca', 'ocanumber', 'oca_number', 'identifier'),
+}
+
+
+def _parse_dob(value):
+    value = (value or '').strip()
+    for parse in (date.fromisoformat, lambda text: datetime.strptime(text, '%m/%d/%Y').date()):
+        try:
+            return parse(value)
+        except ValueError:
+            continue
+    return None
+
+
+def read_entries(rows):
+    """
+    Normalize input rows (dicts with any INPUT_COLUMNS spelling) into match
+    entries. Raises ValueError for a row that is not a dict.
+    """
+    entries = []
+    for position, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError(f'Entry {position + 1} must be an object with name, dob, ssn or identifier fields')
+        fields = {str(key).strip().lower(): value for key, value in row.items() if key is not None}
+        values = {}
+        for field, names in INPUT_COLUMNS.items():
+            values[field] = next((str(fields[name]) for name in names if fields.get(name)), '')
+
+        name = values['name']
+        if not name and values['last_name']:
+            name = f'{values["last_name"]}, {values["first_name"]}'
+        last, first, _ = parse_name(name)
+        entries.append({
+            'position': position,
+            'reference': values['reference'] or str(position + 1),
+            'name': name,
+            'name_key': normalize_name(name),
+            'last': last,
+            'first': first,
+            'dob': _parse_dob(values['dob']),
+            'ssn_index': ssn_blind_index(values['ssn']),
+            'oca_number': normalize_identifier(values['oca_number']),
+        })
+    return entries
+
+
+def read_csv(text):
+    return read_entries(csv.DictReader(io.StringIO(text)))
+
+
+def load_bookings(recent_days=RECENT_DAYS, now=None):
+    """
+    Active bookings plus bookings released within recent_days, as plain tuples:
+    (id, name, dob, ssn_index, oca_number, release_date_time, jail_location, cell).
+    Two range scans on the index led by release_date_time.
+    """
+    now = now or datetime.now()
+    columns = (
+        Roster.id, Roster.name, Roster.dob, Roster.ssn_index, Roster.oca_number,
+        Roster.release_date_time, Roster.jail_location, Roster.cell
+    )
+    active = db.session.query(*columns).filter(Roster.release_date_time.is_(None))
+    recent = db.session.query(*columns).filter(Roster.release_date_time >= now - timedelta(days=recent_days))
+    return [tuple(row) for row in active.all() + recent.all()]
+
+
+class MatchIndex:
+    """Bookings grouped under their blocking keys, with precomputed name features."""
+
+    def __init__(self, bookings):
+        self.bookings = []
+        self.blocks = {}
+        for booking in bookings:
+            booking_id, name, dob, ssn_index, oca_number = booking[:5]
+            last, first, _ = parse_name(name)
+            name_key = normalize_name(name)
+            position = len(self.bookings)
+            self.bookings.append({
+                'booking': booking,
+                'name_key': name_key,
+                'last': last,
+                'first': first,
+                'dob': dob,
+                'ssn_index': ssn_index,
+                'oca_number': oca_number,
+                'name_grams': bigrams(name_key),
+                'last_grams': bigrams(last),
+                'first_grams': bigrams(first),
+            })
+            for key in self._keys(last, dob, ssn_index, oca_number):
+                self.blocks.setdefault(key, []).append(position)
+
+    @staticmethod
+    def _keys(last, dob, ssn_index, oca_number):
+        keys = []
+        if ssn_index:
+            keys.append(('ssn', ssn_index))
+        if oca_number:
+            keys.append(('oca', oca_number))
+        if dob:
+            keys.append(('dob', dob))
+        if last:
+            keys.append(('sx', soundex(last.split()[-1])))
+        return keys
+
+    def candidates(self, entry):
+        positions = set()
+        for key in self._keys(entry['last'], entry['dob'], entry['ssn_index'], entry['oca_number']):
+            positions.update(self.blocks.get(key, ()))
+        return [self.bookings[position] for position in positions]
+
+
+def _dob_score(a, b):
+    """1 for the same DOB, 0.5 when unknown or off by a typo (day/month swap, one field), else 0."""
+    if not a or not b:
+        return 0.5
+    if a == b:
+        return 1.0
+    if (a.month, a.day) == (b.day, b.month) and a.year == b.year:
+        return 0.5
+    if sum((a.year == b.year, a.month == b.month, a.day == b.day)) == 2:
+        return 0.5
+    return 0.0
+
+
+def score(entry, candidate, min_score=0.0):
+    """
+    Return (score, reasons) for one entry against one indexed booking.
+    Name comparison is skipped, returning (0.0, []), when the DOB alone
+    rules out reaching min_score.
+    """
+    if entry['ssn_index'] and entry['ssn_index'] == candidate['ssn_index']:
+        return 1.0, ['ssn']
+    oca_match = bool(entry['oca_number']) and entry['oca_number'] == candidate['oca_number']
+    dob_score = _dob_score(entry['dob'], candidate['dob'])
+    if not oca_match and 0.7 + 0.3 * dob_score < min_score:
+        return 0.0, []
+
+    reasons = ['oca'] if oca_match else []
+    if entry['name_key'] and entry['name_key'] == candidate['name_key']:
+        name_score = 1.0
+        reasons.append('name')
+    elif entry['last'] and entry['last'] == candidate['last'] and \
+            first_names_compatible(entry['first'], candidate['first']):
+        name_score = 0.95
+        reasons.append('lastFirst')
+    else:
+        whole = similarity(entry['name_grams'], candidate['name_grams'])
+        ordered = (similarity(entry['last_grams'], candidate['last_grams']) +
+                   similarity(entry['first_grams'], candidate['first_grams'])) / 2
+        name_score = max(whole, ordered)
+        if name_score >= 0.6:
+            reasons.append('fuzzyName')
+
+    if dob_score == 1.0:
+        reasons.append('dob')
+    total = 0.7 * name_score + 0.3 * dob_score
+    if oca_match:
+        total = max(total, 0.9)
+    return round(total, 3), reasons
+
+
+def match_entries(entries, index, min_score=MIN_SCORE, max_candidates=MAX_CANDIDATES):
+    """Ranked booking candidates for each entry that has any; entries without matches are left out."""
+    results = []
+    for entry in entries:
+        entry['name_grams'] = bigrams(entry['name_key'])
+        entry['last_grams'] = bigrams(entry['last'])
+        entry['first_grams'] = bigrams(entry['first'])
+
+        ranked = []
+        for candidate in index.candidates(entry):
+            candidate_score, reasons = score(entry, candidate, min_score)
+            if candidate_score >= min_score:
+                ranked.append((candidate_score, reasons, candidate['booking']))
+        if not ranked:
+            continue
+        ranked.sort(key=lambda item: (-item[0], item[2][0]))
+        results.append({
+            'reference': entry['reference'],
+            'name': entry['name'],
+            'dob': entry['dob'].isoformat() if entry['dob'] else '',
+            'candidates': [
+                {
+                    'id': booking_id,
+                    'name': name,
+                    'dob': dob.isoformat() if dob else '',
+                    'status': 'released' if release else 'active',
+                    'jailLocation': jail_location,
+                    'cell': cell or '',
+                    'score': candidate_score,
+                    'matchedOn': reasons
+                }
+                for candidate_score, reasons, (booking_id, name, dob, _, _, release, jail_location, cell)
+                in ranked[:max_candidates]
+            ]
+        })
+    return results
+
+
+# Per-process index built once by the pool initializer
+_worker_index = None
+
+
+def _init_worker(bookings):
+    global _worker_index
+    _worker_index = MatchIndex(bookings)
+
+
+def _match_chunk(args):
+    entries, min_score = args
+    return match_entries(entries, _worker_index, min_score)
+
+
+def match_list(entries, recent_days=RECENT_DAYS, min_score=MIN_SCORE, workers=None):
+    """
+    Match entries against active and recent bookings.
+    Returns (results, bookings searched). Lists of POOL_THRESHOLD entries or
+    more are split into chunks matched in a process pool; the booking index
+    is sent to each worker once.
+    """
+    bookings = load_bookings(recent_days)
+    if len(entries) < POOL_THRESHOLD:
+        return match_entries(entries, MatchIndex(bookings), min_score), len(bookings)
+
+    chunks = [
+        (entries[start:start + POOL_CHUNK_SIZE], min_score)
+        for start in range(0, len(entries), POOL_CHUNK_SIZE)
+    ]
+    workers = workers or min(os.cpu_count() or 1, len(chunks))
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(bookings,)) as pool:
+        for chunk_results in pool.map(_match_chunk, chunks):
+            results += chunk_results
+    return results, len(bookings)